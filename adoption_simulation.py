@@ -0,0 +1,333 @@
+"""
+Monte Carlo Adoption Simulation
+
+The dashboard's expected adoption is a point estimate: one fixed mix of
+Cooperative / ICHRA metal choices applied to the company totals. This module
+draws employee behavior many times instead and reports the spread of
+employer and employee cost for each contribution strategy:
+
+- Each draw samples the workforce's adoption mix from a Dirichlet centred on
+  the configured adoption rates (mix_concentration sets how far it strays)
+- Each employee then waives coverage (waive_rate), takes the premium tax
+  credit when the ICHRA is unaffordable and the subsidy beats the allowance
+  (ptc_opt_out_rate), or picks an option from the draw's mix among the
+  options priced for them. Medicare-eligible employees are not enrolled.
+- Affordability is tested on the self-only LCSP, as elsewhere in the app;
+  the subsidy and the net cost of opting out are priced on the household's
+  ICHRA Silver tier premium.
+- Draws are evaluated as batched NumPy operations over (draws x employees),
+  at most MAX_CELLS_PER_CHUNK cells at a time. Behavior draws are shared by
+  all strategies (common random numbers), so differences between strategies
+  are not sampling noise.
+
+Per-employee prices come from FinancialSummaryCalculator.calculate_multi_metal_scenario()
+(see inputs_from_multi_metal). The same seed and inputs give the same results.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from constants import ADOPTION_SIMULATION_CONFIG, COOPERATIVE_CONFIG, DEFAULT_ADOPTION_RATES
+from subsidy_utils import (
+    FAMILY_STATUS_HOUSEHOLD_SIZE,
+    calculate_monthly_subsidy_array,
+    is_subsidy_eligible_array,
+)
+from utils import parse_currency
+
+METALS = ('Bronze', 'Silver', 'Gold')
+COOPERATIVE_OPTION = 'Cooperative'
+# Option whose employer payment is the allowance tested for affordability
+BENCHMARK_OPTION = 'ICHRA Silver'
+
+PERCENTILES = (10, 50, 90)
+
+# Upper bound on draw x employee cells held in memory at once
+MAX_CELLS_PER_CHUNK = 2_000_000
+
+
+@dataclass
+class AdoptionInputs:
+    """
+    Per-employee prices and affordability inputs as parallel arrays.
+
+    Row i of every array describes the same employee; column k of premiums
+    is options[k]. A NaN premium means the option isn't priced for that
+    employee, so they can't choose it.
+    """
+    employee_ids: np.ndarray    # str (object)
+    options: Tuple[str, ...]
+    premiums: np.ndarray        # float64 (employees, options), monthly tier premium
+    employer_paid: np.ndarray   # bool per option: employer pays the whole premium
+    lcsp: np.ndarray            # float64, self-only LCSP (0 if unknown)
+    slcsp: np.ndarray           # float64, tier SLCSP, NaN if unknown (Silver tier used)
+    monthly_income: np.ndarray  # float64, NaN if unknown
+    age: np.ndarray             # int
+    household_size: np.ndarray  # int, from FAMILY_STATUS_HOUSEHOLD_SIZE
+
+    def __len__(self) -> int:
+        return len(self.employee_ids)
+
+    def option_index(self, option: str) -> int:
+        return self.options.index(option)
+
+
+def inputs_from_multi_metal(
+    multi_metal_results: Dict[str, Dict],
+    census_df: Optional[pd.DataFrame] = None,
+    cooperative_premiums: Optional[Mapping[str, float]] = None,
+    cooperative_ratio: Optional[float] = None,
+) -> AdoptionInputs:
+    """
+    Build simulation inputs from calculate_multi_metal_scenario() results.
+
+    Args:
+        multi_metal_results: {metal: {'employee_details': [...]}} for any of Bronze/Silver/Gold
+        census_df: Census with employee_id (or 'Employee Number') and monthly_income,
+            for the affordability test (optional; without it nobody takes the PTC)
+        cooperative_premiums: {employee_id: monthly cooperative premium}; defaults to
+            cooperative_ratio x the Silver tier premium, as in the dashboard totals
+        cooperative_ratio: Cooperative cost as a fraction of Silver
+            (default COOPERATIVE_CONFIG['default_discount_ratio'])
+
+    Returns:
+        AdoptionInputs with options Cooperative, then ICHRA <metal> per metal present
+    """
+    metals = [m for m in METALS if multi_metal_results.get(m, {}).get('employee_details')]
+    if not metals:
+        raise ValueError("multi_metal_results has no employee details")
+    if cooperative_ratio is None:
+        cooperative_ratio = COOPERATIVE_CONFIG['default_discount_ratio']
+
+    # Every metal lists the same employees in the same order
+    details = {m: pd.DataFrame(multi_metal_results[m]['employee_details']) for m in metals}
+    base = details[metals[0]]
+    employee_ids = base['employee_id'].astype(str).to_numpy(dtype=object)
+
+    def tier_premium(metal):
+        values = pd.to_numeric(details[metal]['estimated_tier_premium'], errors='coerce').to_numpy(dtype=float)
+        return np.where(values > 0, values, np.nan)
+
+    metal_premiums = [tier_premium(m) for m in metals]
+    silver = tier_premium('Silver') if 'Silver' in details else np.full(len(base), np.nan)
+
+    if cooperative_premiums is not None:
+        coop = pd.to_numeric(pd.Series(employee_ids).map(
+            {str(k): v for k, v in dict(cooperative_premiums).items()}), errors='coerce').to_numpy(dtype=float)
+        coop = np.where(coop > 0, coop, np.nan)
+    else:
+        coop = silver * cooperative_ratio
+
+    lcsp = (pd.to_numeric(details['Silver']['lcp_ee_rate'], errors='coerce').fillna(0).to_numpy(dtype=float)
+            if 'Silver' in details else np.zeros(len(base)))
+
+    income = np.full(len(base), np.nan)
+    if census_df is not None and 'monthly_income' in census_df.columns:
+        id_col = 'employee_id' if 'employee_id' in census_df.columns else 'Employee Number'
+        if id_col in census_df.columns:
+            by_id = dict(zip(census_df[id_col].astype(str), census_df['monthly_income']))
+            parsed = [parse_currency(by_id.get(emp_id)) for emp_id in employee_ids]
+            income = np.array([np.nan if v is None or v <= 0 else v for v in parsed], dtype=float)
+
+    statuses = base['family_status'].astype(str).str.upper()
+    return AdoptionInputs(
+        employee_ids=employee_ids,
+        options=(COOPERATIVE_OPTION,) + tuple(f"ICHRA {m}" for m in metals),
+        premiums=np.column_stack([coop] + metal_premiums),
+        employer_paid=np.array([COOPERATIVE_CONFIG['employer_pays_100_pct']] + [False] * len(metals)),
+        lcsp=lcsp,
+        slcsp=np.full(len(base), np.nan),
+        monthly_income=income,
+        age=pd.to_numeric(base['ee_age'], errors='coerce').fillna(0).to_numpy(dtype=int),
+        household_size=statuses.map(FAMILY_STATUS_HOUSEHOLD_SIZE).fillna(1).to_numpy(dtype=int),
+    )
+
+
+def allowance_costs(inputs: AdoptionInputs, allowance) -> np.ndarray:
+    """
+    Employer cost per employee and option for a monthly ICHRA allowance.
+
+    The employer reimburses up to the allowance (never more than the premium);
+    employer-paid options (the Cooperative) cost their full premium.
+
+    Args:
+        allowance: Scalar or per-employee monthly allowance
+
+    Returns:
+        float64 array (employees, options)
+    """
+    allowance = np.broadcast_to(np.asarray(allowance, dtype=np.float64), (len(inputs),))
+    premiums = np.nan_to_num(inputs.premiums)
+    return np.where(inputs.employer_paid, premiums, np.minimum(allowance[:, None], premiums))
+
+
+def premium_share_costs(inputs: AdoptionInputs, share: float) -> np.ndarray:
+    """
+    Employer cost per employee and option when it pays a share of the chosen
+    plan's premium (the dashboard's contribution percentage); employer-paid
+    options cost their full premium.
+
+    Returns:
+        float64 array (employees, options)
+    """
+    premiums = np.nan_to_num(inputs.premiums)
+    return np.where(inputs.employer_paid, premiums, premiums * share)
+
+
+def _summary(values: np.ndarray) -> Dict[str, float]:
+    p10, p50, p90 = np.percentile(values, PERCENTILES)
+    return {'mean': float(values.mean()), 'p10': float(p10), 'p50': float(p50), 'p90': float(p90)}
+
+
+def _mix_draws(rng: np.random.Generator, rates: np.ndarray, draws: int,
+               concentration: Optional[float]) -> np.ndarray:
+    """(draws, options) adoption mixes around rates; options with rate 0 stay at 0."""
+    if not concentration:
+        return np.broadcast_to(rates, (draws, len(rates)))
+    mixes = np.zeros((draws, len(rates)))
+    positive = rates > 0
+    mixes[:, positive] = rng.dirichlet(rates[positive] * concentration, size=draws)
+    return mixes
+
+
+def simulate_adoption(
+    inputs: AdoptionInputs,
+    strategies: Dict[str, np.ndarray],
+    adoption_rates: Optional[Dict[str, float]] = None,
+    draws: int = ADOPTION_SIMULATION_CONFIG['draws'],
+    seed: Optional[int] = ADOPTION_SIMULATION_CONFIG['seed'],
+    waive_rate: float = ADOPTION_SIMULATION_CONFIG['waive_rate'],
+    ptc_opt_out_rate: float = ADOPTION_SIMULATION_CONFIG['ptc_opt_out_rate'],
+    mix_concentration: Optional[float] = ADOPTION_SIMULATION_CONFIG['mix_concentration'],
+    return_draws: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Simulate plan choice, PTC opt-outs and waivers for each strategy.
+
+    Args:
+        inputs: Per-employee prices (see inputs_from_multi_metal)
+        strategies: {name: employer cost per employee and option}, e.g. from
+            allowance_costs() or premium_share_costs()
+        adoption_rates: {option: weight} (default DEFAULT_ADOPTION_RATES);
+            options not listed are never chosen
+        draws: Number of simulated plan years
+        seed: Random seed (None = unseeded)
+        waive_rate: Probability an employee declines all coverage
+        ptc_opt_out_rate: Probability a subsidy-eligible employee whose subsidy
+            exceeds the allowance takes the premium tax credit instead
+        mix_concentration: Dirichlet concentration for the per-draw adoption
+            mix (None or 0 = the rates exactly)
+        return_draws: Include the per-draw totals
+
+    Returns:
+        {strategy: {
+            'employer_monthly', 'employee_monthly',   # {'mean', 'p10', 'p50', 'p90'} totals
+            'enrolled', 'opted_out_ptc', 'waived',    # {'mean', 'p10', 'p50', 'p90'} counts
+            'by_option': {option: mean enrolled},
+            'draws': {'employer_monthly': array, 'employee_monthly': array}  # if return_draws
+        }}
+    """
+    if adoption_rates is None:
+        adoption_rates = DEFAULT_ADOPTION_RATES
+    n, k = inputs.premiums.shape
+    rates = np.array([float(adoption_rates.get(option, 0)) for option in inputs.options])
+    if rates.sum() <= 0:
+        raise ValueError("adoption_rates gives no weight to any option")
+    rates = rates / rates.sum()
+
+    priced = ~np.isnan(inputs.premiums) & (rates > 0)           # (n, k)
+    can_enroll = priced.any(axis=1) & (inputs.age < 65)         # Medicare-eligible employees don't enroll
+    premiums = np.nan_to_num(inputs.premiums)
+    benchmark = inputs.option_index(BENCHMARK_OPTION) if BENCHMARK_OPTION in inputs.options else None
+    benchmark_premium = premiums[:, benchmark] if benchmark is not None else np.zeros(n)
+    # Credit toward the household's Silver tier, paid only when the ICHRA is unaffordable
+    household_subsidy = calculate_monthly_subsidy_array(inputs.slcsp, inputs.monthly_income,
+                                                        inputs.household_size, benchmark_premium)
+
+    # Per-strategy, draw-independent terms
+    prepared = {}
+    for name, employer_cost in strategies.items():
+        employer_cost = np.asarray(employer_cost, dtype=np.float64)
+        if employer_cost.shape != (n, k):
+            raise ValueError(f"Strategy {name!r} must give employer cost per employee and option {(n, k)}")
+        # Affordability is tested on the self-only LCSP
+        allowance = employer_cost[:, benchmark] if benchmark is not None else np.zeros(n)
+        unaffordable = is_subsidy_eligible_array(inputs.monthly_income, inputs.lcsp, allowance, inputs.age,
+                                                 household_size=inputs.household_size)['is_unaffordable']
+        subsidy = np.where(unaffordable, household_subsidy, 0.0)
+        ptc_candidate = unaffordable & (subsidy > allowance) & can_enroll
+        # Flattened (employee, option) costs with a trailing 0 for employees not enrolled
+        prepared[name] = {
+            'employer': np.append(employer_cost.ravel(), 0.0),
+            'employee': np.append(np.maximum(premiums - employer_cost, 0.0).ravel(), 0.0),
+            'ptc_candidate': ptc_candidate,
+            'ptc_employee_cost': np.maximum(benchmark_premium - subsidy, 0.0),
+        }
+
+    # Employees priced for the same options share the per-draw choice thresholds
+    patterns, pattern_of = np.unique(priced, axis=0, return_inverse=True)
+    pattern_of = pattern_of.ravel()
+    cell_base = (np.arange(n) * k).astype(np.int32)
+    not_enrolled = np.int32(n * k)
+    priced_cells = priced.ravel()
+    last_priced = (k - 1 - np.argmax(priced[:, ::-1], axis=1)).astype(np.int32)
+
+    rng = np.random.default_rng(seed)
+    totals = {name: {key: np.empty(draws) for key in ('employer', 'employee', 'enrolled', 'opted_out', 'waived')}
+              for name in strategies}
+    by_option = {name: np.zeros(k) for name in strategies}
+    chunk = max(1, MAX_CELLS_PER_CHUNK // max(n, 1))
+
+    for start in range(0, draws, chunk):
+        d = min(chunk, draws - start)
+        window = slice(start, start + d)
+
+        # Plan choice: inverse CDF of the draw's mix over the options priced for each employee
+        weights = _mix_draws(rng, rates, d, mix_concentration)[:, None, :] * patterns[None, :, :]
+        cumulative = np.cumsum(weights, axis=2)
+        cumulative = (cumulative / np.where(cumulative[:, :, -1:] > 0, cumulative[:, :, -1:], 1)).astype(np.float32)
+        u = rng.random((d, n), dtype=np.float32)
+        choice = np.zeros((d, n), dtype=np.int32)
+        for option in range(k - 1):
+            thresholds = cumulative[:, :, option]
+            thresholds = thresholds[:, :1] if len(patterns) == 1 else thresholds[:, pattern_of]
+            choice += u >= thresholds
+        # Rounding can leave u above the last priced option's threshold; step back onto a priced one
+        unpriced = ~priced_cells[cell_base + choice] & can_enroll
+        if unpriced.any():
+            choice[unpriced] = np.broadcast_to(last_priced, (d, n))[unpriced]
+
+        waived = (rng.random((d, n), dtype=np.float32) < waive_rate) & can_enroll
+        takes_ptc = rng.random((d, n), dtype=np.float32) < ptc_opt_out_rate
+        covered = can_enroll & ~waived
+        cells = cell_base + choice
+
+        for name, p in prepared.items():
+            opted_out = covered & takes_ptc & p['ptc_candidate']
+            enrolled = covered & ~opted_out
+            enrolled_cells = np.where(enrolled, cells, not_enrolled)
+            t = totals[name]
+            t['employer'][window] = p['employer'][enrolled_cells].sum(axis=1)
+            t['employee'][window] = (p['employee'][enrolled_cells].sum(axis=1)
+                                     + opted_out @ p['ptc_employee_cost'])
+            t['enrolled'][window] = enrolled.sum(axis=1)
+            t['opted_out'][window] = opted_out.sum(axis=1)
+            t['waived'][window] = waived.sum(axis=1)
+            by_option[name] += np.bincount(choice[enrolled], minlength=k)
+
+    results = {}
+    for name, t in totals.items():
+        results[name] = {
+            'employer_monthly': _summary(t['employer']),
+            'employee_monthly': _summary(t['employee']),
+            'enrolled': _summary(t['enrolled']),
+            'opted_out_ptc': _summary(t['opted_out']),
+            'waived': _summary(t['waived']),
+            'by_option': {option: float(count / draws) for option, count in zip(inputs.options, by_option[name])},
+        }
+        if return_draws:
+            results[name]['draws'] = {'employer_monthly': t['employer'], 'employee_monthly': t['employee']}
+    return results
@@ -27,6 +27,7 @@ from constants import (
     APP_CONFIG, COOPERATIVE_CONFIG, DEFAULT_ADOPTION_RATES
 )
 from database import get_database_connection, test_connection
+from page_profiler import start_page_profile
 
 def get_cloudflare_user():
     """Get authenticated user from Cloudflare Zero Trust headers."""
@@ -48,6 +49,7 @@ st.set_page_config(
     layout=APP_CONFIG['layout'],
     initial_sidebar_state=APP_CONFIG['initial_sidebar_state']
 )
+start_page_profile()
 
 def initialize_session_state():
     """Initialize session state variables"""
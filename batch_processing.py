@@ -0,0 +1,486 @@
+"""
+Batch Processing for Canopy
+Headless re-quoting of many clients at once, without the Streamlit pages.
+
+Each census CSV in a directory is one client. Clients run through the same
+pipeline the pages use, on a process pool:
+
+1. Census parse + rating-area resolution (CensusProcessor.parse_new_census_format)
+2. LCSP / multi-metal scenarios (FinancialSummaryCalculator)
+3. Strategy calculation (ContributionStrategyCalculator)
+4. Exports: CSV, census PDF, employer summary PDF, census PPTX
+
+Every worker process opens one database connection at start-up and reuses it
+for all clients it processes, so the pool size bounds the connection count.
+Within a client, the LCSP/SLCSP cache is built once and shared by every
+strategy in the config. A manifest.json with per-step timings is written to
+the output directory.
+
+Usage:
+    python scripts/batch_requote.py censuses/ --config requote.json --output out/
+
+Config (JSON):
+    {
+        "strategies": [{"strategy_type": "base_age_curve", "base_contribution": 400}],
+        "metal_levels": ["Bronze", "Silver", "Gold"],
+        "outputs": ["csv", "employer_summary_pdf", "census_pptx"]
+    }
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from constants import METAL_LEVELS
+from contribution_strategies import ContributionStrategyCalculator, StrategyConfig, StrategyType
+from csv_export import census_identity_frame, csv_download_data, join_on_employee
+
+logger = logging.getLogger(__name__)
+
+# Output names accepted in the config
+OUTPUT_CSV = 'csv'
+OUTPUT_CENSUS_PDF = 'census_pdf'
+OUTPUT_EMPLOYER_SUMMARY_PDF = 'employer_summary_pdf'
+OUTPUT_CENSUS_PPTX = 'census_pptx'
+OUTPUT_TYPES = (OUTPUT_CSV, OUTPUT_CENSUS_PDF, OUTPUT_EMPLOYER_SUMMARY_PDF, OUTPUT_CENSUS_PPTX)
+
+# Client statuses in the manifest
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Per-worker database connection (set by _init_worker)
+_worker_db = None
+
+
+@dataclass
+class BatchConfig:
+    """What to run for every client in a batch"""
+    strategies: List[Dict[str, Any]] = field(
+        default_factory=lambda: [{'strategy_type': StrategyType.BASE_AGE_CURVE.value}]
+    )
+    metal_levels: List[str] = field(default_factory=lambda: ['Bronze', 'Silver', 'Gold'])
+    outputs: List[str] = field(default_factory=lambda: [OUTPUT_CSV])
+
+    def __post_init__(self):
+        """Validate names up front so a typo fails before any client runs"""
+        if not self.strategies:
+            raise ValueError("Config must list at least one strategy")
+        for strategy in self.strategies:
+            build_strategy_config(strategy)
+        unknown_metals = [m for m in self.metal_levels if m not in METAL_LEVELS]
+        if unknown_metals:
+            raise ValueError(f"Unknown metal levels: {', '.join(unknown_metals)}")
+        unknown_outputs = [o for o in self.outputs if o not in OUTPUT_TYPES]
+        if unknown_outputs:
+            raise ValueError(f"Unknown outputs: {', '.join(unknown_outputs)}")
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'BatchConfig':
+        """Load a config from a JSON file (missing keys use the defaults)"""
+        with open(path) as f:
+            raw = json.load(f)
+        return cls(**{k: v for k, v in raw.items() if k in cls.__dataclass_fields__})
+
+
+@dataclass
+class ClientResult:
+    """Manifest entry for one client"""
+    client_name: str
+    census_file: str
+    status: str = STATUS_OK
+    error: str = ""
+    employees: int = 0
+    dependents: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+    strategies: List[Dict[str, Any]] = field(default_factory=list)
+    outputs: Dict[str, str] = field(default_factory=dict)
+
+
+def build_strategy_config(strategy: Dict[str, Any]) -> StrategyConfig:
+    """
+    Build a StrategyConfig from a config entry.
+
+    Args:
+        strategy: {'strategy_type': 'flat_amount', 'flat_amount': 400, ...};
+            other keys are StrategyConfig fields
+
+    Raises:
+        ValueError: If the strategy type or a field name is unknown
+    """
+    options = dict(strategy)
+    try:
+        strategy_type = StrategyType(options.pop('strategy_type'))
+    except (KeyError, ValueError):
+        valid = ', '.join(t.value for t in StrategyType)
+        raise ValueError(f"Strategy needs a strategy_type, one of: {valid}")
+
+    unknown = [k for k in options if k not in StrategyConfig.__dataclass_fields__]
+    if unknown:
+        raise ValueError(f"Unknown strategy options: {', '.join(unknown)}")
+    return StrategyConfig(strategy_type=strategy_type, **options)
+
+
+def find_census_files(census_dir: Path) -> List[Path]:
+    """Census CSVs in a directory, one per client, in name order"""
+    return sorted(p for p in Path(census_dir).iterdir() if p.suffix.lower() == '.csv' and p.is_file())
+
+
+def client_name_from_path(path: Path) -> str:
+    """'acme_corp_census.csv' -> 'acme corp'"""
+    name = re.sub(r'[_\s-]*census$', '', Path(path).stem, flags=re.IGNORECASE)
+    return name.replace('_', ' ').strip() or Path(path).stem
+
+
+def _safe_filename(client_name: str) -> str:
+    """Client name for use in output file names"""
+    return re.sub(r'[^A-Za-z0-9_-]+', '_', client_name).strip('_') or 'client'
+
+
+def read_census_csv(path: Path) -> pd.DataFrame:
+    """
+    Read a census CSV the way the Census input page does.
+
+    Detects the delimiter and normalizes ZIPs to 5 digits.
+    """
+    content = Path(path).read_text(encoding='utf-8-sig')
+    try:
+        delimiter = csv.Sniffer().sniff(content[:4096], delimiters=',\t;|').delimiter
+    except csv.Error:
+        delimiter = ','
+
+    census_raw = pd.read_csv(io.StringIO(content), dtype={'Home Zip': str}, sep=delimiter)
+    if 'Home Zip' in census_raw.columns:
+        census_raw['Home Zip'] = census_raw['Home Zip'].astype(str).str.replace(r'\.0$', '', regex=True)
+        census_raw['Home Zip'] = census_raw['Home Zip'].str.split('-').str[0].str.zfill(5).str[:5]
+    return census_raw
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], step: str):
+    """Record a pipeline step's wall time in seconds"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[step] = round(time.perf_counter() - start, 3)
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+def build_contributions_export(
+    employees_df: pd.DataFrame,
+    strategy_result: Dict[str, Any],
+    multi_metal_results: Optional[Dict[str, Dict]] = None,
+) -> pd.DataFrame:
+    """
+    Census identity columns with the strategy contribution and plan rates.
+
+    Args:
+        employees_df: Parsed employee census
+        strategy_result: Output of ContributionStrategyCalculator.calculate_strategy()
+        multi_metal_results: Output of calculate_multi_metal_scenario()
+
+    Returns:
+        One row per employee
+    """
+    export = census_identity_frame(employees_df)
+    export['employee_id'] = export['employee_id'].astype(str)
+
+    contributions = pd.DataFrame.from_dict(
+        strategy_result.get('employee_contributions', {}) or {}, orient='index'
+    ).reindex(columns=['monthly_contribution', 'annual_contribution', 'lcsp_ee_rate', 'lcsp_tier_premium'])
+    contributions.index = contributions.index.astype(str)
+    export = export.join(join_on_employee(export, contributions))
+
+    for metal, metal_result in (multi_metal_results or {}).items():
+        details = pd.DataFrame(metal_result.get('employee_details', []) or [])
+        if details.empty or 'employee_id' not in details.columns:
+            continue
+        details['employee_id'] = details['employee_id'].astype(str)
+        details = details.drop_duplicates('employee_id').set_index('employee_id')
+        plans = details.reindex(columns=['lcp_ee_rate', 'lcp_plan_name']).rename(columns={
+            'lcp_ee_rate': f'{metal.lower()}_ee_rate',
+            'lcp_plan_name': f'{metal.lower()}_plan_name',
+        })
+        export = export.join(join_on_employee(export, plans))
+
+    return export.reset_index(drop=True)
+
+
+def _census_chart_images(employees_df: pd.DataFrame, dependents_df: pd.DataFrame) -> Dict[str, bytes]:
+    """Chart PNGs for the census PDF (same charts as the Census input page)"""
+    from visualization_helpers import (
+        generate_age_distribution_chart,
+        generate_dependent_age_distribution_chart,
+        generate_family_composition_chart,
+        generate_state_distribution_chart,
+    )
+
+    charts = {
+        'age_dist': lambda: generate_age_distribution_chart(employees_df, return_image=True),
+        'state': lambda: generate_state_distribution_chart(employees_df, return_image=True),
+        'family_status': lambda: generate_family_composition_chart(employees_df, return_image=True),
+    }
+    if dependents_df is not None and not dependents_df.empty:
+        charts['dependent_age'] = lambda: generate_dependent_age_distribution_chart(dependents_df, return_image=True)
+
+    chart_images = {}
+    for name, render in charts.items():
+        try:
+            chart_images[name] = render()
+        except Exception as e:
+            logger.warning(f"Chart {name} failed: {e}")
+            chart_images[name] = None
+    return chart_images
+
+
+def _renewal_data(employees_df: pd.DataFrame, contrib_totals: Dict) -> Dict[str, float]:
+    """Projected 2026 renewal, split ER/EE by the current contribution ratio (as on Employer summary)"""
+    from financial_calculator import FinancialSummaryCalculator
+
+    projected = FinancialSummaryCalculator.calculate_projected_2026_total(employees_df)
+    renewal_monthly = projected['total_monthly'] if projected['has_data'] else 0
+    current_er = contrib_totals['total_current_er_monthly']
+    current_total = current_er + contrib_totals['total_current_ee_monthly']
+    er_pct = current_er / current_total if current_total > 0 else 0.60
+    return {
+        'renewal_total_annual': renewal_monthly * 12,
+        'projected_er_annual': renewal_monthly * er_pct * 12,
+        'projected_ee_annual': renewal_monthly * (1 - er_pct) * 12,
+    }
+
+
+def write_outputs(
+    output_dir: Path,
+    client_name: str,
+    outputs: List[str],
+    employees_df: pd.DataFrame,
+    dependents_df: pd.DataFrame,
+    multi_metal_results: Dict[str, Dict],
+    strategy_results: List[Dict[str, Any]],
+    timings: Dict[str, float],
+) -> Dict[str, str]:
+    """
+    Write the requested exports for one client.
+
+    The employer summary PDF uses the first strategy; the CSV has one file
+    per strategy.
+
+    Returns:
+        {output name: file path}
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    prefix = _safe_filename(client_name)
+    written = {}
+
+    if OUTPUT_CSV in outputs:
+        with _timed(timings, 'export_csv'):
+            for i, result in enumerate(strategy_results, start=1):
+                path = output_dir / f"{prefix}_contributions_{i}_{result.get('strategy_type', 'strategy')}.csv"
+                export = build_contributions_export(employees_df, result, multi_metal_results)
+                path.write_bytes(csv_download_data(export).getvalue())
+                written[OUTPUT_CSV if i == 1 else f'{OUTPUT_CSV}_{i}'] = str(path)
+
+    if OUTPUT_CENSUS_PDF in outputs:
+        from pdf_census_renderer import generate_census_analysis_pdf
+
+        with _timed(timings, 'export_census_pdf'):
+            path = output_dir / f"{prefix}_census_analysis.pdf"
+            buffer = generate_census_analysis_pdf(
+                employees_df=employees_df,
+                dependents_df=dependents_df,
+                plan_availability_df=None,
+                client_name=client_name,
+                chart_images=_census_chart_images(employees_df, dependents_df),
+            )
+            path.write_bytes(buffer.getvalue())
+            written[OUTPUT_CENSUS_PDF] = str(path)
+
+    if OUTPUT_EMPLOYER_SUMMARY_PDF in outputs:
+        from pdf_employer_summary_renderer import generate_employer_summary_pdf
+        from utils import ContributionComparison
+
+        with _timed(timings, 'export_employer_summary_pdf'):
+            result = strategy_results[0]
+            contrib_totals = ContributionComparison.aggregate_contribution_totals(employees_df)
+            path = output_dir / f"{prefix}_employer_summary.pdf"
+            buffer = generate_employer_summary_pdf(
+                strategy_results={'calculated': True, 'result': result, 'config': result.get('config', {})},
+                contrib_totals=contrib_totals,
+                renewal_data=_renewal_data(employees_df, contrib_totals),
+                client_name=client_name,
+                affordability_impact=result.get('affordability_impact'),
+            )
+            path.write_bytes(buffer.getvalue())
+            written[OUTPUT_EMPLOYER_SUMMARY_PDF] = str(path)
+
+    if OUTPUT_CENSUS_PPTX in outputs:
+        from pptx_census_report import CensusReportData, generate_census_report_slide
+
+        with _timed(timings, 'export_census_pptx'):
+            path = output_dir / f"{prefix}_census_report.pptx"
+            data = CensusReportData.from_census_data(employees_df, dependents_df, client_name=client_name)
+            path.write_bytes(generate_census_report_slide(data).getvalue())
+            written[OUTPUT_CENSUS_PPTX] = str(path)
+
+    return written
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+def _init_worker() -> None:
+    """Open this worker's database connection once, for every client it runs"""
+    global _worker_db
+    from database import create_database_connection
+
+    _worker_db = create_database_connection()
+
+
+def process_client(census_path: Path, config: BatchConfig, output_dir: Path, db=None) -> ClientResult:
+    """
+    Run the full pipeline for one client.
+
+    Errors are recorded on the result rather than raised, so one bad census
+    does not stop the batch.
+
+    Args:
+        census_path: Census CSV (new census format)
+        config: What to run
+        output_dir: Batch output directory (a subdirectory per client is used)
+        db: Database connection (defaults to the worker's connection)
+
+    Returns:
+        ClientResult for the manifest
+    """
+    from financial_calculator import FinancialSummaryCalculator
+    from census_schema import enforce_census_schema, normalize_census_df
+    from utils import CensusProcessor
+
+    db = db if db is not None else _worker_db
+    census_path = Path(census_path)
+    client_name = client_name_from_path(census_path)
+    result = ClientResult(client_name=client_name, census_file=str(census_path))
+    timings = result.timings
+    start = time.perf_counter()
+
+    try:
+        with _timed(timings, 'read_census'):
+            census_raw = read_census_csv(census_path)
+
+        # Rating areas are resolved from ZIP/county during the parse
+        with _timed(timings, 'parse_census'):
+            employees_df, dependents_df = CensusProcessor.parse_new_census_format(census_raw, db)
+            employees_df, _ = enforce_census_schema(normalize_census_df(employees_df), inplace=True)
+            dependents_df, _ = enforce_census_schema(dependents_df, inplace=True)
+        result.employees = len(employees_df)
+        result.dependents = len(dependents_df) if dependents_df is not None else 0
+
+        with _timed(timings, 'multi_metal'):
+            multi_metal_results = FinancialSummaryCalculator.calculate_multi_metal_scenario(
+                employees_df, db, metal_levels=config.metal_levels, dependents_df=dependents_df
+            )
+
+        with _timed(timings, 'strategies'):
+            # One calculator, so the LCSP/SLCSP lookup runs once for all strategies
+            calculator = ContributionStrategyCalculator(db, employees_df)
+            strategy_results = []
+            for strategy in config.strategies:
+                strategy_result = calculator.calculate_strategy(build_strategy_config(strategy))
+                strategy_results.append(strategy_result)
+                result.strategies.append({
+                    'strategy_type': strategy_result.get('strategy_type'),
+                    'strategy_name': strategy_result.get('strategy_name'),
+                    'total_monthly': strategy_result.get('total_monthly', 0),
+                    'total_annual': strategy_result.get('total_annual', 0),
+                    'employees_covered': strategy_result.get('employees_covered', 0),
+                })
+
+        result.outputs = write_outputs(
+            Path(output_dir) / _safe_filename(client_name),
+            client_name,
+            config.outputs,
+            employees_df,
+            dependents_df,
+            multi_metal_results,
+            strategy_results,
+            timings,
+        )
+    except Exception as e:
+        logger.exception(f"BATCH: {client_name} failed")
+        result.status = STATUS_FAILED
+        result.error = f"{type(e).__name__}: {e}"
+
+    timings['total'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def run_batch(
+    census_dir: Path,
+    config: BatchConfig,
+    output_dir: Path,
+    workers: int = DEFAULT_WORKERS,
+) -> Dict[str, Any]:
+    """
+    Process every census in a directory and write manifest.json.
+
+    Args:
+        census_dir: Directory of census CSVs (one client each)
+        config: What to run for every client
+        output_dir: Where exports and the manifest go
+        workers: Worker processes (1 runs in this process, which is easier to debug)
+
+    Returns:
+        The manifest dict
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    census_files = find_census_files(census_dir)
+    started_at = datetime.now()
+    start = time.perf_counter()
+    logger.info(f"BATCH: {len(census_files)} clients, {workers} workers")
+
+    results: List[ClientResult] = []
+    if workers <= 1:
+        _init_worker()
+        for path in census_files:
+            results.append(process_client(path, config, output_dir))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = {pool.submit(process_client, path, config, output_dir): path for path in census_files}
+            for future in as_completed(futures):
+                results.append(future.result())
+                logger.info(f"BATCH: {results[-1].client_name} {results[-1].status} "
+                            f"in {results[-1].timings.get('total', 0):.1f}s")
+
+    results.sort(key=lambda r: r.census_file)
+    manifest = {
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'elapsed_seconds': round(time.perf_counter() - start, 3),
+        'workers': workers,
+        'config': asdict(config),
+        'clients_ok': sum(r.status == STATUS_OK for r in results),
+        'clients_failed': sum(r.status == STATUS_FAILED for r in results),
+        'clients': [asdict(r) for r in results],
+    }
+    with open(output_dir / 'manifest.json', 'w') as f:
+        json.dump(manifest, f, indent=2, default=str)
+    return manifest
@@ -8,10 +8,19 @@ This module solves the problem of inconsistent column naming across the app:
 - Census Input creates 'state' but some pages expect 'state_code'
 - Census Input creates 'rating_area_id' but some pages expect 'rating_area'
 - Original CSV uses 'Family Status' but internal code uses 'family_status'
+
+Use enforce_census_schema() after normalizing to store the canonical columns
+compactly (categoricals, small ints, parsed money and dates) so consumers
+don't re-parse them per row.
 """
 
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 import pandas as pd
-from typing import Optional
 
 
 # =============================================================================
@@ -28,11 +37,13 @@ COL_LAST_NAME = 'last_name'
 # Demographics
 COL_AGE = 'age'
 COL_DOB = 'dob'
+COL_DOB_DATE = 'dob_date'              # Parsed DOB (datetime64), added by enforce_census_schema()
 COL_FAMILY_STATUS = 'family_status'
 
 # Location
 COL_STATE = 'state'                    # 2-letter state code (e.g., 'GA')
 COL_COUNTY = 'county'
+COL_CITY = 'city'
 COL_ZIP = 'zip_code'
 COL_RATING_AREA = 'rating_area_id'     # Integer rating area ID
 
@@ -40,6 +51,11 @@ COL_RATING_AREA = 'rating_area_id'     # Integer rating area ID
 COL_MONTHLY_INCOME = 'monthly_income'
 COL_CURRENT_EE = 'current_ee_monthly'
 COL_CURRENT_ER = 'current_er_monthly'
+COL_PROJECTED_PREMIUM = 'projected_2026_premium'
+COL_GAP_INSURANCE = 'gap_insurance_monthly'
+
+# Dependents
+COL_RELATIONSHIP = 'relationship'
 
 
 # =============================================================================
@@ -133,6 +149,156 @@ def normalize_census_df(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame
     return df
 
 
+# =============================================================================
+# SCHEMA ENFORCEMENT
+# =============================================================================
+# Repeated text columns are stored as categoricals; categories are the values
+# present, so value_counts()/groupby() on the full census don't gain empty rows.
+CATEGORICAL_COLUMNS = (COL_STATE, COL_COUNTY, COL_CITY, COL_FAMILY_STATUS, COL_ZIP, COL_RELATIONSHIP)
+
+# Integer columns and their storage dtype
+INTEGER_COLUMNS = {
+    COL_AGE: 'int16',
+    COL_RATING_AREA: 'int16',
+}
+
+# Money stays float64 so totals across a large census keep exact cents
+MONEY_COLUMNS = (
+    COL_MONTHLY_INCOME, COL_CURRENT_EE, COL_CURRENT_ER, COL_PROJECTED_PREMIUM, COL_GAP_INSURANCE,
+)
+
+
+@dataclass
+class CensusSchemaReport:
+    """What enforce_census_schema() converted and the memory it saved"""
+    memory_before: int = 0
+    memory_after: int = 0
+    converted: Dict[str, str] = field(default_factory=dict)  # column -> new dtype
+    skipped: Dict[str, str] = field(default_factory=dict)    # column -> reason
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.memory_before - self.memory_after
+
+    @property
+    def reduction(self) -> float:
+        """memory_before / memory_after (e.g. 3.5 for 3.5x smaller)"""
+        return self.memory_before / self.memory_after if self.memory_after else 1.0
+
+    def summary(self) -> str:
+        return (
+            f"Census schema: {self.memory_before / 1024:,.1f} KB -> {self.memory_after / 1024:,.1f} KB "
+            f"({self.reduction:.1f}x smaller, {len(self.converted)} columns converted)"
+        )
+
+
+def parse_currency_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized parse_currency(): "$5,920.23" -> 5920.23, blanks/invalid -> NaN.
+
+    Numeric columns are returned as float without re-parsing.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype('float64')
+    cleaned = values.astype('string').str.replace(r'[$,"\s]', '', regex=True)
+    return pd.to_numeric(cleaned, errors='coerce').astype('float64')
+
+
+def _parse_rating_area(values: pd.Series) -> pd.Series:
+    """'Rating Area 4' / '4' / 4 -> 4.0; anything else -> NaN."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype('float64')
+    extracted = values.astype('string').str.extract(
+        r'^\s*(?:Rating Area\s*)?(\d+)(?:\.0)?\s*$', flags=re.IGNORECASE, expand=False
+    )
+    return pd.to_numeric(extracted, errors='coerce').astype('float64')
+
+
+def _as_integer(column: str, values: pd.Series, dtype: str) -> Tuple[Optional[pd.Series], str]:
+    """Integer version of a column, or (None, reason) if it can't be stored losslessly."""
+    parsed = _parse_rating_area(values) if column == COL_RATING_AREA else pd.to_numeric(values, errors='coerce')
+    if parsed.isna().any():
+        return None, 'missing or non-numeric values'
+    info = np.iinfo(dtype)
+    if not (parsed % 1 == 0).all() or parsed.min() < info.min or parsed.max() > info.max:
+        return None, f'values do not fit {dtype}'
+    return parsed.astype(dtype), ''
+
+
+def enforce_census_schema(
+    df: pd.DataFrame,
+    inplace: bool = False,
+) -> Tuple[pd.DataFrame, CensusSchemaReport]:
+    """
+    Coerce the canonical census columns to compact, pre-parsed dtypes.
+
+    Run after normalize_census_df(). Conversions are only applied when they
+    are lossless, so a column with missing or unexpected values keeps its
+    original dtype (and the reason is recorded in the report):
+    - state, county, city, family_status, zip_code, relationship: category
+      (no missing values, and at most half the values distinct)
+    - age, rating_area_id: int16 ('Rating Area 4' is parsed to 4)
+    - monthly_income, current_ee/er_monthly, projected_2026_premium,
+      gap_insurance_monthly: float64, currency strings parsed
+    - dob: kept as entered; dob_date is added as datetime64
+
+    Args:
+        df: Normalized census (employees or dependents) DataFrame
+        inplace: If True, modify df in place. If False, return a copy.
+
+    Returns:
+        (DataFrame, CensusSchemaReport)
+    """
+    report = CensusSchemaReport()
+    if df is None or df.empty:
+        return (df if inplace or df is None else df.copy()), report
+
+    if not inplace:
+        df = df.copy()
+    report.memory_before = int(df.memory_usage(deep=True).sum())
+
+    for column, dtype in INTEGER_COLUMNS.items():
+        if column not in df.columns or df[column].dtype == dtype:
+            continue
+        values, reason = _as_integer(column, df[column], dtype)
+        if values is None:
+            report.skipped[column] = reason
+        else:
+            df[column] = values
+            report.converted[column] = dtype
+
+    for column in MONEY_COLUMNS:
+        if column not in df.columns or df[column].dtype == 'float64':
+            continue
+        values = parse_currency_series(df[column])
+        if values.isna().all():
+            # Leave all-blank columns alone (consumers check `is None`)
+            report.skipped[column] = 'no values'
+        else:
+            df[column] = values
+            report.converted[column] = 'float64'
+
+    for column in CATEGORICAL_COLUMNS:
+        if column not in df.columns or isinstance(df[column].dtype, pd.CategoricalDtype):
+            continue
+        values = df[column]
+        if values.isna().any():
+            report.skipped[column] = 'missing values'
+        elif values.nunique() * 2 > len(values):
+            report.skipped[column] = 'mostly distinct'
+        else:
+            df[column] = values.astype('category')
+            report.converted[column] = 'category'
+
+    if COL_DOB in df.columns and COL_DOB_DATE not in df.columns:
+        df[COL_DOB_DATE] = pd.to_datetime(df[COL_DOB], format='mixed', errors='coerce')
+        report.converted[COL_DOB_DATE] = 'datetime64'
+
+    report.memory_after = int(df.memory_usage(deep=True).sum())
+    logging.debug(f"{report.summary()}; skipped: {report.skipped}")
+    return df, report
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -460,13 +460,13 @@ HELP_TEXT = {
     """
 }
 
-# Database table names (for reference)
+# Database table names (for reference; RBIS names are logical, see dataset_registry)
 DB_TABLES = {
-    'plans': 'rbis_insurance_plan_20251019202724',
-    'variants': 'rbis_insurance_plan_variant_20251019202724',
-    'rates': 'rbis_insurance_plan_base_rates_20251019202724',
-    'deductibles': 'rbis_insurance_plan_variant_ddctbl_moop_20251019202724',
-    'benefits': 'rbis_insurance_plan_benefit_cost_share_20251019202724',
+    'plans': 'rbis_insurance_plan',
+    'variants': 'rbis_insurance_plan_variant',
+    'rates': 'rbis_insurance_plan_base_rates',
+    'deductibles': 'rbis_insurance_plan_variant_ddctbl_moop',
+    'benefits': 'rbis_insurance_plan_benefit_cost_share',
     'rating_areas': 'rbis_state_rating_area_amended'
 }
 
@@ -627,6 +627,15 @@ DEFAULT_ADOPTION_RATES = {
     'ICHRA Gold': 10,     # 10% expected to choose Gold marketplace plan
 }
 
+# Monte Carlo adoption simulation (adoption_simulation.py)
+ADOPTION_SIMULATION_CONFIG = {
+    'draws': 10_000,            # Simulated plan years per strategy
+    'seed': 2026,               # Fixed seed so the dashboard shows the same ranges on every rerun
+    'waive_rate': 0.05,         # Share of employees expected to decline all coverage
+    'ptc_opt_out_rate': 0.75,   # Share of subsidy-eligible employees who take the PTC when it beats the ICHRA
+    'mix_concentration': 200,   # Dirichlet concentration around DEFAULT_ADOPTION_RATES (higher = less spread)
+}
+
 # Workforce demographic thresholds
 OLDER_POPULATION_WARNING_AGE = 45  # Show warning if avg employee age exceeds this
 
@@ -671,6 +680,50 @@ PATTERN_MIN_SAMPLE_SIZE = 3
 # Default ER contribution percentage when pattern cannot be detected
 PATTERN_DEFAULT_ER_PCT = 0.60  # 60% employer / 40% employee
 
+# ==============================================================================
+# TOTAL COST OF CARE (cost_of_care.py)
+# ==============================================================================
+# Services priced by the expected out-of-pocket engine, in array column order
+COST_OF_CARE_SERVICES = (
+    'pcp', 'specialist', 'urgent_care', 'er', 'mental_health', 'outpatient_facility',
+    'inpatient', 'generic_rx', 'preferred_rx', 'non_preferred_rx', 'specialty_rx',
+)
+
+# Typical allowed amount per service unit (visit, 30-day fill, admission)
+SERVICE_ALLOWED_COSTS = {
+    'pcp': 150,
+    'specialist': 250,
+    'urgent_care': 200,
+    'er': 2200,
+    'mental_health': 150,
+    'outpatient_facility': 3500,   # Ambulatory surgery / outpatient procedure
+    'inpatient': 15000,            # Per admission
+    'generic_rx': 20,
+    'preferred_rx': 350,
+    'non_preferred_rx': 600,
+    'specialty_rx': 3000,
+}
+
+# Annual service units per covered member for each utilization profile
+UTILIZATION_PROFILES = {
+    'Low': {'pcp': 1, 'generic_rx': 2},
+    'Moderate': {'pcp': 3, 'specialist': 2, 'urgent_care': 1, 'generic_rx': 12},
+    'High': {'pcp': 6, 'specialist': 6, 'urgent_care': 1, 'er': 1, 'mental_health': 6,
+             'outpatient_facility': 1, 'generic_rx': 24, 'preferred_rx': 12},
+    'Inpatient stay': {'pcp': 6, 'specialist': 8, 'er': 1, 'inpatient': 1,
+                       'outpatient_facility': 1, 'generic_rx': 24, 'preferred_rx': 12},
+}
+DEFAULT_UTILIZATION_PROFILE = 'Moderate'
+
+# ACA out-of-pocket limits (used when a plan has no MOOP on file)
+ACA_MAX_OOP_2026 = {
+    'individual': 10600,
+    'family': 21200,
+}
+
+# Coinsurance assumed for services a plan has no cost-sharing row for
+DEFAULT_COINSURANCE = 0.20
+
 if __name__ == "__main__":
     # Display constants for verification
     print("ICHRA Calculator Constants")
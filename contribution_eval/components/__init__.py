@@ -21,6 +21,7 @@ from .strategy_adjustment_panel import render_strategy_adjustment_panel
 from .employee_breakdown import render_employee_breakdown
 from .action_bar import render_action_bar
 from .affordability_subsidy_comparison import render_affordability_subsidy_comparison
+from .tradeoff_frontier import render_tradeoff_frontier
 
 __all__ = [
     'render_context_bar',
@@ -37,4 +38,5 @@ __all__ = [
     'render_employee_breakdown',
     'render_action_bar',
     'render_affordability_subsidy_comparison',
+    'render_tradeoff_frontier',
 ]
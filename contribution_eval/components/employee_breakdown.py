@@ -16,7 +16,7 @@ from typing import Dict, List, Any, Optional
 
 from contribution_eval import OperatingMode
 from contribution_eval.utils.formatting import format_currency
-from contribution_eval.utils.calculations import calculate_age_band
+from contribution_eval.utils.result_frame import build_result_frame, is_false, is_true
 
 # Brand colors
 BRAND_PRIMARY = '#0047AB'
@@ -34,6 +34,7 @@ def render_employee_breakdown(
     strategy_result: Dict[str, Any],
     affordability_data: Optional[Dict[str, Any]] = None,
     subsidy_data: Optional[Dict[str, Any]] = None,
+    result_frame: Optional[pd.DataFrame] = None,
 ) -> None:
     """
     Render the 4-tab employee breakdown section.
@@ -43,10 +44,13 @@ def render_employee_breakdown(
         strategy_result: Strategy calculation result with employee_contributions
         affordability_data: Affordability analysis (ALE mode)
         subsidy_data: Subsidy analysis (Subsidy mode)
+        result_frame: Prebuilt build_result_frame() output (built here if None)
     """
     st.markdown("### Employee Breakdown")
 
     employee_contributions = strategy_result.get('employee_contributions', {})
+    if result_frame is None:
+        result_frame = build_result_frame(strategy_result, affordability_data, subsidy_data)
 
     # Create tabs based on mode
     if mode == OperatingMode.NON_ALE_SUBSIDY:
@@ -76,26 +80,26 @@ def render_employee_breakdown(
         ])
 
     with tab_summary:
-        _render_summary_tab(mode, strategy_result, affordability_data, subsidy_data)
+        _render_summary_tab(mode, strategy_result, result_frame, affordability_data, subsidy_data)
 
     with tab_age:
-        _render_age_tab_graph(employee_contributions)
+        _render_age_tab_graph(result_frame)
 
     with tab_family:
-        _render_family_tab_graph(employee_contributions)
+        _render_family_tab_graph(result_frame)
 
     with tab_detail:
-        _render_detail_tab(mode, employee_contributions, affordability_data, subsidy_data)
+        _render_detail_tab(mode, result_frame, affordability_data, subsidy_data)
 
 
 def _render_summary_tab(
     mode: OperatingMode,
     strategy_result: Dict[str, Any],
+    result_frame: pd.DataFrame,
     affordability_data: Optional[Dict[str, Any]],
     subsidy_data: Optional[Dict[str, Any]],
 ) -> None:
     """Render the Summary tab with metrics and charts."""
-    employee_contributions = strategy_result.get('employee_contributions', {})
     total_monthly = strategy_result.get('total_monthly', 0)
     total_annual = strategy_result.get('total_annual', 0)
     employee_count = strategy_result.get('employees_covered', 0)
@@ -131,10 +135,7 @@ def _render_summary_tab(
                 st.caption("Income data required")
         else:
             # Standard mode - vs current if available
-            current_total = sum(
-                e.get('current_er_contribution', 0)
-                for e in employee_contributions.values()
-            )
+            current_total = result_frame['current_er_contribution'].sum()
             if current_total > 0:
                 delta = total_monthly - current_total
                 arrow = "↓" if delta < 0 else "↑"
@@ -148,9 +149,9 @@ def _render_summary_tab(
     st.markdown("<div style='margin-top: 1.5rem;'></div>", unsafe_allow_html=True)
 
     # Build chart data
-    age_data = _build_age_distribution_data(employee_contributions)
-    status_data = _build_status_data(mode, employee_contributions, affordability_data, subsidy_data)
-    family_data = _build_family_distribution_data(employee_contributions)
+    age_data = _build_age_distribution_data(result_frame)
+    status_data = _build_status_data(mode, result_frame, affordability_data, subsidy_data)
+    family_data = _build_family_distribution_data(result_frame)
 
     # Charts row 1: Age distribution + Status breakdown
     chart_col1, chart_col2 = st.columns(2)
@@ -269,29 +270,23 @@ def _render_summary_tab(
 
     # ALE Mode: Show employees needing higher contributions
     if mode == OperatingMode.ALE and affordability_data:
-        _render_needs_adjustment_section(employee_contributions, affordability_data)
+        _render_needs_adjustment_section(result_frame)
 
 
-def _build_age_distribution_data(employee_contributions: Dict[str, Dict]) -> List[Dict]:
+def _build_age_distribution_data(result_frame: pd.DataFrame) -> List[Dict]:
     """Build age distribution data for chart."""
     age_bands = ['21-29', '30-39', '40-49', '50-59', '60-64']
-    grouped = {band: {'employees': 0, 'total': 0} for band in age_bands}
-
-    for emp_id, data in employee_contributions.items():
-        age = data.get('age', 30)
-        band = calculate_age_band(age)
-        if band in grouped:
-            grouped[band]['employees'] += 1
-            grouped[band]['total'] += data.get('monthly_contribution', 0)
+    grouped = result_frame.groupby('age_band')['monthly_contribution'].agg(['count', 'sum'])
 
     result = []
     for band in age_bands:
-        if grouped[band]['employees'] > 0:
+        if band in grouped.index:
+            employees, total = int(grouped.at[band, 'count']), float(grouped.at[band, 'sum'])
             result.append({
                 'band': band,
-                'avg_contribution': grouped[band]['total'] / grouped[band]['employees'],
-                'employees': grouped[band]['employees'],
-                'total': grouped[band]['total'],
+                'avg_contribution': total / employees,
+                'employees': employees,
+                'total': total,
             })
 
     return result
@@ -299,12 +294,12 @@ def _build_age_distribution_data(employee_contributions: Dict[str, Dict]) -> Lis
 
 def _build_status_data(
     mode: OperatingMode,
-    employee_contributions: Dict[str, Dict],
+    result_frame: pd.DataFrame,
     affordability_data: Optional[Dict[str, Any]],
     subsidy_data: Optional[Dict[str, Any]],
 ) -> List[Dict]:
     """Build status breakdown data for pie chart."""
-    total = len(employee_contributions)
+    total = len(result_frame)
     if total == 0:
         return []
 
@@ -340,15 +335,9 @@ def _build_status_data(
 
     else:
         # Standard mode: cost impact
-        saves_count = sum(
-            1 for e in employee_contributions.values()
-            if e.get('current_er_contribution', 0) > 0 and
-            e.get('monthly_contribution', 0) < e.get('current_er_contribution', 0)
-        )
-        has_current = sum(
-            1 for e in employee_contributions.values()
-            if e.get('current_er_contribution', 0) > 0
-        )
+        current = result_frame['current_er_contribution']
+        has_current = int((current > 0).sum())
+        saves_count = int(((current > 0) & (result_frame['monthly_contribution'] < current)).sum())
         if has_current > 0:
             return [
                 {'name': 'Saves vs Current', 'value': saves_count, 'color': GREEN},
@@ -357,7 +346,7 @@ def _build_status_data(
         return []
 
 
-def _build_family_distribution_data(employee_contributions: Dict[str, Dict]) -> List[Dict]:
+def _build_family_distribution_data(result_frame: pd.DataFrame) -> List[Dict]:
     """Build family status distribution data for chart."""
     status_labels = {
         'EE': 'Employee Only',
@@ -366,53 +355,44 @@ def _build_family_distribution_data(employee_contributions: Dict[str, Dict]) ->
         'F': 'Family',
     }
 
-    grouped = {s: {'employees': 0, 'total': 0} for s in status_labels.keys()}
-
-    for emp_id, data in employee_contributions.items():
-        status = data.get('family_status', 'EE').upper()
-        if status in grouped:
-            grouped[status]['employees'] += 1
-            grouped[status]['total'] += data.get('monthly_contribution', 0)
+    grouped = result_frame.groupby('family_status')['monthly_contribution'].agg(['count', 'sum'])
 
     result = []
     for status in ['EE', 'ES', 'EC', 'F']:
-        if grouped[status]['employees'] > 0:
+        if status in grouped.index:
+            employees, total = int(grouped.at[status, 'count']), float(grouped.at[status, 'sum'])
             result.append({
                 'status': status_labels[status],
                 'status_code': status,
-                'avg_contribution': grouped[status]['total'] / grouped[status]['employees'],
-                'employees': grouped[status]['employees'],
-                'total': grouped[status]['total'],
+                'avg_contribution': total / employees,
+                'employees': employees,
+                'total': total,
             })
 
     return result
 
 
-def _render_needs_adjustment_section(
-    employee_contributions: Dict[str, Dict],
-    affordability_data: Dict[str, Any],
-) -> None:
+def _render_needs_adjustment_section(result_frame: pd.DataFrame) -> None:
     """Render section showing employees who need higher contributions (ALE mode)."""
-    employee_affordability = affordability_data.get('employee_affordability', {})
-
-    # Find employees who are not affordable
-    needs_adjustment = []
-    for emp_id, aff_data in employee_affordability.items():
-        if not aff_data.get('is_affordable', True):
-            emp_data = employee_contributions.get(emp_id, {})
-            needs_adjustment.append({
-                'name': emp_data.get('name', emp_id),
-                'age': emp_data.get('age', '—'),
-                'current_contribution': emp_data.get('monthly_contribution', 0),
-                'gap': aff_data.get('gap', 0),
-                'min_needed': emp_data.get('monthly_contribution', 0) + aff_data.get('gap', 0),
-            })
+    if 'aff_is_affordable' not in result_frame.columns:
+        return
 
-    if not needs_adjustment:
+    # Employees analyzed and not affordable
+    unaffordable = result_frame[is_false(result_frame['aff_is_affordable'])]
+    gap = unaffordable['aff_gap'].fillna(0)
+    needs_adjustment = pd.DataFrame({
+        'name': unaffordable['name'],
+        'age': unaffordable['age'].where(unaffordable['age'].notna(), '—'),
+        'current_contribution': unaffordable['monthly_contribution'],
+        'gap': gap,
+        'min_needed': unaffordable['monthly_contribution'] + gap,
+    })
+
+    if needs_adjustment.empty:
         return  # All employees are affordable, no section needed
 
     # Sort by gap (highest first)
-    needs_adjustment.sort(key=lambda x: x['gap'], reverse=True)
+    needs_adjustment = needs_adjustment.sort_values('gap', ascending=False, kind='stable')
 
     st.markdown("---")
     st.markdown(f"""
@@ -427,8 +407,7 @@ def _render_needs_adjustment_section(
     """, unsafe_allow_html=True)
 
     # Build DataFrame for display
-    df = pd.DataFrame(needs_adjustment)
-    df = df.rename(columns={
+    df = needs_adjustment.rename(columns={
         'name': 'Employee',
         'age': 'Age',
         'current_contribution': 'Current',
@@ -449,13 +428,13 @@ def _render_needs_adjustment_section(
         st.caption(f"Showing top 10 by gap. See **Full Detail** tab for all {len(needs_adjustment)} employees.")
 
 
-def _render_age_tab_graph(employee_contributions: Dict[str, Dict]) -> None:
+def _render_age_tab_graph(result_frame: pd.DataFrame) -> None:
     """Render the By Age tab with visual graphs."""
-    if not employee_contributions:
+    if result_frame.empty:
         st.info("No employee data available")
         return
 
-    age_data = _build_age_distribution_data(employee_contributions)
+    age_data = _build_age_distribution_data(result_frame)
 
     if not age_data:
         st.info("No age data available")
@@ -548,13 +527,13 @@ def _render_age_tab_graph(employee_contributions: Dict[str, Dict]) -> None:
     st.dataframe(df[['Age Band', 'Employees', 'Total', 'Average']], width="stretch", hide_index=True)
 
 
-def _render_family_tab_graph(employee_contributions: Dict[str, Dict]) -> None:
+def _render_family_tab_graph(result_frame: pd.DataFrame) -> None:
     """Render the By Family Status tab with visual graphs."""
-    if not employee_contributions:
+    if result_frame.empty:
         st.info("No employee data available")
         return
 
-    family_data = _build_family_distribution_data(employee_contributions)
+    family_data = _build_family_distribution_data(result_frame)
 
     if not family_data:
         st.info("No family status data available")
@@ -640,69 +619,63 @@ def _render_family_tab_graph(employee_contributions: Dict[str, Dict]) -> None:
 
 def _render_detail_tab(
     mode: OperatingMode,
-    employee_contributions: Dict[str, Dict],
+    result_frame: pd.DataFrame,
     affordability_data: Optional[Dict[str, Any]],
     subsidy_data: Optional[Dict[str, Any]],
 ) -> None:
     """Render the Full Detail tab with pagination."""
-    if not employee_contributions:
+    if result_frame.empty:
         st.info("No employee data available")
         return
 
     # Build DataFrame
-    rows = []
-    for emp_id, data in employee_contributions.items():
-        row = {
-            'Employee': data.get('name', emp_id),
-            'Age': data.get('age', '—'),
-            'State': data.get('state', '—'),
-            'Family': data.get('family_status', 'EE'),
-            'Contribution': data.get('monthly_contribution', 0),
-        }
-
-        # Mode-specific columns
-        if mode == OperatingMode.NON_ALE_STANDARD:
-            # vs Current column
-            current = data.get('current_er_contribution', 0)
-            if current > 0:
-                delta = data.get('monthly_contribution', 0) - current
-                row['vs Current'] = delta
-            else:
-                row['vs Current'] = None
-
-        elif mode == OperatingMode.NON_ALE_SUBSIDY and subsidy_data:
-            # Subsidy columns
-            has_income_data = subsidy_data.get('has_income_data', True)
-            emp_subsidy = _find_employee_in_subsidy_data(emp_id, subsidy_data)
+    contribution = result_frame['monthly_contribution']
+    df = pd.DataFrame({
+        'Employee': result_frame['name'],
+        'Age': result_frame['age'].where(result_frame['age'].notna(), '—'),
+        'State': result_frame['state'],
+        'Family': result_frame['family_status'],
+        'Contribution': contribution,
+    })
 
-            # Check Medicare status from subsidy_data or directly from age
-            is_medicare = (
-                (emp_subsidy and emp_subsidy.get('is_medicare', False)) or
-                (data.get('age') and int(data.get('age', 0)) >= 65)
-            )
+    # Mode-specific columns
+    if mode == OperatingMode.NON_ALE_STANDARD:
+        # vs Current column
+        current = result_frame['current_er_contribution']
+        df['vs Current'] = (contribution - current).where(current > 0)
 
-            if is_medicare:
-                # Medicare-eligible: show dashes (can't get ACA subsidies)
-                row['Eligible?'] = '—'
-                row['Est. Subsidy'] = None  # Will format as "—"
-            elif emp_subsidy:
-                if not has_income_data:
-                    row['Eligible?'] = '—'  # Can't determine
-                    row['Est. Subsidy'] = 0
-                else:
-                    row['Eligible?'] = '✓' if emp_subsidy.get('eligible') else '✗'
-                    row['Est. Subsidy'] = emp_subsidy.get('subsidy', 0)
-
-        elif mode == OperatingMode.ALE and affordability_data:
-            # Affordability columns
-            emp_aff = _find_employee_in_affordability_data(emp_id, affordability_data)
-            if emp_aff:
-                row['Affordable?'] = '✓' if emp_aff.get('is_affordable') else '✗'
-                row['Gap'] = emp_aff.get('gap', 0) if not emp_aff.get('is_affordable') else 0
-
-        rows.append(row)
-
-    df = pd.DataFrame(rows)
+    elif mode == OperatingMode.NON_ALE_SUBSIDY and subsidy_data:
+        # Subsidy columns
+        has_income_data = subsidy_data.get('has_income_data', True)
+        has_subsidy = result_frame['has_subsidy']
+
+        # Check Medicare status from subsidy_data or directly from age
+        is_medicare = pd.to_numeric(result_frame['age'], errors='coerce').fillna(0) >= 65
+        if 'subsidy_is_medicare' in result_frame.columns:
+            is_medicare |= is_true(result_frame['subsidy_is_medicare'])
+
+        eligible = pd.Series(None, index=result_frame.index, dtype=object)
+        subsidy = pd.Series(float('nan'), index=result_frame.index)
+        if has_subsidy.any():
+            if not has_income_data:
+                eligible[has_subsidy] = '—'  # Can't determine
+                subsidy[has_subsidy] = 0
+            else:
+                eligible[has_subsidy] = is_true(result_frame['subsidy_eligible'])[has_subsidy].map({True: '✓', False: '✗'})
+                subsidy[has_subsidy] = result_frame['subsidy_subsidy'][has_subsidy].fillna(0)
+
+        # Medicare-eligible: show dashes (can't get ACA subsidies)
+        eligible[is_medicare] = '—'
+        subsidy[is_medicare] = float('nan')
+        df['Eligible?'] = eligible
+        df['Est. Subsidy'] = subsidy
+
+    elif mode == OperatingMode.ALE and affordability_data and 'aff_is_affordable' in result_frame.columns:
+        # Affordability columns
+        has_affordability = result_frame['has_affordability']
+        is_affordable = is_true(result_frame['aff_is_affordable'])
+        df['Affordable?'] = is_affordable.map({True: '✓', False: '✗'}).where(has_affordability)
+        df['Gap'] = result_frame['aff_gap'].fillna(0).where(~is_affordable, 0).where(has_affordability)
 
     # Format currency columns
     if 'Contribution' in df.columns:
@@ -712,9 +685,9 @@ def _render_detail_tab(
             lambda x: f"+{format_currency(x)}" if pd.notna(x) and x > 0 else format_currency(x) if pd.notna(x) else '—'
         )
     if 'Est. Subsidy' in df.columns:
-        df['Est. Subsidy'] = df['Est. Subsidy'].apply(lambda x: format_currency(x) if x else '—')
+        df['Est. Subsidy'] = df['Est. Subsidy'].apply(lambda x: format_currency(x) if pd.notna(x) and x else '—')
     if 'Gap' in df.columns:
-        df['Gap'] = df['Gap'].apply(lambda x: format_currency(x) if x else '—')
+        df['Gap'] = df['Gap'].apply(lambda x: format_currency(x) if pd.notna(x) and x else '—')
 
     # Pagination
     total_rows = len(df)
@@ -764,17 +737,3 @@ def _render_detail_tab(
     else:
         st.dataframe(df, width="stretch", hide_index=True)
 
-
-def _find_employee_in_subsidy_data(emp_id: str, subsidy_data: Dict[str, Any]) -> Optional[Dict]:
-    """Find employee data in subsidy analysis results."""
-    by_employee = subsidy_data.get('by_employee', [])
-    for emp in by_employee:
-        if emp.get('employee_id') == emp_id:
-            return emp
-    return None
-
-
-def _find_employee_in_affordability_data(emp_id: str, affordability_data: Dict[str, Any]) -> Optional[Dict]:
-    """Find employee data in affordability analysis results."""
-    employee_affordability = affordability_data.get('employee_affordability', {})
-    return employee_affordability.get(emp_id)
@@ -12,6 +12,7 @@ Displays 4 key metrics that vary by operating mode:
 """
 
 import streamlit as st
+import pandas as pd
 from typing import Dict, Any, Optional
 
 from contribution_eval import OperatingMode
@@ -24,6 +25,7 @@ def render_metrics_grid(
     current_er_spend: Optional[float] = None,
     affordability_data: Optional[Dict[str, Any]] = None,
     subsidy_data: Optional[Dict[str, Any]] = None,
+    result_frame: Optional[pd.DataFrame] = None,
 ) -> None:
     """
     Render the 4-column metrics grid.
@@ -39,6 +41,8 @@ def render_metrics_grid(
         current_er_spend: Current monthly employer spend (if available)
         affordability_data: Affordability analysis (ALE mode)
         subsidy_data: Subsidy analysis (Subsidy mode)
+        result_frame: build_result_frame() output; when given, employee counts
+            come from it so the grid agrees with the breakdown tabs
     """
     total_monthly = strategy_result.get('total_monthly', 0)
     total_annual = strategy_result.get('total_annual', 0)
@@ -46,7 +50,10 @@ def render_metrics_grid(
     medicare_excluded = strategy_result.get('medicare_excluded_count', 0)
 
     # Active employee count excludes Medicare-eligible (65+) who have $0 contributions
-    employee_count = total_employees - medicare_excluded
+    if result_frame is not None:
+        employee_count = int((~result_frame['is_medicare']).sum())
+    else:
+        employee_count = total_employees - medicare_excluded
     avg_per_employee = total_monthly / employee_count if employee_count > 0 else 0
 
     # Calculate vs current
@@ -0,0 +1,112 @@
+"""
+Trade-off Frontier Component
+
+Plots every swept scenario (employer cost vs. affordable / subsidy-eligible
+employees) with the Pareto frontier highlighted, so brokers see the full
+cost/affordability curve instead of comparing points one at a time.
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from typing import Optional
+
+from contribution_eval import OperatingMode
+from contribution_eval.utils.formatting import format_currency
+
+# Brand colors
+BRAND_PRIMARY = '#0047AB'
+BRAND_ACCENT = '#37BEAE'
+AMBER = '#B45309'
+GRAY = '#9CA3AF'
+
+STRATEGY_LABELS = {
+    'flat_amount': 'Flat Amount',
+    'base_age_curve': 'Age Curve',
+    'percentage_lcsp': '% of LCSP',
+}
+
+
+def render_tradeoff_frontier(
+    mode: OperatingMode,
+    sweep_df: pd.DataFrame,
+    current_total_monthly: Optional[float] = None,
+) -> None:
+    """
+    Render the cost vs. affordability trade-off chart and frontier table.
+
+    Args:
+        mode: Current operating mode (subsidy mode plots eligibility instead)
+        sweep_df: Output of StrategyService.sweep_strategies()
+        current_total_monthly: Current strategy cost, drawn as a reference line
+    """
+    if sweep_df is None or sweep_df.empty:
+        st.info("No scenarios to compare for this mode.")
+        return
+
+    if mode == OperatingMode.NON_ALE_SUBSIDY:
+        y_col, y_title, level = 'subsidy_eligible_count', 'Subsidy-Eligible Employees', 'subsidy eligibility'
+    else:
+        y_col, y_title, level = 'affordable_count', 'Affordable Employees', 'affordability'
+
+    fig = go.Figure()
+    for strategy_type, group in sweep_df.groupby('strategy_type', sort=False):
+        is_pct = strategy_type == 'percentage_lcsp'
+        fig.add_trace(go.Scatter(
+            x=group['total_monthly'],
+            y=group[y_col],
+            mode='markers',
+            name=STRATEGY_LABELS.get(strategy_type, strategy_type),
+            marker=dict(size=7, opacity=0.6),
+            customdata=group[['parameter']].to_numpy(),
+            hovertemplate=(
+                f"<b>{STRATEGY_LABELS.get(strategy_type, strategy_type)}</b><br>"
+                + ("%{customdata[0]:.0f}% of LCSP" if is_pct else "Base $%{customdata[0]:,.0f}/mo")
+                + "<br>ER cost: $%{x:,.0f}/mo<br>" + y_title + ": %{y}<extra></extra>"
+            ),
+        ))
+
+    frontier = sweep_df[sweep_df['on_frontier']].sort_values('total_monthly')
+    fig.add_trace(go.Scatter(
+        x=frontier['total_monthly'],
+        y=frontier[y_col],
+        mode='lines+markers',
+        name=f'Frontier ({level})',
+        line=dict(color=BRAND_PRIMARY, width=2, shape='hv'),
+        marker=dict(size=8, color=BRAND_PRIMARY),
+        hoverinfo='skip',
+    ))
+
+    if current_total_monthly:
+        fig.add_vline(x=current_total_monthly, line_dash='dot', line_color=AMBER,
+                      annotation_text='Current', annotation_position='top')
+
+    fig.update_layout(
+        xaxis_title='Employer Cost (monthly)',
+        yaxis_title=y_title,
+        margin=dict(l=20, r=20, t=40, b=40),
+        height=360,
+        xaxis=dict(tickformat='$,.0f'),
+        legend=dict(orientation='h', y=-0.25),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    fig.update_yaxes(tickfont=dict(size=11), gridcolor='#E5E7EB')
+    st.plotly_chart(fig, width="stretch", config={'displayModeBar': False})
+
+    st.markdown(f"**Cheapest scenario for each {level} level**")
+    table = frontier.assign(
+        strategy=frontier['strategy_type'].map(STRATEGY_LABELS),
+        cost=frontier['total_monthly'].map(format_currency),
+    )[['strategy', 'parameter', 'cost', 'affordable_count', 'subsidy_eligible_count']]
+    st.dataframe(
+        table.rename(columns={
+            'strategy': 'Strategy',
+            'parameter': 'Base $ / LCSP %',
+            'cost': 'ER Cost (mo)',
+            'affordable_count': 'Affordable',
+            'subsidy_eligible_count': 'Subsidy-Eligible',
+        }),
+        hide_index=True,
+        width="stretch",
+    )
@@ -8,6 +8,7 @@ keeping components focused on presentation.
 from .strategy_service import StrategyService
 from .recommendation_service import RecommendationService
 from .subsidy_service import SubsidyService
+from .scenario_sweep import sweep_contribution_grid, pareto_frontier, default_contribution_grid
 from .ai_client import (
     get_ai_client,
     is_ai_available,
@@ -18,6 +19,9 @@ __all__ = [
     'StrategyService',
     'RecommendationService',
     'SubsidyService',
+    'sweep_contribution_grid',
+    'pareto_frontier',
+    'default_contribution_grid',
     'get_ai_client',
     'is_ai_available',
     'generate_ai_recommendation',
@@ -0,0 +1,181 @@
+"""
+ALE Affordability Solver.
+
+Finds the minimum base parameter that makes every employee's offer
+affordable (employee cost for the LCSP <= 9.96% of the safe-harbor income)
+for the parametric strategies:
+
+- flat_amount:     contribution_i = base x family_mult_i
+- base_age_curve:  contribution_i = base x (age_ratio_i / base_ratio) x family_mult_i
+- percentage_lcsp: contribution_i = pct x LCSP_i x family_mult_i
+
+Each strategy is linear in its parameter, so the minimum compliant value is
+the max over employees of required_contribution_i / slope_i: one linear pass
+over WorkforceArrays per employee class, no census lookups.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from contribution_eval import SafeHarborType
+from contribution_strategies import WorkforceArrays
+from constants import (
+    ACA_AGE_CURVE,
+    AFFORDABILITY_THRESHOLD_2026,
+    DEFAULT_FAMILY_MULTIPLIERS,
+    FPL_MONTHLY_2026,
+)
+
+
+# Contributions are rounded to the cent; solving for half a cent above the
+# requirement keeps the rounded contribution compliant
+ROUNDING_MARGIN = 0.005
+
+ALL_EMPLOYEES_CLASS = 'All employees'
+
+
+@dataclass
+class MinimumBaseSolution:
+    """Minimum compliant parameter for one strategy within one employee class"""
+    strategy_type: str
+    employee_class: str
+    minimum_base: float                 # $/month (flat, age curve) or % of LCSP
+    exact_base: float                   # Before rounding up
+    employees_considered: int
+    binding_employees: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'strategy_type': self.strategy_type,
+            'employee_class': self.employee_class,
+            'minimum_base': self.minimum_base,
+            'exact_base': round(self.exact_base, 4),
+            'employees_considered': self.employees_considered,
+            'binding_employees': self.binding_employees,
+        }
+
+
+def required_contributions(
+    arrays: WorkforceArrays,
+    safe_harbor: SafeHarborType,
+    monthly_income: Optional[np.ndarray] = None,
+) -> tuple:
+    """
+    Minimum monthly contribution each employee needs to be affordable.
+
+    Rate of Pay uses actual income, falling back to FPL where it is missing
+    (same fallback the previous iterative solve used). Medicare-eligible
+    employees and employees without an LCSP need nothing.
+
+    Returns:
+        (required contribution array, income measure array)
+    """
+    if safe_harbor == SafeHarborType.FPL:
+        income = np.full(len(arrays), FPL_MONTHLY_2026)
+    else:
+        income = arrays.monthly_income if monthly_income is None else monthly_income
+        income = np.where(np.isfinite(income) & (income > 0), income, FPL_MONTHLY_2026)
+
+    lcsp = np.where(arrays.is_medicare, 0.0, arrays.lcsp)
+    required = np.maximum(0.0, lcsp - income * AFFORDABILITY_THRESHOLD_2026)
+    return required, income
+
+
+def solve_minimum_bases(
+    arrays: WorkforceArrays,
+    safe_harbor: SafeHarborType = SafeHarborType.FPL,
+    strategy_types: Sequence[str] = ('flat_amount', 'base_age_curve', 'percentage_lcsp'),
+    base_age: int = 21,
+    family_multipliers: Optional[Dict[str, float]] = None,
+    employee_classes: Optional[Sequence[str]] = None,
+    monthly_income: Optional[np.ndarray] = None,
+    max_binding: int = 5,
+) -> Dict[str, Dict[str, MinimumBaseSolution]]:
+    """
+    Solve the minimum compliant base for each strategy and employee class.
+
+    Args:
+        arrays: Per-employee inputs from ContributionStrategyCalculator.get_workforce_arrays()
+        safe_harbor: Income measure for the affordability test
+        strategy_types: Any of flat_amount, base_age_curve, percentage_lcsp
+        base_age: Base age for base_age_curve
+        family_multipliers: Multipliers the final calculation will apply
+            (defaults to the standard multipliers, as calculate_strategy() does)
+        employee_classes: Class label per employee (aligned with arrays);
+            None solves the whole workforce as one class
+        monthly_income: Optional income override aligned with arrays
+        max_binding: Number of binding employees to report per solution
+
+    Returns:
+        {employee_class: {strategy_type: MinimumBaseSolution}}
+        Dollar bases are rounded up to the next whole dollar and LCSP
+        percentages up to the next whole percent.
+    """
+    if family_multipliers is None:
+        family_multipliers = DEFAULT_FAMILY_MULTIPLIERS
+
+    required, income = required_contributions(arrays, safe_harbor, monthly_income)
+    needs_contribution = required > 0
+    target = np.where(needs_contribution, required + ROUNDING_MARGIN, 0.0)
+    multiplier = arrays.family_multiplier_vector(family_multipliers)
+
+    slopes = {
+        'flat_amount': multiplier,
+        'base_age_curve': arrays.age_ratio / ACA_AGE_CURVE.get(base_age, 1.0) * multiplier,
+        'percentage_lcsp': arrays.lcsp / 100.0 * multiplier,
+    }
+
+    if employee_classes is None:
+        labels = np.full(len(arrays), ALL_EMPLOYEES_CLASS, dtype=object)
+    else:
+        labels = np.asarray(employee_classes, dtype=object)
+    class_names = list(dict.fromkeys(labels))
+    class_index = {name: k for k, name in enumerate(class_names)}
+    codes = np.array([class_index[label] for label in labels], dtype=np.int64)
+    class_sizes = np.bincount(codes, minlength=len(class_names))
+
+    solutions = {name: {} for name in class_names}
+    for strategy_type in strategy_types:
+        if strategy_type not in slopes:
+            raise ValueError(f"No affordability solve for strategy '{strategy_type}'")
+
+        slope = slopes[strategy_type]
+        mask = needs_contribution & (slope > 0)
+        per_employee = np.zeros(len(arrays))
+        per_employee[mask] = target[mask] / slope[mask]
+
+        # Per-class maximum in one pass
+        exact_by_class = np.zeros(len(class_names))
+        np.maximum.at(exact_by_class, codes, per_employee)
+
+        # Binding employees: highest requirement first within each class
+        binding_by_class = {k: [] for k in range(len(class_names))}
+        for i in np.lexsort((-per_employee, codes)):
+            bucket = binding_by_class[codes[i]]
+            if mask[i] and len(bucket) < max_binding:
+                bucket.append({
+                    'employee_id': arrays.employee_ids[i],
+                    'name': arrays.names[i],
+                    'age': int(arrays.age[i]),
+                    'family_status': arrays.family_status[i],
+                    'lcsp_ee_rate': round(float(arrays.lcsp[i]), 2),
+                    'income_measure': round(float(income[i]), 2),
+                    'required_contribution': round(float(required[i]), 2),
+                    'required_base': round(float(per_employee[i]), 2),
+                })
+
+        for k, name in enumerate(class_names):
+            exact = float(exact_by_class[k])
+            solutions[name][strategy_type] = MinimumBaseSolution(
+                strategy_type=strategy_type,
+                employee_class=str(name),
+                minimum_base=float(math.ceil(exact)) if exact > 0 else 0.0,
+                exact_base=exact,
+                employees_considered=int(class_sizes[k]),
+                binding_employees=binding_by_class[k],
+            )
+
+    return solutions
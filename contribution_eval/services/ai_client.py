@@ -11,7 +11,8 @@ import os
 import time
 import json
 import logging
-from typing import Optional, Dict, Any, Tuple
+import importlib.util
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 
 try:
     import streamlit as st
@@ -19,11 +20,11 @@ try:
 except ImportError:
     HAS_STREAMLIT = False
 
-try:
+# Detect the SDK without importing it - anthropic is imported on first client use
+HAS_ANTHROPIC = importlib.util.find_spec('anthropic') is not None
+
+if TYPE_CHECKING:
     from anthropic import Anthropic
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,7 @@ def get_ai_client() -> Optional['Anthropic']:
         logger.warning("No Anthropic API key found - AI features disabled")
         return None
 
+    from anthropic import Anthropic
     return Anthropic(api_key=api_key)
 
 
@@ -0,0 +1,231 @@
+"""
+Scenario Sweep for Contribution Evaluation.
+
+Evaluates a whole grid of contribution parameters (strategy type x base
+contribution / LCSP % x family multiplier set) in one vectorized pass over
+WorkforceArrays, instead of one calculate_strategy() call per point.
+
+Per-employee math mirrors ContributionStrategyCalculator (rounding to the
+cent, Medicare exclusion, ALE auto-bump) and the affordability counts mirror
+StrategyService.calculate_with_affordability(), so any row of the sweep
+matches the single-point result for the same parameters.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from contribution_eval import SafeHarborType
+from contribution_strategies import FAMILY_STATUS_ORDER, WorkforceArrays
+from constants import (
+    ACA_AGE_CURVE,
+    AFFORDABILITY_THRESHOLD_2026,
+    DEFAULT_FAMILY_MULTIPLIERS,
+    FPL_MONTHLY_2026,
+)
+from subsidy_utils import FAMILY_STATUS_HOUSEHOLD_SIZE, calculate_monthly_subsidy_array
+
+
+# Strategies whose contribution is linear in a single parameter
+SWEEPABLE_STRATEGIES = ('flat_amount', 'base_age_curve', 'percentage_lcsp')
+
+# Upper bound on scenario x employee cells held in memory at once
+MAX_CELLS_PER_CHUNK = 2_000_000
+
+NO_MULTIPLIERS = {'EE': 1.0, 'ES': 1.0, 'EC': 1.0, 'F': 1.0}
+
+
+def round_cents(values: np.ndarray) -> np.ndarray:
+    """
+    Round to the cent exactly like Python's round(x, 2).
+
+    np.round scales by 100 first, which can land on the other side of a
+    half-cent tie; the few near-tie elements are re-rounded in Python so
+    sweep results match the scalar calculator to the cent.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(float(v), 2) for v in values[near_tie]]
+    return rounded
+
+
+def sweep_contribution_grid(
+    arrays: WorkforceArrays,
+    strategy_types: Iterable[str],
+    base_contributions: Iterable[float] = (),
+    lcsp_percentages: Iterable[float] = (),
+    family_multiplier_sets: Optional[Dict[str, Dict[str, float]]] = None,
+    base_age: int = 21,
+    safe_harbor: SafeHarborType = SafeHarborType.FPL,
+    is_ale: bool = False,
+) -> pd.DataFrame:
+    """
+    Evaluate every combination of strategy parameters in one pass.
+
+    Args:
+        arrays: Per-employee inputs from ContributionStrategyCalculator.get_workforce_arrays()
+        strategy_types: Any of SWEEPABLE_STRATEGIES
+        base_contributions: $/month values for flat_amount and base_age_curve
+        lcsp_percentages: Percent values (e.g. 75.0) for percentage_lcsp
+        family_multiplier_sets: {label: {EE/ES/EC/F: multiplier}}; defaults to
+            the standard multipliers only
+        base_age: Base age for base_age_curve
+        safe_harbor: Income measure for the affordability counts
+        is_ale: Apply the ALE affordability auto-bump (flat and age curve)
+
+    Returns:
+        DataFrame with one row per scenario: strategy_type, parameter,
+        multiplier_set, total_monthly, total_annual, affordable_count,
+        total_analyzed, affordable_pct, subsidy_eligible_count,
+        avg_employee_cost, employees_affordability_adjusted
+    """
+    if family_multiplier_sets is None:
+        family_multiplier_sets = {'Standard': DEFAULT_FAMILY_MULTIPLIERS}
+
+    base_contributions = np.asarray(list(base_contributions), dtype=np.float64)
+    lcsp_percentages = np.asarray(list(lcsp_percentages), dtype=np.float64)
+
+    # Contribution-independent per-employee terms
+    active = ~arrays.is_medicare
+    lcsp = np.where(active, arrays.lcsp, 0.0)  # Medicare rows carry no LCSP in strategy results
+    has_income = arrays.has_income
+    income = np.where(has_income, arrays.monthly_income, 0.0)
+    max_ee_cost = income * AFFORDABILITY_THRESHOLD_2026
+
+    if safe_harbor == SafeHarborType.FPL:
+        analyzed = np.ones(len(arrays), dtype=bool)
+        affordable_limit = np.full(len(arrays), FPL_MONTHLY_2026 * AFFORDABILITY_THRESHOLD_2026)
+    else:
+        analyzed = has_income
+        affordable_limit = max_ee_cost
+
+    household_size = np.array(
+        [FAMILY_STATUS_HOUSEHOLD_SIZE[fs] for fs in FAMILY_STATUS_ORDER]
+    )[arrays.family_status_code]
+    subsidy_possible = active & has_income & (
+        calculate_monthly_subsidy_array(arrays.slcsp, income, household_size, arrays.lcsp) > 0
+    )
+    ale_bump_mask = active & has_income & (lcsp > 0) if is_ale else np.zeros(len(arrays), dtype=bool)
+    min_affordable = (lcsp - max_ee_cost) * 1.10  # +10% buffer, as in the calculator
+
+    frames = []
+    for strategy_type in strategy_types:
+        if strategy_type == 'flat_amount':
+            shape, params, labels, bump = np.ones(len(arrays)), base_contributions, base_contributions, True
+        elif strategy_type == 'base_age_curve':
+            shape = arrays.age_ratio / ACA_AGE_CURVE.get(base_age, 1.0)
+            params, labels, bump = base_contributions, base_contributions, True
+        elif strategy_type == 'percentage_lcsp':
+            shape, params, labels, bump = arrays.lcsp, lcsp_percentages / 100.0, lcsp_percentages, False
+        else:
+            raise ValueError(f"Strategy '{strategy_type}' cannot be swept (use one of {SWEEPABLE_STRATEGIES})")
+
+        if len(params) == 0:
+            continue
+
+        for label, multipliers in family_multiplier_sets.items():
+            multiplier = arrays.family_multiplier_vector(multipliers)
+            chunk = max(1, MAX_CELLS_PER_CHUNK // max(len(arrays), 1))
+
+            for start in range(0, len(params), chunk):
+                p = params[start:start + chunk]
+                contribution = round_cents((p[:, None] * shape[None, :]) * multiplier[None, :])
+
+                bumped = np.zeros_like(contribution, dtype=bool)
+                if bump and is_ale:
+                    cost_before = np.maximum(0.0, lcsp - contribution)
+                    bumped = ale_bump_mask & (cost_before > max_ee_cost) & (min_affordable > contribution)
+                    contribution = np.where(bumped, round_cents(min_affordable), contribution)
+
+                contribution = np.where(active, contribution, 0.0)
+                employee_cost = np.maximum(0.0, lcsp - contribution)
+
+                affordable = analyzed & (employee_cost <= affordable_limit)
+                subsidy_eligible = subsidy_possible & (employee_cost > max_ee_cost)
+
+                # Sequential (cumsum) rather than pairwise sum: same float result as the calculator's sum()
+                total_monthly = np.cumsum(contribution, axis=1)[:, -1] if len(arrays) else np.zeros(len(p))
+                affordable_count = affordable.sum(axis=1)
+                total_analyzed = int(analyzed.sum())
+                active_count = int(active.sum())
+
+                frames.append(pd.DataFrame({
+                    'strategy_type': strategy_type,
+                    'parameter': labels[start:start + chunk],
+                    'multiplier_set': label,
+                    'total_monthly': round_cents(total_monthly),
+                    'total_annual': round_cents(total_monthly * 12),
+                    'affordable_count': affordable_count,
+                    'total_analyzed': total_analyzed,
+                    'affordable_pct': affordable_count / total_analyzed * 100 if total_analyzed else 0.0,
+                    'subsidy_eligible_count': subsidy_eligible.sum(axis=1),
+                    'avg_employee_cost': (
+                        np.round((employee_cost * active).sum(axis=1) / active_count, 2) if active_count else 0.0
+                    ),
+                    'employees_affordability_adjusted': bumped.sum(axis=1),
+                }))
+
+    if not frames:
+        return pd.DataFrame(columns=[
+            'strategy_type', 'parameter', 'multiplier_set', 'total_monthly', 'total_annual',
+            'affordable_count', 'total_analyzed', 'affordable_pct', 'subsidy_eligible_count',
+            'avg_employee_cost', 'employees_affordability_adjusted',
+        ])
+    return pd.concat(frames, ignore_index=True)
+
+
+def pareto_frontier(
+    df: pd.DataFrame,
+    cost_col: str = 'total_monthly',
+    benefit_col: str = 'affordable_count',
+    maximize: bool = True,
+) -> pd.Series:
+    """
+    Flag scenarios on the cost/benefit Pareto frontier.
+
+    A scenario is on the frontier if no other scenario achieves an equal or
+    better benefit for less cost. Single sort + running best, O(n log n).
+
+    Args:
+        df: Sweep results
+        cost_col: Column to minimize
+        benefit_col: Column to maximize (or minimize if maximize=False)
+
+    Returns:
+        Boolean Series aligned with df.index
+    """
+    if df.empty:
+        return pd.Series(dtype=bool)
+
+    benefit = df[benefit_col] if maximize else -df[benefit_col]
+    order = np.lexsort((-benefit.to_numpy(), df[cost_col].to_numpy()))
+
+    on_frontier = np.zeros(len(df), dtype=bool)
+    best = -np.inf
+    values = benefit.to_numpy()
+    for i in order:
+        if values[i] > best:
+            on_frontier[i] = True
+            best = values[i]
+
+    return pd.Series(on_frontier, index=df.index)
+
+
+def frontier_points(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    """Frontier rows only, cheapest first."""
+    cost_col = kwargs.get('cost_col', 'total_monthly')
+    return df[pareto_frontier(df, **kwargs)].sort_values(cost_col)
+
+
+def default_contribution_grid(
+    center: float,
+    span: float = 0.5,
+    steps: int = 41,
+) -> List[float]:
+    """Evenly spaced $ grid of +/- span around a starting contribution."""
+    low = max(0.0, center * (1 - span))
+    high = max(center * (1 + span), low + 1.0)
+    return [round(v, 2) for v in np.linspace(low, high, steps)]
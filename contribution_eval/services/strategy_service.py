@@ -9,6 +9,7 @@ Wraps ContributionStrategyCalculator with additional logic for:
 
 from typing import Dict, List, Optional, Any
 import pandas as pd
+import numpy as np
 import logging
 
 from contribution_strategies import (
@@ -21,9 +22,20 @@ from contribution_eval import (
     SafeHarborType,
     STRATEGY_CONSTRAINTS,
 )
+from contribution_eval.services.affordability_solver import (
+    ALL_EMPLOYEES_CLASS,
+    MinimumBaseSolution,
+    solve_minimum_bases,
+)
+from contribution_eval.services.scenario_sweep import (
+    NO_MULTIPLIERS,
+    SWEEPABLE_STRATEGIES,
+    pareto_frontier,
+    sweep_contribution_grid,
+)
 from constants import (
     AFFORDABILITY_THRESHOLD_2026,
-    ACA_AGE_CURVE,
+    DEFAULT_FAMILY_MULTIPLIERS,
 )
 
 logger = logging.getLogger(__name__)
@@ -50,6 +62,7 @@ class StrategyService:
         self.census_df = census_df
         self._calculator = ContributionStrategyCalculator(db, census_df, lcsp_cache)
         self._lcsp_cache = lcsp_cache
+        self._employee_rows = None  # employee_id -> census row, built on first lookup
 
     def get_lcsp_cache(self) -> Dict[str, Any]:
         """Get the LCSP cache for storage in session state."""
@@ -187,6 +200,93 @@ class StrategyService:
 
         return results
 
+    def sweep_strategies(
+        self,
+        mode: OperatingMode,
+        base_contributions: List[float],
+        lcsp_percentages: Optional[List[float]] = None,
+        family_multiplier_sets: Optional[Dict[str, Dict[str, float]]] = None,
+        safe_harbor: SafeHarborType = SafeHarborType.FPL,
+        base_age: int = 21,
+    ) -> pd.DataFrame:
+        """
+        Evaluate a grid of contribution parameters in one vectorized pass.
+
+        Sweeps every parametric strategy available in the mode (flat, age
+        curve, % of LCSP) over the given values and flags the Pareto frontier
+        of employer cost vs. affordable employees (subsidy-eligible employees
+        in NON_ALE_SUBSIDY mode).
+
+        Args:
+            mode: Operating mode to determine available strategies
+            base_contributions: $/month values for flat/age curve strategies
+            lcsp_percentages: Percent values for the LCSP strategy
+            family_multiplier_sets: {label: multipliers}; default multipliers if None
+            safe_harbor: Income measure for the affordability counts
+            base_age: Base age for the age curve strategy
+
+        Returns:
+            DataFrame with one row per scenario plus an 'on_frontier' column
+        """
+        strategy_types = [s for s in STRATEGY_CONSTRAINTS.get(mode, []) if s in SWEEPABLE_STRATEGIES]
+        sweep = sweep_contribution_grid(
+            self._calculator.get_workforce_arrays(),
+            strategy_types,
+            base_contributions=base_contributions,
+            lcsp_percentages=lcsp_percentages or [],
+            family_multiplier_sets=family_multiplier_sets,
+            base_age=base_age,
+            safe_harbor=safe_harbor,
+            is_ale=self._calculator.is_ale,
+        )
+        benefit_col = 'subsidy_eligible_count' if mode == OperatingMode.NON_ALE_SUBSIDY else 'affordable_count'
+        sweep['on_frontier'] = pareto_frontier(sweep, benefit_col=benefit_col) if not sweep.empty else []
+        return sweep
+
+    def solve_minimum_bases(
+        self,
+        safe_harbor: SafeHarborType = SafeHarborType.FPL,
+        base_age: int = 21,
+        class_column: Optional[str] = None,
+        apply_family_multipliers: bool = True,
+    ) -> Dict[str, Dict[str, MinimumBaseSolution]]:
+        """
+        Minimum compliant base for flat, age-curve and %-of-LCSP strategies.
+
+        Args:
+            safe_harbor: Income measure for the affordability test
+            base_age: Base age for the age curve strategy
+            class_column: Census column defining employee classes (e.g. 'state');
+                None treats the whole workforce as one class
+            apply_family_multipliers: Whether the final strategy applies multipliers
+
+        Returns:
+            {employee_class: {strategy_type: MinimumBaseSolution}}
+        """
+        arrays = self._calculator.get_workforce_arrays()
+
+        # Same income source and parsing as calculate_with_affordability()
+        monthly_income = np.array([
+            self._parse_income((self._get_employee_row(emp_id) or {}).get('monthly_income')) or np.nan
+            for emp_id in arrays.employee_ids
+        ], dtype=np.float64)
+
+        employee_classes = None
+        if class_column:
+            employee_classes = [
+                str((self._get_employee_row(emp_id) or {}).get(class_column) or 'Unassigned')
+                for emp_id in arrays.employee_ids
+            ]
+
+        return solve_minimum_bases(
+            arrays,
+            safe_harbor=safe_harbor,
+            base_age=base_age,
+            family_multipliers=DEFAULT_FAMILY_MULTIPLIERS if apply_family_multipliers else NO_MULTIPLIERS,
+            employee_classes=employee_classes,
+            monthly_income=monthly_income,
+        )
+
     def _calculate_ale_strategies(
         self,
         safe_harbor: SafeHarborType,
@@ -203,65 +303,15 @@ class StrategyService:
         Returns:
             List of strategy results, each achieving 100% affordability
         """
-        from constants import FPL_MONTHLY_2026
-
         results = []
-
-        # Step 1: Calculate a baseline strategy to get LCSP values for all employees
-        # This ensures we use the same employee IDs and LCSP values as the final calculation
-        baseline_result = self.calculate_strategy(
-            strategy_type='base_age_curve',
-            base_age=21,
-            base_contribution=100,  # Arbitrary starting point
-        )
-
-        # Step 2: Calculate minimum contribution needed for each employee
         base_age = 21
-        base_ratio = ACA_AGE_CURVE.get(base_age, 1.0)
-        required_bases = []
-
-        employee_contributions = baseline_result.get('employee_contributions', {})
 
-        for emp_id, contrib in employee_contributions.items():
-            lcsp = contrib.get('lcsp_ee_rate', 0)
-            emp_age = contrib.get('age', 30)
-            emp_age = min(max(int(emp_age), 0), 64)
-            emp_ratio = ACA_AGE_CURVE.get(emp_age, 1.0)
+        # Step 1: Solve minimum compliant bases in one pass over the joined arrays
+        solutions = self.solve_minimum_bases(safe_harbor, base_age=base_age)[ALL_EMPLOYEES_CLASS]
+        age_curve_solution = solutions['base_age_curve']
+        optimal_base = age_curve_solution.minimum_base
 
-            # Get income based on safe harbor
-            if safe_harbor == SafeHarborType.FPL:
-                monthly_income = FPL_MONTHLY_2026
-            else:
-                # Rate of Pay - get from census
-                emp_row = self._get_employee_row(emp_id)
-                if emp_row is not None:
-                    monthly_income = self._parse_income(emp_row.get('monthly_income'))
-                else:
-                    monthly_income = None
-
-                if monthly_income is None or monthly_income <= 0:
-                    # Fall back to FPL for employees without income data
-                    monthly_income = FPL_MONTHLY_2026
-
-            # Calculate minimum contribution for affordability
-            # Affordability: LCSP - Contribution <= 9.96% × Income
-            # So: Contribution >= LCSP - (9.96% × Income)
-            max_employee_cost = monthly_income * AFFORDABILITY_THRESHOLD_2026
-            min_contribution = max(0, lcsp - max_employee_cost)
-
-            # Reverse the age curve to find required base
-            # Contribution = base_contribution × (emp_ratio / base_ratio)
-            # So: base_contribution = min_contribution × (base_ratio / emp_ratio)
-            if emp_ratio > 0:
-                required_base = min_contribution * (base_ratio / emp_ratio)
-                required_bases.append(required_base)
-
-        # Step 3: Use the MAX of all required bases to ensure everyone is covered
-        optimal_base = max(required_bases) if required_bases else 0
-        # Round UP to next dollar to ensure we meet the threshold
-        optimal_base = float(int(optimal_base) + 1)
-
-        # Step 4: Calculate strategy with optimal base and verify affordability
+        # Step 2: Calculate strategy with optimal base and verify affordability
         age_curve_result = self.calculate_strategy(
             strategy_type='base_age_curve',
             base_age=base_age,
@@ -270,7 +320,7 @@ class StrategyService:
         age_curve_result['strategy_type'] = 'base_age_curve'
         age_curve_result = self.calculate_with_affordability(age_curve_result, safe_harbor)
 
-        # Step 5: If not 100% affordable, iterate to fix (handles edge cases)
+        # Step 3: If not 100% affordable, iterate to fix (safety net for edge cases)
         max_iterations = 10
         iteration = 0
         while iteration < max_iterations:
@@ -296,15 +346,22 @@ class StrategyService:
             age_curve_result = self.calculate_with_affordability(age_curve_result, safe_harbor)
             iteration += 1
 
+        age_curve_result['affordability_solution'] = age_curve_solution.to_dict()
         results.append(age_curve_result)
 
-        # Strategy 2: Percentage of LCSP (100%) - always 100% affordable
+        # Strategy 2: Percentage of LCSP - smallest whole percent that is 100% affordable
+        lcsp_solution = solutions['percentage_lcsp']
         lcsp_result = self.calculate_strategy(
             strategy_type='percentage_lcsp',
-            lcsp_percentage=100,
+            lcsp_percentage=lcsp_solution.minimum_base or 100,
         )
         lcsp_result['strategy_type'] = 'percentage_lcsp'
         lcsp_result = self.calculate_with_affordability(lcsp_result, safe_harbor)
+        if not lcsp_result['affordability'].get('all_affordable', False):
+            lcsp_result = self.calculate_strategy(strategy_type='percentage_lcsp', lcsp_percentage=100)
+            lcsp_result['strategy_type'] = 'percentage_lcsp'
+            lcsp_result = self.calculate_with_affordability(lcsp_result, safe_harbor)
+        lcsp_result['affordability_solution'] = lcsp_solution.to_dict()
         results.append(lcsp_result)
 
         # Strategy 3: FPL Safe Harbor - guaranteed affordable using FPL threshold
@@ -574,13 +631,16 @@ class StrategyService:
         }
 
     def _get_employee_row(self, employee_id: str) -> Optional[Dict]:
-        """Get employee row from census by ID."""
-        for col in ['employee_id', 'Employee Number', 'employee_number']:
-            if col in self.census_df.columns:
-                matches = self.census_df[self.census_df[col].astype(str) == str(employee_id)]
-                if not matches.empty:
-                    return matches.iloc[0].to_dict()
-        return None
+        """Get employee row from census by ID (index built once, O(1) lookups)."""
+        if self._employee_rows is None:
+            # First match wins, checking ID columns in priority order
+            self._employee_rows = {}
+            records = self.census_df.to_dict('records')
+            for col in ['employee_id', 'Employee Number', 'employee_number']:
+                if col in self.census_df.columns:
+                    for record in records:
+                        self._employee_rows.setdefault(str(record[col]), record)
+        return self._employee_rows.get(str(employee_id))
 
     def _parse_income(self, value) -> Optional[float]:
         """Parse income value from various formats."""
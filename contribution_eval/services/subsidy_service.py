@@ -5,11 +5,12 @@ Provides subsidy eligibility calculations for the Subsidy-optimized mode.
 Uses subsidy_utils for unified eligibility logic.
 """
 
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any
+import numpy as np
 import pandas as pd
 import logging
 
-from subsidy_utils import is_subsidy_eligible
+from subsidy_utils import FAMILY_STATUS_HOUSEHOLD_SIZE, is_subsidy_eligible_array
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +43,8 @@ class SubsidyService:
         """
         Analyze subsidy eligibility for entire workforce under a strategy.
 
-        Uses subsidy_utils.is_subsidy_eligible for unified eligibility logic.
+        Uses subsidy_utils.is_subsidy_eligible_array, the vectorized form of
+        is_subsidy_eligible, so the whole workforce is evaluated in one pass.
 
         Args:
             strategy_result: Output from StrategyService.calculate_strategy()
@@ -61,22 +63,25 @@ class SubsidyService:
         """
         employee_contributions = strategy_result.get('employee_contributions', {})
         results = []
-        medicare_count = 0
 
         # Census-level check: does the census have income data?
         has_income_data = self._census_has_income_data()
 
+        # Gather per-employee inputs, then evaluate the whole workforce at once
+        employee_index = self._build_employee_index()
+        employees = []
+        columns = {name: [] for name in ('monthly_income', 'lcsp', 'contribution', 'age', 'slcsp', 'household_size')}
+
         for emp_id, contrib in employee_contributions.items():
+            emp_data = employee_index(emp_id)
+            if emp_data is None:
+                continue
+
             contribution = contrib.get('monthly_contribution', 0)
             lcsp = lcsp_data.get(emp_id, contrib.get('lcsp_ee_rate', 0))
             # Use actual SLCSP from data - don't estimate
             slcsp = slcsp_data.get(emp_id, contrib.get('slcsp_ee_rate', 0))
 
-            # Get employee data
-            emp_data = self._get_employee_data(emp_id)
-            if emp_data is None:
-                continue
-
             # Get age - prefer from contrib (already calculated by strategy), fall back to census
             age = contrib.get('age')
             if age is None:
@@ -90,33 +95,38 @@ class SubsidyService:
                 emp_data.get('monthly_income') or emp_data.get('Monthly Income')
             )
 
-            # Use unified eligibility check from subsidy_utils
-            eligibility = is_subsidy_eligible(
-                monthly_income=monthly_income,
-                lcsp=lcsp,
-                contribution=contribution,
-                age=age,
-                slcsp=slcsp,
-                family_status=family_status,
-            )
-
-            # Track Medicare count
-            if eligibility.get('is_medicare', False):
-                medicare_count += 1
-
+            employees.append((emp_id, contrib, contribution))
+            columns['monthly_income'].append(np.nan if monthly_income is None else monthly_income)
+            columns['lcsp'].append(lcsp)
+            columns['contribution'].append(contribution)
+            columns['age'].append(age)
+            columns['slcsp'].append(np.nan if slcsp is None else slcsp)
+            columns['household_size'].append(FAMILY_STATUS_HOUSEHOLD_SIZE.get(family_status, 1))
+
+        # Same checks as subsidy_utils.is_subsidy_eligible, one array op per step
+        eligibility = is_subsidy_eligible_array(**{name: np.array(values, dtype=np.float64) for name, values in columns.items()})
+        eligible = eligibility['eligible'].tolist()
+        reasons = eligibility['reason'].tolist()
+        subsidies = eligibility['subsidy_amount'].tolist()
+        is_medicare = eligibility['is_medicare'].tolist()
+        is_unaffordable = eligibility['is_unaffordable'].tolist()
+        employee_costs = eligibility['employee_cost'].tolist()
+        medicare_count = sum(is_medicare)
+
+        for i, (emp_id, contrib, contribution) in enumerate(employees):
             # Build result record
             result = {
                 'employee_id': emp_id,
                 'name': contrib.get('name', emp_id),
-                'eligible': eligibility.get('eligible', False),
-                'reason': eligibility.get('reason', ''),
-                'subsidy': eligibility.get('subsidy_amount', 0),
-                'is_medicare': eligibility.get('is_medicare', False),
+                'eligible': eligible[i],
+                'reason': reasons[i],
+                'subsidy': subsidies[i],
+                'is_medicare': is_medicare[i],
             }
 
             # Add additional fields for eligible employees
-            if eligibility.get('eligible', False):
-                subsidy = eligibility.get('subsidy_amount', 0)
+            if eligible[i]:
+                subsidy = subsidies[i]
                 better_option = 'Subsidy' if subsidy > contribution else 'ICHRA'
                 result.update({
                     'ichra_contribution': contribution,
@@ -125,8 +135,8 @@ class SubsidyService:
                 })
 
             # Add ICHRA cost for affordable employees
-            if not eligibility.get('is_unaffordable', True) and not eligibility.get('is_medicare', False):
-                result['ichra_cost'] = eligibility.get('employee_cost', 0)
+            if not is_unaffordable[i] and not is_medicare[i]:
+                result['ichra_cost'] = employee_costs[i]
 
             results.append(result)
 
@@ -199,12 +209,32 @@ class SubsidyService:
 
     def _get_employee_data(self, employee_id: str) -> Optional[Dict]:
         """Get employee data from census by ID."""
-        for col in ['employee_id', 'Employee Number', 'employee_number']:
-            if col in self.census_df.columns:
-                matches = self.census_df[self.census_df[col].astype(str) == str(employee_id)]
-                if not matches.empty:
-                    return matches.iloc[0].to_dict()
-        return None
+        return self._build_employee_index()(employee_id)
+
+    def _build_employee_index(self) -> Callable[[str], Optional[Dict]]:
+        """
+        Index the census by employee ID once for repeated lookups.
+
+        Returns a lookup with _get_employee_data's matching rules: ID columns
+        are tried in order and the first matching row wins.
+        """
+        id_columns = [col for col in ['employee_id', 'Employee Number', 'employee_number'] if col in self.census_df.columns]
+        records = self.census_df.to_dict('records')
+        positions = []
+        for col in id_columns:
+            position = {}
+            for i, value in enumerate(self.census_df[col].astype(str)):
+                position.setdefault(value, i)
+            positions.append(position)
+
+        def lookup(employee_id: str) -> Optional[Dict]:
+            key = str(employee_id)
+            for position in positions:
+                if key in position:
+                    return records[position[key]]
+            return None
+
+        return lookup
 
     def _parse_income(self, value) -> Optional[float]:
         """Parse income value from various formats."""
@@ -17,6 +17,11 @@ from .calculations import (
     calculate_contribution_preview,
 )
 
+from .result_frame import (
+    build_result_frame,
+    join_census,
+)
+
 __all__ = [
     'CONTRIBUTION_EVAL_CSS',
     'format_currency',
@@ -27,4 +32,6 @@ __all__ = [
     'calculate_age_band',
     'build_census_context',
     'calculate_contribution_preview',
+    'build_result_frame',
+    'join_census',
 ]
@@ -0,0 +1,139 @@
+"""
+Columnar view of a strategy result.
+
+calculate_strategy() returns employee_contributions as {emp_id: {...}} and
+the affordability / subsidy analyses add their own per-employee records.
+build_result_frame() lines all three up in one DataFrame indexed by
+employee_id, so the breakdown tabs, metrics grid and exports join and
+aggregate with pandas instead of looking employees up one at a time.
+
+Columns:
+- Contribution columns keep the names used in employee_contributions
+  (monthly_contribution, lcsp_ee_rate, is_medicare, ...)
+- Affordability columns are prefixed 'aff_' (aff_is_affordable, aff_gap, ...)
+- Subsidy columns are prefixed 'subsidy_' (subsidy_eligible, subsidy_subsidy, ...)
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+from contribution_eval.utils.calculations import calculate_age_band
+
+# Contribution columns every frame carries, with the default used when an
+# employee's record omits them (Medicare rows carry only a few keys)
+CONTRIBUTION_COLUMNS = {
+    'name': None,
+    'age': None,
+    'state': '',
+    'family_status': 'EE',
+    'rating_area': '',
+    'is_medicare': False,
+    'monthly_contribution': 0.0,
+    'annual_contribution': 0.0,
+    'lcsp_ee_rate': 0.0,
+    'slcsp_ee_rate': None,
+    'lcsp_tier_premium': 0.0,
+    'current_er_contribution': 0.0,
+    'monthly_income': None,
+}
+
+AFFORDABILITY_PREFIX = 'aff_'
+SUBSIDY_PREFIX = 'subsidy_'
+
+
+def build_result_frame(
+    strategy_result: Dict[str, Any],
+    affordability_data: Optional[Dict[str, Any]] = None,
+    subsidy_data: Optional[Dict[str, Any]] = None,
+) -> pd.DataFrame:
+    """
+    Build the per-employee result frame for a strategy.
+
+    Args:
+        strategy_result: Output of StrategyService.calculate_strategy()
+        affordability_data: Affordability analysis with 'employee_affordability'
+            ({emp_id: {...}}), e.g. strategy_result['affordability']
+        subsidy_data: Subsidy analysis with 'by_employee' ([{employee_id, ...}])
+
+    Returns:
+        DataFrame indexed by employee_id in strategy order, with the
+        contribution columns plus 'age_band', 'has_affordability' and
+        'has_subsidy' flags and any aff_/subsidy_ columns available
+    """
+    employee_contributions = strategy_result.get('employee_contributions', {}) or {}
+
+    frame = pd.DataFrame.from_dict(employee_contributions, orient='index')
+    frame.index = frame.index.astype(str)
+    frame.index.name = 'employee_id'
+
+    for column, default in CONTRIBUTION_COLUMNS.items():
+        if column not in frame.columns:
+            frame[column] = default
+        elif default is not None:
+            frame[column] = frame[column].where(frame[column].notna(), default)
+
+    frame['name'] = frame['name'].where(frame['name'].notna(), pd.Series(frame.index, index=frame.index))
+    frame['family_status'] = frame['family_status'].astype(str).str.upper()
+    frame['is_medicare'] = frame['is_medicare'].astype(bool)
+    frame['age_band'] = pd.to_numeric(frame['age'], errors='coerce').fillna(30).map(calculate_age_band)
+
+    employee_affordability = (affordability_data or {}).get('employee_affordability') or {}
+    frame['has_affordability'] = frame.index.isin([str(k) for k in employee_affordability])
+    if employee_affordability:
+        affordability = pd.DataFrame.from_dict(employee_affordability, orient='index')
+        affordability.index = affordability.index.astype(str)
+        frame = frame.join(affordability.add_prefix(AFFORDABILITY_PREFIX))
+
+    by_employee = (subsidy_data or {}).get('by_employee') or []
+    subsidy_ids = [str(e['employee_id']) for e in by_employee if e.get('employee_id') is not None]
+    frame['has_subsidy'] = frame.index.isin(subsidy_ids)
+    if subsidy_ids:
+        subsidy = pd.DataFrame([e for e in by_employee if e.get('employee_id') is not None])
+        subsidy['employee_id'] = subsidy_ids
+        # First record wins, as the old linear scan did
+        subsidy = subsidy.drop_duplicates('employee_id').set_index('employee_id').drop(columns='name', errors='ignore')
+        frame = frame.join(subsidy.add_prefix(SUBSIDY_PREFIX))
+
+    return frame
+
+
+def join_census(
+    frame: pd.DataFrame,
+    census_df: pd.DataFrame,
+    columns: Iterable[str],
+    id_column: str = 'employee_id',
+) -> pd.DataFrame:
+    """
+    Left-join census columns onto a result frame by employee_id.
+
+    Columns missing from the census come back as all-NaN, and duplicate
+    census IDs keep their first row.
+
+    Args:
+        frame: Output of build_result_frame()
+        census_df: Census DataFrame
+        columns: Census columns to bring across
+        id_column: Census employee ID column
+
+    Returns:
+        frame with the requested census columns added
+    """
+    columns = list(columns)
+    if census_df is None or id_column not in census_df.columns:
+        census = pd.DataFrame(columns=columns, dtype=object)
+    else:
+        census = census_df.assign(**{id_column: census_df[id_column].astype(str)})
+        census = census.drop_duplicates(id_column).set_index(id_column).reindex(columns=columns)
+    # Columns the frame already has (e.g. monthly_income) come across as <name>_census
+    return frame.join(census, rsuffix='_census')
+
+
+def is_true(series: pd.Series) -> pd.Series:
+    """Element-wise truthiness of a column that may hold None/NaN."""
+    return series.where(series.notna(), False).astype(bool)
+
+
+def is_false(series: pd.Series) -> pd.Series:
+    """Element-wise 'value is False' (None/NaN are neither true nor false)."""
+    return series.notna() & ~is_true(series)
@@ -105,6 +105,51 @@ class StrategyConfig:
                 self.name = "Subsidy-Optimized (Maximize Subsidy Eligibility)"
 
 
+FAMILY_STATUS_ORDER = ('EE', 'ES', 'EC', 'F')
+
+
+@dataclass
+class WorkforceArrays:
+    """
+    Per-employee inputs as parallel NumPy arrays (struct of arrays).
+
+    Built once from the census and LCSP cache so vectorized evaluators
+    (scenario sweeps, affordability solvers) never re-scan the census.
+    Row i of every array describes the same employee; employee IDs are
+    de-duplicated the same way calculate_strategy() does (last row wins).
+
+    Missing values: slcsp and monthly_income are NaN when unavailable.
+    """
+    employee_ids: np.ndarray        # str (object)
+    names: np.ndarray               # str (object)
+    age: np.ndarray                 # int16
+    age_ratio: np.ndarray           # float64, ACA 3:1 curve ratio (age clamped 0-64)
+    family_status: np.ndarray       # str (object), normalized to EE/ES/EC/F
+    family_status_code: np.ndarray  # int8 index into FAMILY_STATUS_ORDER
+    state: np.ndarray               # str (object)
+    lcsp: np.ndarray                # float64, LCSP EE rate (0 if unknown)
+    slcsp: np.ndarray               # float64, NaN if unknown
+    monthly_income: np.ndarray      # float64, NaN if unknown
+    is_medicare: np.ndarray         # bool, age >= 65
+
+    def __len__(self) -> int:
+        return len(self.employee_ids)
+
+    @property
+    def has_income(self) -> np.ndarray:
+        """Boolean mask of employees with usable (positive) income."""
+        return np.isfinite(self.monthly_income) & (self.monthly_income > 0)
+
+    def family_multiplier_vector(self, multipliers: Dict[str, float]) -> np.ndarray:
+        """Map a family-multiplier dict onto every employee."""
+        lookup = np.array([multipliers.get(fs, 1.0) for fs in FAMILY_STATUS_ORDER], dtype=np.float64)
+        return lookup[self.family_status_code]
+
+    def index_of(self) -> Dict[str, int]:
+        """Employee ID -> row index."""
+        return {emp_id: i for i, emp_id in enumerate(self.employee_ids)}
+
+
 class ContributionStrategyCalculator:
     """
     Calculate contributions for different strategy types.
@@ -125,6 +170,7 @@ class ContributionStrategyCalculator:
         self.db = db
         self.census_df = census_df
         self._lcsp_cache = lcsp_cache  # Can be pre-populated to avoid repeated queries
+        self._workforce_arrays = None  # Built lazily by get_workforce_arrays()
         # Determine ALE status at initialization (used for affordability requirements)
         self.is_ale = self._is_ale_employer()
 
@@ -253,6 +299,62 @@ class ContributionStrategyCalculator:
         """
         return self._get_employee_lcsps()
 
+    def get_workforce_arrays(self) -> WorkforceArrays:
+        """
+        Get per-employee inputs as parallel arrays (built once, then cached).
+
+        Joins census age/family status/income with the LCSP cache in a single
+        pass, using the same parsing helpers as the strategy calculations.
+        """
+        if self._workforce_arrays is not None:
+            return self._workforce_arrays
+
+        employee_lcsps = self._get_employee_lcsps()
+        status_index = {fs: i for i, fs in enumerate(FAMILY_STATUS_ORDER)}
+
+        rows = {}
+        for _, emp in self.census_df.iterrows():
+            emp_id = str(emp.get('employee_id') or emp.get('Employee Number', ''))
+            emp_age = self._get_employee_age(emp)
+            family_status = str(emp.get('family_status') or emp.get('Family Status', 'EE')).upper()
+            if family_status not in status_index:
+                family_status = 'EE'
+            monthly_income, has_income = self._parse_employee_income(emp)
+            lcsp_data = employee_lcsps.get(emp_id, {})
+            slcsp = lcsp_data.get('slcsp_ee_rate')
+
+            rows[emp_id] = (
+                self._get_employee_name(emp, emp_id),
+                emp_age,
+                ACA_AGE_CURVE.get(min(max(emp_age, 0), 64), 1.0),
+                family_status,
+                str(emp.get('state') or emp.get('Home State', '')).upper(),
+                float(lcsp_data.get('lcsp_ee_rate', 0) or 0),
+                float(slcsp) if slcsp is not None else np.nan,
+                monthly_income if has_income else np.nan,
+            )
+
+        ids = list(rows.keys())
+        names, ages, ratios, statuses, states, lcsps, slcsps, incomes = (
+            zip(*rows.values()) if rows else ([],) * 8
+        )
+        age_array = np.array(ages, dtype=np.int16)
+
+        self._workforce_arrays = WorkforceArrays(
+            employee_ids=np.array(ids, dtype=object),
+            names=np.array(names, dtype=object),
+            age=age_array,
+            age_ratio=np.array(ratios, dtype=np.float64),
+            family_status=np.array(statuses, dtype=object),
+            family_status_code=np.array([status_index[fs] for fs in statuses], dtype=np.int8),
+            state=np.array(states, dtype=object),
+            lcsp=np.array(lcsps, dtype=np.float64),
+            slcsp=np.array(slcsps, dtype=np.float64),
+            monthly_income=np.array(incomes, dtype=np.float64),
+            is_medicare=age_array >= MEDICARE_ELIGIBILITY_AGE,
+        )
+        return self._workforce_arrays
+
     def calculate_strategy(self, config: StrategyConfig) -> Dict[str, Any]:
         """
         Calculate contributions for all employees based on strategy.
@@ -0,0 +1,305 @@
+"""
+Total Cost of Care Engine
+
+Ranks plans by what a household can expect to spend in a year: premium plus
+expected out-of-pocket (OOP) cost for a utilization profile.
+
+Each plan's deductible, MOOP and per-service copay / coinsurance (from
+CostEstimatorQueries) are compiled once into arrays (CostSharingArrays).
+Households are described as service units per member (household_utilization),
+so every household is evaluated against every plan with a few matrix products
+instead of a loop over plans.
+
+Cost model, per member and plan:
+- Services with a copay or coinsurance not subject to the deductible cost
+  their cost share from the first visit
+- Allowed amounts of deductible services count toward the deductible; the
+  remainder is charged at the service's cost share (pro rata across services)
+- Each member is capped at the individual MOOP and the household at the
+  family MOOP (2x individual, the ACA family aggregate)
+
+Separate drug deductibles are folded into the medical deductible. Services a
+plan has no cost-sharing row for go to the deductible, then DEFAULT_COINSURANCE.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from constants import (
+    ACA_MAX_OOP_2026,
+    COST_OF_CARE_SERVICES,
+    DEFAULT_COINSURANCE,
+    SERVICE_ALLOWED_COSTS,
+    UTILIZATION_PROFILES,
+)
+from database import DatabaseConnection
+from queries import CostEstimatorQueries
+
+# Benefit name fragments (lowercase) per service; more specific patterns first
+# ('non-preferred brand drugs' also contains 'preferred brand')
+BENEFIT_SERVICE_PATTERNS = (
+    ('non_preferred_rx', 'non-preferred brand'),
+    ('preferred_rx', 'preferred brand'),
+    ('generic_rx', 'generic drug'),
+    ('specialty_rx', 'specialty drug'),
+    ('pcp', 'primary care'),
+    ('specialist', 'specialist visit'),
+    ('er', 'emergency room'),
+    ('urgent_care', 'urgent care'),
+    ('mental_health', 'mental/behavioral health outpatient'),
+    ('mental_health', 'mental health outpatient'),
+    ('inpatient', 'inpatient hospital'),
+    ('outpatient_facility', 'outpatient facility'),
+)
+
+# Deductible / MOOP row types in order of preference
+_DEDUCTIBLE_TYPES = ('combined medical and drug ehb deductible', 'medical ehb deductible')
+_MOOP_TYPES = ('maximum out of pocket for medical and drug ehb benefits', 'maximum out of pocket for medical ehb')
+
+_AMOUNT = r'([\d,]+(?:\.\d+)?)'
+
+
+@dataclass
+class CostSharingArrays:
+    """
+    Cost-sharing parameters for a set of plans as arrays.
+
+    Row p of every array is plan_ids[p]; column s of the (plans, services)
+    arrays is services[s].
+    """
+    plan_ids: np.ndarray              # str (object)
+    services: tuple
+    deductible: np.ndarray            # float64, individual in-network deductible
+    moop: np.ndarray                  # float64, individual in-network MOOP
+    family_moop: np.ndarray           # float64
+    copay: np.ndarray                 # float64 (plans, services), per unit
+    coinsurance: np.ndarray           # float64 (plans, services), 0-1
+    subject_to_deductible: np.ndarray  # bool (plans, services)
+
+    def __len__(self) -> int:
+        return len(self.plan_ids)
+
+
+def classify_benefits(benefits: pd.Series) -> pd.Series:
+    """Service key for each benefit name (None for benefits the engine doesn't price)."""
+    lowered = benefits.astype('string').str.lower().fillna('')
+    service = pd.Series([None] * len(benefits), index=benefits.index, dtype=object)
+    for key, pattern in reversed(BENEFIT_SERVICE_PATTERNS):
+        service = service.mask(lowered.str.contains(pattern, regex=False), key)
+    return service
+
+
+def _parse_cost_share(values: pd.Series, percent: bool):
+    """
+    Parse RBIS copay / coinsurance strings.
+
+    "$30.00", "30 Copay after deductible", "No Charge" (0) for copays;
+    "20.00%", "20% Coinsurance after deductible", "No Charge" for coinsurance.
+    "Not Applicable" and unparseable values are NaN.
+
+    Returns:
+        (amounts, after_deductible) as numpy arrays
+    """
+    text = values.astype('string').str.strip().str.lower().fillna('')
+    if percent:
+        amount = pd.to_numeric(text.str.extract(r'([\d.]+)\s*%')[0], errors='coerce') / 100
+    else:
+        # Pure coinsurance text in the copay column isn't a copay
+        is_percent = text.str.contains('%', regex=False) & ~text.str.contains('copay', regex=False)
+        amount = pd.to_numeric(text.str.extract(_AMOUNT)[0].str.replace(',', '', regex=False), errors='coerce')
+        amount = amount.mask(is_percent)
+    amount = amount.mask(text.str.startswith('no charge'), 0.0)
+    after_deductible = text.str.contains('deductible', regex=False)
+    return amount.to_numpy(dtype=float), after_deductible.to_numpy(dtype=bool)
+
+
+def _pick_amounts(ded_moop_df: pd.DataFrame, plan_index: pd.Index, types: Sequence[str]) -> np.ndarray:
+    """Per-plan amount from the first preferred row type that has a number."""
+    result = np.full(len(plan_index), np.nan)
+    if ded_moop_df is None or ded_moop_df.empty:
+        return result
+    kinds = ded_moop_df['moop_ded_type'].astype('string').str.lower().fillna('')
+    amounts = pd.to_numeric(
+        ded_moop_df['individual_ded_moop_amount'].astype('string').str.extract(_AMOUNT)[0]
+        .str.replace(',', '', regex=False), errors='coerce')
+    for kind in reversed(types):
+        rows = kinds.str.startswith(kind) & amounts.notna()
+        positions = plan_index.get_indexer(ded_moop_df.loc[rows, 'plan_id'].astype(str))
+        found = positions >= 0
+        result[positions[found]] = amounts[rows].to_numpy(dtype=float)[found]
+    return result
+
+
+def compile_cost_sharing(
+    plan_ids: Sequence[str],
+    copay_df: Optional[pd.DataFrame],
+    ded_moop_df: Optional[pd.DataFrame],
+    default_coinsurance: float = DEFAULT_COINSURANCE,
+) -> CostSharingArrays:
+    """
+    Compile cost-sharing rows into arrays.
+
+    Args:
+        plan_ids: Plans to compile, in output order
+        copay_df: CostEstimatorQueries.get_plan_copays() rows
+            (hios_plan_id, benefit, copay, coinsurance)
+        ded_moop_df: CostEstimatorQueries.get_plan_deductible_and_moop() rows
+            (plan_id, moop_ded_type, individual_ded_moop_amount)
+        default_coinsurance: Coinsurance after the deductible for services with no row
+
+    Returns:
+        CostSharingArrays for plan_ids
+    """
+    plan_index = pd.Index([str(p) for p in plan_ids])
+    services = COST_OF_CARE_SERVICES
+    n_plans, n_services = len(plan_index), len(services)
+
+    copay = np.zeros((n_plans, n_services))
+    coinsurance = np.full((n_plans, n_services), float(default_coinsurance))
+    subject = np.ones((n_plans, n_services), dtype=bool)
+
+    if copay_df is not None and not copay_df.empty:
+        rows = copay_df.assign(service=classify_benefits(copay_df['benefit']))
+        rows = rows[rows['service'].notna()].drop_duplicates(['hios_plan_id', 'service'])
+        copay_amount, copay_after = _parse_cost_share(rows['copay'], percent=False)
+        coins_amount, coins_after = _parse_cost_share(rows['coinsurance'], percent=True)
+        known = ~(np.isnan(copay_amount) & np.isnan(coins_amount))
+
+        plan_pos = plan_index.get_indexer(rows['hios_plan_id'].astype(str))
+        service_pos = pd.Index(services).get_indexer(rows['service'])
+        keep = known & (plan_pos >= 0)
+        p, s = plan_pos[keep], service_pos[keep]
+        copay[p, s] = np.nan_to_num(copay_amount[keep])
+        coinsurance[p, s] = np.nan_to_num(coins_amount[keep])
+        subject[p, s] = copay_after[keep] | coins_after[keep]
+
+    deductible = np.nan_to_num(_pick_amounts(ded_moop_df, plan_index, _DEDUCTIBLE_TYPES))
+    moop = _pick_amounts(ded_moop_df, plan_index, _MOOP_TYPES)
+    moop = np.where(np.isnan(moop), ACA_MAX_OOP_2026['individual'], moop)
+
+    return CostSharingArrays(
+        plan_ids=plan_index.to_numpy(dtype=object),
+        services=services,
+        deductible=deductible,
+        moop=moop,
+        family_moop=moop * 2,
+        copay=copay,
+        coinsurance=coinsurance,
+        subject_to_deductible=subject,
+    )
+
+
+def load_cost_sharing(db: DatabaseConnection, plan_ids: Sequence[str]) -> CostSharingArrays:
+    """Fetch and compile cost sharing for plan_ids (two queries for all plans)."""
+    plan_ids = list(plan_ids)
+    copay_df = CostEstimatorQueries.get_plan_copays(db, plan_ids)
+    ded_moop_df = CostEstimatorQueries.get_plan_deductible_and_moop(db, plan_ids)
+    return compile_cost_sharing(plan_ids, copay_df, ded_moop_df)
+
+
+def household_utilization(
+    households: Sequence[Sequence[Union[str, Dict[str, float]]]],
+    services: Sequence[str] = COST_OF_CARE_SERVICES,
+) -> np.ndarray:
+    """
+    Service units per household member.
+
+    Args:
+        households: One list per household with a profile name (from
+            UTILIZATION_PROFILES) or {service: units} dict per member
+        services: Service column order
+
+    Returns:
+        float64 array (households, max members, services); missing members are 0
+    """
+    max_members = max((len(members) for members in households), default=0)
+    units = np.zeros((len(households), max(max_members, 1), len(services)))
+    column = {service: i for i, service in enumerate(services)}
+    for h, members in enumerate(households):
+        for m, profile in enumerate(members):
+            if isinstance(profile, str):
+                if profile not in UTILIZATION_PROFILES:
+                    raise ValueError(f"Unknown utilization profile: {profile}")
+                profile = UTILIZATION_PROFILES[profile]
+            for service, count in profile.items():
+                units[h, m, column[service]] = count
+    return units
+
+
+def expected_oop(
+    cost_sharing: CostSharingArrays,
+    utilization: np.ndarray,
+    allowed_costs: Optional[Dict[str, float]] = None,
+) -> np.ndarray:
+    """
+    Expected annual out-of-pocket cost for every household under every plan.
+
+    Args:
+        cost_sharing: Compiled plan parameters
+        utilization: (households, members, services) units from household_utilization()
+        allowed_costs: {service: allowed amount per unit} (default SERVICE_ALLOWED_COSTS)
+
+    Returns:
+        float64 array (households, plans)
+    """
+    if allowed_costs is None:
+        allowed_costs = SERVICE_ALLOWED_COSTS
+    households, members, n_services = utilization.shape
+    if n_services != len(cost_sharing.services):
+        raise ValueError("utilization must have one column per cost_sharing service")
+
+    unit_cost = np.array([float(allowed_costs.get(s, 0)) for s in cost_sharing.services])
+    # Member's share of one unit: copay, plus coinsurance on the rest, never more than the allowed amount
+    unit_share = np.minimum(
+        unit_cost,
+        cost_sharing.copay + cost_sharing.coinsurance * np.maximum(unit_cost - cost_sharing.copay, 0.0),
+    )
+    subject = cost_sharing.subject_to_deductible
+
+    units = utilization.reshape(households * members, n_services)
+    first_dollar = units @ np.where(subject, 0.0, unit_share).T         # (member, plan)
+    deductible_allowed = (units * unit_cost) @ subject.T.astype(float)
+    after_deductible_full = units @ np.where(subject, unit_share, 0.0).T
+
+    paid_to_deductible = np.minimum(deductible_allowed, cost_sharing.deductible)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        remaining = np.where(deductible_allowed > 0,
+                             (deductible_allowed - paid_to_deductible) / deductible_allowed, 0.0)
+    member_oop = np.minimum(first_dollar + paid_to_deductible + remaining * after_deductible_full,
+                            cost_sharing.moop)
+    household_oop = member_oop.reshape(households, members, -1).sum(axis=1)
+    return np.minimum(household_oop, cost_sharing.family_moop)
+
+
+def total_cost_of_care(
+    cost_sharing: CostSharingArrays,
+    annual_premiums: np.ndarray,
+    utilization: np.ndarray,
+    allowed_costs: Optional[Dict[str, float]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Premium plus expected OOP per household and plan, with plans ranked.
+
+    Args:
+        cost_sharing: Compiled plan parameters
+        annual_premiums: (plans,) or (households, plans) annual premium the
+            household pays; NaN for plans not available to a household
+        utilization: (households, members, services) units
+
+    Returns:
+        {'premium', 'oop', 'total': (households, plans) arrays,
+         'ranking': (households, plans) plan positions, lowest total first (unavailable last)}
+    """
+    oop = expected_oop(cost_sharing, utilization, allowed_costs)
+    premium = np.broadcast_to(np.asarray(annual_premiums, dtype=np.float64), oop.shape)
+    total = premium + oop
+    return {
+        'premium': premium,
+        'oop': oop,
+        'total': total,
+        'ranking': np.argsort(total, axis=1, kind='stable'),
+    }
+
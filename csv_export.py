@@ -0,0 +1,212 @@
+"""
+CSV Export Pipeline
+
+Builds census-with-analysis downloads column-wise instead of row by row:
+the analysis is flattened into a DataFrame once, joined to the census by
+employee_id, and the result is encoded to CSV in fixed-size row chunks so a
+large census never holds a list of row dicts plus a full CSV string plus
+its encoded copy at the same time.
+
+Used by the Export results census export and the dashboard rate-detail
+downloads.
+"""
+
+import io
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+import pandas as pd
+
+# Rows encoded per chunk
+CSV_CHUNK_ROWS = 5000
+
+# (output column, census columns in priority order, default when none exist)
+CENSUS_IDENTITY_COLUMNS = [
+    ('employee_id', ('employee_id', 'Employee Number'), ''),
+    ('first_name', ('first_name', 'First Name'), ''),
+    ('last_name', ('last_name', 'Last Name'), ''),
+    ('age', ('age',), 0),
+    ('family_status', ('family_status', 'Family Status'), 'EE'),
+    ('state', ('state', 'Home State'), ''),
+    ('zip', ('zip_code', 'Home Zip'), ''),
+    ('county', ('county',), ''),
+    ('rating_area', ('rating_area_id',), ''),
+]
+
+
+def first_column(df: pd.DataFrame, names: Sequence[str], default: Any = '') -> pd.Series:
+    """
+    Return the first of `names` present in df, or a constant column.
+
+    Mirrors row.get('a', row.get('b', default)): an existing column wins even
+    where its value is missing.
+    """
+    for name in names:
+        if name in df.columns:
+            return df[name]
+    return pd.Series(default, index=df.index, dtype=object if isinstance(default, str) else None)
+
+
+def numeric_column(df: pd.DataFrame, name: str, fill: Optional[float] = 0) -> pd.Series:
+    """Numeric census column with missing/unparseable values filled (None leaves NaN)."""
+    if name not in df.columns:
+        return pd.Series(fill if fill is not None else float('nan'), index=df.index, dtype=float)
+    values = pd.to_numeric(df[name], errors='coerce')
+    return values if fill is None else values.fillna(fill)
+
+
+def census_identity_frame(census_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Employee identity columns shared by the rate-detail exports.
+
+    Returns:
+        DataFrame aligned with census_df.index: employee_id, first_name,
+        last_name, age (int, 0 when missing), family_status, state, zip,
+        county, rating_area
+    """
+    frame = pd.DataFrame(index=census_df.index)
+    for column, names, default in CENSUS_IDENTITY_COLUMNS:
+        frame[column] = first_column(census_df, names, default)
+    frame['age'] = numeric_column(census_df, 'age').astype(int)
+    return frame
+
+
+def flatten_records(
+    records: Dict[Any, Dict[str, Any]],
+    fields: Dict[str, str],
+    path: Sequence[str] = (),
+) -> pd.DataFrame:
+    """
+    Flatten {employee_id: {...nested...}} into one column per field.
+
+    Args:
+        records: Per-employee analysis dicts
+        fields: {output column: key inside the record (after following path)}
+        path: Keys to descend before reading fields (e.g. ('ichra_analysis',))
+
+    Returns:
+        DataFrame indexed by the record keys; missing values are NaN
+    """
+    rows = {}
+    for emp_id, record in (records or {}).items():
+        for key in path:
+            record = (record or {}).get(key) or {}
+        rows[emp_id] = {column: record.get(key) for column, key in fields.items()}
+
+    frame = pd.DataFrame.from_dict(rows, orient='index', columns=list(fields))
+    return frame.apply(pd.to_numeric, errors='coerce') if not frame.empty else frame
+
+
+def join_on_employee(
+    census_df: pd.DataFrame,
+    analysis: pd.DataFrame,
+    id_column: str = 'employee_id',
+) -> pd.DataFrame:
+    """
+    Look up each census row's analysis columns by employee ID.
+
+    IDs are matched as-is (same semantics as dict.get on the analysis keys);
+    unmatched rows get NaN. The result is aligned with census_df.index.
+    """
+    ids = first_column(census_df, (id_column,), None)
+    matched = analysis.reindex(ids.to_numpy())
+    matched.index = census_df.index
+    return matched
+
+
+def iter_csv_chunks(
+    df: pd.DataFrame,
+    chunk_rows: int = CSV_CHUNK_ROWS,
+    encoding: str = 'utf-8',
+    **to_csv_kwargs,
+) -> Iterator[bytes]:
+    """
+    Yield the CSV encoding of df (header first) in chunks of `chunk_rows` rows.
+
+    Args:
+        df: Frame to export
+        chunk_rows: Rows per chunk
+        encoding: Byte encoding
+        **to_csv_kwargs: Passed to DataFrame.to_csv (index defaults to False)
+    """
+    to_csv_kwargs.setdefault('index', False)
+    yield df.head(0).to_csv(**to_csv_kwargs).encode(encoding)
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield chunk.to_csv(header=False, **to_csv_kwargs).encode(encoding)
+
+
+def csv_download_data(df: pd.DataFrame, chunk_rows: int = CSV_CHUNK_ROWS, **to_csv_kwargs) -> io.BytesIO:
+    """
+    Encode df as CSV into a buffer for st.download_button, one chunk at a time.
+
+    Returns:
+        BytesIO positioned at the start
+    """
+    return write_chunks(iter_csv_chunks(df, chunk_rows, **to_csv_kwargs))
+
+
+def write_chunks(chunks: Iterable[bytes]) -> io.BytesIO:
+    """Collect byte chunks into a rewound BytesIO."""
+    buffer = io.BytesIO()
+    for chunk in chunks:
+        buffer.write(chunk)
+    buffer.seek(0)
+    return buffer
+
+
+# =============================================================================
+# CENSUS WITH CONTRIBUTION ANALYSIS (Export results page)
+# =============================================================================
+
+ICHRA_ANALYSIS_FIELDS = {
+    'ichra_total_premium': 'total_premium',
+    'ichra_employer_contribution': 'employer_contribution',
+    'ichra_employee_cost': 'employee_cost',
+}
+
+
+def build_census_analysis_export(
+    census_df: pd.DataFrame,
+    contribution_analysis: Dict[Any, Dict[str, Any]],
+) -> pd.DataFrame:
+    """
+    Census rows with current contributions, ICHRA analysis and the changes.
+
+    Args:
+        census_df: Employee census
+        contribution_analysis: {employee_id: {'ichra_analysis': {...}}}
+
+    Returns:
+        One row per census row; change columns are blank where either side
+        is missing
+    """
+    analysis = join_on_employee(
+        census_df, flatten_records(contribution_analysis, ICHRA_ANALYSIS_FIELDS, path=('ichra_analysis',))
+    ).reindex(columns=list(ICHRA_ANALYSIS_FIELDS))
+
+    current_ee = numeric_column(census_df, 'current_ee_monthly', fill=None)
+    current_er = numeric_column(census_df, 'current_er_monthly', fill=None)
+    ee_change = analysis['ichra_employee_cost'] - current_ee
+    er_change = analysis['ichra_employer_contribution'] - current_er
+
+    export = pd.DataFrame({
+        'employee_id': first_column(census_df, ('employee_id',), ''),
+        'first_name': first_column(census_df, ('first_name',), ''),
+        'last_name': first_column(census_df, ('last_name',), ''),
+        'age': first_column(census_df, ('age',), ''),
+        'state': first_column(census_df, ('state',), ''),
+        'county': first_column(census_df, ('county',), ''),
+        'rating_area': first_column(census_df, ('rating_area_id',), ''),
+        'family_status': first_column(census_df, ('family_status',), 'EE'),
+        # Current group plan contributions
+        'current_ee_monthly': current_ee,
+        'current_er_monthly': current_er,
+        # ICHRA analysis
+        **{column: analysis[column] for column in ICHRA_ANALYSIS_FIELDS},
+        # Changes
+        'ee_change_monthly': ee_change,
+        'er_change_monthly': er_change,
+        'ee_change_annual': ee_change * 12,
+        'er_change_annual': er_change * 12,
+    })
+    return export.reset_index(drop=True)
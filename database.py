@@ -1,14 +1,39 @@
 """
 Database connection module for ICHRA Calculator
 Connects to PostgreSQL database 'pricing-proposal'
+
+Streamlit is imported only when running inside the app, so DatabaseConnection
+can be used by headless tools (batch CLI, quoting service) without it.
 """
 
+import sys
 import psycopg2
 from psycopg2.extras import RealDictCursor
-import streamlit as st
-from typing import Optional
+from typing import Callable, List, Optional
 import pandas as pd
-from sqlalchemy import create_engine
+
+from dataset_registry import get_dataset_registry
+
+# Called as listener(query, seconds) after every execute_query() (see page_profiler)
+_query_listeners: List[Callable[[str, float], None]] = []
+
+
+def add_query_listener(listener: Callable[[str, float], None]) -> None:
+    """Register a callback timing each execute_query() call."""
+    _query_listeners.append(listener)
+
+
+def remove_query_listener(listener: Callable[[str, float], None]) -> None:
+    """Unregister a callback added with add_query_listener()."""
+    if listener in _query_listeners:
+        _query_listeners.remove(listener)
+
+
+def _show_error(message: str) -> None:
+    """Surface an error in the Streamlit UI when running inside the app."""
+    if 'streamlit' in sys.modules:
+        import streamlit as st
+        st.error(message)
 
 
 class DatabaseConnection:
@@ -74,7 +99,7 @@ class DatabaseConnection:
                     logging.error(f"Database connection error: {e}")
                 else:
                     logging.error(f"Database connection error: {type(e).__name__}")
-                st.error("Database connection error. Please check your configuration.")
+                _show_error("Database connection error. Please check your configuration.")
                 raise
         return self._conn
 
@@ -99,15 +124,33 @@ class DatabaseConnection:
             # Add SSL mode as query parameter if specified
             if self.sslmode:
                 connection_string += f"?sslmode={self.sslmode}"
+            # SQLAlchemy is only needed for pd.read_sql paths - import on first use
+            from sqlalchemy import create_engine
             self._engine = create_engine(connection_string)
         return self._engine
 
+    def read_sql(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+        """
+        Execute a SQL query with pd.read_sql on the SQLAlchemy engine
+
+        Unlike execute_query, numeric (Decimal) columns come back as float.
+
+        Args:
+            query: SQL query string (logical RBIS table names are resolved, see dataset_registry)
+            params: Query parameters (optional)
+
+        Returns:
+            Pandas DataFrame with query results
+        """
+        query = get_dataset_registry().resolve(query, self.connect())
+        return pd.read_sql(query, self.engine, params=params)
+
     def execute_query(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
         """
         Execute a SQL query and return results as DataFrame
 
         Args:
-            query: SQL query string
+            query: SQL query string (logical RBIS table names are resolved, see dataset_registry)
             params: Query parameters (optional)
 
         Returns:
@@ -126,6 +169,8 @@ class DatabaseConnection:
         if connect_time > 0.1:
             logging.info(f"DB QUERY: Connection took {connect_time:.2f}s (slow)")
 
+        query = get_dataset_registry().resolve(query, conn)
+
         try:
             exec_start = time.time()
             with conn.cursor(cursor_factory=RealDictCursor) as cursor:
@@ -148,9 +193,14 @@ class DatabaseConnection:
             logging.error(f"Query execution error: {e}")
             logging.error(f"Query: {query[:200]}...")
             logging.error(f"Params: {params}")
-            st.error(f"Database query error: {e}")
+            _show_error(f"Database query error: {e}")
             conn.rollback()
             raise
+        finally:
+            if _query_listeners:
+                elapsed = time.time() - connect_start
+                for listener in list(_query_listeners):
+                    listener(query, elapsed)
 
     def close(self):
         """Close database connection"""
@@ -158,7 +208,9 @@ class DatabaseConnection:
             self._conn.close()
 
 
-@st.cache_resource
+_cached_connection_factory = None
+
+
 def get_database_connection():
     """
     Get cached database connection for Streamlit app
@@ -166,6 +218,38 @@ def get_database_connection():
     Returns:
         DatabaseConnection instance
     """
+    global _cached_connection_factory
+    if _cached_connection_factory is None:
+        import streamlit as st
+        _cached_connection_factory = st.cache_resource(create_database_connection)
+    return _cached_connection_factory()
+
+
+def create_database_connection() -> DatabaseConnection:
+    """
+    Create a database connection from environment, secrets, or local defaults
+
+    Uncached: use this outside the Streamlit runtime (e.g. batch worker processes).
+
+    With RBIS_PARQUET_DIR set, returns a duckdb_backend.DuckDBConnection that
+    serves the read-only RBIS tables from that Parquet export and sends all
+    other queries to the PostgreSQL connection.
+
+    Returns:
+        DatabaseConnection instance
+    """
+    import os
+
+    db = _create_postgres_connection()
+    parquet_dir = os.environ.get('RBIS_PARQUET_DIR')
+    if parquet_dir:
+        from duckdb_backend import DuckDBConnection
+        return DuckDBConnection(parquet_dir, fallback=db)
+    return db
+
+
+def _create_postgres_connection() -> DatabaseConnection:
+    """PostgreSQL connection settings from environment, secrets, or local defaults."""
     import os
 
     # Option 1: Check Railway/environment variables first
@@ -197,7 +281,8 @@ def get_database_connection():
     # Option 2: Check Streamlit secrets (for Streamlit Cloud)
     # Wrap in try/except because st.secrets throws if no secrets file exists
     try:
-        if hasattr(st, 'secrets') and 'database' in st.secrets:
+        st = sys.modules.get('streamlit')
+        if st is not None and hasattr(st, 'secrets') and 'database' in st.secrets:
             db_secrets = st.secrets['database']
             # Use bracket notation for password - .get() may not work with Streamlit's AttrDict
             password = db_secrets['password'] if 'password' in db_secrets else None
@@ -0,0 +1,187 @@
+"""
+Dataset Registry
+Resolves logical RBIS table names to the tables of the active plan-year load.
+
+Each load of the CMS RBIS public use files lives in its own set of tables,
+named <logical name>_<version> (e.g. rbis_insurance_plan_base_rates_20251019202724).
+SQL in queries.py and the pages uses the logical names (rbis_insurance_plan,
+rbis_insurance_plan_base_rates, ...) and DatabaseConnection rewrites them to
+the active version's tables just before executing.
+
+The active version is the 'rbis' row of the dataset_registry table
+(migrations/005). plan_year_ingest loads a new version into fresh tables while
+the app keeps reading the current ones, then activates it by updating that one
+row, so switching plan years has no read downtime and is undone the same way.
+Each process re-reads the row at most every DATASET_REGISTRY_TTL_SECONDS.
+
+Environment:
+- RBIS_DATASET_VERSION: Use this version and never read the registry table
+- DATASET_REGISTRY_TTL_SECONDS: How often to re-read the active version (default 60)
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+from functools import lru_cache
+from typing import Optional
+
+import psycopg2
+
+logger = logging.getLogger(__name__)
+
+RBIS_DATASET = 'rbis'
+# Version loaded before the registry existed (also the fallback without a registry table)
+DEFAULT_RBIS_VERSION = '20251019202724'
+DEFAULT_TTL_SECONDS = 60.0
+
+# Logical names of the versioned RBIS tables
+RBIS_TABLES = (
+    'rbis_insurance_plan',
+    'rbis_insurance_plan_base_rates',
+    'rbis_insurance_plan_benefit_cost_share',
+    'rbis_insurance_plan_benefits',
+    'rbis_insurance_plan_variant',
+    'rbis_insurance_plan_variant_ddctbl_moop',
+    'rbis_insurance_plan_variant_sbc_scenario',
+    'rbis_state_rating_area',
+)
+
+REGISTRY_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS dataset_registry (
+    dataset text PRIMARY KEY,
+    version text NOT NULL,
+    previous_version text,
+    row_counts jsonb,
+    activated_at timestamptz NOT NULL DEFAULT now()
+)
+"""
+
+_VERSION = re.compile(r'[0-9A-Za-z_]+')
+# Whole identifiers only: rbis_state_rating_area_amended and already-versioned
+# names like rbis_insurance_plan_20251019202724 are left alone
+_LOGICAL_TABLE = re.compile(
+    r'\b(' + '|'.join(sorted(RBIS_TABLES, key=len, reverse=True)) + r')\b'
+)
+
+
+def validate_version(version: str) -> str:
+    """Return version if it can be used as a table-name suffix, else raise ValueError."""
+    if not isinstance(version, str) or not _VERSION.fullmatch(version):
+        raise ValueError(f"Invalid dataset version: {version!r}")
+    return version
+
+
+def versioned_table(logical_name: str, version: str) -> str:
+    """Physical table name for a logical RBIS table in a given version."""
+    if logical_name not in RBIS_TABLES:
+        raise ValueError(f"Not a versioned RBIS table: {logical_name}")
+    return f"{logical_name}_{validate_version(version)}"
+
+
+@lru_cache(maxsize=1024)
+def _rewrite(query: str, version: str) -> str:
+    return _LOGICAL_TABLE.sub(lambda m: f"{m.group(1)}_{version}", query)
+
+
+def read_active_version(conn, dataset: str = RBIS_DATASET) -> Optional[str]:
+    """Version recorded in dataset_registry, or None if there is no table or row yet."""
+    with conn.cursor() as cursor:
+        # to_regclass doesn't fail on a missing table, so the caller's
+        # transaction isn't aborted on unmigrated databases
+        cursor.execute("SELECT to_regclass('dataset_registry') IS NOT NULL")
+        if not cursor.fetchone()[0]:
+            return None
+        cursor.execute("SELECT version FROM dataset_registry WHERE dataset = %s", (dataset,))
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+class DatasetRegistry:
+    """Active RBIS version for this process, re-read from dataset_registry on a TTL."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, pinned_version: Optional[str] = None):
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv('DATASET_REGISTRY_TTL_SECONDS') or DEFAULT_TTL_SECONDS)
+        self.ttl_seconds = ttl_seconds
+        self.pinned_version = validate_version(pinned_version) if pinned_version else None
+        self._version = self.pinned_version or DEFAULT_RBIS_VERSION
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        """Last known active version (does not query the database)."""
+        return self._version
+
+    def table(self, logical_name: str) -> str:
+        """Physical name of a logical RBIS table; other names are returned unchanged."""
+        if logical_name in RBIS_TABLES:
+            return versioned_table(logical_name, self._version)
+        return logical_name
+
+    def resolve(self, query: str, conn=None) -> str:
+        """
+        Rewrite logical RBIS table names in a SQL query to the active version.
+
+        Args:
+            query: SQL using logical table names
+            conn: psycopg2 connection used to re-read the registry once the TTL
+                has passed (None = use the last known version)
+
+        Returns:
+            The query with physical table names
+        """
+        if conn is not None and self._is_stale():
+            self.refresh(conn)
+        return _rewrite(query, self._version)
+
+    def _is_stale(self) -> bool:
+        if self.pinned_version:
+            return False
+        return self._checked_at is None or time.monotonic() - self._checked_at >= self.ttl_seconds
+
+    def refresh(self, conn) -> str:
+        """
+        Re-read the active version from the dataset_registry table.
+
+        Without a registry table (databases not yet migrated) the version stays
+        as it is. Errors are logged and the last known version is kept.
+
+        Returns:
+            The active version
+        """
+        if self.pinned_version:
+            return self._version
+        with self._lock:
+            try:
+                version = read_active_version(conn)
+                if version and version != self._version:
+                    logger.info(f"Dataset registry: RBIS version {self._version} -> {version}")
+                    self._version = validate_version(version)
+            except (psycopg2.Error, ValueError) as e:
+                logger.warning(f"Dataset registry lookup failed, keeping version {self._version}: {e}")
+                if isinstance(e, psycopg2.Error):
+                    conn.rollback()
+            self._checked_at = time.monotonic()
+        return self._version
+
+
+_registry = DatasetRegistry(pinned_version=os.getenv('RBIS_DATASET_VERSION') or None)
+
+
+def get_dataset_registry() -> DatasetRegistry:
+    """The process-wide registry used by DatabaseConnection."""
+    return _registry
+
+
+def rbis_table(logical_name: str) -> str:
+    """Physical name of a logical RBIS table in the active version."""
+    return _registry.table(logical_name)
+
+
+def clear_dataset_registry() -> None:
+    """Forget the active version, so the next query re-reads the registry table."""
+    global _registry
+    _registry = DatasetRegistry(pinned_version=os.getenv('RBIS_DATASET_VERSION') or None)
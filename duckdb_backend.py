@@ -0,0 +1,387 @@
+"""
+Embedded DuckDB/Parquet backend for the read-only RBIS tables
+
+Plan, rate, rating-area and ZIP data doesn't change during a plan year, so
+each app node can serve it from local Parquet files instead of querying the
+remote PostgreSQL database.
+
+- export_rbis_parquet() copies the active version of the RBIS tables (see
+  dataset_registry), zip_to_county_correct, rbis_state_rating_area_amended
+  and HIOS_issuers_pivoted to Parquet, partitioned by state and named by
+  logical table name (see scripts/export_rbis_parquet.py). Re-export after
+  activating a new plan year.
+- DuckDBConnection has DatabaseConnection's execute_query()/read_sql()
+  contract and runs queries.py's SQL against those files. Queries touching
+  any other table go to the fallback DatabaseConnection.
+
+Export layout:
+    <dir>/manifest.json
+    <dir>/<table>/state_code=WI/data_0.parquet   (tables with a state column)
+    <dir>/<table>/data_0.parquet                 (all other tables)
+
+Environment:
+- RBIS_PARQUET_DIR: Serve RBIS queries from this export (see
+  database.create_database_connection)
+
+duckdb is optional and only imported when this backend is used.
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from database import _query_listeners
+from dataset_registry import RBIS_TABLES, get_dataset_registry, versioned_table
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_TABLES = ('rbis_state_rating_area_amended', 'zip_to_county_correct', 'HIOS_issuers_pivoted')
+
+# First column present is the Parquet partition key
+PARTITION_COLUMNS = ('state_code', 'State', 'state')
+# Rows are written in plan order so per-row-group min/max skip most files for plan-ID lookups
+SORT_COLUMNS = ('hios_plan_id', 'plan_id')
+
+EXPORT_CHUNK_ROWS = 100_000
+MANIFEST_FILE = 'manifest.json'
+
+# PostgreSQL information_schema data_type -> DuckDB type (anything else is VARCHAR)
+_PG_TYPES = {
+    'smallint': 'SMALLINT',
+    'integer': 'INTEGER',
+    'bigint': 'BIGINT',
+    'real': 'REAL',
+    'double precision': 'DOUBLE',
+    'boolean': 'BOOLEAN',
+    'date': 'DATE',
+    'timestamp without time zone': 'TIMESTAMP',
+    'timestamp with time zone': 'TIMESTAMPTZ',
+}
+# Unconstrained NUMERIC (premiums, deductibles) - 12 integer digits, 6 decimals
+_DEFAULT_DECIMAL = 'DECIMAL(18, 6)'
+
+_PLACEHOLDER = re.compile(r'%%|%s')
+_TABLE_REF = re.compile(r'\b(?:FROM|JOIN)\s+"?([A-Za-z_]\w*)\b"?(?!\s*\()', re.IGNORECASE)
+_CTE_NAME = re.compile(r'\b([A-Za-z_]\w*)\s+AS\s*\(', re.IGNORECASE)
+
+
+def translate_query(query: str, params: Optional[Sequence] = None) -> Tuple[str, List[Any]]:
+    """
+    Convert a psycopg2 query to DuckDB's parameter style.
+
+    %s becomes ?, %% becomes %, and tuple parameters expand to (?, ?, ...)
+    as psycopg2 adapts them for IN %s. Lists pass through as DuckDB lists.
+    Without params psycopg2 leaves the query untouched, and so does this.
+
+    Raises:
+        ValueError: Named (%(name)s) parameters or a placeholder/param count mismatch
+    """
+    if params is None:
+        return query, []
+    if isinstance(params, dict):
+        raise ValueError("DuckDBConnection supports positional %s parameters only")
+
+    params = list(params)
+    values: List[Any] = []
+    position = 0
+
+    def replace(match):
+        nonlocal position
+        if match.group(0) == '%%':
+            return '%'
+        if position >= len(params):
+            raise ValueError("More %s placeholders than parameters")
+        value = params[position]
+        position += 1
+        if isinstance(value, tuple):
+            values.extend(value)
+            return '(' + ', '.join(['?'] * len(value)) + ')'
+        values.append(value)
+        return '?'
+
+    sql = _PLACEHOLDER.sub(replace, query)
+    if position != len(params):
+        raise ValueError(f"{len(params)} parameters for {position} %s placeholders")
+    return sql, values
+
+
+def referenced_tables(query: str) -> set:
+    """Tables named after FROM/JOIN, excluding CTEs defined in the query."""
+    ctes = {name.lower() for name in _CTE_NAME.findall(query)}
+    return {name for name in _TABLE_REF.findall(query) if name.lower() not in ctes}
+
+
+class DuckDBConnection:
+    """
+    Read-only DatabaseConnection stand-in backed by an RBIS Parquet export.
+
+    Queries whose tables are all in the export run locally; the rest (and
+    connect()/engine for direct psycopg2/SQLAlchemy use) go to fallback.
+    """
+
+    def __init__(self, parquet_dir: str, fallback=None, threads: Optional[int] = None):
+        """
+        Args:
+            parquet_dir: Directory written by export_rbis_parquet()
+            fallback: DatabaseConnection for everything else (None = local only)
+            threads: DuckDB worker threads (default: DuckDB's, one per core)
+        """
+        import duckdb
+
+        self.parquet_dir = Path(parquet_dir)
+        self.fallback = fallback
+        manifest_path = self.parquet_dir / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No RBIS export at {self.parquet_dir} ({MANIFEST_FILE} missing)")
+        self.manifest = json.loads(manifest_path.read_text())
+
+        self._con = duckdb.connect(':memory:')
+        if threads:
+            self._con.execute(f"SET threads = {int(threads)}")
+        for table, info in self.manifest['tables'].items():
+            table_dir = self.parquet_dir / table
+            if info.get('partition_column'):
+                source = f"read_parquet('{table_dir.as_posix()}/*/*.parquet', hive_partitioning = true)"
+            else:
+                source = f"read_parquet('{table_dir.as_posix()}/*.parquet')"
+            self._con.execute(f'CREATE VIEW "{table}" AS SELECT * FROM {source}')
+        self.tables = {table.lower() for table in self.manifest['tables']}
+        logger.info(f"DuckDB backend: {len(self.tables)} tables from {self.parquet_dir} "
+                    f"(exported {self.manifest.get('exported_at')})")
+
+    def is_local(self, query: str) -> bool:
+        """Whether every table the query reads is in the Parquet export."""
+        if self.fallback is None:
+            return True
+        return all(table.lower() in self.tables for table in referenced_tables(query))
+
+    def _fetch(self, query: str, params: Optional[Sequence]) -> Tuple[List[str], List[tuple]]:
+        """Run a query locally; (column names, rows)."""
+        start = time.time()
+        try:
+            sql, values = translate_query(query, params)
+            cursor = self._con.cursor()  # one cursor per call: DuckDB connections aren't shared across threads
+            try:
+                cursor.execute(sql, values)
+                if cursor.description is None:
+                    return [], []
+                return [desc[0] for desc in cursor.description], cursor.fetchall()
+            finally:
+                cursor.close()
+        except Exception as e:
+            logging.error(f"DuckDB query error: {e}")
+            logging.error(f"Query: {query[:200]}...")
+            logging.error(f"Params: {params}")
+            raise
+        finally:
+            if _query_listeners:
+                elapsed = time.time() - start
+                for listener in list(_query_listeners):
+                    listener(query, elapsed)
+
+    def execute_query(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+        """
+        Execute a SQL query and return results as DataFrame
+
+        Same contract as DatabaseConnection.execute_query: psycopg2-style
+        parameters, Python values (Decimal, date, list) in the cells.
+        """
+        if not self.is_local(query):
+            return self.fallback.execute_query(query, params)
+        columns, rows = self._fetch(query, params)
+        return pd.DataFrame(rows, columns=columns)
+
+    def read_sql(self, query: str, params: Optional[Sequence] = None) -> pd.DataFrame:
+        """Same contract as DatabaseConnection.read_sql (Decimal columns come back as float)."""
+        if not self.is_local(query):
+            return self.fallback.read_sql(query, params)
+        columns, rows = self._fetch(query, params)
+        return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+    def connect(self):
+        """psycopg2 connection of the fallback database (the Parquet export is read-only)."""
+        if self.fallback is None:
+            raise RuntimeError("DuckDBConnection has no fallback database for direct connections")
+        return self.fallback.connect()
+
+    @property
+    def engine(self):
+        """SQLAlchemy engine of the fallback database."""
+        if self.fallback is None:
+            raise RuntimeError("DuckDBConnection has no fallback database for SQLAlchemy access")
+        return self.fallback.engine
+
+    def close(self):
+        """Close the DuckDB connection and the fallback connection."""
+        self._con.close()
+        if self.fallback is not None:
+            self.fallback.close()
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def _source_table(table: str, rbis_version: str) -> str:
+    """PostgreSQL table to export a logical table from."""
+    return versioned_table(table, rbis_version) if table in RBIS_TABLES else table
+
+
+def list_export_tables(db, rbis_version: Optional[str] = None) -> List[str]:
+    """Logical names of the RBIS and reference tables that exist in the database."""
+    rbis_version = rbis_version or get_dataset_registry().version
+    physical = {_source_table(table, rbis_version): table for table in RBIS_TABLES + REFERENCE_TABLES}
+    df = db.execute_query(
+        """
+        SELECT table_name
+        FROM information_schema.tables
+        WHERE table_schema = ANY(current_schemas(false))
+            AND table_name = ANY(%s)
+        """,
+        (list(physical),),
+    )
+    return sorted(physical[table] for table in df['table_name'])
+
+
+def _duckdb_columns(db, table: str) -> List[Tuple[str, str]]:
+    """(column, DuckDB type) for a PostgreSQL table, in column order."""
+    df = db.execute_query(
+        """
+        SELECT column_name, data_type, numeric_precision, numeric_scale
+        FROM information_schema.columns
+        WHERE table_schema = ANY(current_schemas(false)) AND table_name = %s
+        ORDER BY ordinal_position
+        """,
+        (table,),
+    )
+    columns = []
+    for row in df.itertuples(index=False):
+        if row.data_type == 'numeric':
+            if pd.notna(row.numeric_precision) and row.numeric_precision <= 38:
+                duck_type = f"DECIMAL({int(row.numeric_precision)}, {int(row.numeric_scale)})"
+            else:
+                duck_type = _DEFAULT_DECIMAL
+        else:
+            duck_type = _PG_TYPES.get(row.data_type, 'VARCHAR')
+        columns.append((row.column_name, duck_type))
+    return columns
+
+
+def _stream_table(db, con, table: str, chunk_rows: int, rbis_version: str) -> None:
+    """Copy one PostgreSQL table into a DuckDB table named by its logical name, chunk by chunk."""
+    source = _source_table(table, rbis_version)
+    columns = _duckdb_columns(db, source)
+    names = [name for name, _ in columns]
+    column_list = ', '.join(f'"{name}"' for name in names)
+    column_defs = ', '.join(f'"{name}" {duck_type}' for name, duck_type in columns)
+    con.execute(f'CREATE OR REPLACE TABLE "{table}" ({column_defs})')
+
+    conn = db.connect()
+    # Named cursor = server-side: the 13.4M-row rates table is streamed, not loaded at once
+    with conn.cursor(name=f"export_{table.lower()}") as cursor:
+        cursor.itersize = chunk_rows
+        cursor.execute(f'SELECT {column_list} FROM "{source}"')
+        while True:
+            batch = cursor.fetchmany(chunk_rows)
+            if not batch:
+                break
+            con.register('chunk', pd.DataFrame(batch, columns=names))
+            con.execute(f'INSERT INTO "{table}" SELECT {column_list} FROM chunk')
+            con.unregister('chunk')
+    conn.rollback()  # end the read transaction the named cursor opened
+
+
+def write_parquet_table(con, table: str, out_dir) -> Dict[str, Any]:
+    """
+    Write a DuckDB table to out_dir/<table> in the export layout.
+
+    Partitioned by the first PARTITION_COLUMNS column it has, rows sorted by
+    plan ID. The previous copy is replaced only once the new files are complete.
+
+    Returns:
+        Manifest entry: {'rows', 'partition_column'}
+    """
+    out_dir = Path(out_dir)
+    names = [row[0] for row in con.execute(f'DESCRIBE "{table}"').fetchall()]
+    partition_column = next((c for c in PARTITION_COLUMNS if c in names), None)
+    sort_column = next((c for c in SORT_COLUMNS if c in names), None)
+    source = f'SELECT * FROM "{table}"' + (f' ORDER BY "{sort_column}"' if sort_column else '')
+
+    staging_dir = out_dir / f".{table}.tmp"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    staging_dir.mkdir(parents=True)
+    if partition_column:
+        con.execute(f"""COPY ({source}) TO '{staging_dir.as_posix()}'
+                        (FORMAT PARQUET, PARTITION_BY ("{partition_column}"), OVERWRITE_OR_IGNORE)""")
+    else:
+        con.execute(f"COPY ({source}) TO '{(staging_dir / 'data_0.parquet').as_posix()}' (FORMAT PARQUET)")
+
+    table_dir = out_dir / table
+    shutil.rmtree(table_dir, ignore_errors=True)
+    staging_dir.rename(table_dir)
+
+    rows = con.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+    return {'rows': rows, 'partition_column': partition_column}
+
+
+def write_manifest(out_dir, tables: Dict[str, Dict[str, Any]],
+                   rbis_version: Optional[str] = None) -> Dict[str, Any]:
+    """Write manifest.json, which DuckDBConnection reads the table list from."""
+    manifest = {
+        'exported_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'rbis_version': rbis_version or get_dataset_registry().version,
+        'tables': tables,
+    }
+    (Path(out_dir) / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def export_rbis_parquet(db, out_dir, tables: Optional[List[str]] = None,
+                        chunk_rows: int = EXPORT_CHUNK_ROWS) -> Dict[str, Any]:
+    """
+    Export the read-only RBIS tables from PostgreSQL to state-partitioned Parquet.
+
+    Args:
+        db: DatabaseConnection to read from
+        out_dir: Export directory (created if missing; tables are replaced)
+        tables: Logical table names (default: list_export_tables())
+        chunk_rows: Rows fetched per round trip
+
+    Returns:
+        The manifest written to out_dir/manifest.json
+    """
+    import duckdb
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # One version for the whole export, even if a new one is activated meanwhile
+    rbis_version = get_dataset_registry().refresh(db.connect())
+    tables = tables or list_export_tables(db, rbis_version)
+
+    exported = {}
+    # Staging goes to a scratch file, not memory: the rates table is several GB
+    scratch = out_dir / '.export.duckdb'
+    con = duckdb.connect(str(scratch))
+    try:
+        for table in tables:
+            start = time.time()
+            _stream_table(db, con, table, chunk_rows, rbis_version)
+            exported[table] = write_parquet_table(con, table, out_dir)
+            con.execute(f'DROP TABLE "{table}"')
+            exported[table]['seconds'] = round(time.time() - start, 2)
+            logger.info(f"Exported {table}: {exported[table]['rows']:,} rows in {exported[table]['seconds']:.1f}s")
+    finally:
+        con.close()
+        for path in (scratch, scratch.with_name(scratch.name + '.wal')):
+            if path.exists():
+                os.remove(path)
+
+    return write_manifest(out_dir, exported, rbis_version)
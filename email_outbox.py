@@ -0,0 +1,511 @@
+"""
+Email Outbox for Canopy
+Asynchronous, persistent delivery queue for proposal emails.
+
+Sending a proposal from the Streamlit page only spools the attachment to disk
+and records a job; a background worker thread delivers it via EmailService,
+retrying with exponential backoff. The page polls job status by ID.
+
+Features:
+- SQLite-backed queue that survives process restarts
+- Attachments streamed to a spool directory (not held in session state)
+  and removed once a job is sent or fails permanently
+- Retry with exponential backoff and jitter
+- Failure notification sent from the worker after the final attempt
+- Status API (get_status) for the Proposal Generator page
+
+Environment:
+- EMAIL_OUTBOX_DIR: Spool/queue directory (default: <tmp>/canopy_outbox)
+- EMAIL_OUTBOX_MAX_ATTEMPTS: Delivery attempts before giving up (default: 5)
+"""
+
+import os
+import uuid
+import time
+import shutil
+import random
+import sqlite3
+import logging
+import tempfile
+import threading
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+from dataclasses import dataclass, asdict
+
+from email_service import (
+    EmailService,
+    validate_email,
+    validate_file_size,
+)
+
+logger = logging.getLogger(__name__)
+
+# Job statuses
+STATUS_QUEUED = "queued"
+STATUS_SENDING = "sending"
+STATUS_RETRYING = "retrying"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+PENDING_STATUSES = (STATUS_QUEUED, STATUS_SENDING, STATUS_RETRYING)
+
+DEFAULT_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+DEFAULT_BASE_DELAY_SECONDS = 2.0
+DEFAULT_MAX_DELAY_SECONDS = 300.0
+# Worker wakes at least this often to pick up due retries
+POLL_INTERVAL_SECONDS = 1.0
+
+# Client-side errors that retrying will not fix
+NON_RETRYABLE_STATUS_CODES = (400, 401, 403, 413)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox_jobs (
+    job_id TEXT PRIMARY KEY,
+    recipient TEXT NOT NULL,
+    client_name TEXT NOT NULL,
+    attachment_filename TEXT NOT NULL,
+    attachment_path TEXT NOT NULL,
+    presentation_id TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    sent_at TEXT,
+    status_code INTEGER,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox_jobs (status, next_attempt_at);
+"""
+
+
+@dataclass
+class OutboxJob:
+    """A queued proposal email."""
+    job_id: str
+    recipient: str
+    client_name: str
+    attachment_filename: str
+    attachment_path: str
+    presentation_id: Optional[str]
+    status: str
+    attempts: int
+    next_attempt_at: float
+    created_at: str
+    updated_at: str
+    sent_at: Optional[str] = None
+    status_code: Optional[int] = None
+    last_error: Optional[str] = None
+
+    @property
+    def is_pending(self) -> bool:
+        return self.status in PENDING_STATUSES
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+    def to_email_result_dict(self) -> dict:
+        """Convert to the EmailResult.to_dict() shape used by the page."""
+        return {
+            "success": self.status == STATUS_SENT,
+            "pending": self.is_pending,
+            "status": self.status,
+            "job_id": self.job_id,
+            "attempts": self.attempts,
+            "recipient": self.recipient,
+            "sent_at": self.sent_at,
+            "error_message": self.last_error,
+            "error_details": {},
+            "status_code": self.status_code,
+        }
+
+
+def backoff_delay(
+    attempts: int,
+    base_delay: float = DEFAULT_BASE_DELAY_SECONDS,
+    max_delay: float = DEFAULT_MAX_DELAY_SECONDS
+) -> float:
+    """Exponential backoff with +/-20% jitter for the given attempt count."""
+    delay = min(max_delay, base_delay * (2 ** max(attempts - 1, 0)))
+    return delay * random.uniform(0.8, 1.2)
+
+
+class EmailOutbox:
+    """
+    Persistent proposal email queue with a background delivery worker.
+
+    Usage:
+        outbox = get_email_outbox()
+        job = outbox.enqueue_proposal(
+            recipient_email="client@example.com",
+            client_name="ABC Company",
+            attachment_data=pdf_buffer,
+            attachment_filename="proposal.pdf"
+        )
+        ...
+        job = outbox.get_status(job.job_id)
+    """
+
+    def __init__(
+        self,
+        outbox_dir: Optional[str] = None,
+        email_service: Optional[EmailService] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY_SECONDS,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+    ):
+        """Initialize outbox storage (the worker is started separately)."""
+        self.outbox_dir = Path(
+            outbox_dir
+            or os.getenv("EMAIL_OUTBOX_DIR")
+            or Path(tempfile.gettempdir()) / "canopy_outbox"
+        )
+        self.spool_dir = self.outbox_dir / "attachments"
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+
+        self.email_service = email_service or EmailService()
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.outbox_dir / "outbox.sqlite3"),
+            check_same_thread=False,
+            isolation_level=None,  # autocommit; explicit transactions where needed
+        )
+        self._conn.row_factory = sqlite3.Row
+        with self._db_lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            # Jobs interrupted mid-send by a restart go back on the queue
+            self._conn.execute(
+                "UPDATE outbox_jobs SET status = ? WHERE status = ?",
+                (STATUS_QUEUED, STATUS_SENDING)
+            )
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def enqueue_proposal(
+        self,
+        recipient_email: str,
+        client_name: str,
+        attachment_data: bytes | BytesIO,
+        attachment_filename: str,
+        presentation_id: Optional[str] = None
+    ) -> OutboxJob:
+        """
+        Spool a proposal to disk and queue it for delivery. Returns immediately.
+
+        Validation failures produce a job that is already in the failed state,
+        so callers handle every outcome through the same status API.
+
+        Args:
+            recipient_email: Recipient's email address
+            client_name: Client/company name for personalization
+            attachment_data: Proposal file data (bytes or BytesIO)
+            attachment_filename: Filename for the attachment
+            presentation_id: Optional unique ID for tracking
+
+        Returns:
+            The queued OutboxJob
+        """
+        job_id = uuid.uuid4().hex
+        now = datetime.now().isoformat()
+        attachment_path = self.spool_dir / f"{job_id}{Path(attachment_filename).suffix}"
+
+        error = None
+        is_configured, config_error = self.email_service.is_configured()
+        if not is_configured:
+            error = f"Email service not configured: {config_error}"
+        if error is None:
+            is_valid, error_msg = validate_email(recipient_email)
+            if not is_valid:
+                error = error_msg
+        if error is None:
+            is_valid, error_msg = validate_file_size(attachment_data, attachment_filename)
+            if not is_valid:
+                error = error_msg
+
+        if error is None:
+            self._spool_attachment(attachment_data, attachment_path)
+
+        job = OutboxJob(
+            job_id=job_id,
+            recipient=recipient_email.strip(),
+            client_name=client_name,
+            attachment_filename=attachment_filename,
+            attachment_path=str(attachment_path),
+            presentation_id=presentation_id,
+            status=STATUS_FAILED if error else STATUS_QUEUED,
+            attempts=0,
+            next_attempt_at=time.time(),
+            created_at=now,
+            updated_at=now,
+            last_error=error,
+        )
+        with self._db_lock:
+            self._conn.execute(
+                """
+                INSERT INTO outbox_jobs (
+                    job_id, recipient, client_name, attachment_filename, attachment_path,
+                    presentation_id, status, attempts, next_attempt_at, created_at,
+                    updated_at, sent_at, status_code, last_error
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    job.job_id, job.recipient, job.client_name, job.attachment_filename,
+                    job.attachment_path, job.presentation_id, job.status, job.attempts,
+                    job.next_attempt_at, job.created_at, job.updated_at, job.sent_at,
+                    job.status_code, job.last_error,
+                )
+            )
+
+        if not error:
+            logger.info(f"Queued proposal email {job_id} to {job.recipient}")
+            self.start()
+            self._wake.set()
+        return job
+
+    def get_status(self, job_id: str) -> Optional[OutboxJob]:
+        """Get the current state of a job, or None if unknown."""
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT * FROM outbox_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return OutboxJob(**dict(row)) if row else None
+
+    def retry(
+        self,
+        job_id: str,
+        attachment_data: Optional[bytes | BytesIO] = None
+    ) -> Optional[OutboxJob]:
+        """
+        Re-queue a failed job with a fresh attempt budget.
+
+        Failed jobs no longer hold their spooled attachment, so pass
+        attachment_data to spool it again; without it the job stays failed.
+        """
+        job = self.get_status(job_id)
+        if job is None or job.status != STATUS_FAILED:
+            return job
+        if not os.path.exists(job.attachment_path):
+            if attachment_data is None:
+                logger.warning(f"Cannot retry {job_id}: attachment no longer spooled")
+                return job
+            self._spool_attachment(attachment_data, job.attachment_path)
+
+        self._update(
+            job_id,
+            status=STATUS_QUEUED,
+            attempts=0,
+            next_attempt_at=time.time(),
+            last_error=None,
+        )
+        self.start()
+        self._wake.set()
+        return self.get_status(job_id)
+
+    def pending_count(self) -> int:
+        """Number of jobs not yet sent or failed."""
+        with self._db_lock:
+            row = self._conn.execute(
+                f"SELECT COUNT(*) FROM outbox_jobs WHERE status IN ({','.join('?' * len(PENDING_STATUSES))})",
+                PENDING_STATUSES
+            ).fetchone()
+        return row[0]
+
+    def start(self) -> None:
+        """Start the delivery worker if it is not already running."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=self._run, name="email-outbox-worker", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the delivery worker."""
+        self._stop.set()
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def process_due_jobs(self) -> int:
+        """
+        Deliver all jobs that are due now (one pass). Returns jobs attempted.
+
+        Called by the worker loop; also usable directly from tests or scripts.
+        """
+        processed = 0
+        while not self._stop.is_set():
+            job = self._claim_next_due()
+            if job is None:
+                break
+            self._attempt(job)
+            processed += 1
+        return processed
+
+    # ------------------------------------------------------------------
+    # Worker internals
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        """Worker loop: deliver due jobs, then sleep until woken or the next poll."""
+        logger.info("Email outbox worker started")
+        while not self._stop.is_set():
+            try:
+                self.process_due_jobs()
+            except Exception as e:
+                # Never let the worker die on an unexpected error
+                logger.exception(f"Email outbox worker error: {e}")
+            self._wake.wait(POLL_INTERVAL_SECONDS)
+            self._wake.clear()
+        logger.info("Email outbox worker stopped")
+
+    def _claim_next_due(self) -> Optional[OutboxJob]:
+        """Atomically mark the oldest due job as sending and return it."""
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    """
+                    SELECT * FROM outbox_jobs
+                    WHERE status IN (?, ?) AND next_attempt_at <= ?
+                    ORDER BY next_attempt_at
+                    LIMIT 1
+                    """,
+                    (STATUS_QUEUED, STATUS_RETRYING, time.time())
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE outbox_jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                    (STATUS_SENDING, datetime.now().isoformat(), row["job_id"])
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        job = OutboxJob(**dict(row))
+        job.status = STATUS_SENDING
+        return job
+
+    def _attempt(self, job: OutboxJob) -> None:
+        """Make one delivery attempt and record the outcome."""
+        attempts = job.attempts + 1
+        result = self.email_service.send_proposal_email_from_file(
+            recipient_email=job.recipient,
+            client_name=job.client_name,
+            attachment_path=job.attachment_path,
+            attachment_filename=job.attachment_filename,
+            presentation_id=job.presentation_id,
+            notify_on_failure=False,
+        )
+
+        if result.success:
+            self._update(
+                job.job_id,
+                status=STATUS_SENT,
+                attempts=attempts,
+                sent_at=(result.sent_at or datetime.now()).isoformat(),
+                status_code=result.status_code,
+                last_error=None,
+            )
+            self._remove_attachment(job.attachment_path)
+            logger.info(f"Delivered proposal email {job.job_id} (attempt {attempts})")
+            return
+
+        retryable = (
+            result.status_code not in NON_RETRYABLE_STATUS_CODES
+            and os.path.exists(job.attachment_path)
+        )
+        if retryable and attempts < self.max_attempts:
+            delay = backoff_delay(attempts, self.base_delay, self.max_delay)
+            self._update(
+                job.job_id,
+                status=STATUS_RETRYING,
+                attempts=attempts,
+                next_attempt_at=time.time() + delay,
+                status_code=result.status_code,
+                last_error=result.error_message,
+            )
+            logger.warning(
+                f"Proposal email {job.job_id} failed (attempt {attempts}), "
+                f"retrying in {delay:.1f}s: {result.error_message}"
+            )
+            return
+
+        self._update(
+            job.job_id,
+            status=STATUS_FAILED,
+            attempts=attempts,
+            status_code=result.status_code,
+            last_error=result.error_message,
+        )
+        self._remove_attachment(job.attachment_path)
+        logger.error(f"Proposal email {job.job_id} failed permanently: {result.error_message}")
+        self.email_service._send_failure_notification(
+            recipient_email=job.recipient,
+            client_name=job.client_name,
+            presentation_id=job.presentation_id or job.attachment_filename,
+            error_details=result.error_details or {"message": result.error_message},
+        )
+
+    def _update(self, job_id: str, **fields) -> None:
+        """Update columns on a job row."""
+        fields["updated_at"] = datetime.now().isoformat()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._db_lock:
+            self._conn.execute(
+                f"UPDATE outbox_jobs SET {assignments} WHERE job_id = ?",
+                (*fields.values(), job_id)
+            )
+
+    @staticmethod
+    def _spool_attachment(attachment_data: bytes | BytesIO, path) -> None:
+        """Stream to disk; BytesIO is copied without materializing a second bytes object."""
+        with open(path, "wb") as f:
+            if isinstance(attachment_data, BytesIO):
+                attachment_data.seek(0)
+                shutil.copyfileobj(attachment_data, f)
+                attachment_data.seek(0)
+            else:
+                f.write(attachment_data)
+
+    @staticmethod
+    def _remove_attachment(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_outbox: Optional[EmailOutbox] = None
+_outbox_lock = threading.Lock()
+
+
+# Convenience function for Streamlit usage
+def get_email_outbox() -> EmailOutbox:
+    """Get the process-wide email outbox (worker started on first use)."""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = EmailOutbox()
+            # Resume any jobs left over from a previous process
+            if _outbox.pending_count():
+                _outbox.start()
+        return _outbox
@@ -16,7 +16,7 @@ import base64
 import logging
 from datetime import datetime
 from html import escape as html_escape
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 from dataclasses import dataclass, field
 from io import BytesIO
 
@@ -149,6 +149,37 @@ def validate_file_size(file_data: bytes | BytesIO, filename: str = "") -> Tuple[
     return True, ""
 
 
+def encode_file_base64(path: str, chunk_size: int = 3 * 256 * 1024) -> str:
+    """
+    Base64-encode a file from disk in chunks.
+
+    The chunk size is a multiple of 3 so each chunk encodes without padding
+    and the pieces concatenate to the same result as encoding the whole file.
+
+    Args:
+        path: Path to the file
+        chunk_size: Bytes read per chunk (must be a multiple of 3)
+
+    Returns:
+        Base64-encoded file content
+    """
+    parts = []
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            parts.append(base64.b64encode(chunk).decode())
+    return "".join(parts)
+
+
+def get_attachment_mime_type(filename: str) -> str:
+    """Determine attachment MIME type from filename."""
+    if filename.endswith('.pdf'):
+        return 'application/pdf'
+    return 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+
+
 class EmailService:
     """
     Email service for sending proposals via SendGrid.
@@ -397,6 +428,108 @@ Glove Benefits Monitoring System
         else:
             file_bytes = attachment_data
 
+        return self._deliver(
+            recipient_email=recipient_email,
+            client_name=client_name,
+            encode_attachment=lambda: base64.b64encode(file_bytes).decode(),
+            attachment_filename=attachment_filename,
+            presentation_id=presentation_id,
+        )
+
+    def send_proposal_email_from_file(
+        self,
+        recipient_email: str,
+        client_name: str,
+        attachment_path: str,
+        attachment_filename: str,
+        presentation_id: Optional[str] = None,
+        notify_on_failure: bool = True
+    ) -> EmailResult:
+        """
+        Send proposal email with an attachment read from disk.
+
+        Used by the email outbox worker so the attachment never has to be held
+        in the Streamlit session.
+
+        Args:
+            recipient_email: Recipient's email address
+            client_name: Client/company name for personalization
+            attachment_path: Path to the attachment file
+            attachment_filename: Filename for the attachment
+            presentation_id: Optional unique ID for tracking
+            notify_on_failure: Send a monitoring notification if delivery fails
+                (the outbox disables this until its final retry)
+
+        Returns:
+            EmailResult with success/failure details
+        """
+        is_valid, error_msg = self.is_configured()
+        if not is_valid:
+            return EmailResult(
+                success=False,
+                recipient=recipient_email,
+                error_message=f"Email service not configured: {error_msg}",
+            )
+
+        is_valid, error_msg = validate_email(recipient_email)
+        if not is_valid:
+            return EmailResult(
+                success=False,
+                recipient=recipient_email,
+                error_message=error_msg,
+            )
+
+        if not os.path.exists(attachment_path):
+            return EmailResult(
+                success=False,
+                recipient=recipient_email,
+                error_message=f"Attachment file not found: {attachment_filename}",
+            )
+
+        size = os.path.getsize(attachment_path)
+        if size > MAX_ATTACHMENT_SIZE_BYTES:
+            size_mb = size / (1024 * 1024)
+            return EmailResult(
+                success=False,
+                recipient=recipient_email,
+                error_message=(
+                    f"File size ({size_mb:.1f}MB) exceeds the {MAX_ATTACHMENT_SIZE_MB}MB email attachment limit. "
+                    f"Please download the file manually instead."
+                ),
+            )
+
+        return self._deliver(
+            recipient_email=recipient_email,
+            client_name=client_name,
+            encode_attachment=lambda: encode_file_base64(attachment_path),
+            attachment_filename=attachment_filename,
+            presentation_id=presentation_id,
+            notify_on_failure=notify_on_failure,
+        )
+
+    def _deliver(
+        self,
+        recipient_email: str,
+        client_name: str,
+        encode_attachment: Callable[[], str],
+        attachment_filename: str,
+        presentation_id: Optional[str] = None,
+        notify_on_failure: bool = True
+    ) -> EmailResult:
+        """
+        Build and send the proposal message via SendGrid.
+
+        Args:
+            recipient_email: Validated recipient address
+            client_name: Client/company name for personalization
+            encode_attachment: Returns the base64-encoded attachment content
+            attachment_filename: Filename for the attachment
+            presentation_id: Optional unique ID for tracking
+            notify_on_failure: Send a monitoring notification on failure
+
+        Returns:
+            EmailResult with success/failure details
+        """
         # Create email content
         subject, plain_text, html_body = self._create_presentation_email_content(
             client_name, attachment_filename
@@ -418,18 +551,10 @@ Glove Benefits Monitoring System
             )
 
             # Add attachment
-            encoded_file = base64.b64encode(file_bytes).decode()
-
-            # Determine MIME type
-            if attachment_filename.endswith('.pdf'):
-                mime_type = 'application/pdf'
-            else:
-                mime_type = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
-
             attachment = Attachment(
-                FileContent(encoded_file),
+                FileContent(encode_attachment()),
                 FileName(attachment_filename),
-                FileType(mime_type),
+                FileType(get_attachment_mime_type(attachment_filename)),
                 Disposition('attachment')
             )
             message.attachment = attachment
@@ -454,12 +579,13 @@ Glove Benefits Monitoring System
                 }
 
                 # Send failure notification
-                self._send_failure_notification(
-                    recipient_email=recipient_email,
-                    client_name=client_name,
-                    presentation_id=presentation_id or attachment_filename,
-                    error_details=error_details,
-                )
+                if notify_on_failure:
+                    self._send_failure_notification(
+                        recipient_email=recipient_email,
+                        client_name=client_name,
+                        presentation_id=presentation_id or attachment_filename,
+                        error_details=error_details,
+                    )
 
                 return EmailResult(
                     success=False,
@@ -477,12 +603,13 @@ Glove Benefits Monitoring System
             }
 
             # Send failure notification
-            self._send_failure_notification(
-                recipient_email=recipient_email,
-                client_name=client_name,
-                presentation_id=presentation_id or attachment_filename,
-                error_details=error_details,
-            )
+            if notify_on_failure:
+                self._send_failure_notification(
+                    recipient_email=recipient_email,
+                    client_name=client_name,
+                    presentation_id=presentation_id or attachment_filename,
+                    error_details=error_details,
+                )
 
             logger.exception("Failed to send proposal email")
             return EmailResult(
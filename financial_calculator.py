@@ -14,6 +14,7 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from database import DatabaseConnection
 from constants import FAMILY_TIER_STATES
+from census_schema import parse_currency_series
 
 # Suppress pandas warning about psycopg2 connections
 warnings.filterwarnings('ignore', message='.*pandas only supports SQLAlchemy.*')
@@ -136,7 +137,7 @@ class FinancialSummaryCalculator:
                 p.plan_marketing_name as name,
                 p.level_of_coverage as metal,
                 p.plan_type as type
-            FROM rbis_insurance_plan_20251019202724 p
+            FROM rbis_insurance_plan p
             WHERE SUBSTRING(p.hios_plan_id, 6, 2) = %s
               AND p.market_coverage = 'Individual'
               AND p.plan_effective_date = '2026-01-01'
@@ -145,7 +146,7 @@ class FinancialSummaryCalculator:
             """
 
             try:
-                df = pd.read_sql(query, db.engine, params=(state, tuple(expanded_levels)))
+                df = db.read_sql(query, params=(state, tuple(expanded_levels)))
                 result[state] = df.to_dict('records')
             except Exception as e:
                 print(f"Error fetching plans for {state}: {e}")
@@ -207,8 +208,8 @@ class FinancialSummaryCalculator:
                     p.hios_plan_id as plan_id,
                     p.plan_marketing_name as name,
                     r.individual_rate as rate
-                FROM rbis_insurance_plan_20251019202724 p
-                JOIN rbis_insurance_plan_base_rates_20251019202724 r
+                FROM rbis_insurance_plan p
+                JOIN rbis_insurance_plan_base_rates r
                     ON p.hios_plan_id = r.plan_id
                 WHERE SUBSTRING(p.hios_plan_id, 6, 2) = %s
                   AND p.market_coverage = 'Individual'
@@ -223,7 +224,7 @@ class FinancialSummaryCalculator:
 
                 try:
                     params = [state] + metal_values + [f"Rating Area {rating_area}", age_band]
-                    df = pd.read_sql(query, db.engine, params=tuple(params))
+                    df = db.read_sql(query, params=tuple(params))
                     if not df.empty:
                         result[state] = df.iloc[0]['plan_id']
                         plan_found = True
@@ -235,7 +236,7 @@ class FinancialSummaryCalculator:
             if not plan_found and 1 not in rating_areas:
                 try:
                     fallback_params = [state] + metal_values + ["Rating Area 1", age_band]
-                    df = pd.read_sql(query, db.engine, params=tuple(fallback_params))
+                    df = db.read_sql(query, params=tuple(fallback_params))
                     if not df.empty:
                         result[state] = df.iloc[0]['plan_id']
                 except Exception as e:
@@ -337,13 +338,13 @@ class FinancialSummaryCalculator:
             rating_area_id,
             age,
             individual_rate as rate
-        FROM rbis_insurance_plan_base_rates_20251019202724
+        FROM rbis_insurance_plan_base_rates
         WHERE plan_id IN %s
           AND market_coverage = 'Individual'
         """
 
         try:
-            df = pd.read_sql(query, db.engine, params=(tuple(plan_ids),))
+            df = db.read_sql(query, params=(tuple(plan_ids),))
             return df
         except Exception as e:
             print(f"Error fetching rates: {e}")
@@ -537,12 +538,12 @@ class FinancialSummaryCalculator:
 
         query = """
         SELECT hios_plan_id, plan_marketing_name
-        FROM rbis_insurance_plan_20251019202724
+        FROM rbis_insurance_plan
         WHERE hios_plan_id IN %s
         """
 
         try:
-            df = pd.read_sql(query, db.engine, params=(tuple(plan_ids),))
+            df = db.read_sql(query, params=(tuple(plan_ids),))
             return dict(zip(df['hios_plan_id'], df['plan_marketing_name']))
         except Exception:
             return {}
@@ -565,15 +566,6 @@ class FinancialSummaryCalculator:
                 'employees_with_data': int
             }
         """
-        def parse_currency(val):
-            if pd.isna(val):
-                return 0.0
-            s = str(val).replace('$', '').replace(',', '').replace('"', '').strip()
-            try:
-                return float(s)
-            except (ValueError, TypeError):
-                return 0.0
-
         # Find contribution columns
         ee_col = None
         er_col = None
@@ -599,9 +591,10 @@ class FinancialSummaryCalculator:
         }
 
         if ee_col and er_col:
-            ee_values = census_df[ee_col].apply(parse_currency)
-            er_values = census_df[er_col].apply(parse_currency)
-            gap_values = census_df[gap_col].apply(parse_currency) if gap_col else pd.Series([0.0] * len(census_df))
+            # Already float after enforce_census_schema(); raw CSV columns are parsed here
+            ee_values = parse_currency_series(census_df[ee_col]).fillna(0.0)
+            er_values = parse_currency_series(census_df[er_col]).fillna(0.0)
+            gap_values = parse_currency_series(census_df[gap_col]).fillna(0.0) if gap_col else pd.Series([0.0] * len(census_df))
 
             result['total_ee_monthly'] = ee_values.sum()
             result['total_er_monthly'] = er_values.sum()
@@ -633,17 +626,6 @@ class FinancialSummaryCalculator:
                 'has_data': bool  # True if 2026 Premium column exists with values
             }
         """
-        def parse_currency(val):
-            if pd.isna(val):
-                return 0.0
-            s = str(val).replace('$', '').replace(',', '').replace('"', '').strip()
-            if not s:
-                return 0.0
-            try:
-                return float(s)
-            except (ValueError, TypeError):
-                return 0.0
-
         result = {
             'total_monthly': 0.0,
             'total_annual': 0.0,
@@ -668,8 +650,8 @@ class FinancialSummaryCalculator:
                 break
 
         if premium_col:
-            values = census_df[premium_col].apply(parse_currency)
-            gap_values = census_df[gap_col].apply(parse_currency) if gap_col else pd.Series([0.0] * len(census_df))
+            values = parse_currency_series(census_df[premium_col]).fillna(0.0)
+            gap_values = parse_currency_series(census_df[gap_col]).fillna(0.0) if gap_col else pd.Series([0.0] * len(census_df))
 
             result['total_gap_monthly'] = gap_values.sum()
             result['total_gap_annual'] = result['total_gap_monthly'] * 12
@@ -747,7 +729,7 @@ class FinancialSummaryCalculator:
 
         query = """
         SELECT individual_rate
-        FROM rbis_insurance_plan_base_rates_20251019202724
+        FROM rbis_insurance_plan_base_rates
         WHERE plan_id = %s
           AND rating_area_numeric = %s
           AND age = %s
@@ -1020,8 +1002,8 @@ class FinancialSummaryCalculator:
                 r.age as age_band,
                 p.plan_marketing_name,
                 r.individual_rate as lcsp_rate
-            FROM rbis_insurance_plan_20251019202724 p
-            JOIN rbis_insurance_plan_base_rates_20251019202724 r
+            FROM rbis_insurance_plan p
+            JOIN rbis_insurance_plan_base_rates r
                 ON p.hios_plan_id = r.plan_id
             WHERE SUBSTRING(p.hios_plan_id, 6, 2) IN %s
               AND p.market_coverage = 'Individual'
@@ -1035,7 +1017,7 @@ class FinancialSummaryCalculator:
 
             try:
                 query_start = time.time()
-                batch_df = pd.read_sql(batch_query, db.engine, params=(
+                batch_df = db.read_sql(batch_query, params=(
                     tuple(states),
                     tuple(metal_levels_list),
                     tuple(rating_areas),
@@ -1284,10 +1266,10 @@ class FinancialSummaryCalculator:
                 p.plan_marketing_name,
                 r.individual_rate as lcp_rate,
                 v.issuer_actuarial_value
-            FROM rbis_insurance_plan_20251019202724 p
-            JOIN rbis_insurance_plan_base_rates_20251019202724 r
+            FROM rbis_insurance_plan p
+            JOIN rbis_insurance_plan_base_rates r
                 ON p.hios_plan_id = r.plan_id
-            LEFT JOIN rbis_insurance_plan_variant_20251019202724 v
+            LEFT JOIN rbis_insurance_plan_variant v
                 ON p.hios_plan_id = v.hios_plan_id
                 AND v.csr_variation_type = 'Exchange variant (no CSR)'
             WHERE SUBSTRING(p.hios_plan_id, 6, 2) IN %s
@@ -1302,7 +1284,7 @@ class FinancialSummaryCalculator:
             query_start = time.time()
 
             try:
-                batch_df = pd.read_sql(batch_query, db.engine, params=(
+                batch_df = db.read_sql(batch_query, params=(
                     tuple(states),
                     tuple(rating_areas),
                     tuple(age_bands)
@@ -0,0 +1,250 @@
+"""
+Group-Rate Pricing for Cooperative (HAS) and Sedera plans
+
+HAS and Sedera charge ONE rate per family, set by the family tier and the
+age band of the eldest covered member (spouse for ES/F, all children for
+EC/F, no 3-child cap). Instead of pricing each employee by filtering the
+dependents table, this module:
+
+- Compiles a rate table once into an array indexed by
+  (option, age band, family status), where options are the HAS deductibles
+  ('1k', '2.5k') or the Sedera IUAs ('500', '1000', ...)
+- Computes every employee's eldest member age with one groupby over dependents
+- Prices every option for the whole census with one array gather
+
+Used by the ICHRA dashboard totals, tier averages and rate exports.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+FAMILY_STATUSES = ('EE', 'ES', 'EC', 'F')
+
+# Lower bounds of the 30-39, 40-49, 50-59 and oldest bands (youngest band is 18-29)
+AGE_BAND_EDGES = np.array([30, 40, 50, 60])
+HAS_AGE_BANDS = ('18-29', '30-39', '40-49', '50-59', '60-64')
+SEDERA_AGE_BANDS = ('18-29', '30-39', '40-49', '50-59', '60+')
+
+HAS_DEDUCTIBLES = ('1k', '2.5k')
+
+
+@dataclass
+class GroupRateTable:
+    """Monthly group rates indexed by (option, age band, family status)"""
+    options: Tuple[str, ...]
+    age_bands: Tuple[str, ...]
+    rates: np.ndarray      # float64, shape (options, age bands, FAMILY_STATUSES)
+    populated: np.ndarray  # bool per option: False if the table had no rows for it
+
+    @classmethod
+    def build(
+        cls,
+        option_frames: Dict[str, Tuple[pd.DataFrame, str]],
+        age_bands: Sequence[str],
+    ) -> 'GroupRateTable':
+        """
+        Compile rate rows into an array.
+
+        Args:
+            option_frames: {option: (rows with age_band/family_status columns, rate column)}
+            age_bands: Band labels in age order
+
+        Rates missing from the table (or NULL) are 0, as in the dict lookups.
+        """
+        options = tuple(option_frames)
+        rates = np.zeros((len(options), len(age_bands), len(FAMILY_STATUSES)))
+        populated = np.zeros(len(options), dtype=bool)
+        band_index = {band: i for i, band in enumerate(age_bands)}
+        status_index = {status: i for i, status in enumerate(FAMILY_STATUSES)}
+
+        for o, (frame, rate_col) in enumerate(option_frames.values()):
+            if frame is None or frame.empty:
+                continue
+            populated[o] = True
+            bands = frame['age_band'].map(band_index)
+            statuses = frame['family_status'].map(status_index)
+            valid = (bands.notna() & statuses.notna()).to_numpy()
+            values = pd.to_numeric(frame[rate_col], errors='coerce').fillna(0).to_numpy(dtype=float)
+            # Later rows win for duplicate keys, like the dict lookups
+            rates[o, bands.to_numpy()[valid].astype(int), statuses.to_numpy()[valid].astype(int)] = values[valid]
+
+        return cls(options, tuple(age_bands), rates, populated)
+
+    def option_index(self, option: str) -> int:
+        return self.options.index(option)
+
+    def rate_ranges(self, option: str) -> Dict[str, Dict[str, float]]:
+        """Youngest- and oldest-band rate per family status."""
+        o = self.option_index(option)
+        return {
+            status: {'min': float(self.rates[o, 0, s]), 'max': float(self.rates[o, -1, s])}
+            for s, status in enumerate(FAMILY_STATUSES)
+        }
+
+    def price(self, eldest_ages: np.ndarray, status_codes: np.ndarray) -> np.ndarray:
+        """
+        Group rates for every option and employee.
+
+        Args:
+            eldest_ages: Eldest covered member age per employee
+            status_codes: Index into FAMILY_STATUSES per employee (-1 = unknown)
+
+        Returns:
+            Array of shape (options, employees); unknown statuses price at 0
+        """
+        bands = age_band_index(eldest_ages)
+        known = status_codes >= 0
+        priced = self.rates[:, bands, np.where(known, status_codes, 0)]
+        return np.where(known, priced, 0.0)
+
+
+def cooperative_rate_table(
+    coop_rates_df: pd.DataFrame,
+    deductibles: Iterable[str] = HAS_DEDUCTIBLES,
+) -> GroupRateTable:
+    """
+    Compile the hap_cooperative_rates table (one column per deductible).
+
+    Args:
+        coop_rates_df: From load_cooperative_rate_table()
+        deductibles: '2.5k' reads deductible_2_5k; anything else deductible_1k
+    """
+    frame = coop_rates_df if coop_rates_df is not None else pd.DataFrame()
+    option_frames = {
+        deductible: (frame, 'deductible_2_5k' if deductible == '2.5k' else 'deductible_1k')
+        for deductible in deductibles
+    }
+    return GroupRateTable.build(option_frames, HAS_AGE_BANDS)
+
+
+def sedera_rate_table(sedera_rates_df: pd.DataFrame, iuas: Iterable[str]) -> GroupRateTable:
+    """
+    Compile the sedera_rates_with_dpc table (one row set per IUA).
+
+    Args:
+        sedera_rates_df: From load_sedera_rate_table()
+        iuas: IUA levels as strings ('500', '1000', ...)
+    """
+    option_frames = {}
+    for iua in iuas:
+        if sedera_rates_df is None or sedera_rates_df.empty:
+            option_frames[iua] = (None, 'sedera_monthly_rate')
+        else:
+            option_frames[iua] = (sedera_rates_df[sedera_rates_df['IUA'] == iua], 'sedera_monthly_rate')
+    return GroupRateTable.build(option_frames, SEDERA_AGE_BANDS)
+
+
+# =============================================================================
+# CENSUS SIDE
+# =============================================================================
+
+def age_band_index(ages) -> np.ndarray:
+    """Band index per age: <30 -> 0, 30-39 -> 1, ..., 60+ -> 4."""
+    return np.searchsorted(AGE_BAND_EDGES, np.asarray(ages), side='right')
+
+
+def family_status_codes(values: pd.Series) -> np.ndarray:
+    """Index into FAMILY_STATUSES per value (-1 for anything else)."""
+    codes = values.astype(object).map({status: i for i, status in enumerate(FAMILY_STATUSES)})
+    return codes.fillna(-1).to_numpy(dtype=int)
+
+
+def eldest_member_ages(
+    census_df: pd.DataFrame,
+    dependents_df: Optional[pd.DataFrame],
+    family_col: str = 'family_status',
+) -> np.ndarray:
+    """
+    Age of the eldest covered member per employee.
+
+    The spouse (first spouse row) counts for ES/F and every child counts for
+    EC/F; dependents are matched on employee_id. Missing ages count as 0.
+    """
+    if 'age' in census_df.columns:
+        ages = pd.to_numeric(census_df['age'], errors='coerce').fillna(0).to_numpy(dtype=float)
+    else:
+        ages = np.zeros(len(census_df))
+    if dependents_df is None or dependents_df.empty or 'employee_id' not in census_df.columns:
+        return ages
+
+    statuses = census_df[family_col]
+    relationship = dependents_df['relationship'].astype(str).str.lower()
+    dep_ages = pd.to_numeric(dependents_df['age'], errors='coerce')
+
+    spouse_age = (
+        dep_ages[relationship == 'spouse']
+        .groupby(dependents_df.loc[relationship == 'spouse', 'employee_id'], observed=True)
+        .first()
+    )
+    child_age = (
+        dep_ages[relationship == 'child']
+        .groupby(dependents_df.loc[relationship == 'child', 'employee_id'], observed=True)
+        .max()
+    )
+
+    emp_ids = census_df['employee_id'].to_numpy()
+    spouse = spouse_age.reindex(emp_ids).fillna(0).to_numpy(dtype=float)
+    child = child_age.reindex(emp_ids).fillna(0).to_numpy(dtype=float)
+
+    with_spouse = statuses.isin(['ES', 'F']).to_numpy()
+    with_children = statuses.isin(['EC', 'F']).to_numpy()
+    eldest = np.maximum(ages, np.where(with_spouse, spouse, 0))
+    return np.maximum(eldest, np.where(with_children, child, 0))
+
+
+def price_census(
+    census_df: pd.DataFrame,
+    table: GroupRateTable,
+    dependents_df: Optional[pd.DataFrame] = None,
+    family_col: str = 'family_status',
+) -> pd.DataFrame:
+    """
+    Monthly group rate per employee for every option in the table.
+
+    Returns:
+        DataFrame aligned with census_df.index, one column per option
+    """
+    if census_df is None or census_df.empty:
+        return pd.DataFrame(columns=list(table.options), dtype=float)
+    eldest = eldest_member_ages(census_df, dependents_df, family_col)
+    priced = table.price(eldest, family_status_codes(census_df[family_col]))
+    return pd.DataFrame(priced.T, index=census_df.index, columns=list(table.options))
+
+
+def group_rate_totals(
+    census_df: pd.DataFrame,
+    table: GroupRateTable,
+    dependents_df: Optional[pd.DataFrame] = None,
+    family_col: str = 'family_status',
+) -> Dict[str, Dict]:
+    """
+    Census totals per option in one pass.
+
+    Returns:
+        {option: {'total': float,
+                  'by_tier': {status: {'total': float, 'count': int}},
+                  'rate_ranges': {status: {'min': float, 'max': float}}}}
+        Options with no rate rows have zero totals and counts.
+    """
+    prices = price_census(census_df, table, dependents_df, family_col)
+    codes = family_status_codes(census_df[family_col])
+    counts = np.bincount(codes[codes >= 0], minlength=len(FAMILY_STATUSES))
+
+    result = {}
+    for o, option in enumerate(table.options):
+        option_result = {
+            'total': 0.0,
+            'by_tier': {status: {'total': 0.0, 'count': 0} for status in FAMILY_STATUSES},
+            'rate_ranges': table.rate_ranges(option),
+        }
+        if table.populated[o]:
+            values = prices[option].to_numpy()
+            tier_totals = np.bincount(codes[codes >= 0], weights=values[codes >= 0], minlength=len(FAMILY_STATUSES))
+            option_result['total'] = float(values.sum())
+            for s, status in enumerate(FAMILY_STATUSES):
+                option_result['by_tier'][status] = {'total': float(tier_totals[s]), 'count': int(counts[s])}
+        result[option] = option_result
+    return result
@@ -0,0 +1,143 @@
+"""
+Household Quote Engine
+
+Prices a household (employee + spouse + children) across marketplace plans
+in one set-based query and returns the N cheapest plans, fully priced.
+
+Rated members follow ACA rules: every adult is rated, but only the 3 oldest
+children under 21 are rated (children 21+ are rated individually).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from database import DatabaseConnection
+from financial_calculator import FinancialSummaryCalculator
+from queries import MarketplaceQueries
+
+# ACA 3-child rule: only this many children under 21 are rated
+MAX_RATED_CHILDREN_UNDER_21 = 3
+
+
+@dataclass
+class HouseholdQuote:
+    """One plan priced for the whole household"""
+    plan_id: str
+    plan_name: str
+    metal_level: str
+    plan_type: str
+    exchange_status: str
+    household_premium: float
+    employee_premium: float
+    members_rated: int
+
+
+def rated_member_ages(
+    ee_age: int,
+    spouse_age: Optional[int] = None,
+    child_ages: Iterable[Optional[int]] = (),
+    family_status: str = 'EE',
+) -> List[int]:
+    """
+    Ages of the household members that are rated, employee first.
+
+    Spouse counts for ES/F, children for EC/F. Only the 3 oldest children
+    under 21 are rated; children 21+ are always rated.
+
+    Args:
+        ee_age: Employee age
+        spouse_age: Spouse age (ignored unless ES or F)
+        child_ages: Dependent ages (None entries ignored; ignored unless EC or F)
+        family_status: EE, ES, EC, or F
+
+    Returns:
+        List of rated ages
+    """
+    family_status = (family_status or 'EE').upper()
+    ages = [int(ee_age)]
+
+    if family_status in ('ES', 'F') and spouse_age is not None:
+        ages.append(int(spouse_age))
+
+    if family_status in ('EC', 'F'):
+        children = [int(a) for a in child_ages if a is not None]
+        under_21 = sorted((a for a in children if a < 21), reverse=True)
+        ages.extend(under_21[:MAX_RATED_CHILDREN_UNDER_21])
+        ages.extend(a for a in children if a >= 21)
+
+    return ages
+
+
+def member_age_bands(ages: Iterable[int]) -> Dict[str, int]:
+    """Count rated members per ACA age band (e.g. {'40': 2, '0-14': 1})."""
+    bands: Dict[str, int] = {}
+    for age in ages:
+        band = FinancialSummaryCalculator.get_age_band(int(age))
+        bands[band] = bands.get(band, 0) + 1
+    return bands
+
+
+def quote_household(
+    db: DatabaseConnection,
+    state: str,
+    rating_area_id: int,
+    ee_age: int,
+    spouse_age: Optional[int] = None,
+    child_ages: Iterable[Optional[int]] = (),
+    family_status: str = 'EE',
+    metal_levels: Optional[List[str]] = None,
+    plan_types: Optional[List[str]] = None,
+    plan_ids: Optional[List[str]] = None,
+    limit: int = 10,
+    on_exchange_only: bool = False,
+) -> List[HouseholdQuote]:
+    """
+    Return the N cheapest plans for a household, priced for every rated member.
+
+    Args:
+        db: Database connection
+        state: 2-letter state code
+        rating_area_id: Integer rating area
+        ee_age: Employee age
+        spouse_age: Spouse age (ES/F)
+        child_ages: Dependent ages (EC/F); 3-child rule applied here
+        family_status: EE, ES, EC, or F
+        metal_levels: Metal levels to include (None = all)
+        plan_types: Plan types to include (None = all)
+        plan_ids: Restrict to specific plans (None = all)
+        limit: Number of plans to return
+        on_exchange_only: Only on-exchange plans
+
+    Returns:
+        List of HouseholdQuote, cheapest household premium first
+    """
+    ages = rated_member_ages(ee_age, spouse_age, child_ages, family_status)
+
+    df = MarketplaceQueries.get_household_quotes(
+        db=db,
+        state=state,
+        rating_area_id=int(rating_area_id),
+        member_bands=member_age_bands(ages),
+        employee_band=FinancialSummaryCalculator.get_age_band(int(ee_age)),
+        metal_levels=metal_levels,
+        plan_types=plan_types,
+        plan_ids=plan_ids,
+        limit=limit,
+        on_exchange_only=on_exchange_only,
+    )
+    if df is None or df.empty:
+        return []
+
+    return [
+        HouseholdQuote(
+            plan_id=row['plan_id'],
+            plan_name=row['plan_name'],
+            metal_level=row['metal_level'],
+            plan_type=row['plan_type'],
+            exchange_status=row['exchange_status'],
+            household_premium=float(row['household_premium']),
+            employee_premium=float(row['employee_premium']),
+            members_rated=int(row['members_rated']),
+        )
+        for _, row in df.iterrows()
+    ]
@@ -0,0 +1,74 @@
+"""
+LLM Response Cache
+Process-wide cache for Claude responses used by plan_suggester.
+
+Plan selection and analysis prompts are built entirely from the candidate
+plans, census summary and employer preferences, so a Streamlit rerun with
+the same inputs produces the same request. Responses are cached by a hash
+of those inputs and reused instead of calling the API again.
+
+Features:
+- Keys are SHA-256 hashes of the request inputs (JSON, sorted keys)
+- Bounded LRU (bounded_lru); hit/miss counts (get_llm_response_stats)
+- Rough token estimate for sizing prompt context (estimate_tokens)
+
+Environment:
+- LLM_RESPONSE_CACHE_SIZE: Max cached responses (default 256)
+"""
+
+import hashlib
+import json
+import math
+import os
+from typing import Any, Dict, Optional
+
+from bounded_lru import BoundedLRU
+
+DEFAULT_CACHE_SIZE = 256
+
+# Claude averages roughly 4 characters of English/JSON per token
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of text (no tokenizer call)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def response_cache_key(*parts: Any) -> str:
+    """
+    Stable hash of the inputs that determine an LLM request.
+
+    Args:
+        parts: JSON-serializable values (dicts are hashed with sorted keys)
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache(BoundedLRU):
+    """Bounded LRU of response text keyed by response_cache_key()."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        super().__init__(max_entries)
+
+    def get(self, key: str) -> Optional[str]:
+        return super().get(key)
+
+
+_cache = LLMResponseCache(int(os.getenv('LLM_RESPONSE_CACHE_SIZE') or DEFAULT_CACHE_SIZE))
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """The process-wide cache used by plan_suggester."""
+    return _cache
+
+
+def get_llm_response_stats() -> Dict[str, Any]:
+    """Hit-rate stats for the process-wide cache."""
+    return _cache.stats()
+
+
+def clear_llm_response_cache() -> None:
+    """Drop all cached LLM responses."""
+    _cache.clear()
@@ -0,0 +1,71 @@
+-- Migration: Integer rating area column and plan-scoped rate indexes
+-- Date: 2026-10-18
+-- Purpose: Eliminate REGEXP_REPLACE(rating_area_id, ...)::integer calls on the base rates table
+--
+-- rating_area_id is stored as text ('Rating Area 7'), so every rating-area filter in
+-- queries.py used to be written as
+--     br.rating_area_id ~ '^Rating Area [0-9]+$'
+--     AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
+-- which no btree index can serve. A stored generated column holds the same value
+-- (NULL for anything that is not 'Rating Area <n>'), so queries can filter on
+-- br.rating_area_numeric directly and use idx_rates_state_area_age_date (001).
+--
+-- Queries also join br.state_code = p.state_code, which lets the planner apply the
+-- plan's state filter to the rates table and use the leading index column.
+--
+-- Requires: 001_add_state_code_columns.sql
+--
+-- IMPORTANT: Run this migration during a maintenance window. Adding a stored
+-- generated column rewrites the base_rates table (13.4M rows).
+
+-- ============================================================================
+-- STEP 1: Integer rating area on the base_rates table
+-- ============================================================================
+
+-- Existing deployments that already have rating_area_numeric keep their column;
+-- see the verification queries below to check it matches this definition.
+ALTER TABLE rbis_insurance_plan_base_rates_20251019202724
+ADD COLUMN IF NOT EXISTS rating_area_numeric integer
+GENERATED ALWAYS AS (
+    CASE
+        WHEN rating_area_id ~ '^Rating Area [0-9]+$'
+        THEN (REGEXP_REPLACE(rating_area_id, '[^0-9]', '', 'g'))::integer
+    END
+) STORED;
+
+
+-- ============================================================================
+-- STEP 2: Plan-scoped rate lookups
+-- ============================================================================
+
+-- get_plan_rates_by_age, get_plans_with_rating_area_coverage and
+-- FinancialQueries.get_rates_batch filter by plan_id IN (...) and effective date
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rates_plan_date_area
+ON rbis_insurance_plan_base_rates_20251019202724 (plan_id, rate_effective_date, rating_area_numeric);
+
+
+-- ============================================================================
+-- VERIFICATION QUERIES (run after migration)
+-- ============================================================================
+
+-- Column matches the old expression (should return 0):
+-- SELECT COUNT(*)
+-- FROM rbis_insurance_plan_base_rates_20251019202724
+-- WHERE rating_area_numeric IS DISTINCT FROM CASE
+--     WHEN rating_area_id ~ '^Rating Area [0-9]+$'
+--     THEN (REGEXP_REPLACE(rating_area_id, '[^0-9]', '', 'g'))::integer
+-- END;
+
+-- LCSP lookup uses idx_rates_state_area_age_date (no Seq Scan on base_rates):
+-- EXPLAIN
+-- SELECT p.hios_plan_id, br.individual_rate
+-- FROM rbis_insurance_plan_base_rates_20251019202724 br
+-- JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
+-- WHERE p.level_of_coverage = 'Silver'
+--   AND p.state_code = 'WI'
+--   AND br.state_code = p.state_code
+--   AND br.rating_area_numeric = 12
+--   AND br.age = '40'
+--   AND br.rate_effective_date = '2026-01-01'
+-- ORDER BY br.individual_rate
+-- LIMIT 1;
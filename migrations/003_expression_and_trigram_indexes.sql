@@ -0,0 +1,75 @@
+-- Migration: Expression, plan-lookup and trigram indexes
+-- Date: 2026-10-18
+-- Purpose: Index the remaining filter patterns in queries.py that cannot use a plain column index
+--
+-- - UPPER(state_code) / UPPER(county) / UPPER("State") lookups on the rating area
+--   and ZIP tables need expression indexes on the same expressions
+-- - The plan attribute tables (variant, deductible/MOOP, benefit cost share) are
+--   always read for a list of plan IDs; index them by plan ID plus the variant/network
+--   filters every query applies
+-- - LOWER(benefit) LIKE '%...%' and LOWER(moop_ded_type) LIKE '%...%' need
+--   trigram (pg_trgm) indexes; 004 adds normalized category columns for the common cases
+--
+-- Small tables (< 100K rows); safe to run outside a maintenance window.
+
+-- ============================================================================
+-- STEP 1: Expression indexes for case-insensitive location lookups
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rating_area_amended_state_county
+ON rbis_state_rating_area_amended (UPPER(state_code), UPPER(county), market);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rating_area_amended_fips
+ON rbis_state_rating_area_amended ("FIPS", market);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_zip_to_county_zip_state
+ON zip_to_county_correct ("ZIP", UPPER("State"));
+
+-- 3-digit ZIP fallback in get_county_by_zip / get_counties_by_zip_batch
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rating_area_state_zip3
+ON rbis_state_rating_area_20251019202724 (state, three_digit_zip, market);
+
+-- Issuer names are joined on SUBSTRING(hios_plan_id, 1, 5) = hios_issuer_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_hios_issuers_issuer_id
+ON "HIOS_issuers_pivoted" (hios_issuer_id);
+
+
+-- ============================================================================
+-- STEP 2: Plan attribute tables by plan ID
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_plan_variant_plan_csr
+ON rbis_insurance_plan_variant_20251019202724 (hios_plan_id, csr_variation_type);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ddctbl_moop_plan_variant_network
+ON rbis_insurance_plan_variant_ddctbl_moop_20251019202724 (plan_id, variant_component, network_type);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_benefit_cost_share_plan_csr_network
+ON rbis_insurance_plan_benefit_cost_share_20251019202724 (hios_plan_id, csr_variation_type, network_type);
+
+
+-- ============================================================================
+-- STEP 3: Trigram indexes for substring searches (requires pg_trgm)
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_benefit_cost_share_benefit_trgm
+ON rbis_insurance_plan_benefit_cost_share_20251019202724 USING gin (LOWER(benefit) gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ddctbl_moop_type_trgm
+ON rbis_insurance_plan_variant_ddctbl_moop_20251019202724 USING gin (LOWER(moop_ded_type) gin_trgm_ops);
+
+
+-- ============================================================================
+-- VERIFICATION QUERIES (run after migration)
+-- ============================================================================
+
+-- Verify indexes exist:
+-- SELECT tablename, indexname FROM pg_indexes
+-- WHERE indexname LIKE 'idx_%' ORDER BY tablename, indexname;
+
+-- County lookup uses idx_rating_area_amended_state_county:
+-- EXPLAIN
+-- SELECT rating_area_id FROM rbis_state_rating_area_amended
+-- WHERE UPPER(state_code) = UPPER('wi') AND UPPER(county) = UPPER('dane') AND market = 'Individual';
@@ -0,0 +1,78 @@
+-- Migration: Normalized benefit and deductible/MOOP category columns
+-- Date: 2026-10-18
+-- Purpose: Replace LOWER(benefit) LIKE '%...%' filters with indexed equality on a category
+--
+-- Benefit and deductible/MOOP names are free text ('Inpatient Hospital Services (e.g.,
+-- Hospital Stay)', 'Maximum Out of Pocket for Medical and Drug EHB Benefits (Total)'),
+-- so queries match them with LOWER(...) LIKE '%...%'. Stored generated category
+-- columns compute that match once per row:
+--
+--   benefit_category   inpatient_hospital | emergency_room | urgent_care | primary_care |
+--                      specialist_visit | generic_drug | non_preferred_brand_drug |
+--                      preferred_brand_drug | specialty_drug | mental_health_outpatient |
+--                      outpatient_facility | NULL
+--   moop_ded_category  deductible | moop | NULL
+--
+-- Each category is exactly the LOWER(...) LIKE pattern used in queries.py, checked in
+-- the order listed (so 'Non-Preferred Brand Drugs' is non_preferred_brand_drug, which
+-- the '%%preferred brand drug%%' pattern also matched). Queries that filter on one of
+-- these patterns should filter on the category column instead.
+--
+-- Requires: 003_expression_and_trigram_indexes.sql (plan ID indexes)
+
+-- ============================================================================
+-- STEP 1: Benefit category on the benefit cost share table
+-- ============================================================================
+
+ALTER TABLE rbis_insurance_plan_benefit_cost_share_20251019202724
+ADD COLUMN IF NOT EXISTS benefit_category varchar(32)
+GENERATED ALWAYS AS (
+    CASE
+        WHEN LOWER(benefit) LIKE '%inpatient hospital%' THEN 'inpatient_hospital'
+        WHEN LOWER(benefit) LIKE '%emergency room%' THEN 'emergency_room'
+        WHEN LOWER(benefit) LIKE '%urgent care%' THEN 'urgent_care'
+        WHEN LOWER(benefit) LIKE '%primary care%' THEN 'primary_care'
+        WHEN LOWER(benefit) LIKE '%specialist visit%' THEN 'specialist_visit'
+        WHEN LOWER(benefit) LIKE '%generic drug%' THEN 'generic_drug'
+        WHEN LOWER(benefit) LIKE '%non-preferred brand%' THEN 'non_preferred_brand_drug'
+        WHEN LOWER(benefit) LIKE '%preferred brand drug%' THEN 'preferred_brand_drug'
+        WHEN LOWER(benefit) LIKE '%specialty drug%' THEN 'specialty_drug'
+        WHEN LOWER(benefit) LIKE '%mental health outpatient%' THEN 'mental_health_outpatient'
+        WHEN LOWER(benefit) LIKE '%outpatient facility%' THEN 'outpatient_facility'
+    END
+) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_benefit_cost_share_plan_category
+ON rbis_insurance_plan_benefit_cost_share_20251019202724 (hios_plan_id, benefit_category)
+WHERE benefit_category IS NOT NULL;
+
+
+-- ============================================================================
+-- STEP 2: Deductible / MOOP category
+-- ============================================================================
+
+ALTER TABLE rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+ADD COLUMN IF NOT EXISTS moop_ded_category varchar(16)
+GENERATED ALWAYS AS (
+    CASE
+        WHEN LOWER(moop_ded_type) LIKE '%deductible%' THEN 'deductible'
+        WHEN LOWER(moop_ded_type) LIKE '%maximum out of pocket%' THEN 'moop'
+    END
+) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ddctbl_moop_plan_category
+ON rbis_insurance_plan_variant_ddctbl_moop_20251019202724 (plan_id, moop_ded_category, network_type)
+WHERE moop_ded_category IS NOT NULL;
+
+
+-- ============================================================================
+-- VERIFICATION QUERIES (run after migration)
+-- ============================================================================
+
+-- Category counts:
+-- SELECT benefit_category, COUNT(*) FROM rbis_insurance_plan_benefit_cost_share_20251019202724
+-- GROUP BY benefit_category ORDER BY 2 DESC;
+
+-- No deductible/MOOP type matches both patterns (should return 0):
+-- SELECT COUNT(*) FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+-- WHERE LOWER(moop_ded_type) LIKE '%deductible%' AND LOWER(moop_ded_type) LIKE '%maximum out of pocket%';
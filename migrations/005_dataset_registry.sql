@@ -0,0 +1,41 @@
+-- Migration: Dataset registry for versioned RBIS tables
+-- Date: 2026-10-18
+-- Purpose: Resolve logical RBIS table names to the active plan-year load
+--
+-- Each load of the CMS RBIS public use files lives in its own set of tables
+-- (rbis_insurance_plan_<version>, rbis_insurance_plan_base_rates_<version>, ...).
+-- queries.py and the pages use the logical names (rbis_insurance_plan, ...) and
+-- dataset_registry.py rewrites them to the version recorded here.
+--
+-- scripts/ingest_plan_year.py loads a new version next to the active one and
+-- activates it by updating the 'rbis' row, so readers switch plan years in one
+-- statement and never see a half-loaded dataset. Activating the previous
+-- version undoes it.
+--
+-- Tiny table; safe to run outside a maintenance window.
+
+CREATE TABLE IF NOT EXISTS dataset_registry (
+    dataset text PRIMARY KEY,
+    version text NOT NULL,
+    previous_version text,
+    row_counts jsonb,
+    activated_at timestamptz NOT NULL DEFAULT now()
+);
+
+-- The tables loaded before the registry existed
+INSERT INTO dataset_registry (dataset, version)
+VALUES ('rbis', '20251019202724')
+ON CONFLICT (dataset) DO NOTHING;
+
+
+-- ============================================================================
+-- VERIFICATION QUERIES (run after migration)
+-- ============================================================================
+
+-- SELECT dataset, version, previous_version, activated_at FROM dataset_registry;
+
+-- Roll back to the previous plan year (app processes pick it up within
+-- DATASET_REGISTRY_TTL_SECONDS):
+-- UPDATE dataset_registry
+-- SET version = previous_version, previous_version = version, activated_at = now()
+-- WHERE dataset = 'rbis' AND previous_version IS NOT NULL;
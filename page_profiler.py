@@ -0,0 +1,338 @@
+"""
+Page Profiler
+Opt-in sampling profiler for Streamlit page reruns.
+
+When enabled, each rerun of a page is sampled from a background thread until
+the page script finishes. Wall time is attributed to the page's top-level
+functions (render_header, render_stage_2_..., etc.) and to the query functions
+that hit the database, and the full rerun is exported as speedscope JSON
+(open at https://www.speedscope.app).
+
+The sidebar shows the last finished rerun: total time, the top functions,
+DB query time, and a download button for the speedscope file. A one-line
+summary is also logged per rerun ("PROFILE: ...").
+
+Usage (in each page, after st.set_page_config):
+    from page_profiler import start_page_profile
+    start_page_profile()
+
+Enable with:
+- CANOPY_PROFILE=1 (every session), or
+- ?profile=1 in the page URL (this session)
+
+Environment:
+- CANOPY_PROFILE_INTERVAL_MS: Sampling interval (default 5)
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV_VAR = 'CANOPY_PROFILE'
+PROFILE_QUERY_PARAM = 'profile'
+DEFAULT_INTERVAL_MS = 5.0
+
+# Stop sampling a rerun after this many samples (~10 minutes at 5 ms)
+MAX_SAMPLES = 120_000
+
+# Rows shown in the sidebar tables
+TOP_N = 8
+
+# Frames in these files count as database time
+DB_FILES = ('queries.py', 'database.py')
+
+SESSION_KEY = '_page_profiler'
+
+# (function qualname, file, first line)
+FrameKey = Tuple[str, str, int]
+
+
+def _frame_key(frame) -> FrameKey:
+    code = frame.f_code
+    return (getattr(code, 'co_qualname', code.co_name), code.co_filename, code.co_firstlineno)
+
+
+def _call_stack(frame) -> List[FrameKey]:
+    """Frame keys from frame up to the thread's outermost frame (innermost first)."""
+    stack = []
+    while frame is not None:
+        stack.append(_frame_key(frame))
+        frame = frame.f_back
+    return stack
+
+
+def _db_label(stack) -> Optional[str]:
+    """'queries.py:PlanQueries.get_x' for the outermost DB frame in a stack (outermost first)."""
+    for name, filename, _ in stack:
+        if Path(filename).name in DB_FILES:
+            return f"{Path(filename).name}:{name}"
+    return None
+
+
+class PageProfiler:
+    """
+    Samples one thread's stack until a given frame (the page module) returns.
+
+    Samples are stored as (weight seconds, stack) with the stack listed
+    outermost first and rooted at the page module frame, so Streamlit's
+    script-runner frames are left out.
+    """
+
+    def __init__(self, root_frame, page_name: str, interval_ms: float = DEFAULT_INTERVAL_MS):
+        """
+        Args:
+            root_frame: The page script's module frame
+            page_name: Label for the report (e.g. '2_ICHRA_dashboard')
+            interval_ms: Sampling interval in milliseconds
+        """
+        self.page_name = page_name
+        self.page_file = root_frame.f_code.co_filename
+        self.interval = max(interval_ms, 0.5) / 1000
+        self.thread_id = threading.get_ident()
+        self.started_at = time.time()
+
+        self.samples: List[Tuple[float, Tuple[FrameKey, ...]]] = []
+        self.queries: List[Tuple[str, str, float]] = []  # (caller, sql preview, seconds)
+        self.wall_seconds = 0.0
+        self.finished = threading.Event()
+
+        self._root = root_frame
+        self._thread = threading.Thread(target=self._run, name=f'page-profiler-{page_name}', daemon=True)
+
+    def start(self) -> 'PageProfiler':
+        from database import add_query_listener
+        add_query_listener(self._on_query)
+        self._thread.start()
+        return self
+
+    def _stack(self) -> Optional[Tuple[FrameKey, ...]]:
+        """Current stack of the profiled thread, or None once the page has returned."""
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            stack.append(_frame_key(frame))
+            if frame is self._root:
+                return tuple(reversed(stack))
+            frame = frame.f_back
+        return None
+
+    def _run(self) -> None:
+        start = last = time.perf_counter()
+        try:
+            while len(self.samples) < MAX_SAMPLES:
+                time.sleep(self.interval)
+                stack = self._stack()
+                now = time.perf_counter()
+                if stack is None:
+                    break
+                self.samples.append((now - last, stack))
+                last = now
+        finally:
+            self.wall_seconds = time.perf_counter() - start
+            from database import remove_query_listener
+            remove_query_listener(self._on_query)
+            # Drop the root frame so the finished profile doesn't keep the page's globals alive
+            self._root = None
+            self.finished.set()
+            logger.info(f"PROFILE: {self.summary_line()}")
+
+    def _on_query(self, query: str, seconds: float) -> None:
+        """database listener: record queries issued from the profiled thread."""
+        if threading.get_ident() != self.thread_id or self.finished.is_set():
+            return
+        preview = ' '.join(query.split())[:80]
+        self.queries.append((_db_label(reversed(_call_stack(sys._getframe(1)))), preview, seconds))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the page has returned (for tests and scripts)."""
+        return self.finished.wait(timeout)
+
+    # -------------------------------------------------------------------------
+    # Reports
+    # -------------------------------------------------------------------------
+
+    @property
+    def sampled_seconds(self) -> float:
+        return sum(weight for weight, _ in self.samples)
+
+    def function_times(self) -> List[Dict[str, Any]]:
+        """
+        Wall time per top-level page function.
+
+        Each sample is charged to the outermost function defined in the page
+        script; time spent directly in the page's module body is '<page body>'.
+        """
+        totals: Dict[str, float] = defaultdict(float)
+        for weight, stack in self.samples:
+            label = '<page body>'
+            for name, filename, _ in stack[1:]:
+                if filename == self.page_file:
+                    label = name
+                    break
+            totals[label] += weight
+        return self._ranked(totals)
+
+    def db_times(self) -> List[Dict[str, Any]]:
+        """
+        Database time per query function.
+
+        'seconds' is sampled time inside queries.py/database.py (covers
+        pd.read_sql too), charged to the outermost query frame; 'calls' and
+        'query_seconds' are measured by execute_query().
+        """
+        totals: Dict[str, float] = defaultdict(float)
+        for weight, stack in self.samples:
+            label = _db_label(stack)
+            if label:
+                totals[label] += weight
+
+        calls: Dict[str, List[float]] = defaultdict(list)
+        for label, _, seconds in self.queries:
+            calls[label].append(seconds)
+        for label in calls:
+            totals.setdefault(label, 0.0)
+
+        rows = self._ranked(totals)
+        for row in rows:
+            timings = calls.get(row['function'], [])
+            row['calls'] = len(timings)
+            row['query_seconds'] = round(sum(timings), 3)
+        return rows
+
+    def _ranked(self, totals: Dict[str, float]) -> List[Dict[str, Any]]:
+        total = self.sampled_seconds or 1.0
+        return [
+            {'function': label, 'seconds': round(seconds, 3), 'percent': round(100 * seconds / total, 1)}
+            for label, seconds in sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        ]
+
+    def summary_line(self) -> str:
+        top = ', '.join(f"{row['function']} {row['seconds']:.2f}s" for row in self.function_times()[:3])
+        db_seconds = sum(row['seconds'] for row in self.db_times())
+        return (
+            f"{self.page_name} rerun {self.wall_seconds:.2f}s "
+            f"({len(self.samples)} samples, {len(self.queries)} queries, DB {db_seconds:.2f}s); top: {top}"
+        )
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """Speedscope 'sampled' profile; adjacent identical stacks are merged."""
+        frame_index: Dict[FrameKey, int] = {}
+        frames = []
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        previous = None
+
+        for weight, stack in self.samples:
+            if stack == previous:
+                weights[-1] += weight
+                continue
+            indices = []
+            for key in stack:
+                if key not in frame_index:
+                    frame_index[key] = len(frames)
+                    name, filename, line = key
+                    frames.append({'name': name, 'file': filename, 'line': line})
+                indices.append(frame_index[key])
+            samples.append(indices)
+            weights.append(weight)
+            previous = stack
+
+        name = f"{self.page_name} {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at))}"
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'canopy page_profiler',
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights,
+            }],
+        }
+
+
+# =============================================================================
+# STREAMLIT INTEGRATION
+# =============================================================================
+
+def profiling_enabled() -> bool:
+    """True if CANOPY_PROFILE is set or the URL has ?profile=1."""
+    if os.getenv(PROFILE_ENV_VAR, '').lower() in ('1', 'true', 'yes'):
+        return True
+
+    import streamlit as st
+    try:
+        if hasattr(st, 'query_params'):
+            value = st.query_params.get(PROFILE_QUERY_PARAM)
+        else:
+            value = (st.experimental_get_query_params().get(PROFILE_QUERY_PARAM) or [None])[0]
+    except Exception:
+        return False
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
+def start_page_profile() -> Optional[PageProfiler]:
+    """
+    Profile this rerun of the calling page, if profiling is enabled.
+
+    Shows the previous rerun's profile in the sidebar, then starts sampling
+    this one. Call from page module level, after st.set_page_config().
+
+    Returns:
+        The running PageProfiler, or None when profiling is off
+    """
+    if not profiling_enabled():
+        return None
+
+    import streamlit as st
+
+    previous = st.session_state.get(SESSION_KEY)
+    if previous is not None and previous.finished.is_set():
+        render_profile_overlay(previous)
+    else:
+        st.sidebar.caption("⏱ Profiling on: this rerun's profile appears on the next one.")
+
+    root = sys._getframe(1)
+    interval_ms = float(os.getenv('CANOPY_PROFILE_INTERVAL_MS') or DEFAULT_INTERVAL_MS)
+    profiler = PageProfiler(root, Path(root.f_code.co_filename).stem, interval_ms).start()
+    st.session_state[SESSION_KEY] = profiler
+    return profiler
+
+
+def render_profile_overlay(profiler: PageProfiler) -> None:
+    """Sidebar expander with the profile of a finished rerun."""
+    import pandas as pd
+    import streamlit as st
+
+    with st.sidebar.expander(f"⏱ Last rerun: {profiler.wall_seconds:.2f}s", expanded=False):
+        st.caption(f"{profiler.page_name} · {len(profiler.samples)} samples · {len(profiler.queries)} queries")
+
+        functions = profiler.function_times()[:TOP_N]
+        if functions:
+            st.markdown("**Page functions**")
+            st.dataframe(pd.DataFrame(functions), hide_index=True, width="stretch")
+
+        db_rows = profiler.db_times()[:TOP_N]
+        if db_rows:
+            st.markdown("**Database**")
+            st.dataframe(pd.DataFrame(db_rows), hide_index=True, width="stretch")
+
+        st.download_button(
+            "Download speedscope profile",
+            data=json.dumps(profiler.to_speedscope()).encode('utf-8'),
+            file_name=f"{profiler.page_name}_{int(profiler.started_at)}.speedscope.json",
+            mime='application/json',
+            key='_page_profiler_download',
+        )
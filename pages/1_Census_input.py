@@ -18,7 +18,8 @@ logging.basicConfig(
 from database import get_database_connection
 from utils import CensusProcessor, ContributionComparison, render_feedback_sidebar
 from constants import FAMILY_STATUS_CODES
-from census_schema import normalize_census_df
+from census_schema import enforce_census_schema, normalize_census_df
+from page_profiler import start_page_profile
 # PDF renderer imported lazily when needed (requires playwright)
 
 
@@ -79,7 +80,7 @@ def _get_plan_availability_cached(ra_hash, _db_available, ra_data_json: str):
     if emp_df is None or emp_df.empty or 'rating_area_id' not in emp_df.columns or db is None:
         return pd.DataFrame()
 
-    ra_counts = emp_df.groupby(['state', 'county', 'rating_area_id']).size().reset_index(name='employees')
+    ra_counts = emp_df.groupby(['state', 'county', 'rating_area_id'], observed=True).size().reset_index(name='employees')
     ra_counts = ra_counts[ra_counts['rating_area_id'].notna()]
 
     if ra_counts.empty:
@@ -94,9 +95,9 @@ def _get_plan_availability_cached(ra_hash, _db_available, ra_data_json: str):
         SUBSTRING(p.hios_plan_id, 6, 2) as state,
         r.rating_area_id,
         COUNT(DISTINCT p.hios_plan_id) as plan_count
-    FROM rbis_insurance_plan_20251019202724 p
-    JOIN rbis_insurance_plan_variant_20251019202724 v ON v.hios_plan_id = p.hios_plan_id
-    JOIN rbis_insurance_plan_base_rates_20251019202724 r ON r.plan_id = p.hios_plan_id
+    FROM rbis_insurance_plan p
+    JOIN rbis_insurance_plan_variant v ON v.hios_plan_id = p.hios_plan_id
+    JOIN rbis_insurance_plan_base_rates r ON r.plan_id = p.hios_plan_id
     WHERE p.market_coverage = 'Individual'
       AND p.plan_effective_date = '2026-01-01'
       AND v.csr_variation_type IN ('Exchange variant (no CSR)', 'Non-Exchange variant')
@@ -105,7 +106,7 @@ def _get_plan_availability_cached(ra_hash, _db_available, ra_data_json: str):
     GROUP BY SUBSTRING(p.hios_plan_id, 6, 2), r.rating_area_id
     """
     try:
-        plan_counts_df = pd.read_sql(query, db.engine, params=(tuple(states), tuple(rating_areas)))
+        plan_counts_df = db.read_sql(query, params=(tuple(states), tuple(rating_areas)))
         if not plan_counts_df.empty:
             plan_counts_df['rating_area_num'] = plan_counts_df['rating_area_id'].str.extract(r'(\d+)').astype(int)
             plan_availability_df = ra_counts.merge(
@@ -177,6 +178,7 @@ def get_census_pdf_filename(client_name: str) -> str:
 
 # Page config
 st.set_page_config(page_title="Census Input", page_icon="📊", layout="wide")
+start_page_profile()
 
 # Custom CSS to match app branding
 st.markdown("""
@@ -743,7 +745,7 @@ if st.session_state.census_df is not None:
 
         st.markdown("---")
         st.markdown("**Employees by County:**")
-        county_counts = employees_df.groupby(['state', 'county']).size().reset_index(name='count')
+        county_counts = employees_df.groupby(['state', 'county'], observed=True).size().reset_index(name='count')
         county_counts = county_counts.sort_values('count', ascending=False)
         st.dataframe(county_counts, width="stretch", hide_index=True)
 
@@ -889,7 +891,7 @@ if st.session_state.census_df is not None:
         col1, col2 = st.columns(2)
 
         with col1:
-            ra_counts = employees_df.groupby(['state', 'rating_area_id']).size().reset_index(name='count')
+            ra_counts = employees_df.groupby(['state', 'rating_area_id'], observed=True).size().reset_index(name='count')
             ra_counts = ra_counts.sort_values(['state', 'rating_area_id'])
 
             st.markdown("**Employees by Rating Area:**")
@@ -1080,6 +1082,11 @@ else:
                     # Normalize column names before storing (ensures consistent access across pages)
                     employees_df = normalize_census_df(employees_df)
 
+                    # Store canonical columns compactly (categoricals, small ints, parsed money/DOB)
+                    employees_df, schema_report = enforce_census_schema(employees_df, inplace=True)
+                    dependents_df, _ = enforce_census_schema(dependents_df, inplace=True)
+                    logging.info(f"FILE UPLOAD: {schema_report.summary()}")
+
                     # Store in session state
                     st.session_state.census_df = employees_df
                     st.session_state.dependents_df = dependents_df
@@ -1515,7 +1522,7 @@ else:
 
                         st.markdown("---")
                         st.markdown("**Employees by County:**")
-                        county_counts = employees_df.groupby(['state', 'county']).size().reset_index(name='count')
+                        county_counts = employees_df.groupby(['state', 'county'], observed=True).size().reset_index(name='count')
                         county_counts = county_counts.sort_values('count', ascending=False)
                         st.dataframe(county_counts, width="stretch", hide_index=True)
 
@@ -1661,7 +1668,7 @@ else:
                         col1, col2 = st.columns(2)
 
                         with col1:
-                            ra_counts = employees_df.groupby(['state', 'rating_area_id']).size().reset_index(name='count')
+                            ra_counts = employees_df.groupby(['state', 'rating_area_id'], observed=True).size().reset_index(name='count')
                             ra_counts = ra_counts.sort_values(['state', 'rating_area_id'])
 
                             st.markdown("**Employees by Rating Area:**")
@@ -8,8 +8,6 @@ import streamlit as st
 import pandas as pd
 # Opt-in to future pandas behavior for fillna (avoids FutureWarning)
 pd.set_option('future.no_silent_downcasting', True)
-import plotly.express as px
-import plotly.graph_objects as go
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -20,10 +18,12 @@ from typing import Dict, List, Optional, Any, Union
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database import get_database_connection, DatabaseConnection
+from dataset_registry import get_dataset_registry
+from csv_export import census_identity_frame, csv_download_data, join_on_employee, numeric_column
+from group_rate_pricing import cooperative_rate_table, group_rate_totals, price_census, sedera_rate_table
 from utils import ContributionComparison, PremiumCalculator, render_feedback_sidebar
 from financial_calculator import FinancialSummaryCalculator
-from pptx_cooperative_health import CooperativeHealthData, generate_cooperative_health_slide
-from pptx_employee_examples import generate_employee_examples_pptx
+from adoption_simulation import inputs_from_multi_metal, premium_share_costs, simulate_adoption
 from queries import get_plan_deductible_and_moop_batch, HealthCheckQueries
 from constants import (
     FAMILY_STATUS_CODES,
@@ -33,11 +33,15 @@ from constants import (
     COOPERATIVE_CONFIG,
     METAL_COST_RATIOS,
     DEFAULT_ADOPTION_RATES,
+    ADOPTION_SIMULATION_CONFIG,
     OLDER_POPULATION_WARNING_AGE,
     DISPLAY_PLACEHOLDERS,
     TIER_COLORS,
     TIER_LABELS,
 )
+from page_profiler import start_page_profile
+
+start_page_profile()
 
 # Custom CSS to match Figma design
 st.markdown("""
@@ -383,6 +387,8 @@ class DashboardData:
 
     # Expected adoption
     expected_adoption: Dict[str, Dict] = field(default_factory=dict)
+    # Monte Carlo spread around expected adoption (simulate_adoption result for the contribution strategy)
+    adoption_simulation: Dict[str, Any] = field(default_factory=dict)
 
     # Affordability
     affordability_failures: int = 0
@@ -588,8 +594,8 @@ def load_dashboard_data(census_df: pd.DataFrame, dependents_df: pd.DataFrame = N
             if state_col in census_df.columns:
                 data.diagnostic_info['states'] = census_df[state_col].unique().tolist()
 
-            data.multi_metal_results = FinancialSummaryCalculator.calculate_multi_metal_scenario(
-                census_df, db, ['Bronze', 'Silver', 'Gold'], dependents_df
+            data.multi_metal_results = load_multi_metal_results(
+                census_df, dependents_df, get_dataset_registry().version, _db=db
             )
             data.has_lcsp_data = True
 
@@ -709,11 +715,12 @@ def load_dashboard_data(census_df: pd.DataFrame, dependents_df: pd.DataFrame = N
     if dashboard_config and 'adoption_rates' in dashboard_config:
         adoption_rates = dashboard_config['adoption_rates']
 
-    data.expected_adoption = {
-        "Cooperative": {"pct": adoption_rates.get('Cooperative', 70), "color": "#00c950"},
-        "ICHRA Silver": {"pct": adoption_rates.get('ICHRA Silver', 20), "color": "#6a7282"},
-        "ICHRA Gold": {"pct": adoption_rates.get('ICHRA Gold', 10), "color": "#f0b100"},
-    }
+    data.expected_adoption = build_expected_adoption(adoption_rates)
+    if data.multi_metal_results:
+        data.adoption_simulation = load_adoption_simulation(
+            census_df, dependents_df, adoption_rates, data.contribution_pct, cooperative_ratio,
+            get_dataset_registry().version, _db=db
+        )
 
     # ==========================================================================
     # AFFORDABILITY ANALYSIS
@@ -728,6 +735,107 @@ def load_dashboard_data(census_df: pd.DataFrame, dependents_df: pd.DataFrame = N
     return data
 
 
+def simulate_expected_adoption(census_df: pd.DataFrame, multi_metal_results: Dict,
+                               adoption_rates: Dict[str, float], contribution_pct: float,
+                               cooperative_ratio: float = None, coop_rates_df: pd.DataFrame = None,
+                               dependents_df: pd.DataFrame = None) -> Dict[str, Any]:
+    """
+    Simulate plan choice, waivers and PTC opt-outs around the expected adoption mix.
+
+    Prices employees the way calculate_company_totals() does: the employer pays
+    contribution_pct of the ICHRA metal premium and all of the Cooperative
+    premium (rate table, else cooperative_ratio x Silver).
+
+    Returns:
+        simulate_adoption() result for the contribution strategy, or {} without multi-metal data
+    """
+    if not multi_metal_results:
+        return {}
+
+    cooperative_premiums = None
+    family_col = 'family_status' if 'family_status' in census_df.columns else None
+    id_col = 'employee_id' if 'employee_id' in census_df.columns else 'Employee Number'
+    if coop_rates_df is not None and not coop_rates_df.empty and family_col and id_col in census_df.columns:
+        coop_table = cooperative_rate_table(coop_rates_df, ('2.5k',))
+        coop_prices = price_census(census_df, coop_table, dependents_df, family_col)['2.5k']
+        cooperative_premiums = dict(zip(census_df[id_col].astype(str), coop_prices))
+
+    try:
+        inputs = inputs_from_multi_metal(multi_metal_results, census_df,
+                                         cooperative_premiums=cooperative_premiums,
+                                         cooperative_ratio=cooperative_ratio)
+    except ValueError:
+        return {}
+    results = simulate_adoption(inputs, {'contribution': premium_share_costs(inputs, contribution_pct)},
+                                adoption_rates=adoption_rates)
+    return results['contribution']
+
+
+def build_expected_adoption(adoption_rates: Dict[str, float]) -> Dict[str, Dict]:
+    """Adoption mix for the donut chart: {option: {'pct': ..., 'color': ...}}."""
+    return {
+        "Cooperative": {"pct": adoption_rates.get('Cooperative', 70), "color": "#00c950"},
+        "ICHRA Silver": {"pct": adoption_rates.get('ICHRA Silver', 20), "color": "#6a7282"},
+        "ICHRA Gold": {"pct": adoption_rates.get('ICHRA Gold', 10), "color": "#f0b100"},
+    }
+
+
+# =============================================================================
+# MEMOIZED DATA PROVIDERS
+# =============================================================================
+# Widget reruns (and fragment reruns) read these instead of recalculating.
+# Each is keyed on the census, dependents and active RBIS version; the
+# database connection is left out of the key (leading underscore).
+
+@st.cache_data(show_spinner=False, ttl=3600)  # Cache for 1 hour
+def load_multi_metal_results(census_df: pd.DataFrame, dependents_df: pd.DataFrame = None,
+                             rbis_version: str = '', _db=None) -> Dict[str, Dict]:
+    """Bronze/Silver/Gold lowest-cost premiums per employee (calculate_multi_metal_scenario)."""
+    return FinancialSummaryCalculator.calculate_multi_metal_scenario(
+        census_df, _db, ['Bronze', 'Silver', 'Gold'], dependents_df
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=3600)  # Cache for 1 hour
+def load_tier_marketplace_costs(census_df: pd.DataFrame, dependents_df: pd.DataFrame = None,
+                                rbis_version: str = '', _db=None) -> Dict:
+    """Marketplace rates by coverage type (calculate_tier_marketplace_costs)."""
+    multi_metal_results = load_multi_metal_results(census_df, dependents_df, rbis_version, _db=_db)
+    return calculate_tier_marketplace_costs(census_df, multi_metal_results, _db, dependents_df)
+
+
+@st.cache_data(show_spinner=False, ttl=3600)  # Cache for 1 hour
+def load_marketplace_rates_csv(census_df: pd.DataFrame, dependents_df: pd.DataFrame = None,
+                               rbis_version: str = '', _db=None) -> pd.DataFrame:
+    """Per-employee marketplace rate details export (generate_marketplace_rates_csv)."""
+    multi_metal_results = load_multi_metal_results(census_df, dependents_df, rbis_version, _db=_db)
+    return generate_marketplace_rates_csv(census_df, multi_metal_results, dependents_df, _db)
+
+
+@st.cache_data(show_spinner=False, ttl=3600)  # Cache for 1 hour
+def load_adoption_simulation(census_df: pd.DataFrame, dependents_df: pd.DataFrame,
+                             adoption_rates: Dict[str, float], contribution_pct: float,
+                             cooperative_ratio: float, rbis_version: str = '',
+                             _db=None) -> Dict[str, Any]:
+    """Monte Carlo adoption spread for one adoption mix (simulate_expected_adoption)."""
+    multi_metal_results = load_multi_metal_results(census_df, dependents_df, rbis_version, _db=_db)
+    return simulate_expected_adoption(
+        census_df, multi_metal_results, adoption_rates, contribution_pct,
+        cooperative_ratio=cooperative_ratio,
+        coop_rates_df=load_cooperative_rate_table(_db_available=_db is not None),
+        dependents_df=dependents_df
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=3600)  # Cache for 1 hour
+def get_employee_option_labels(census_df: pd.DataFrame) -> Dict[str, str]:
+    """Dropdown labels for every employee, keyed like get_employee_dropdown_options()."""
+    labels = {}
+    for idx, row in census_df.iterrows():
+        labels.setdefault(str(row.get('employee_id', idx)), _format_employee_row(row))
+    return labels
+
+
 def calculate_tier_costs(census_df: pd.DataFrame, contribution_analysis: Dict = None,
                          db=None, multi_metal_results: Dict = None,
                          renewal_monthly: float = None,
@@ -781,8 +889,12 @@ def calculate_tier_costs(census_df: pd.DataFrame, contribution_analysis: Dict =
     if not family_col:
         return tier_costs
 
-    # OPTIMIZATION: Build cooperative rate lookup once for O(1) access
-    coop_lookup = build_cooperative_rate_lookup(coop_rates_df) if coop_rates_df is not None else {}
+    # Cooperative ($2.5k) group rate for every employee, priced once for the census
+    has_coop_rates = coop_rates_df is not None and not coop_rates_df.empty
+    coop_prices = (
+        price_census(census_df, cooperative_rate_table(coop_rates_df, ('2.5k',)), dependents_df, family_col)['2.5k']
+        if has_coop_rates else None
+    )
 
     # Pre-calculate metal costs by tier from multi_metal_results
     metal_costs_by_tier = {}
@@ -849,18 +961,12 @@ def calculate_tier_costs(census_df: pd.DataFrame, contribution_analysis: Dict =
 
             # Cooperative - use rate table if available, otherwise ratio of silver
             # Uses eldest family member's age band for all members
-            if coop_lookup:
-                # Calculate cooperative rate for each employee using family rate function
-                # This applies the eldest member age band rule
-                coop_rates = []
-                for _, emp_row in tier_employees.iterrows():
-                    coop_rate = calculate_cooperative_family_rate(
-                        emp_row, status_code, coop_lookup, dependents_df
-                    )
-                    if coop_rate > 0:
-                        coop_rates.append(coop_rate)
-                if coop_rates:
-                    tier_costs[tier_name]['Cooperative'] = round(sum(coop_rates) / len(coop_rates), 0)
+            if has_coop_rates:
+                # Eldest member age band rule, already applied in coop_prices
+                coop_rates = coop_prices.loc[tier_employees.index]
+                coop_rates = coop_rates[coop_rates > 0]
+                if not coop_rates.empty:
+                    tier_costs[tier_name]['Cooperative'] = round(float(coop_rates.mean()), 0)
                 else:
                     # Fallback to ratio if no rates found
                     silver_cost = metal_costs_by_tier[tier_name].get('ICHRA Silver', 0)
@@ -1165,52 +1271,24 @@ def calculate_hap_totals(census_df: pd.DataFrame, coop_rates_df: pd.DataFrame,
     if coop_rates_df is None or coop_rates_df.empty:
         return result
 
-    # Build lookup dicts for both deductible levels
-    lookup_1k = build_cooperative_rate_lookup(coop_rates_df, "1k")
-    lookup_2_5k = build_cooperative_rate_lookup(coop_rates_df, "2.5k")
-
-    # Calculate rate ranges from the rate table itself (youngest to oldest age band)
-    youngest_band = "18-29"
-    oldest_band = "60-64"
-    for family_status in ['EE', 'ES', 'EC', 'F']:
-        # $1k deductible ranges
-        min_rate_1k = lookup_1k.get((youngest_band, family_status), 0)
-        max_rate_1k = lookup_1k.get((oldest_band, family_status), 0)
-        result['hap_1k']['rate_ranges'][family_status] = {'min': min_rate_1k, 'max': max_rate_1k}
-
-        # $2.5k deductible ranges
-        min_rate_2_5k = lookup_2_5k.get((youngest_band, family_status), 0)
-        max_rate_2_5k = lookup_2_5k.get((oldest_band, family_status), 0)
-        result['hap_2_5k']['rate_ranges'][family_status] = {'min': min_rate_2_5k, 'max': max_rate_2_5k}
-
     # Determine column names
     family_col = 'family_status' if 'family_status' in census_df.columns else None
     if not family_col and 'Family Status' in census_df.columns:
         family_col = 'Family Status'
     age_col = 'age' if 'age' in census_df.columns else None
 
+    # Rate ranges come from the rate table itself (youngest to oldest age band)
+    table = cooperative_rate_table(coop_rates_df, ('1k', '2.5k'))
+    result['hap_1k']['rate_ranges'] = table.rate_ranges('1k')
+    result['hap_2_5k']['rate_ranges'] = table.rate_ranges('2.5k')
+
     if not family_col or not age_col:
         return result
 
-    # Loop through each employee and accumulate totals
-    for _, emp in census_df.iterrows():
-        family_status = emp.get(family_col, 'EE')
-
-        # Calculate aggregate family rate (summing all family members)
-        # For EE, uses single rate; for ES/EC/F, sums employee + dependent rates
-        rate_1k = calculate_cooperative_family_rate(emp, family_status, lookup_1k, dependents_df)
-        rate_2_5k = calculate_cooperative_family_rate(emp, family_status, lookup_2_5k, dependents_df)
-
-        # Accumulate totals
-        result['hap_1k']['total'] += rate_1k
-        result['hap_2_5k']['total'] += rate_2_5k
-
-        # Accumulate by tier
-        if family_status in result['hap_1k']['by_tier']:
-            result['hap_1k']['by_tier'][family_status]['total'] += rate_1k
-            result['hap_1k']['by_tier'][family_status]['count'] += 1
-            result['hap_2_5k']['by_tier'][family_status]['total'] += rate_2_5k
-            result['hap_2_5k']['by_tier'][family_status]['count'] += 1
+    # Both deductibles priced for the whole census in one pass
+    totals = group_rate_totals(census_df, table, dependents_df, family_col)
+    result['hap_1k'] = totals['1k']
+    result['hap_2_5k'] = totals['2.5k']
 
     return result
 
@@ -1466,10 +1544,6 @@ def calculate_sedera_totals(census_df: pd.DataFrame, sedera_rates_df: pd.DataFra
     if sedera_rates_df is None or sedera_rates_df.empty:
         return result
 
-    # Sedera age bands for rate ranges
-    youngest_band = "18-29"
-    oldest_band = "60+"
-
     # Determine column names
     family_col = 'family_status' if 'family_status' in census_df.columns else None
     if not family_col and 'Family Status' in census_df.columns:
@@ -1479,40 +1553,10 @@ def calculate_sedera_totals(census_df: pd.DataFrame, sedera_rates_df: pd.DataFra
     if not family_col or not age_col:
         return result
 
-    for iua in selected_iuas:
-        key = f'sedera_{iua}'
-        result[key] = {
-            'total': 0,
-            'by_tier': {code: {'total': 0, 'count': 0} for code in ['EE', 'ES', 'EC', 'F']},
-            'rate_ranges': {code: {'min': 0, 'max': 0} for code in ['EE', 'ES', 'EC', 'F']}
-        }
-
-        # Build lookup for this IUA
-        lookup = build_sedera_rate_lookup(sedera_rates_df, iua)
-        if not lookup:
-            continue
-
-        # Calculate rate ranges
-        for family_status in ['EE', 'ES', 'EC', 'F']:
-            min_rate = lookup.get((youngest_band, family_status), 0)
-            max_rate = lookup.get((oldest_band, family_status), 0)
-            result[key]['rate_ranges'][family_status] = {'min': min_rate, 'max': max_rate}
-
-        # Loop through each employee and accumulate totals
-        for _, emp in census_df.iterrows():
-            family_status = emp.get(family_col, 'EE')
-
-            # Calculate aggregate family rate (summing all family members)
-            # For EE, uses single rate; for ES/EC/F, sums employee + dependent rates
-            rate = calculate_sedera_family_rate(emp, family_status, lookup, dependents_df)
-
-            # Accumulate totals
-            result[key]['total'] += rate
-
-            # Accumulate by tier
-            if family_status in result[key]['by_tier']:
-                result[key]['by_tier'][family_status]['total'] += rate
-                result[key]['by_tier'][family_status]['count'] += 1
+    # All selected IUAs priced for the whole census in one pass
+    table = sedera_rate_table(sedera_rates_df, selected_iuas)
+    for iua, totals in group_rate_totals(census_df, table, dependents_df, family_col).items():
+        result[f'sedera_{iua}'] = totals
 
     return result
 
@@ -2007,15 +2051,11 @@ def calculate_company_totals(census_df: pd.DataFrame, contribution_analysis: Dic
         if coop_rates_df is not None and not coop_rates_df.empty:
             # Sum cooperative rates from rate table for each employee
             # Uses aggregate family rates (sums employee + dependent rates, no 3-child cap)
-            coop_lookup = build_cooperative_rate_lookup(coop_rates_df)
             coop_total = 0
             family_col = 'family_status' if 'family_status' in census_df.columns else None
             if family_col:
-                for _, emp_row in census_df.iterrows():
-                    emp_fs = emp_row.get(family_col, 'EE')
-                    coop_rate = calculate_cooperative_family_rate(emp_row, emp_fs, coop_lookup, dependents_df)
-                    if coop_rate > 0:
-                        coop_total += coop_rate
+                coop_table = cooperative_rate_table(coop_rates_df, ('2.5k',))
+                coop_total = float(price_census(census_df, coop_table, dependents_df, family_col)['2.5k'].sum())
             if coop_total > 0:
                 totals['Cooperative'] = coop_total
             else:
@@ -2206,7 +2246,7 @@ def get_single_rate(plan_id: str, rating_area: int, age: int, db, state_code: st
 
     query = """
     SELECT individual_rate
-    FROM rbis_insurance_plan_base_rates_20251019202724
+    FROM rbis_insurance_plan_base_rates
     WHERE plan_id = %s
       AND rating_area_id = %s
       AND age = %s
@@ -2215,7 +2255,7 @@ def get_single_rate(plan_id: str, rating_area: int, age: int, db, state_code: st
     """
 
     try:
-        result = pd.read_sql(query, db.engine, params=(plan_id, rating_area_str, age_band))
+        result = db.read_sql(query, params=(plan_id, rating_area_str, age_band))
         if not result.empty:
             return float(result.iloc[0]['individual_rate'])
     except Exception as e:
@@ -2265,7 +2305,11 @@ def select_employee_examples(census_df: pd.DataFrame, contribution_analysis: Dic
     # Add DOB as secondary sort key to break ties (later DOB = truly younger)
     df_with_dob_date = census_df.copy()
     if 'dob' in df_with_dob_date.columns:
-        df_with_dob_date['_dob_parsed'] = pd.to_datetime(df_with_dob_date['dob'], format='mixed', errors='coerce')
+        # dob_date is pre-parsed by enforce_census_schema()
+        df_with_dob_date['_dob_parsed'] = (
+            df_with_dob_date['dob_date'] if 'dob_date' in df_with_dob_date.columns
+            else pd.to_datetime(df_with_dob_date['dob'], format='mixed', errors='coerce')
+        )
         # Sort: age ascending (youngest first), then DOB descending (later birth date = younger)
         sorted_df = df_with_dob_date.sort_values(['age', '_dob_parsed'], ascending=[True, False])
     else:
@@ -2398,7 +2442,11 @@ def format_employee_option(census_df: pd.DataFrame, emp_id: str) -> str:
     employee_row = get_employee_row_by_id(census_df, emp_id)
     if employee_row is None:
         return emp_id
+    return _format_employee_row(employee_row)
 
+
+def _format_employee_row(employee_row: pd.Series) -> str:
+    """Dropdown label for one census row (see format_employee_option)."""
     tier_labels = {
         'EE': 'Employee Only',
         'ES': 'Employee + Spouse',
@@ -2484,7 +2532,11 @@ def get_default_employee_selections(census_df: pd.DataFrame) -> Dict[str, str]:
     # Add DOB parsing for tie-breaking
     df = census_df.copy()
     if 'dob' in df.columns:
-        df['_dob_parsed'] = pd.to_datetime(df['dob'], format='mixed', errors='coerce')
+        # dob_date is pre-parsed by enforce_census_schema()
+        df['_dob_parsed'] = (
+            df['dob_date'] if 'dob_date' in df.columns
+            else pd.to_datetime(df['dob'], format='mixed', errors='coerce')
+        )
         # Sort: age ascending, then DOB descending (later DOB = younger)
         sorted_df = df.sort_values(['age', '_dob_parsed'], ascending=[True, False])
     else:
@@ -2773,7 +2825,7 @@ def build_employee_example(employee_row: pd.Series, label: str,
                 # Deductible query - check for both Medical EHB and Combined Medical/Drug patterns
                 ded_query = """
                 SELECT plan_id, individual_ded_moop_amount as deductible
-                FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+                FROM rbis_insurance_plan_variant_ddctbl_moop
                 WHERE plan_id IN %s
                   AND network_type = 'In Network'
                   AND (
@@ -2782,17 +2834,17 @@ def build_employee_example(employee_row: pd.Series, label: str,
                   )
                   AND individual_ded_moop_amount NOT IN ('Not Applicable', 'N/A', '')
                 """
-                ded_df = pd.read_sql(ded_query, db.engine, params=(plan_ids_tuple,))
+                ded_df = db.read_sql(ded_query, params=(plan_ids_tuple,))
 
                 # MOOP query
                 moop_query = """
                 SELECT plan_id, individual_ded_moop_amount as moop
-                FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+                FROM rbis_insurance_plan_variant_ddctbl_moop
                 WHERE plan_id IN %s
                   AND network_type = 'In Network'
                   AND moop_ded_type LIKE '%%Maximum Out of Pocket%%'
                 """
-                moop_df = pd.read_sql(moop_query, db.engine, params=(plan_ids_tuple,))
+                moop_df = db.read_sql(moop_query, params=(plan_ids_tuple,))
 
                 # Build lookup
                 plan_info_lookup = {pid: {'deductible': None, 'moop': None} for pid in plan_ids_tuple}
@@ -3032,6 +3084,7 @@ def build_employee_example(employee_row: pd.Series, label: str,
     renewal_total_monthly = costs['Renewal']['employer'] + costs['Renewal']['employee']
 
     return {
+        "employee_id": emp_id,
         "name": first_name,
         "label": label,
         "age": age,
@@ -3094,90 +3147,49 @@ def generate_scenario_rates_csv(census_df: pd.DataFrame,
             'sedera_iuas': set(),
         }
 
-    # Build lookup dicts for HAS rates
-    hap_lookups = {}
+    # Compile the selected HAS deductibles and Sedera IUAs into rate arrays
+    hap_iuas, sedera_iuas = [], []
     if config['hap_enabled'] and config['hap_iuas']:
-        for iua in config['hap_iuas']:
-            hap_lookups[iua] = build_cooperative_rate_lookup(coop_rates_df, iua) if coop_rates_df is not None else {}
-
-    # Build lookup dicts for Sedera rates
-    sedera_lookups = {}
+        hap_iuas = sorted(config['hap_iuas'], key=lambda x: float(x.replace('k', '')))
     if config['sedera_enabled'] and config['sedera_iuas'] and sedera_rates_df is not None:
-        for iua in config['sedera_iuas']:
-            sedera_lookups[iua] = build_sedera_rate_lookup(sedera_rates_df, iua)
-
-    all_rows = []
-
-    for _, emp in census_df.iterrows():
-        # Get employee data
-        emp_id = emp.get('employee_id', emp.get('Employee Number', ''))
-        first_name = emp.get('first_name', emp.get('First Name', ''))
-        last_name = emp.get('last_name', emp.get('Last Name', ''))
-        age = int(emp.get('age', 0)) if pd.notna(emp.get('age')) else 0
-        family_status = emp.get('family_status', emp.get('Family Status', 'EE'))
-        state = emp.get('state', emp.get('Home State', ''))
-        zip_code = emp.get('zip_code', emp.get('Home Zip', ''))
-        county = emp.get('county', '')
-        rating_area = emp.get('rating_area_id', '')
-
-        # Current/Renewal premiums
-        current_ee = emp.get('current_ee_monthly', 0)
-        current_ee = 0 if pd.isna(current_ee) else (current_ee or 0)
-        current_er = emp.get('current_er_monthly', 0)
-        current_er = 0 if pd.isna(current_er) else (current_er or 0)
-        gap_insurance = emp.get('gap_insurance_monthly', 0) or 0
-        current_total = current_ee + current_er + gap_insurance
-        renewal = emp.get('projected_2026_premium', 0) or 0
-
-        # Calculate age band for cooperative rates
-        age_band = _get_age_band(age) if age > 0 else ''
-
-        row = {
-            'employee_id': emp_id,
-            'first_name': first_name,
-            'last_name': last_name,
-            'age': age,
-            'age_band': age_band,
-            'family_status': family_status,
-            'state': state,
-            'zip': zip_code,
-            'county': county,
-            'rating_area': rating_area,
-            'current_ee_monthly': current_ee,
-            'current_er_monthly': current_er,
-            'gap_insurance_monthly': gap_insurance,
-            'current_total_monthly': current_total,
-            'renewal_premium': renewal,
-        }
-
-        # Add HAS rates based on config (aggregate family rates with member breakdown)
-        # Use None (not '') for empty values to keep columns numeric in CSV output
-        for iua in sorted(hap_lookups.keys(), key=lambda x: float(x.replace('k', ''))):
-            breakdown = calculate_cooperative_family_rate(emp, family_status, hap_lookups[iua], dependents_df, return_breakdown=True)
-            iua_col = iua.replace('.', '_')  # e.g., '2.5k' -> '2_5k'
-            row[f'hap_{iua_col}_total_rate'] = breakdown['total_rate']
-            row[f'hap_{iua_col}_ee_rate'] = breakdown['ee_rate']
-            row[f'hap_{iua_col}_spouse_rate'] = breakdown['spouse_rate']  # None for N/A
-            for i in range(1, 6):
-                row[f'hap_{iua_col}_child_{i}_rate'] = breakdown.get(f'child_{i}_rate')  # None for N/A
-
-        # Add Sedera rates based on config (aggregate family rates with member breakdown)
+        sedera_iuas = sorted(config['sedera_iuas'], key=lambda x: int(x))
+
+    # Employee metadata and current/renewal premiums, column-wise
+    df = census_identity_frame(census_df)
+    df['age_band'] = df['age'].map(lambda age: _get_age_band(age) if age > 0 else '')
+    df = df[['employee_id', 'first_name', 'last_name', 'age', 'age_band', 'family_status',
+             'state', 'zip', 'county', 'rating_area']]
+
+    current_ee = numeric_column(census_df, 'current_ee_monthly')
+    current_er = numeric_column(census_df, 'current_er_monthly')
+    gap_insurance = numeric_column(census_df, 'gap_insurance_monthly')
+    df['current_ee_monthly'] = current_ee
+    df['current_er_monthly'] = current_er
+    df['gap_insurance_monthly'] = gap_insurance
+    df['current_total_monthly'] = current_ee + current_er + gap_insurance
+    df['renewal_premium'] = numeric_column(census_df, 'projected_2026_premium')
+
+    # Plan rate columns: HAS/Sedera are group-priced, so the family's single rate is
+    # both the total and the EE rate; member rates stay empty (None keeps columns numeric)
+    rate_columns: Dict[str, list] = {}
+    priced = []
+    if hap_iuas:
+        hap_prices = price_census(df, cooperative_rate_table(coop_rates_df, hap_iuas), dependents_df)
+        priced += [(f"hap_{iua.replace('.', '_')}", hap_prices[iua]) for iua in hap_iuas]  # '2.5k' -> '2_5k'
+    if sedera_iuas:
         iua_display_map = {'500': '500', '1000': '1k', '1500': '1_5k', '2500': '2_5k', '5000': '5k'}
-        for iua in sorted(sedera_lookups.keys(), key=lambda x: int(x)):
-            breakdown = calculate_sedera_family_rate(emp, family_status, sedera_lookups[iua], dependents_df, return_breakdown=True)
-            col_name = iua_display_map.get(iua, iua)
-            row[f'sedera_{col_name}_total_rate'] = breakdown['total_rate']
-            row[f'sedera_{col_name}_ee_rate'] = breakdown['ee_rate']
-            row[f'sedera_{col_name}_spouse_rate'] = breakdown['spouse_rate']  # None for N/A
-            for i in range(1, 6):
-                row[f'sedera_{col_name}_child_{i}_rate'] = breakdown.get(f'child_{i}_rate')  # None for N/A
-
-        all_rows.append(row)
-
-    if not all_rows:
-        return pd.DataFrame()
+        sedera_prices = price_census(df, sedera_rate_table(sedera_rates_df, sedera_iuas), dependents_df)
+        priced += [(f"sedera_{iua_display_map.get(iua, iua)}", sedera_prices[iua]) for iua in sedera_iuas]
+
+    for prefix, rates in priced:
+        rate_columns[f'{prefix}_total_rate'] = rates.tolist()
+        rate_columns[f'{prefix}_ee_rate'] = rates.tolist()
+        rate_columns[f'{prefix}_spouse_rate'] = [None] * len(df)
+        for i in range(1, 6):
+            rate_columns[f'{prefix}_child_{i}_rate'] = [None] * len(df)
 
-    df = pd.DataFrame(all_rows)
+    if rate_columns:
+        df = pd.concat([df, pd.DataFrame(rate_columns, index=df.index)], axis=1)
 
     # Sort by last name, first name
     df = df.sort_values(['last_name', 'first_name'])
@@ -3234,109 +3246,72 @@ def generate_marketplace_rates_csv(census_df: pd.DataFrame,
                 'rating_area': emp_detail.get('rating_area', ''),
             }
 
-    all_rows = []
-
-    for _, emp in census_df.iterrows():
-        # Get employee data
-        emp_id = emp.get('employee_id', emp.get('Employee Number', ''))
-        first_name = emp.get('first_name', emp.get('First Name', ''))
-        last_name = emp.get('last_name', emp.get('Last Name', ''))
-        age = int(emp.get('age', 0)) if pd.notna(emp.get('age')) else 0
-        family_status = emp.get('family_status', emp.get('Family Status', 'EE'))
-        state = emp.get('state', emp.get('Home State', ''))
-        zip_code = emp.get('zip_code', emp.get('Home Zip', ''))
-        county = emp.get('county', '')
-        rating_area = emp.get('rating_area_id', '')
-
-        # Get metal plan data for this employee
-        metal_info = emp_metal_data.get(emp_id, {})
-
-        # For EE, use ee_rate; for ES/EC/F, calculate aggregate family premium if not already in data
-        bronze_info = metal_info.get('Bronze', {})
-        silver_info = metal_info.get('Silver', {})
-        gold_info = metal_info.get('Gold', {})
-
-        # Use family_rate for the main rate column (includes dependents for ES/EC/F)
-        bronze_rate = bronze_info.get('family_rate', 0)
-        silver_rate = silver_info.get('family_rate', 0)
-        gold_rate = gold_info.get('family_rate', 0)
-
-        # Store member breakdowns for each metal
-        metal_breakdowns = {'Bronze': None, 'Silver': None, 'Gold': None}
-
-        # If family_rate is 0 or same as ee_rate for non-EE, try to calculate
-        if family_status != 'EE' and db is not None:
-            for metal, info, current_rate in [
-                ('Bronze', bronze_info, bronze_rate),
-                ('Silver', silver_info, silver_rate),
-                ('Gold', gold_info, gold_rate)
-            ]:
-                plan_id = info.get('plan_id')
-                ra = info.get('rating_area') or rating_area
-                if plan_id and ra:
-                    # Parse rating area
-                    ra_int = ra
-                    if isinstance(ra, str):
-                        if ra.startswith('Rating Area '):
-                            ra_int = int(ra.replace('Rating Area ', ''))
-                        else:
-                            try:
-                                ra_int = int(ra)
-                            except ValueError:
-                                ra_int = 1
-                    # Calculate aggregate family premium with breakdown
-                    breakdown = calculate_aggregate_family_premium(emp, plan_id, ra_int, db, dependents_df, return_breakdown=True)
-                    if isinstance(breakdown, dict) and breakdown.get('total_rate', 0) > 0:
-                        metal_breakdowns[metal] = breakdown
-                        if current_rate == 0 or current_rate == info.get('ee_rate', 0):
-                            if metal == 'Bronze':
-                                bronze_rate = breakdown['total_rate']
-                            elif metal == 'Silver':
-                                silver_rate = breakdown['total_rate']
-                            elif metal == 'Gold':
-                                gold_rate = breakdown['total_rate']
+    df = census_identity_frame(census_df)
+    employees = census_df.to_dict('records')
 
-        row = {
-            'employee_id': emp_id,
-            'first_name': first_name,
-            'last_name': last_name,
-            'age': age,
-            'family_status': family_status,
-            'state': state,
-            'zip': zip_code,
-            'county': county,
-            'rating_area': rating_area,
-            'bronze_ee_rate': bronze_info.get('ee_rate', 0),
-            'bronze_family_rate': bronze_rate,
-            'bronze_plan_name': bronze_info.get('plan_name', 'N/A'),
-            'silver_ee_rate': silver_info.get('ee_rate', 0),
-            'silver_family_rate': silver_rate,
-            'silver_plan_name': silver_info.get('plan_name', 'N/A'),
-            'gold_ee_rate': gold_info.get('ee_rate', 0),
-            'gold_family_rate': gold_rate,
-            'gold_plan_name': gold_info.get('plan_name', 'N/A'),
-        }
-
-        # Add individual member rate columns for each metal level
-        # Use None (not '') for empty values to keep columns numeric in CSV output
-        for metal in ['bronze', 'silver', 'gold']:
-            breakdown = metal_breakdowns.get(metal.capitalize())
-            if breakdown:
-                row[f'{metal}_spouse_rate'] = breakdown.get('spouse_rate')  # None for N/A
-                for i in range(1, 6):
-                    row[f'{metal}_child_{i}_rate'] = breakdown.get(f'child_{i}_rate')  # None for N/A
-            else:
-                # No breakdown available (EE-only or no plan data)
-                row[f'{metal}_spouse_rate'] = None
-                for i in range(1, 6):
-                    row[f'{metal}_child_{i}_rate'] = None
-
-        all_rows.append(row)
-
-    if not all_rows:
-        return pd.DataFrame()
+    # Per-metal plan columns, looked up by employee ID; employees without plan data
+    # get zero rates and 'N/A' plan names
+    metal_info = {}
+    for metal in ['Bronze', 'Silver', 'Gold']:
+        plans = pd.DataFrame.from_dict(
+            {emp_id: data[metal] for emp_id, data in emp_metal_data.items() if metal in data},
+            orient='index',
+            columns=['ee_rate', 'family_rate', 'plan_name', 'plan_id', 'rating_area'],
+        )
+        info = join_on_employee(df, plans)
+        matched = df['employee_id'].isin(plans.index)
+        info['ee_rate'] = info['ee_rate'].where(matched, 0)
+        info['family_rate'] = info['family_rate'].where(matched, 0)
+        info['plan_name'] = info['plan_name'].where(matched, 'N/A')
+        metal_info[metal] = info
+
+    # Use None (not '') for empty values to keep member columns numeric in CSV output
+    member_columns = ['spouse_rate'] + [f'child_{i}_rate' for i in range(1, 6)]
+    family_rates = {metal: info['family_rate'].tolist() for metal, info in metal_info.items()}
+    member_rates = {
+        metal: {column: [None] * len(df) for column in member_columns}
+        for metal in metal_info
+    }
 
-    df = pd.DataFrame(all_rows)
+    # For ES/EC/F, calculate the aggregate family premium with member breakdown;
+    # only the non-EE rows need a rate lookup
+    if db is not None:
+        for pos, family_status in enumerate(df['family_status']):
+            if family_status == 'EE':
+                continue
+            for metal, info in metal_info.items():
+                plan_id = info['plan_id'].iat[pos]
+                ra = info['rating_area'].iat[pos]
+                ra = ra if pd.notna(ra) and ra else df['rating_area'].iat[pos]
+                if not (pd.notna(plan_id) and plan_id and ra):
+                    continue
+                # Parse rating area
+                ra_int = ra
+                if isinstance(ra, str):
+                    if ra.startswith('Rating Area '):
+                        ra_int = int(ra.replace('Rating Area ', ''))
+                    else:
+                        try:
+                            ra_int = int(ra)
+                        except ValueError:
+                            ra_int = 1
+                breakdown = calculate_aggregate_family_premium(employees[pos], plan_id, ra_int, db, dependents_df, return_breakdown=True)
+                if isinstance(breakdown, dict) and breakdown.get('total_rate', 0) > 0:
+                    for column in member_columns:
+                        member_rates[metal][column][pos] = breakdown.get(column)  # None for N/A
+                    current_rate = family_rates[metal][pos]
+                    if current_rate == 0 or current_rate == info['ee_rate'].iat[pos]:
+                        family_rates[metal][pos] = breakdown['total_rate']
+
+    df = df[['employee_id', 'first_name', 'last_name', 'age', 'family_status',
+             'state', 'zip', 'county', 'rating_area']]
+    for metal, info in metal_info.items():
+        df[f'{metal.lower()}_ee_rate'] = info['ee_rate']
+        df[f'{metal.lower()}_family_rate'] = family_rates[metal]
+        df[f'{metal.lower()}_plan_name'] = info['plan_name']
+    for metal in metal_info:
+        for column in member_columns:
+            df[f'{metal.lower()}_{column}'] = member_rates[metal][column]
 
     # Sort by last name, first name
     df = df.sort_values(['last_name', 'first_name'])
@@ -4443,7 +4418,7 @@ def render_comparison_table(data: DashboardData, db=None, census_df: pd.DataFram
         if db is not None and census_df is not None and not census_df.empty:
             csv_df = generate_scenario_rates_csv(census_df, coop_rates_df, sedera_rates_df, config, dependents_df)
             if csv_df is not None and not csv_df.empty:
-                csv_data = csv_df.to_csv(index=False)
+                csv_data = csv_download_data(csv_df)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 client_name = st.session_state.get('client_name', '').strip()
                 if client_name:
@@ -4463,7 +4438,10 @@ def render_comparison_table(data: DashboardData, db=None, census_df: pd.DataFram
         # PowerPoint download button for comparison table slide
         if census_df is not None and not census_df.empty:
             # Build CooperativeHealthData from current table data
-            from pptx_cooperative_health import TierData, PlanColumnData, PlanColumnTotals
+            from pptx_cooperative_health import (
+                CooperativeHealthData, TierData, PlanColumnData, PlanColumnTotals,
+                generate_cooperative_health_slide,
+            )
 
             # Build PPTX plan columns from UI plan_columns (1:1 mapping)
             pptx_plan_columns = []
@@ -4834,12 +4812,17 @@ def render_marketplace_rates_table(data: DashboardData, db: DatabaseConnection =
     """, unsafe_allow_html=True)
 
     # Calculate tier marketplace costs with aggregate family premiums
-    tier_costs = calculate_tier_marketplace_costs(
-        census_df,
-        multi_metal_results=data.multi_metal_results,
-        db=db,
-        dependents_df=dependents_df
-    )
+    # (memoized once multi-metal results exist, so widget reruns skip the rate lookups)
+    rbis_version = get_dataset_registry().version
+    if data.multi_metal_results:
+        tier_costs = load_tier_marketplace_costs(census_df, dependents_df, rbis_version, _db=db)
+    else:
+        tier_costs = calculate_tier_marketplace_costs(
+            census_df,
+            multi_metal_results=data.multi_metal_results,
+            db=db,
+            dependents_df=dependents_df
+        )
 
     # Get totals for comparison
     totals = tier_costs.get('totals', {})
@@ -5039,9 +5022,9 @@ def render_marketplace_rates_table(data: DashboardData, db: DatabaseConnection =
     with footer_col2:
         # CSV download button for marketplace rate details (includes aggregate family rates)
         if census_df is not None and not census_df.empty and data.multi_metal_results:
-            csv_df = generate_marketplace_rates_csv(census_df, data.multi_metal_results, dependents_df, db)
+            csv_df = load_marketplace_rates_csv(census_df, dependents_df, rbis_version, _db=db)
             if csv_df is not None and not csv_df.empty:
-                csv_data = csv_df.to_csv(index=False)
+                csv_data = csv_download_data(csv_df)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 client_name = st.session_state.get('client_name', '').strip()
                 if client_name:
@@ -5671,6 +5654,20 @@ def render_employee_examples(data: DashboardData, census_df: pd.DataFrame = None
         if current_selections.get(slot_key) is None or current_selections.get(slot_key) == '':
             current_selections[slot_key] = defaults.get(slot_key)
 
+    render_employee_example_cards(data, census_df, dependents_df, contribution_analysis, db)
+
+
+@st.fragment
+def render_employee_example_cards(data: DashboardData, census_df: pd.DataFrame,
+                                  dependents_df: pd.DataFrame = None,
+                                  contribution_analysis: Dict = None,
+                                  db=None):
+    """
+    Render the example options row and the three employee slot cards.
+
+    Runs as a fragment: changing a slot dropdown or an option checkbox reruns
+    only this panel, against the DashboardData of the last full run.
+    """
     # Options row: checkboxes and export buttons in a horizontal layout
     opt_col1, opt_col2, opt_col3, opt_col4 = st.columns([1, 1, 1, 1])
 
@@ -5774,6 +5771,7 @@ def render_employee_examples(data: DashboardData, census_df: pd.DataFrame = None
                 })
 
             # Generate PPTX with plan configurator settings for dynamic columns
+            from pptx_employee_examples import generate_employee_examples_pptx
             pptx_buffer = generate_employee_examples_pptx(
                 pptx_data,
                 client_name=data.client_name or '',
@@ -5831,6 +5829,8 @@ def render_employee_examples(data: DashboardData, census_df: pd.DataFrame = None
         ('slot_3', 'Older Employee', ['EE', 'ES', 'EC', 'F']),
     ]
 
+    option_labels = get_employee_option_labels(census_df)
+
     for slot_key, slot_label, tier_filter in slot_configs:
         # Get dropdown options for this slot (list of employee ID strings)
         options = get_employee_dropdown_options(census_df, tier_filter)
@@ -5850,17 +5850,11 @@ def render_employee_examples(data: DashboardData, census_df: pd.DataFrame = None
             # Dropdown selector at top of card
             dropdown_col, _ = st.columns([3, 5])
             with dropdown_col:
-                # Use a closure to capture census_df for format_func
-                def make_format_func(df):
-                    def format_func(emp_id):
-                        return format_employee_option(df, emp_id)
-                    return format_func
-
                 selected_emp_id = st.selectbox(
                     slot_label,
                     options=options,
                     index=selected_idx,
-                    format_func=make_format_func(census_df),
+                    format_func=lambda emp_id: option_labels.get(emp_id, emp_id),
                     key=f"employee_dropdown_{slot_key}",
                     label_visibility="collapsed"
                 )
@@ -5928,15 +5922,76 @@ def render_key_messages(data: DashboardData):
         """, unsafe_allow_html=True)
 
 
-def render_expected_adoption(data: DashboardData):
+def render_adoption_rate_inputs() -> Dict[str, float]:
+    """
+    Adoption rate sliders; valid mixes (summing to 100%) are saved to dashboard_config.
+
+    Returns:
+        The adoption rates in effect (the last valid mix)
+    """
+    current_rates = st.session_state.dashboard_config.get('adoption_rates', DEFAULT_ADOPTION_RATES)
+
+    with st.expander("Adoption rate assumptions", expanded=False):
+        st.caption("Estimate how employees will choose their coverage")
+
+        coop_pct = st.slider(
+            "Cooperative %", 0, 100,
+            value=current_rates.get('Cooperative', 70),
+            key='adoption_coop_slider'
+        )
+        silver_pct = st.slider(
+            "ICHRA Silver %", 0, 100,
+            value=current_rates.get('ICHRA Silver', 20),
+            key='adoption_silver_slider'
+        )
+        gold_pct = st.slider(
+            "ICHRA Gold %", 0, 100,
+            value=current_rates.get('ICHRA Gold', 10),
+            key='adoption_gold_slider'
+        )
+
+        # Validate sum = 100
+        total = coop_pct + silver_pct + gold_pct
+        if total != 100:
+            st.warning(f"⚠️ Rates must sum to 100% (currently {total}%)")
+        else:
+            st.session_state.dashboard_config['adoption_rates'] = {
+                'Cooperative': coop_pct,
+                'ICHRA Silver': silver_pct,
+                'ICHRA Gold': gold_pct,
+            }
+
+    return st.session_state.dashboard_config.get('adoption_rates', DEFAULT_ADOPTION_RATES)
+
+
+@st.fragment
+def render_expected_adoption(data: DashboardData, census_df: pd.DataFrame = None,
+                             dependents_df: pd.DataFrame = None, db=None):
+    """
+    Render the Expected adoption card with its adoption rate sliders.
+
+    Runs as a fragment: moving a slider reruns only this card. The mix and its
+    simulation come from the memoized providers, so a rerun costs one
+    simulate_adoption() call the first time a mix is seen.
+    """
     st.markdown('<p class="card-title">Expected adoption</p>', unsafe_allow_html=True)
 
-    adoption = data.expected_adoption
-    if not adoption:
-        st.info("Adoption estimates will be available after analysis")
-        return
+    adoption_rates = render_adoption_rate_inputs()
+    adoption = build_expected_adoption(adoption_rates)
+
+    # Same key as load_dashboard_data() for the mix of the last full run, so
+    # only a changed mix runs a new simulation
+    simulation = {}
+    if data.multi_metal_results and census_df is not None:
+        cooperative_ratio = st.session_state.dashboard_config.get(
+            'cooperative_ratio', COOPERATIVE_CONFIG['default_discount_ratio'])
+        simulation = load_adoption_simulation(
+            census_df, dependents_df, adoption_rates, data.contribution_pct, cooperative_ratio,
+            get_dataset_registry().version, _db=db
+        )
 
-    # Donut chart
+    # Donut chart (plotly imported here - the only chart on this page)
+    import plotly.graph_objects as go
     fig = go.Figure(data=[go.Pie(
         labels=list(adoption.keys()),
         values=[v["pct"] for v in adoption.values()],
@@ -5953,14 +6008,15 @@ def render_expected_adoption(data: DashboardData):
     )
     st.plotly_chart(fig, key="adoption_pie_chart")
 
-    # Calculate blended employer cost based on adoption
-    # 70% Cooperative + 20% Silver + 10% Gold
-    coop_cost = data.company_totals.get('Cooperative', 0)
-    silver_cost = data.company_totals.get('ICHRA Silver', 0)
-    gold_cost = data.company_totals.get('ICHRA Gold', 0)
-
-    blended_cost = (coop_cost * 0.70) + (silver_cost * 0.20) + (gold_cost * 0.10)
-    renewal_cost = data.company_totals.get('Renewal 2026', data.renewal_premium)
+    # Blended employer cost: simulated median when available, otherwise the
+    # company totals weighted by the expected adoption mix
+    if simulation:
+        blended_cost = simulation['employer_monthly']['p50']
+    else:
+        total_pct = sum(v["pct"] for v in adoption.values()) or 1
+        blended_cost = sum(data.company_totals.get(option, 0) * v["pct"] / total_pct
+                           for option, v in adoption.items())
+    renewal_cost = data.company_totals.get(f'Renewal {RENEWAL_PLAN_YEAR}', data.renewal_premium)
     savings_monthly = renewal_cost - blended_cost if renewal_cost > 0 else 0
     savings_annual = savings_monthly * 12
 
@@ -5975,6 +6031,17 @@ def render_expected_adoption(data: DashboardData):
     with col2:
         st.markdown(f'<span style="font-family: Poppins; font-weight: 700; font-size: 18px;">${blended_cost:,.0f}/month</span>', unsafe_allow_html=True)
 
+    if simulation:
+        employer = simulation['employer_monthly']
+        employee = simulation['employee_monthly']
+        st.caption(
+            f"Likely range (P10–P90 of {ADOPTION_SIMULATION_CONFIG['draws']:,} simulated enrollments): "
+            rf"employer \${employer['p10']:,.0f}–\${employer['p90']:,.0f}/month, "
+            rf"employees \${employee['p10']:,.0f}–\${employee['p90']:,.0f}/month. "
+            f"About {simulation['waived']['mean']:.0f} waive coverage and "
+            f"{simulation['opted_out_ptc']['mean']:.0f} take the premium tax credit."
+        )
+
     st.markdown(f"""
     <div class="success-box" style="margin-top: 16px;">
         <div style="display: flex; justify-content: space-between; align-items: center;">
@@ -6049,48 +6116,15 @@ if db_health_issues:
 # =============================================================================
 # SIDEBAR: Scenario Settings
 # =============================================================================
+# Adoption rate sliders live in the Expected adoption card (a fragment)
+if 'dashboard_config' not in st.session_state:
+    st.session_state.dashboard_config = {
+        'cooperative_ratio': COOPERATIVE_CONFIG['default_discount_ratio'],
+        'adoption_rates': DEFAULT_ADOPTION_RATES.copy(),
+    }
+
 with st.sidebar:
     with st.expander("⚙️ Scenario Settings", expanded=False):
-        st.markdown("**Adoption Rate Assumptions**")
-        st.caption("Estimate how employees will choose their coverage")
-
-        # Get current values from session state or defaults
-        if 'dashboard_config' not in st.session_state:
-            st.session_state.dashboard_config = {
-                'cooperative_ratio': COOPERATIVE_CONFIG['default_discount_ratio'],
-                'adoption_rates': DEFAULT_ADOPTION_RATES.copy(),
-            }
-
-        current_rates = st.session_state.dashboard_config.get('adoption_rates', DEFAULT_ADOPTION_RATES)
-
-        coop_pct = st.slider(
-            "Cooperative %", 0, 100,
-            value=current_rates.get('Cooperative', 70),
-            key='adoption_coop_slider'
-        )
-        silver_pct = st.slider(
-            "ICHRA Silver %", 0, 100,
-            value=current_rates.get('ICHRA Silver', 20),
-            key='adoption_silver_slider'
-        )
-        gold_pct = st.slider(
-            "ICHRA Gold %", 0, 100,
-            value=current_rates.get('ICHRA Gold', 10),
-            key='adoption_gold_slider'
-        )
-
-        # Validate sum = 100
-        total = coop_pct + silver_pct + gold_pct
-        if total != 100:
-            st.warning(f"⚠️ Rates must sum to 100% (currently {total}%)")
-        else:
-            st.session_state.dashboard_config['adoption_rates'] = {
-                'Cooperative': coop_pct,
-                'ICHRA Silver': silver_pct,
-                'ICHRA Gold': gold_pct,
-            }
-
-        st.markdown("---")
         st.markdown("**Cooperative Pricing**")
         st.caption("Cooperative cost as percentage of Silver LCSP")
 
@@ -6258,7 +6292,8 @@ with col1:
 
 with col2:
     with st.container(border=True):
-        render_expected_adoption(data)
+        render_expected_adoption(data, census_df=census_df,
+                                 dependents_df=st.session_state.get('dependents_df'), db=db)
 
 # Feedback button in sidebar
 render_feedback_sidebar()
@@ -28,6 +28,7 @@ except ImportError:
 
 from database import get_database_connection
 from utils import render_feedback_sidebar
+from page_profiler import start_page_profile
 
 # Import contribution evaluation module
 from contribution_eval import (
@@ -41,11 +42,13 @@ from contribution_eval import (
 from contribution_eval.utils import (
     CONTRIBUTION_EVAL_CSS,
     build_census_context,
+    build_result_frame,
 )
 from contribution_eval.services import (
     StrategyService,
     RecommendationService,
     SubsidyService,
+    default_contribution_grid,
     is_ai_available,
 )
 from contribution_eval.components import (
@@ -58,6 +61,7 @@ from contribution_eval.components import (
     render_strategy_adjustment_panel,
     render_employee_breakdown,
     render_action_bar,
+    render_tradeoff_frontier,
     get_default_config,
 )
 
@@ -75,6 +79,7 @@ st.set_page_config(
     page_icon="💰",
     layout="wide"
 )
+start_page_profile()
 
 # Apply CSS
 st.markdown(CONTRIBUTION_EVAL_CSS, unsafe_allow_html=True)
@@ -275,6 +280,9 @@ def main():
             strategy_result, lcsp_data, slcsp_data
         )
 
+    # One columnar view of the result, shared by the metrics grid and breakdown
+    result_frame = build_result_frame(strategy_result, affordability_data, subsidy_data)
+
     # Render metrics grid
     render_metrics_grid(
         mode=mode,
@@ -282,6 +290,7 @@ def main():
         current_er_spend=context.total_current_er_monthly,
         affordability_data=affordability_data,
         subsidy_data=subsidy_data,
+        result_frame=result_frame,
     )
 
     # ==========================================================================
@@ -422,12 +431,31 @@ def main():
             # Custom config from Customize tab - already handled by on_recalculate
             st.rerun()
 
+    # Cost vs. affordability trade-off across a grid of contribution levels
+    if mode in (OperatingMode.ALE, OperatingMode.NON_ALE_STANDARD, OperatingMode.NON_ALE_SUBSIDY):
+        with st.expander("Explore cost vs. affordability trade-off", expanded=False):
+            sweep_key = (mode.value, current_safe_harbor.value, comparison_base, id(lcsp_cache))
+            if st.session_state.get('scenario_sweep_key') != sweep_key:
+                st.session_state.scenario_sweep = strategy_service.sweep_strategies(
+                    mode,
+                    base_contributions=default_contribution_grid(comparison_base, span=0.75, steps=61),
+                    lcsp_percentages=list(range(25, 151, 5)),
+                    safe_harbor=current_safe_harbor,
+                )
+                st.session_state.scenario_sweep_key = sweep_key
+            render_tradeoff_frontier(
+                mode,
+                st.session_state.scenario_sweep,
+                current_total_monthly=strategy_result.get('total_monthly'),
+            )
+
     # Render Employee Breakdown
     render_employee_breakdown(
         mode=mode,
         strategy_result=strategy_result,
         affordability_data=affordability_data,
         subsidy_data=subsidy_data,
+        result_frame=result_frame,
     )
 
     # Render Action Bar
@@ -474,6 +502,8 @@ def main():
             'customize_lcsp_pct',
             'customize_family_mult',
             'customize_location_adj',
+            'scenario_sweep',
+            'scenario_sweep_key',
         ]
         for key in keys_to_clear:
             if key in st.session_state:
@@ -28,6 +28,7 @@ from database import get_database_connection
 from contribution_strategies import calculate_affordability_impact
 from queries import MarketplaceQueries
 from utils import render_feedback_sidebar
+from page_profiler import start_page_profile
 
 
 def get_anthropic_api_key():
@@ -59,6 +60,7 @@ logger = logging.getLogger(__name__)
 
 # Page config
 st.set_page_config(page_title="Contribution Evaluation", page_icon="💰", layout="wide")
+start_page_profile()
 
 # Sidebar: Client name for exports
 with st.sidebar:
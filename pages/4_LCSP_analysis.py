@@ -13,9 +13,11 @@ import plotly.graph_objects as go
 from database import get_database_connection
 from financial_calculator import FinancialSummaryCalculator
 from utils import render_feedback_sidebar
+from page_profiler import start_page_profile
 
 # Page config
 st.set_page_config(page_title="LCSP Analysis", page_icon="📊", layout="wide")
+start_page_profile()
 
 # Sidebar: Client name for exports
 with st.sidebar:
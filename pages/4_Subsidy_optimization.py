@@ -16,7 +16,6 @@ and return the contribution that maximizes total benefit.
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-from io import BytesIO
 import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -29,10 +28,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from database import get_database_connection, DatabaseConnection
 from queries import PlanQueries
 from utils import render_feedback_sidebar
-from pdf_subsidy_optimization_renderer import (
-    SubsidyOptimizationPDFRenderer,
-    build_subsidy_optimization_data,
-)
 from subsidy_utils import (
     get_household_size,
     get_fpl_for_household,
@@ -47,6 +42,8 @@ from census_schema import (
     get_age_band,
 )
 from constants import ACA_AGE_CURVE
+from xlsx_export import StreamingWorkbook
+from page_profiler import start_page_profile
 
 # =============================================================================
 # CONSTANTS
@@ -55,6 +52,37 @@ from constants import ACA_AGE_CURVE
 AFFORDABILITY_PCT = AFFORDABILITY_THRESHOLD_2026  # 0.0996 for 2026
 FPL_400_SINGLE = FPL_2025_BASE * 4  # 400% FPL for single person
 
+# Excel export layout
+CURVE_COLUMNS = [
+    'ICHRA contribution',
+    'Total monthly ICHRA benefit (ER payout)',
+    'Total annual ICHRA benefit (ER payout)',
+    'Employees Taking ICHRA',
+    'Employees Taking PTC',
+    '% PTC',
+    '% ICHRA',
+    'Avg PTC Benefit',
+]
+CURVE_FORMATS = {
+    'ICHRA contribution': 'currency',
+    'Total monthly ICHRA benefit (ER payout)': 'currency',
+    'Total annual ICHRA benefit (ER payout)': 'currency',
+    '% PTC': 'percent',
+    '% ICHRA': 'percent',
+    'Avg PTC Benefit': 'currency',
+}
+EMPLOYEE_DETAIL_COLUMNS = [
+    'Employee ID', 'Name', 'Age', 'Family Status', 'Annual Income', 'FPL %', 'Income Band',
+    'LCSP', 'SLCSP', 'PTC Eligible', 'Medicare', 'Subsidy', 'Best Option',
+]
+EMPLOYEE_DETAIL_FORMATS = {
+    'Annual Income': 'currency',
+    'FPL %': 'percent',
+    'LCSP': 'currency',
+    'SLCSP': 'currency',
+    'Subsidy': 'currency',
+}
+
 
 # =============================================================================
 # CSS STYLING
@@ -388,6 +416,7 @@ st.set_page_config(
     page_icon="💎",
     layout="wide"
 )
+start_page_profile()
 
 st.markdown(SUBSIDY_PAGE_CSS, unsafe_allow_html=True)
 
@@ -1534,63 +1563,64 @@ def export_to_csv(
 
 
 def export_to_excel(result: OptimizationResult, baseline_contribution: float) -> bytes:
-    """Export analysis to Excel."""
-    output = BytesIO()
+    """Export analysis to Excel (streamed; rows generated as each sheet is written)."""
+    workbook = StreamingWorkbook()
+
+    # Optimization curve data with all numeric columns
+    total_employees = len([e for e in result.employee_analyses if not e.is_medicare])
 
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Optimization curve data with all numeric columns
-        total_employees = len([e for e in result.employee_analyses if not e.is_medicare])
-        curve_data = []
+    def curve_rows():
         for s in result.all_scenarios:
             pct_ptc = s.employees_taking_ptc / total_employees if total_employees > 0 else 0
             pct_ichra = s.employees_taking_ichra / total_employees if total_employees > 0 else 0
-            curve_data.append({
-                'ICHRA contribution': s.contribution,
-                'Total monthly ICHRA benefit (ER payout)': s.total_monthly_benefit,
-                'Total annual ICHRA benefit (ER payout)': s.total_annual_benefit,
-                'Employees Taking ICHRA': s.employees_taking_ichra,
-                'Employees Taking PTC': s.employees_taking_ptc,
-                '% PTC': round(pct_ptc, 4),
-                '% ICHRA': round(pct_ichra, 4),
-                'Avg PTC Benefit': s.avg_ptc_benefit,
-            })
-        pd.DataFrame(curve_data).to_excel(writer, sheet_name='Optimization Curve', index=False)
+            yield (
+                s.contribution,
+                s.total_monthly_benefit,
+                s.total_annual_benefit,
+                s.employees_taking_ichra,
+                s.employees_taking_ptc,
+                round(pct_ptc, 4),
+                round(pct_ichra, 4),
+                s.avg_ptc_benefit,
+            )
+
+    workbook.add_sheet('Optimization Curve', CURVE_COLUMNS, curve_rows(), column_formats=CURVE_FORMATS)
 
-        # Employee detail at optimal
-        emp_data = []
+    # Employee detail at optimal
+    def employee_rows():
         for e in result.employee_analyses:
             benefit, source = calculate_employee_benefit(e, result.optimal_contribution)
-            emp_data.append({
-                'Employee ID': e.employee_id,
-                'Name': e.name,
-                'Age': e.age,
-                'Family Status': e.family_status,
-                'Annual Income': e.annual_income,
-                'FPL %': round(e.fpl_percentage / 100, 4),  # Numeric decimal
-                'Income Band': e.income_band,
-                'LCSP': e.lcsp,
-                'SLCSP': e.slcsp,
-                'PTC Eligible': 1 if e.is_ptc_eligible else 0,
-                'Medicare': 1 if e.is_medicare else 0,
-                'Subsidy': benefit if source == 'PTC' else '',
-                'Best Option': source,
-            })
-        pd.DataFrame(emp_data).to_excel(writer, sheet_name='Employee Detail', index=False)
+            yield (
+                e.employee_id,
+                e.name,
+                e.age,
+                e.family_status,
+                e.annual_income,
+                round(e.fpl_percentage / 100, 4),  # Numeric decimal
+                e.income_band,
+                e.lcsp,
+                e.slcsp,
+                1 if e.is_ptc_eligible else 0,
+                1 if e.is_medicare else 0,
+                benefit if source == 'PTC' else '',
+                source,
+            )
 
-        # Summary comparison
-        summary_data = [{
-            'Metric': 'Optimal Contribution',
-            'Value': result.optimal_contribution,
-        }, {
-            'Metric': 'Baseline Contribution',
-            'Value': baseline_contribution,
-        }, {
-            'Metric': 'Total Monthly Benefit at Optimal',
-            'Value': result.optimal_total_benefit,
-        }]
-        pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
+    workbook.add_sheet('Employee Detail', EMPLOYEE_DETAIL_COLUMNS, employee_rows(), column_formats=EMPLOYEE_DETAIL_FORMATS)
+
+    # Summary comparison
+    workbook.add_sheet(
+        'Summary',
+        ['Metric', 'Value'],
+        [
+            ('Optimal Contribution', result.optimal_contribution),
+            ('Baseline Contribution', baseline_contribution),
+            ('Total Monthly Benefit at Optimal', result.optimal_total_benefit),
+        ],
+        column_formats={'Value': 'currency'},
+    )
 
-    return output.getvalue()
+    return workbook.close()
 
 
 # =============================================================================
@@ -1991,6 +2021,11 @@ Based on this workforce's income distribution, <strong>no employees would benefi
         if not breakdown_df.empty:
             # Get show_slcsp from session state for PDF consistency with UI
             show_slcsp_for_pdf = st.session_state.get('show_slcsp', False)
+            # Jinja/Playwright stack is imported only once there is something to export
+            from pdf_subsidy_optimization_renderer import (
+                SubsidyOptimizationPDFRenderer,
+                build_subsidy_optimization_data,
+            )
             pdf_data = build_subsidy_optimization_data(
                 breakdown_df=breakdown_df,
                 totals=totals,
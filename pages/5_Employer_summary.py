@@ -13,9 +13,35 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils import DataFormatter, ContributionComparison, render_feedback_sidebar
 from database import get_database_connection
+from contribution_eval.utils.result_frame import build_result_frame, is_false, is_true, join_census
+from xlsx_export import StreamingWorkbook
+from page_profiler import start_page_profile
+
+# Column number formats for the Excel export
+EMPLOYEE_DETAIL_FORMATS = {
+    'Current ER Monthly': 'currency',
+    'Current EE Monthly': 'currency',
+    'Current Total Monthly': 'currency',
+    'LCSP (Self-Only)': 'currency',
+    'LCSP (Tier/Family)': 'currency',
+    'ER Minimum Contribution': 'currency',
+    'ER ICHRA Monthly': 'currency',
+    'ER ICHRA Annual': 'currency',
+    'Monthly Income': 'currency',
+    'Max EE Cost (9.96%)': 'currency',
+    'Income-Based Threshold': 'currency',
+    'EE Cost After ICHRA': 'currency',
+    'Min Needed': 'currency',
+}
+
+LCSP_PLAN_COLUMNS = [
+    'Employee ID', 'Name', 'Age', 'State', 'County', 'Rating Area', 'ZIP', 'Family Status',
+    'LCSP Premium', 'Plan Name', 'Plan ID', 'Carrier', 'Plan Brochure', 'SBC Link',
+]
 
 
 st.set_page_config(page_title="Employer Summary", page_icon="📊", layout="wide")
+start_page_profile()
 
 # Sidebar styling and hero section
 st.markdown("""
@@ -313,11 +339,6 @@ if has_individual_contribs:
         # Build comprehensive Excel export with multiple tabs
         def generate_comprehensive_excel():
             """Generate Excel workbook with tabs: Employee Detail, Summary & Costs, Breakdowns, Glossary."""
-            import io
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-            from openpyxl.utils.dataframe import dataframe_to_rows
-
-            output = io.BytesIO()
             client_name = st.session_state.get('client_name', 'Client')
             aff_impact = result.get('affordability_impact', {})
             after = aff_impact.get('after', {}) if aff_impact else {}
@@ -325,447 +346,384 @@ if has_individual_contribs:
             strategy_type = result.get('strategy_type', '')
             emp_contribs = result.get('employee_contributions', {})
 
-            # Define Tahoma 12pt font style
-            tahoma_font = Font(name='Tahoma', size=12)
-            tahoma_bold = Font(name='Tahoma', size=12, bold=True)
-            header_fill = PatternFill(start_color='E8F1FD', end_color='E8F1FD', fill_type='solid')
-            section_fill = PatternFill(start_color='F0F4FA', end_color='F0F4FA', fill_type='solid')
-
-            def apply_tahoma_styling(worksheet):
-                """Apply Tahoma 12pt font to all cells in worksheet."""
-                for row in worksheet.iter_rows():
-                    for cell in row:
-                        cell.font = tahoma_font
-
-            def style_header_row(worksheet, header_row=1):
-                """Style the header row with bold font and fill."""
-                for cell in worksheet[header_row]:
-                    cell.font = tahoma_bold
-                    cell.fill = header_fill
-
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-
-                # ============================================================
-                # TAB 1: EMPLOYEE DETAIL (moved to first position)
-                # ============================================================
-                if emp_contribs:
-                    emp_rows = []
-                    for emp_id, emp_data in emp_contribs.items():
-                        # Get census data
-                        emp_census = census_df[census_df['employee_id'] == emp_id]
-                        if not emp_census.empty:
-                            emp_row = emp_census.iloc[0]
-                            current_er = emp_row.get('current_er_monthly', 0) if pd.notna(emp_row.get('current_er_monthly')) else 0
-                            current_ee = emp_row.get('current_ee_monthly', 0) if pd.notna(emp_row.get('current_ee_monthly')) else 0
-                            county = emp_row.get('county', '')
-                            zip_code = emp_row.get('zip_code', emp_row.get('zip', emp_row.get('home_zip', '')))
-                            monthly_income = emp_row.get('monthly_income', 0) if pd.notna(emp_row.get('monthly_income')) else 0
-                        else:
-                            current_er = current_ee = 0
-                            county = zip_code = ''
-                            monthly_income = 0
-
-                        emp_aff = aff_impact.get('employee_affordability', {}).get(emp_id, {}) if aff_impact else {}
-
-                        # Determine affordability method and max EE cost
-                        is_fpl_strategy = strategy_type == 'fpl_safe_harbor'
-                        has_income = monthly_income > 0
-
-                        if is_fpl_strategy:
-                            # FPL Safe Harbor strategy - use FPL threshold
-                            fpl_threshold = emp_data.get('fpl_threshold') or result.get('config', {}).get('fpl_threshold')
-                            max_ee_cost = fpl_threshold
-                            affordability_basis = 'FPL'
-                            # If income data available, also calculate income-based threshold for reference
-                            income_based_threshold = monthly_income * 0.0996 if has_income else None
-                        elif has_income:
-                            # Income-based strategy with income data
-                            max_ee_cost = monthly_income * 0.0996
-                            affordability_basis = 'Income'
-                            income_based_threshold = max_ee_cost
-                        else:
-                            # No income data and not FPL strategy
-                            max_ee_cost = None
-                            affordability_basis = ''
-                            income_based_threshold = None
-
-                        lcsp_ee = emp_data.get('lcsp_ee_rate', 0)
-                        ichra_monthly = emp_data.get('monthly_contribution', 0)
-                        ee_cost_after_ichra = max(0, lcsp_ee - ichra_monthly) if lcsp_ee else None
-
-                        # Determine tier multiplier for LCSP
-                        lcsp_tier = emp_data.get('lcsp_tier_premium', 0)
-                        tier_mult = round(lcsp_tier / lcsp_ee, 2) if lcsp_ee and lcsp_ee > 0 else 1.0
-
-                        row_data = {
-                            'Employee ID': emp_id,
-                            'Name': emp_data.get('name', emp_id),
-                            'Age': emp_data.get('age', ''),
-                            'State': emp_data.get('state', ''),
-                            'County': county,
-                            'Rating Area': emp_data.get('rating_area', ''),
-                            'ZIP': zip_code,
-                            'Family Status': emp_data.get('family_status', 'EE'),
-                            'Current ER Monthly': current_er,
-                            'Current EE Monthly': current_ee,
-                            'Current Total Monthly': current_er + current_ee,
-                            'LCSP (Self-Only)': lcsp_ee,
-                            'Tier Multiplier': tier_mult,
-                            'LCSP (Tier/Family)': lcsp_tier,
-                            'Age Ratio (ACA)': emp_data.get('age_ratio', 1.0),
-                            'ER Minimum Contribution': emp_data.get('base_contribution', 0),
-                            'Family Multiplier': emp_data.get('family_multiplier', 1.0),
-                            'ER ICHRA Monthly': ichra_monthly,
-                            'ER ICHRA Annual': emp_data.get('annual_contribution', 0),
-                            'Monthly Income': monthly_income if has_income else None,
-                            'Affordability Basis': affordability_basis,
-                            'Max EE Cost (9.96%)': max_ee_cost,
-                        }
-
-                        # Add income-based threshold column if using FPL but income data exists
-                        if is_fpl_strategy:
-                            row_data['Income-Based Threshold'] = income_based_threshold
-
-                        row_data.update({
-                            'EE Cost After ICHRA': ee_cost_after_ichra,
-                            'Affordable': (
-                                'Yes' if (
-                                    (is_fpl_strategy and emp_data.get('is_fpl_affordable')) or
-                                    emp_aff.get('is_affordable')
-                                ) else (
-                                    'No' if (
-                                        (is_fpl_strategy and emp_data.get('is_fpl_affordable') is False) or
-                                        emp_aff.get('is_affordable') is False
-                                    ) else ''
-                                )
-                            ),
-                            'Min Needed': emp_aff.get('monthly_contribution') if emp_aff.get('monthly_contribution') else None,
-                            'Adjusted': 'Yes' if emp_data.get('adjusted_for_affordability') else '',
-                        })
-
-                        emp_rows.append(row_data)
-
-                    emp_df = pd.DataFrame(emp_rows)
-                    emp_df.to_excel(writer, sheet_name='Employee Detail', index=False)
-                    apply_tahoma_styling(writer.sheets['Employee Detail'])
-                    style_header_row(writer.sheets['Employee Detail'])
-
-                # ============================================================
-                # TAB 2: SUMMARY & COSTS (combined Summary, Cost Comparison, Savings, IRS Compliance)
-                # ============================================================
-                summary_rows = []
-
-                # --- REPORT INFO ---
-                summary_rows.append({'Section': 'REPORT INFO', 'Item': '', 'Value': '', 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'Report Generated', 'Value': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'), 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'Client Name', 'Value': client_name, 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': '', 'Value': '', 'Notes': ''})
-
-                # --- STRATEGY ---
-                summary_rows.append({'Section': 'STRATEGY', 'Item': '', 'Value': '', 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'Strategy Name', 'Value': strategy_name, 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'Strategy Type', 'Value': strategy_type, 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'Employees Covered', 'Value': employees_covered, 'Notes': ''})
-
-                # Strategy-specific parameters
-                if strategy_type == 'base_age_curve':
-                    summary_rows.append({'Section': '', 'Item': 'Base Age', 'Value': config.get('base_age', 21), 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'Base Contribution', 'Value': config.get('base_contribution', 0), 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'Method', 'Value': 'Base contribution × ACA 3:1 age curve ratio', 'Notes': ''})
-                elif strategy_type == 'percentage_lcsp':
-                    summary_rows.append({'Section': '', 'Item': 'LCSP Percentage', 'Value': f"{config.get('lcsp_percentage', 0):.1f}%", 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'Method', 'Value': 'Percentage of employee LCSP', 'Notes': ''})
-                elif strategy_type == 'fpl_safe_harbor':
-                    fpl_threshold = config.get('fpl_threshold', 0) or result.get('config', {}).get('fpl_threshold', 0)
-                    summary_rows.append({'Section': '', 'Item': 'FPL Threshold', 'Value': f"${fpl_threshold:,.2f}/mo", 'Notes': '9.96% of Federal Poverty Level'})
-                    summary_rows.append({'Section': '', 'Item': 'Method', 'Value': 'FPL Safe Harbor (guaranteed affordable)', 'Notes': ''})
-
-                summary_rows.append({'Section': '', 'Item': 'Family Multipliers', 'Value': 'Yes' if config.get('apply_family_multipliers') else 'No', 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'Affordability Adjusted', 'Value': 'Yes' if result.get('affordability_adjusted') else 'No', 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': '', 'Value': '', 'Notes': ''})
-
-                # --- COST COMPARISON ---
-                summary_rows.append({'Section': 'COST COMPARISON', 'Item': '', 'Value': '', 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'Current (2025) - ER', 'Value': current_er_annual, 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'Current (2025) - EE', 'Value': current_ee_annual, 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'Current (2025) - Total', 'Value': current_total_annual, 'Notes': ''})
-
-                if has_renewal_data:
-                    summary_rows.append({'Section': '', 'Item': '2026 Renewal - ER', 'Value': projected_er_annual_2026, 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': '2026 Renewal - EE', 'Value': projected_ee_annual_2026, 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': '2026 Renewal - Total', 'Value': renewal_total_annual, 'Notes': ''})
-
-                summary_rows.append({'Section': '', 'Item': 'ICHRA Budget (ER)', 'Value': proposed_annual, 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': 'ICHRA Budget (EE)', 'Value': 'Varies by plan selection', 'Notes': ''})
-                summary_rows.append({'Section': '', 'Item': '', 'Value': '', 'Notes': ''})
-
-                # --- SAVINGS ---
-                summary_rows.append({'Section': 'SAVINGS ANALYSIS', 'Item': '', 'Value': '', 'Notes': ''})
-                savings_vs_current = current_total_annual - proposed_annual
-                savings_vs_current_pct = (savings_vs_current / current_total_annual * 100) if current_total_annual > 0 else 0
-
-                if has_renewal_data:
-                    ichra_70 = proposed_annual * 0.70
-                    savings_70 = renewal_total_annual - ichra_70
-                    savings_70_pct = (savings_70 / renewal_total_annual * 100) if renewal_total_annual > 0 else 0
-
-                    summary_rows.append({'Section': '', 'Item': 'vs 2026 Renewal', 'Value': savings_vs_renewal_total, 'Notes': f'{savings_vs_renewal_total_pct:.1f}%'})
-                    summary_rows.append({'Section': '', 'Item': 'vs 2026 Renewal (70% take rate)', 'Value': savings_70, 'Notes': f'{savings_70_pct:.1f}%'})
-
-                summary_rows.append({'Section': '', 'Item': 'vs Current Plan (2025)', 'Value': savings_vs_current, 'Notes': f'{savings_vs_current_pct:.1f}%'})
-                summary_rows.append({'Section': '', 'Item': '', 'Value': '', 'Notes': ''})
-
-                # --- IRS COMPLIANCE ---
-                summary_rows.append({'Section': 'IRS COMPLIANCE', 'Item': '', 'Value': '', 'Notes': ''})
-
-                if strategy_type == 'fpl_safe_harbor':
-                    summary_rows.append({'Section': '', 'Item': 'Affordability Method', 'Value': 'FPL Safe Harbor', 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'IRS Threshold', 'Value': f"${fpl_threshold:,.2f}/mo", 'Notes': '9.96% of Federal Poverty Level'})
-                    summary_rows.append({'Section': '', 'Item': 'Employees Affordable', 'Value': employees_covered, 'Notes': '100% (guaranteed)'})
-                    summary_rows.append({'Section': '', 'Item': 'Status', 'Value': 'Compliant', 'Notes': 'FPL Safe Harbor guarantees affordability'})
-                elif after:
-                    compliance_status = 'Compliant (Adjusted)' if result.get('affordability_adjusted') else (
-                        'Action Needed' if after.get('total_gap', 0) > 0 else 'Compliant'
+            # Streamed workbook: Tahoma styles and column formats declared once
+            workbook = StreamingWorkbook()
+
+
+            # ============================================================
+            # TAB 1: EMPLOYEE DETAIL (moved to first position)
+            # ============================================================
+            if emp_contribs:
+                # One columnar frame for the strategy + affordability, census joined once
+                frame = build_result_frame(result, aff_impact)
+                zip_column = next((c for c in ('zip_code', 'zip', 'home_zip') if c in census_df.columns), 'zip_code')
+                frame = join_census(
+                    frame, census_df,
+                    ['current_er_monthly', 'current_ee_monthly', 'county', zip_column, 'monthly_income'],
+                )
+
+                def column(name, default):
+                    values = frame[name] if name in frame.columns else pd.Series(default, index=frame.index)
+                    return values.where(values.notna(), default)
+
+                current_er = pd.to_numeric(frame['current_er_monthly'], errors='coerce').fillna(0)
+                current_ee = pd.to_numeric(frame['current_ee_monthly'], errors='coerce').fillna(0)
+                monthly_income = pd.to_numeric(frame['monthly_income_census'], errors='coerce').fillna(0)
+                has_income = monthly_income > 0
+
+                # Determine affordability method and max EE cost
+                is_fpl_strategy = strategy_type == 'fpl_safe_harbor'
+                income_threshold = (monthly_income * 0.0996).where(has_income)
+                if is_fpl_strategy:
+                    # FPL Safe Harbor strategy - use FPL threshold
+                    fpl_threshold = column('fpl_threshold', None).where(
+                        is_true(column('fpl_threshold', None)), config.get('fpl_threshold')
                     )
-                    summary_rows.append({'Section': '', 'Item': 'Affordability Method', 'Value': 'Income-Based', 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'IRS Threshold', 'Value': '9.96% of household income', 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'Employees with Income Data', 'Value': after.get('employees_analyzed', 0), 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'Employees Meeting Threshold', 'Value': after.get('affordable_count', 0), 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'Compliance Rate', 'Value': f"{after.get('affordable_pct', 0):.1f}%", 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'Annual Gap to 100%', 'Value': after.get('total_gap', 0), 'Notes': ''})
-                    summary_rows.append({'Section': '', 'Item': 'Status', 'Value': compliance_status, 'Notes': ''})
-
-                summary_df = pd.DataFrame(summary_rows)
-                summary_df.to_excel(writer, sheet_name='Summary & Costs', index=False)
-                apply_tahoma_styling(writer.sheets['Summary & Costs'])
-                style_header_row(writer.sheets['Summary & Costs'])
-
-                # Highlight section headers
-                ws = writer.sheets['Summary & Costs']
-                for row_idx, row in enumerate(ws.iter_rows(min_row=2), start=2):
-                    if row[0].value and row[0].value.isupper():
-                        for cell in row:
-                            cell.font = tahoma_bold
-                            cell.fill = section_fill
-
-                # ============================================================
-                # TAB 3: BREAKDOWNS (combined By Age Tier and By Family Status)
-                # ============================================================
-                breakdown_rows = []
-
-                # --- BY AGE TIER ---
-                by_age = result.get('by_age_tier', {})
-                if by_age:
-                    breakdown_rows.append({'Category': 'BY AGE TIER', 'Group': '', 'Employee Count': '', 'Total Monthly': '', 'Average Monthly': '', 'Total Annual': ''})
-                    for tier, data in sorted(by_age.items()):
-                        avg = data['total_monthly'] / data['count'] if data['count'] > 0 else 0
-                        breakdown_rows.append({
-                            'Category': '',
-                            'Group': tier,
-                            'Employee Count': data['count'],
-                            'Total Monthly': data['total_monthly'],
-                            'Average Monthly': avg,
-                            'Total Annual': data['total_monthly'] * 12,
-                        })
-                    breakdown_rows.append({'Category': '', 'Group': '', 'Employee Count': '', 'Total Monthly': '', 'Average Monthly': '', 'Total Annual': ''})
-
-                # --- BY FAMILY STATUS ---
-                by_fs = result.get('by_family_status', {})
-                if by_fs:
-                    breakdown_rows.append({'Category': 'BY FAMILY STATUS', 'Group': '', 'Employee Count': '', 'Total Monthly': '', 'Average Monthly': '', 'Total Annual': ''})
-                    for fs, data in sorted(by_fs.items()):
-                        avg = data['total_monthly'] / data['count'] if data['count'] > 0 else 0
-                        breakdown_rows.append({
-                            'Category': '',
-                            'Group': fs,
-                            'Employee Count': data['count'],
-                            'Total Monthly': data['total_monthly'],
-                            'Average Monthly': avg,
-                            'Total Annual': data['total_monthly'] * 12,
-                        })
-
-                if breakdown_rows:
-                    breakdown_df = pd.DataFrame(breakdown_rows)
-                    breakdown_df.to_excel(writer, sheet_name='Breakdowns', index=False)
-                    apply_tahoma_styling(writer.sheets['Breakdowns'])
-                    style_header_row(writer.sheets['Breakdowns'])
-
-                    # Highlight section headers
-                    ws = writer.sheets['Breakdowns']
-                    for row_idx, row in enumerate(ws.iter_rows(min_row=2), start=2):
-                        if row[0].value and row[0].value.startswith('BY '):
-                            for cell in row:
-                                cell.font = tahoma_bold
-                                cell.fill = section_fill
-
-                # ============================================================
-                # TAB 4: LCSP PLANS (employee LCSP details with plan info)
-                # ============================================================
-                if emp_contribs:
-                    # Query to get LCSP plan details for each employee
-                    lcsp_plan_rows = []
-
-                    # Get unique state/rating_area/age combinations to batch query
-                    lcsp_lookups = {}
-                    for emp_id, emp_data in emp_contribs.items():
-                        state = emp_data.get('state', '')
-                        rating_area = emp_data.get('rating_area', '')
-                        age = emp_data.get('age', 21)
-                        lcsp_ee_rate = emp_data.get('lcsp_ee_rate', 0)
-
-                        if state and rating_area:
-                            key = (state, rating_area, age)
-                            if key not in lcsp_lookups:
-                                lcsp_lookups[key] = {'rate': lcsp_ee_rate, 'employees': []}
-                            lcsp_lookups[key]['employees'].append(emp_id)
-
-                    # Query LCSP plan details for each unique combination
-                    lcsp_plan_details = {}
-                    try:
-                        db = st.session_state.get('db')
-                        if db:
-                            for (state, rating_area, age), lookup_data in lcsp_lookups.items():
-                                # Extract numeric rating area
-                                if isinstance(rating_area, str):
-                                    import re
-                                    ra_match = re.search(r'(\d+)', rating_area)
-                                    ra_numeric = int(ra_match.group(1)) if ra_match else 1
-                                else:
-                                    ra_numeric = int(rating_area) if rating_area else 1
-
-                                # Query for LCSP plan details
-                                lcsp_query = """
-                                SELECT
-                                    p.hios_plan_id as plan_id,
-                                    p.plan_marketing_name,
-                                    i.issr_lgl_name as issuer_name,
-                                    v.plan_brochure,
-                                    v.url_for_summary_of_benefits_and_coverage as sbc_url,
-                                    br.individual_rate::numeric as premium
-                                FROM rbis_insurance_plan_base_rates_20251019202724 br
-                                JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
-                                JOIN rbis_insurance_plan_variant_20251019202724 v ON p.hios_plan_id = v.hios_plan_id
-                                LEFT JOIN "HIOS_issuers_pivoted" i ON LEFT(p.hios_plan_id, 5) = i.hios_issuer_id
-                                WHERE p.level_of_coverage = 'Silver'
-                                    AND p.market_coverage = 'Individual'
-                                    AND v.csr_variation_type = 'Exchange variant (no CSR)'
-                                    AND SUBSTRING(p.hios_plan_id, 6, 2) = %s
-                                    AND br.rating_area_id ~ '^Rating Area [0-9]+$'
-                                    AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
-                                    AND br.age = %s
-                                ORDER BY br.individual_rate::numeric ASC
-                                LIMIT 1
-                                """
-                                try:
-                                    result_df = pd.read_sql(lcsp_query, db.engine, params=(state, ra_numeric, str(age)))
-                                    if not result_df.empty:
-                                        row = result_df.iloc[0]
-                                        for emp_id in lookup_data['employees']:
-                                            lcsp_plan_details[emp_id] = {
-                                                'plan_id': row.get('plan_id', ''),
-                                                'plan_marketing_name': row.get('plan_marketing_name', ''),
-                                                'issuer_name': row.get('issuer_name', ''),
-                                                'plan_brochure': row.get('plan_brochure', ''),
-                                                'sbc_url': row.get('sbc_url', ''),
-                                            }
-                                except Exception as e:
-                                    pass  # Skip on error, leave empty
-                    except Exception as e:
-                        pass  # Skip LCSP plan lookup on error
+                    max_ee_cost = fpl_threshold
+                    affordability_basis = pd.Series('FPL', index=frame.index)
+                else:
+                    # Income-based; blank when there is no income data
+                    max_ee_cost = income_threshold
+                    affordability_basis = pd.Series('', index=frame.index).mask(has_income, 'Income')
+
+                lcsp_ee = frame['lcsp_ee_rate']
+                ichra_monthly = frame['monthly_contribution']
+                ee_cost_after_ichra = (lcsp_ee - ichra_monthly).clip(lower=0).where(lcsp_ee != 0)
+
+                # Determine tier multiplier for LCSP
+                lcsp_tier = frame['lcsp_tier_premium']
+                tier_mult = (lcsp_tier / lcsp_ee.where(lcsp_ee > 0)).round(2).fillna(1.0)
+
+                emp_df = pd.DataFrame({
+                    'Employee ID': frame.index,
+                    'Name': frame['name'],
+                    'Age': column('age', ''),
+                    'State': frame['state'],
+                    'County': column('county', ''),
+                    'Rating Area': frame['rating_area'],
+                    'ZIP': column(zip_column, ''),
+                    'Family Status': frame['family_status'],
+                    'Current ER Monthly': current_er,
+                    'Current EE Monthly': current_ee,
+                    'Current Total Monthly': current_er + current_ee,
+                    'LCSP (Self-Only)': lcsp_ee,
+                    'Tier Multiplier': tier_mult,
+                    'LCSP (Tier/Family)': lcsp_tier,
+                    'Age Ratio (ACA)': column('age_ratio', 1.0),
+                    'ER Minimum Contribution': column('base_contribution', 0),
+                    'Family Multiplier': column('family_multiplier', 1.0),
+                    'ER ICHRA Monthly': ichra_monthly,
+                    'ER ICHRA Annual': frame['annual_contribution'],
+                    'Monthly Income': monthly_income.where(has_income),
+                    'Affordability Basis': affordability_basis,
+                    'Max EE Cost (9.96%)': max_ee_cost,
+                }).reset_index(drop=True)
+
+                # Add income-based threshold column if using FPL but income data exists
+                if is_fpl_strategy:
+                    emp_df['Income-Based Threshold'] = income_threshold.to_numpy()
+
+                fpl_affordable = column('is_fpl_affordable', None) if is_fpl_strategy else pd.Series(None, index=frame.index)
+                aff_affordable = column('aff_is_affordable', None)
+                affordable = pd.Series('', index=frame.index)
+                affordable = affordable.mask(is_false(fpl_affordable) | is_false(aff_affordable), 'No')
+                affordable = affordable.mask(is_true(fpl_affordable) | is_true(aff_affordable), 'Yes')
+                min_needed = column('aff_monthly_contribution', None)
+
+                emp_df['EE Cost After ICHRA'] = ee_cost_after_ichra.to_numpy()
+                emp_df['Affordable'] = affordable.to_numpy()
+                emp_df['Min Needed'] = min_needed.where(is_true(min_needed)).to_numpy()
+                emp_df['Adjusted'] = is_true(column('adjusted_for_affordability', None)).map({True: 'Yes', False: ''}).to_numpy()
+                workbook.add_frame('Employee Detail', emp_df, column_formats=EMPLOYEE_DETAIL_FORMATS)
+
+            # ============================================================
+            # TAB 2: SUMMARY & COSTS (combined Summary, Cost Comparison, Savings, IRS Compliance)
+            # ============================================================
+            summary_rows = []
+
+            # --- REPORT INFO ---
+            summary_rows.append({'Section': 'REPORT INFO', 'Item': '', 'Value': '', 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'Report Generated', 'Value': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'), 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'Client Name', 'Value': client_name, 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': '', 'Value': '', 'Notes': ''})
+
+            # --- STRATEGY ---
+            summary_rows.append({'Section': 'STRATEGY', 'Item': '', 'Value': '', 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'Strategy Name', 'Value': strategy_name, 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'Strategy Type', 'Value': strategy_type, 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'Employees Covered', 'Value': employees_covered, 'Notes': ''})
+
+            # Strategy-specific parameters
+            if strategy_type == 'base_age_curve':
+                summary_rows.append({'Section': '', 'Item': 'Base Age', 'Value': config.get('base_age', 21), 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'Base Contribution', 'Value': config.get('base_contribution', 0), 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'Method', 'Value': 'Base contribution × ACA 3:1 age curve ratio', 'Notes': ''})
+            elif strategy_type == 'percentage_lcsp':
+                summary_rows.append({'Section': '', 'Item': 'LCSP Percentage', 'Value': f"{config.get('lcsp_percentage', 0):.1f}%", 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'Method', 'Value': 'Percentage of employee LCSP', 'Notes': ''})
+            elif strategy_type == 'fpl_safe_harbor':
+                fpl_threshold = config.get('fpl_threshold', 0) or result.get('config', {}).get('fpl_threshold', 0)
+                summary_rows.append({'Section': '', 'Item': 'FPL Threshold', 'Value': f"${fpl_threshold:,.2f}/mo", 'Notes': '9.96% of Federal Poverty Level'})
+                summary_rows.append({'Section': '', 'Item': 'Method', 'Value': 'FPL Safe Harbor (guaranteed affordable)', 'Notes': ''})
+
+            summary_rows.append({'Section': '', 'Item': 'Family Multipliers', 'Value': 'Yes' if config.get('apply_family_multipliers') else 'No', 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'Affordability Adjusted', 'Value': 'Yes' if result.get('affordability_adjusted') else 'No', 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': '', 'Value': '', 'Notes': ''})
+
+            # --- COST COMPARISON ---
+            summary_rows.append({'Section': 'COST COMPARISON', 'Item': '', 'Value': '', 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'Current (2025) - ER', 'Value': current_er_annual, 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'Current (2025) - EE', 'Value': current_ee_annual, 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'Current (2025) - Total', 'Value': current_total_annual, 'Notes': ''})
+
+            if has_renewal_data:
+                summary_rows.append({'Section': '', 'Item': '2026 Renewal - ER', 'Value': projected_er_annual_2026, 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': '2026 Renewal - EE', 'Value': projected_ee_annual_2026, 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': '2026 Renewal - Total', 'Value': renewal_total_annual, 'Notes': ''})
+
+            summary_rows.append({'Section': '', 'Item': 'ICHRA Budget (ER)', 'Value': proposed_annual, 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': 'ICHRA Budget (EE)', 'Value': 'Varies by plan selection', 'Notes': ''})
+            summary_rows.append({'Section': '', 'Item': '', 'Value': '', 'Notes': ''})
+
+            # --- SAVINGS ---
+            summary_rows.append({'Section': 'SAVINGS ANALYSIS', 'Item': '', 'Value': '', 'Notes': ''})
+            savings_vs_current = current_total_annual - proposed_annual
+            savings_vs_current_pct = (savings_vs_current / current_total_annual * 100) if current_total_annual > 0 else 0
+
+            if has_renewal_data:
+                ichra_70 = proposed_annual * 0.70
+                savings_70 = renewal_total_annual - ichra_70
+                savings_70_pct = (savings_70 / renewal_total_annual * 100) if renewal_total_annual > 0 else 0
+
+                summary_rows.append({'Section': '', 'Item': 'vs 2026 Renewal', 'Value': savings_vs_renewal_total, 'Notes': f'{savings_vs_renewal_total_pct:.1f}%'})
+                summary_rows.append({'Section': '', 'Item': 'vs 2026 Renewal (70% take rate)', 'Value': savings_70, 'Notes': f'{savings_70_pct:.1f}%'})
+
+            summary_rows.append({'Section': '', 'Item': 'vs Current Plan (2025)', 'Value': savings_vs_current, 'Notes': f'{savings_vs_current_pct:.1f}%'})
+            summary_rows.append({'Section': '', 'Item': '', 'Value': '', 'Notes': ''})
+
+            # --- IRS COMPLIANCE ---
+            summary_rows.append({'Section': 'IRS COMPLIANCE', 'Item': '', 'Value': '', 'Notes': ''})
+
+            if strategy_type == 'fpl_safe_harbor':
+                summary_rows.append({'Section': '', 'Item': 'Affordability Method', 'Value': 'FPL Safe Harbor', 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'IRS Threshold', 'Value': f"${fpl_threshold:,.2f}/mo", 'Notes': '9.96% of Federal Poverty Level'})
+                summary_rows.append({'Section': '', 'Item': 'Employees Affordable', 'Value': employees_covered, 'Notes': '100% (guaranteed)'})
+                summary_rows.append({'Section': '', 'Item': 'Status', 'Value': 'Compliant', 'Notes': 'FPL Safe Harbor guarantees affordability'})
+            elif after:
+                compliance_status = 'Compliant (Adjusted)' if result.get('affordability_adjusted') else (
+                    'Action Needed' if after.get('total_gap', 0) > 0 else 'Compliant'
+                )
+                summary_rows.append({'Section': '', 'Item': 'Affordability Method', 'Value': 'Income-Based', 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'IRS Threshold', 'Value': '9.96% of household income', 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'Employees with Income Data', 'Value': after.get('employees_analyzed', 0), 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'Employees Meeting Threshold', 'Value': after.get('affordable_count', 0), 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'Compliance Rate', 'Value': f"{after.get('affordable_pct', 0):.1f}%", 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'Annual Gap to 100%', 'Value': after.get('total_gap', 0), 'Notes': ''})
+                summary_rows.append({'Section': '', 'Item': 'Status', 'Value': compliance_status, 'Notes': ''})
+
+            # Section headers (REPORT INFO, STRATEGY, ...) highlighted as written
+            workbook.add_records(
+                'Summary & Costs', summary_rows, ['Section', 'Item', 'Value', 'Notes'],
+                is_section_row=lambda row: bool(row[0]) and row[0].isupper(),
+            )
 
-                    # Build LCSP Plans rows
+            # ============================================================
+            # TAB 3: BREAKDOWNS (combined By Age Tier and By Family Status)
+            # ============================================================
+            breakdown_rows = []
+
+            # --- BY AGE TIER ---
+            by_age = result.get('by_age_tier', {})
+            if by_age:
+                breakdown_rows.append({'Category': 'BY AGE TIER', 'Group': '', 'Employee Count': '', 'Total Monthly': '', 'Average Monthly': '', 'Total Annual': ''})
+                for tier, data in sorted(by_age.items()):
+                    avg = data['total_monthly'] / data['count'] if data['count'] > 0 else 0
+                    breakdown_rows.append({
+                        'Category': '',
+                        'Group': tier,
+                        'Employee Count': data['count'],
+                        'Total Monthly': data['total_monthly'],
+                        'Average Monthly': avg,
+                        'Total Annual': data['total_monthly'] * 12,
+                    })
+                breakdown_rows.append({'Category': '', 'Group': '', 'Employee Count': '', 'Total Monthly': '', 'Average Monthly': '', 'Total Annual': ''})
+
+            # --- BY FAMILY STATUS ---
+            by_fs = result.get('by_family_status', {})
+            if by_fs:
+                breakdown_rows.append({'Category': 'BY FAMILY STATUS', 'Group': '', 'Employee Count': '', 'Total Monthly': '', 'Average Monthly': '', 'Total Annual': ''})
+                for fs, data in sorted(by_fs.items()):
+                    avg = data['total_monthly'] / data['count'] if data['count'] > 0 else 0
+                    breakdown_rows.append({
+                        'Category': '',
+                        'Group': fs,
+                        'Employee Count': data['count'],
+                        'Total Monthly': data['total_monthly'],
+                        'Average Monthly': avg,
+                        'Total Annual': data['total_monthly'] * 12,
+                    })
+
+            if breakdown_rows:
+                workbook.add_records(
+                    'Breakdowns', breakdown_rows,
+                    ['Category', 'Group', 'Employee Count', 'Total Monthly', 'Average Monthly', 'Total Annual'],
+                    column_formats={'Total Monthly': 'currency', 'Average Monthly': 'currency', 'Total Annual': 'currency'},
+                    is_section_row=lambda row: bool(row[0]) and row[0].startswith('BY '),
+                )
+
+            # ============================================================
+            # TAB 4: LCSP PLANS (employee LCSP details with plan info)
+            # ============================================================
+            if emp_contribs:
+                # Query to get LCSP plan details for each employee
+                # Get unique state/rating_area/age combinations to batch query
+                lcsp_lookups = {}
+                for emp_id, emp_data in emp_contribs.items():
+                    state = emp_data.get('state', '')
+                    rating_area = emp_data.get('rating_area', '')
+                    age = emp_data.get('age', 21)
+                    lcsp_ee_rate = emp_data.get('lcsp_ee_rate', 0)
+
+                    if state and rating_area:
+                        key = (state, rating_area, age)
+                        if key not in lcsp_lookups:
+                            lcsp_lookups[key] = {'rate': lcsp_ee_rate, 'employees': []}
+                        lcsp_lookups[key]['employees'].append(emp_id)
+
+                # Query LCSP plan details for each unique combination
+                lcsp_plan_details = {}
+                try:
+                    db = st.session_state.get('db')
+                    if db:
+                        for (state, rating_area, age), lookup_data in lcsp_lookups.items():
+                            # Extract numeric rating area
+                            if isinstance(rating_area, str):
+                                import re
+                                ra_match = re.search(r'(\d+)', rating_area)
+                                ra_numeric = int(ra_match.group(1)) if ra_match else 1
+                            else:
+                                ra_numeric = int(rating_area) if rating_area else 1
+
+                            # Query for LCSP plan details
+                            lcsp_query = """
+                            SELECT
+                                p.hios_plan_id as plan_id,
+                                p.plan_marketing_name,
+                                i.issr_lgl_name as issuer_name,
+                                v.plan_brochure,
+                                v.url_for_summary_of_benefits_and_coverage as sbc_url,
+                                br.individual_rate::numeric as premium
+                            FROM rbis_insurance_plan_base_rates br
+                            JOIN rbis_insurance_plan p ON br.plan_id = p.hios_plan_id
+                            JOIN rbis_insurance_plan_variant v ON p.hios_plan_id = v.hios_plan_id
+                            LEFT JOIN "HIOS_issuers_pivoted" i ON LEFT(p.hios_plan_id, 5) = i.hios_issuer_id
+                            WHERE p.level_of_coverage = 'Silver'
+                                AND p.market_coverage = 'Individual'
+                                AND v.csr_variation_type = 'Exchange variant (no CSR)'
+                                AND SUBSTRING(p.hios_plan_id, 6, 2) = %s
+                                AND br.rating_area_id ~ '^Rating Area [0-9]+$'
+                                AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
+                                AND br.age = %s
+                            ORDER BY br.individual_rate::numeric ASC
+                            LIMIT 1
+                            """
+                            try:
+                                result_df = db.read_sql(lcsp_query, params=(state, ra_numeric, str(age)))
+                                if not result_df.empty:
+                                    row = result_df.iloc[0]
+                                    for emp_id in lookup_data['employees']:
+                                        lcsp_plan_details[emp_id] = {
+                                            'plan_id': row.get('plan_id', ''),
+                                            'plan_marketing_name': row.get('plan_marketing_name', ''),
+                                            'issuer_name': row.get('issuer_name', ''),
+                                            'plan_brochure': row.get('plan_brochure', ''),
+                                            'sbc_url': row.get('sbc_url', ''),
+                                        }
+                            except Exception as e:
+                                pass  # Skip on error, leave empty
+                except Exception as e:
+                    pass  # Skip LCSP plan lookup on error
+
+                # LCSP Plans rows, generated as the sheet is written (county/ZIP from the tab 1 census join)
+                def lcsp_plan_rows():
+                    county = column('county', '')
+                    zip_code = column(zip_column, '')
                     for emp_id, emp_data in emp_contribs.items():
-                        # Get census data for county and ZIP
-                        emp_census = census_df[census_df['employee_id'] == emp_id]
-                        if not emp_census.empty:
-                            emp_row = emp_census.iloc[0]
-                            county = emp_row.get('county', '')
-                            zip_code = emp_row.get('zip_code', emp_row.get('zip', emp_row.get('home_zip', '')))
-                        else:
-                            county = ''
-                            zip_code = ''
-
                         plan_details = lcsp_plan_details.get(emp_id, {})
+                        yield (
+                            emp_id,
+                            emp_data.get('name', emp_id),
+                            emp_data.get('age', ''),
+                            emp_data.get('state', ''),
+                            county.get(str(emp_id), ''),
+                            emp_data.get('rating_area', ''),
+                            zip_code.get(str(emp_id), ''),
+                            emp_data.get('family_status', 'EE'),
+                            emp_data.get('lcsp_ee_rate', 0),
+                            plan_details.get('plan_marketing_name', ''),
+                            plan_details.get('plan_id', ''),
+                            plan_details.get('issuer_name', ''),
+                            plan_details.get('plan_brochure', ''),
+                            plan_details.get('sbc_url', ''),
+                        )
 
-                        lcsp_plan_rows.append({
-                            'Employee ID': emp_id,
-                            'Name': emp_data.get('name', emp_id),
-                            'Age': emp_data.get('age', ''),
-                            'State': emp_data.get('state', ''),
-                            'County': county,
-                            'Rating Area': emp_data.get('rating_area', ''),
-                            'ZIP': zip_code,
-                            'Family Status': emp_data.get('family_status', 'EE'),
-                            'LCSP Premium': emp_data.get('lcsp_ee_rate', 0),
-                            'Plan Name': plan_details.get('plan_marketing_name', ''),
-                            'Plan ID': plan_details.get('plan_id', ''),
-                            'Carrier': plan_details.get('issuer_name', ''),
-                            'Plan Brochure': plan_details.get('plan_brochure', ''),
-                            'SBC Link': plan_details.get('sbc_url', ''),
-                        })
-
-                    if lcsp_plan_rows:
-                        lcsp_df = pd.DataFrame(lcsp_plan_rows)
-                        lcsp_df.to_excel(writer, sheet_name='LCSP Plans', index=False)
-                        apply_tahoma_styling(writer.sheets['LCSP Plans'])
-                        style_header_row(writer.sheets['LCSP Plans'])
-
-                # ============================================================
-                # TAB 5: GLOSSARY
-                # ============================================================
-                glossary_data = {
-                    'Term': [
-                        'ICHRA',
-                        'LCSP',
-                        'LCSP (Self-Only)',
-                        'LCSP (Tier/Family)',
-                        'LCSP Premium',
-                        'Plan ID',
-                        'Carrier',
-                        'Plan Brochure',
-                        'SBC Link',
-                        'Tier Multiplier',
-                        'Rating Area',
-                        'ACA Age Curve',
-                        'Age Ratio',
-                        'Family Multiplier',
-                        'ER Minimum Contribution',
-                        'ER ICHRA Monthly',
-                        'ER ICHRA Annual',
-                        'Affordability Basis',
-                        '9.96% Threshold (Income)',
-                        'FPL Safe Harbor',
-                    ],
-                    'Definition': [
-                        'Individual Coverage Health Reimbursement Arrangement - employer-funded allowance for employees to buy their own health insurance',
-                        'Lowest Cost Silver Plan - cheapest silver-tier marketplace plan in an employees rating area',
-                        'LCSP premium for employee-only (self) coverage based on employee age',
-                        'Estimated LCSP premium for the employees coverage tier (Self-Only × Tier Multiplier)',
-                        'Monthly premium for the Lowest Cost Silver Plan based on employee age and rating area',
-                        'HIOS Plan ID - unique identifier for the marketplace plan (format: XXXXX-CC-NNNNNNNN-NN)',
-                        'Insurance company (issuer) offering the plan',
-                        'URL to the plan brochure/marketing materials from the carrier',
-                        'URL to the Summary of Benefits and Coverage (SBC) document - standardized plan comparison document',
-                        'Multiplier applied to Self-Only LCSP based on family status: EE=1.0, ES=1.5, EC=1.3, F=1.8',
-                        'Geographic zone used by insurers to set premiums (defined by state)',
-                        'Federal 3:1 age rating curve - premiums can vary up to 3x based on age (21-64)',
-                        'Multiplier from ACA age curve (age 21 = 1.0, age 64 = 3.0)',
-                        'Multiplier for employees with dependents applied to ICHRA contribution',
-                        'Base employer contribution before family multipliers are applied',
-                        'Total monthly employer ICHRA contribution (after all multipliers)',
-                        'Total annual employer ICHRA contribution (ER ICHRA Monthly × 12)',
-                        'Method used to determine affordability: "FPL" (Federal Poverty Level) or "Income" (household income)',
-                        '2026 IRS affordability threshold - employee LCSP cost cannot exceed 9.96% of household income',
-                        'IRS safe harbor: if employee LCSP cost ≤ 9.96% of FPL (~$128/mo), ICHRA is deemed affordable for all employees regardless of income',
-                    ],
-                }
-                glossary_df = pd.DataFrame(glossary_data)
-                glossary_df.to_excel(writer, sheet_name='Glossary', index=False)
-                apply_tahoma_styling(writer.sheets['Glossary'])
-                style_header_row(writer.sheets['Glossary'])
-
-            output.seek(0)
-            return output.getvalue()
+                workbook.add_sheet(
+                    'LCSP Plans', LCSP_PLAN_COLUMNS, lcsp_plan_rows(), column_formats={'LCSP Premium': 'currency'},
+                )
+
+            # ============================================================
+            # TAB 5: GLOSSARY
+            # ============================================================
+            glossary_data = {
+                'Term': [
+                    'ICHRA',
+                    'LCSP',
+                    'LCSP (Self-Only)',
+                    'LCSP (Tier/Family)',
+                    'LCSP Premium',
+                    'Plan ID',
+                    'Carrier',
+                    'Plan Brochure',
+                    'SBC Link',
+                    'Tier Multiplier',
+                    'Rating Area',
+                    'ACA Age Curve',
+                    'Age Ratio',
+                    'Family Multiplier',
+                    'ER Minimum Contribution',
+                    'ER ICHRA Monthly',
+                    'ER ICHRA Annual',
+                    'Affordability Basis',
+                    '9.96% Threshold (Income)',
+                    'FPL Safe Harbor',
+                ],
+                'Definition': [
+                    'Individual Coverage Health Reimbursement Arrangement - employer-funded allowance for employees to buy their own health insurance',
+                    'Lowest Cost Silver Plan - cheapest silver-tier marketplace plan in an employees rating area',
+                    'LCSP premium for employee-only (self) coverage based on employee age',
+                    'Estimated LCSP premium for the employees coverage tier (Self-Only × Tier Multiplier)',
+                    'Monthly premium for the Lowest Cost Silver Plan based on employee age and rating area',
+                    'HIOS Plan ID - unique identifier for the marketplace plan (format: XXXXX-CC-NNNNNNNN-NN)',
+                    'Insurance company (issuer) offering the plan',
+                    'URL to the plan brochure/marketing materials from the carrier',
+                    'URL to the Summary of Benefits and Coverage (SBC) document - standardized plan comparison document',
+                    'Multiplier applied to Self-Only LCSP based on family status: EE=1.0, ES=1.5, EC=1.3, F=1.8',
+                    'Geographic zone used by insurers to set premiums (defined by state)',
+                    'Federal 3:1 age rating curve - premiums can vary up to 3x based on age (21-64)',
+                    'Multiplier from ACA age curve (age 21 = 1.0, age 64 = 3.0)',
+                    'Multiplier for employees with dependents applied to ICHRA contribution',
+                    'Base employer contribution before family multipliers are applied',
+                    'Total monthly employer ICHRA contribution (after all multipliers)',
+                    'Total annual employer ICHRA contribution (ER ICHRA Monthly × 12)',
+                    'Method used to determine affordability: "FPL" (Federal Poverty Level) or "Income" (household income)',
+                    '2026 IRS affordability threshold - employee LCSP cost cannot exceed 9.96% of household income',
+                    'IRS safe harbor: if employee LCSP cost ≤ 9.96% of FPL (~$128/mo), ICHRA is deemed affordable for all employees regardless of income',
+                ],
+            }
+            glossary_df = pd.DataFrame(glossary_data)
+            workbook.add_frame('Glossary', glossary_df)
+
+            return workbook.close()
 
         with export_col2:
             # Excel Export
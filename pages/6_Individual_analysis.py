@@ -8,15 +8,19 @@ import pandas as pd
 import logging
 
 from database import get_database_connection
-from constants import FAMILY_STATUS_CODES
+from constants import DEFAULT_UTILIZATION_PROFILE, FAMILY_STATUS_CODES, UTILIZATION_PROFILES
+from cost_of_care import household_utilization, load_cost_sharing, total_cost_of_care
 from queries import MarketplaceQueries
+from household_quotes import quote_household
 from utils import render_feedback_sidebar
+from page_profiler import start_page_profile
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Page config
 st.set_page_config(page_title="Individual analysis", page_icon="👤", layout="wide")
+start_page_profile()
 
 
 # =============================================================================
@@ -163,57 +167,73 @@ def get_employer_contribution(employee: dict) -> float:
         return float(settings.get('default_percentage', 75))
 
 
-def calculate_family_premium(employee: dict, plan_id: str, db) -> float:
-    """Calculate total family premium for a plan using MarketplaceQueries"""
-    family_status = str(employee.get('family_status', 'EE')).upper()
-    rating_area_id = employee.get('rating_area_id')
+def get_household_ages(employee: dict) -> tuple:
+    """Get (employee age, spouse age, dependent ages) from a census row"""
+    def parse_age(val):
+        if val is None or (isinstance(val, float) and pd.isna(val)) or val == '':
+            return None
+        try:
+            return int(float(val))
+        except (ValueError, TypeError):
+            return None
 
-    if not rating_area_id:
-        return None
+    ee_age = parse_age(employee.get('age', employee.get('ee_age'))) or 30
+    spouse_age = parse_age(employee.get('spouse_age'))
+    child_ages = [parse_age(employee.get(f'dep_{i}_age')) for i in range(2, 7)]
+    return ee_age, spouse_age, child_ages
 
-    total_premium = 0.0
-    ra_id = int(rating_area_id)
 
-    # Employee premium
-    ee_age = employee.get('age', employee.get('ee_age', 30))
-    age_band = get_age_band(int(ee_age))
+def quote_employee_household(employee: dict, db, include_family: bool = True, **filters) -> list:
+    """Price the employee's household across plans in one query (cheapest first)"""
+    rating_area_id = employee.get('rating_area_id')
+    if not rating_area_id:
+        return []
+
+    ee_age, spouse_age, child_ages = get_household_ages(employee)
+    family_status = str(employee.get('family_status', 'EE')).upper() if include_family else 'EE'
+
+    return quote_household(
+        db=db,
+        state=employee.get('state', employee.get('home_state', '')),
+        rating_area_id=int(rating_area_id),
+        ee_age=ee_age,
+        spouse_age=spouse_age,
+        child_ages=child_ages,
+        family_status=family_status,
+        **filters,
+    )
 
-    ee_rate = MarketplaceQueries.get_rate_by_plan_area_age(db, plan_id, ra_id, age_band)
-    if ee_rate is None:
+
+def calculate_family_premium(employee: dict, plan_id: str, db) -> float:
+    """Calculate total family premium for a plan (ACA 3-child rule applied)"""
+    quotes = quote_employee_household(employee, db, plan_ids=[plan_id], limit=1)
+    if not quotes:
         return None
+    return quotes[0].household_premium
+
 
-    total_premium = ee_rate
-
-    # Add spouse if applicable
-    if family_status in ['ES', 'F']:
-        spouse_age = employee.get('spouse_age')
-        if spouse_age:
-            spouse_band = get_age_band(int(spouse_age))
-            spouse_rate = MarketplaceQueries.get_rate_by_plan_area_age(db, plan_id, ra_id, spouse_band)
-            if spouse_rate:
-                total_premium += spouse_rate
-
-    # Add children if applicable (max 3 oldest under 21 per ACA rules)
-    if family_status in ['EC', 'F']:
-        child_ages = []
-        for i in range(2, 7):
-            child_age = employee.get(f'dep_{i}_age')
-            if child_age and int(child_age) < 21:
-                child_ages.append(int(child_age))
-
-        # Sort and take oldest 3
-        child_ages.sort(reverse=True)
-        for age in child_ages[:3]:
-            child_band = get_age_band(age)
-            child_rate = MarketplaceQueries.get_rate_by_plan_area_age(db, plan_id, ra_id, child_band)
-            if child_rate:
-                total_premium += child_rate
-
-    return total_premium
-
-
-def compare_current_vs_marketplace(employee_id: str, include_family: bool = True) -> dict:
-    """Compare current contribution to marketplace options using MarketplaceQueries"""
+def count_household_members(employee: dict, include_family: bool = True) -> int:
+    """Covered members (employee, spouse, children) for out-of-pocket estimates"""
+    family_status = str(employee.get('family_status', 'EE')).upper()
+    if not include_family:
+        return 1
+    _, _, child_ages = get_household_ages(employee)
+    members = 1
+    if family_status in ('ES', 'F'):
+        members += 1
+    if family_status in ('EC', 'F'):
+        members += max(1, sum(age is not None for age in child_ages))
+    return members
+
+
+def compare_current_vs_marketplace(employee_id: str, include_family: bool = True,
+                                   utilization_profile: str = DEFAULT_UTILIZATION_PROFILE) -> dict:
+    """
+    Compare current contribution to marketplace options using MarketplaceQueries.
+
+    Plans are ranked by what the employee pays in a year: their premium share
+    plus expected out-of-pocket cost for the household at utilization_profile.
+    """
     employee = get_employee_by_id(employee_id)
     if not employee:
         return {"error": f"Employee '{employee_id}' not found in census"}
@@ -241,40 +261,36 @@ def compare_current_vs_marketplace(employee_id: str, include_family: bool = True
     if not rating_area_id:
         return {"error": f"No rating area found for employee '{employee_id}'"}
 
-    ee_age = employee.get('age', employee.get('ee_age', 30))
-    age_band = get_age_band(int(ee_age))
-    state = employee.get('state', employee.get('home_state', ''))
     family_status = str(employee.get('family_status', 'EE')).upper()
 
     try:
         db = st.session_state.db
 
-        # Use MarketplaceQueries for plan lookup
-        df = MarketplaceQueries.get_marketplace_plans_for_employee(
-            db=db,
-            state=state,
-            rating_area_id=int(rating_area_id),
-            age_band=age_band,
-            metal_levels=None,
+        # Price the whole household for every plan in one query, cheapest first
+        quotes = quote_employee_household(
+            employee,
+            db,
+            include_family=include_family,
             limit=10,
-            on_exchange_only=False
+            on_exchange_only=False,
         )
 
-        if df.empty:
+        if not quotes:
             return {"error": f"No marketplace plans found for this location"}
 
         settings = st.session_state.contribution_settings
         contribution = get_employer_contribution(employee)
 
-        comparisons = []
-        for _, row in df.iterrows():
-            ee_premium = float(row['monthly_premium'])
+        # Expected out-of-pocket cost of the household under every quoted plan
+        cost_sharing = load_cost_sharing(db, [quote.plan_id for quote in quotes])
+        members = [utilization_profile] * count_household_members(employee, include_family)
+        oop_by_plan = total_cost_of_care(
+            cost_sharing, [quote.household_premium * 12 for quote in quotes], household_utilization([members])
+        )['oop'][0]
 
-            if include_family and family_status in ['ES', 'EC', 'F']:
-                family_premium = calculate_family_premium(employee, row['plan_id'], db)
-                premium = family_premium if family_premium else ee_premium
-            else:
-                premium = ee_premium
+        comparisons = []
+        for quote, expected_oop in zip(quotes, oop_by_plan):
+            premium = quote.household_premium
 
             if settings.get('contribution_type') == 'class_based':
                 employer_pays = min(contribution, premium)
@@ -285,23 +301,30 @@ def compare_current_vs_marketplace(employee_id: str, include_family: bool = True
 
             monthly_diff = employee_pays - current_ee
             annual_diff = monthly_diff * 12
+            annual_total = employee_pays * 12 + expected_oop
 
             comparisons.append({
-                "plan_id": row['plan_id'],
-                "plan_name": row['plan_name'],
-                "metal_level": row['metal_level'],
-                "plan_type": row['plan_type'],
+                "plan_id": quote.plan_id,
+                "plan_name": quote.plan_name,
+                "metal_level": quote.metal_level,
+                "plan_type": quote.plan_type,
                 "marketplace_total_premium": f"${premium:,.2f}",
                 "marketplace_employer_pays": f"${employer_pays:,.2f}",
                 "marketplace_employee_pays": f"${employee_pays:,.2f}",
                 "current_employee_pays": f"${current_ee:,.2f}",
                 "monthly_difference": f"${monthly_diff:+,.2f}",
                 "annual_difference": f"${annual_diff:+,.2f}",
+                "expected_annual_oop": f"${expected_oop:,.0f}",
+                "annual_total_cost": f"${annual_total:,.0f}",
                 "saves_money": monthly_diff < 0,
                 "_premium_num": premium,
-                "_employee_cost_num": employee_pays
+                "_employee_cost_num": employee_pays,
+                "_total_cost_num": annual_total
             })
 
+        # Lowest expected annual cost to the employee first
+        comparisons.sort(key=lambda c: c['_total_cost_num'])
+
         return {
             "employee_id": employee_id,
             "employee_name": f"{employee.get('first_name', '')} {employee.get('last_name', '')}".strip(),
@@ -527,11 +550,18 @@ with col1:
     selected_id = selected.split(" - ")[0] if selected else None
     st.session_state.selected_employee_id = selected_id
 
+    utilization_profile = st.selectbox(
+        "Expected healthcare use",
+        options=list(UTILIZATION_PROFILES),
+        index=list(UTILIZATION_PROFILES).index(DEFAULT_UTILIZATION_PROFILE),
+        help="Used to estimate out-of-pocket costs (deductible, copays, coinsurance, capped at the MOOP) when ranking plans"
+    )
+
 with col2:
     if st.button("🔍 Analyze employee", type="primary"):
         if selected_id:
             with st.spinner("Analyzing..."):
-                result = compare_current_vs_marketplace(selected_id)
+                result = compare_current_vs_marketplace(selected_id, utilization_profile=utilization_profile)
                 employee = get_employee_by_id(selected_id)
 
                 if "error" in result:
@@ -723,6 +753,7 @@ if '_quick_analysis_result' in st.session_state and st.session_state['_quick_ana
 
     # Marketplace plans
     with st.expander("🏥 Marketplace plan options", expanded=True):
+        st.caption("Ranked by what the employee pays in a year: premium share plus expected out-of-pocket cost.")
         plan_data = []
         for comp in result['comparisons'][:5]:
             plan_data.append({
@@ -734,6 +765,8 @@ if '_quick_analysis_result' in st.session_state and st.session_state['_quick_ana
                 "You pay": comp['marketplace_employee_pays'],
                 "Δ Monthly": comp['monthly_difference'],
                 "Δ Annual": comp['annual_difference'],
+                "Est. OOP": comp.get('expected_annual_oop', 'N/A'),
+                "Total/yr": comp.get('annual_total_cost', 'N/A'),
             })
 
         if plan_data:
@@ -751,6 +784,9 @@ if '_quick_analysis_result' in st.session_state and st.session_state['_quick_ana
                     "You pay": st.column_config.TextColumn("You pay", width="small"),
                     "Δ Monthly": st.column_config.TextColumn("Monthly Δ", width="small"),
                     "Δ Annual": st.column_config.TextColumn("Annual Δ", width="small"),
+                    "Est. OOP": st.column_config.TextColumn("Est. OOP/yr", width="small",
+                                                            help="Expected out-of-pocket cost for the selected healthcare use"),
+                    "Total/yr": st.column_config.TextColumn("You pay/yr + OOP", width="small"),
                 }
             )
 
@@ -16,6 +16,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from constants import EXPORT_FILE_PREFIX, DATE_FORMAT, FAMILY_STATUS_CODES
 from utils import DataFormatter, ContributionComparison, render_feedback_sidebar
 from database import get_database_connection
+from csv_export import build_census_analysis_export, csv_download_data
+from page_profiler import start_page_profile
 import re
 
 
@@ -48,6 +50,7 @@ except ImportError:
 
 
 st.set_page_config(page_title="Export results", page_icon="📄", layout="wide")
+start_page_profile()
 
 # Sidebar styling and hero section
 st.markdown("""
@@ -548,60 +551,9 @@ with col1:
     st.markdown("**Employee census with analysis**")
 
     if st.button("Generate census export"):
-        employee_export = []
-
-        # Get contribution settings for reference
-        settings = st.session_state.contribution_settings
-        contribution_type = settings.get('contribution_type', 'percentage')
-
-        for _, emp in census_df.iterrows():
-            employee_id = emp.get('employee_id', '')
-
-            # Get current contribution data
-            current_ee = emp.get('current_ee_monthly')
-            current_er = emp.get('current_er_monthly')
-
-            # Get analysis data if available
-            analysis = contribution_analysis.get(employee_id, {})
-            ichra_data = analysis.get('ichra_analysis', {})
-
-            proposed_ee = ichra_data.get('employee_cost', '')
-            proposed_er = ichra_data.get('employer_contribution', '')
-            total_premium = ichra_data.get('total_premium', '')
-
-            # Calculate changes if data available
-            ee_change_monthly = ''
-            er_change_monthly = ''
-            if pd.notna(current_ee) and proposed_ee != '':
-                ee_change_monthly = proposed_ee - current_ee
-            if pd.notna(current_er) and proposed_er != '':
-                er_change_monthly = proposed_er - current_er
-
-            employee_export.append({
-                'employee_id': employee_id,
-                'first_name': emp.get('first_name', ''),
-                'last_name': emp.get('last_name', ''),
-                'age': emp.get('age', ''),
-                'state': emp.get('state', ''),
-                'county': emp.get('county', ''),
-                'rating_area': emp.get('rating_area_id', ''),
-                'family_status': emp.get('family_status', 'EE'),
-                # Current group plan contributions
-                'current_ee_monthly': current_ee if pd.notna(current_ee) else '',
-                'current_er_monthly': current_er if pd.notna(current_er) else '',
-                # ICHRA analysis
-                'ichra_total_premium': total_premium,
-                'ichra_employer_contribution': proposed_er,
-                'ichra_employee_cost': proposed_ee,
-                # Changes
-                'ee_change_monthly': ee_change_monthly,
-                'er_change_monthly': er_change_monthly,
-                'ee_change_annual': ee_change_monthly * 12 if ee_change_monthly != '' else '',
-                'er_change_annual': er_change_monthly * 12 if er_change_monthly != '' else '',
-            })
-
-        employee_export_df = pd.DataFrame(employee_export)
-        csv = employee_export_df.to_csv(index=False)
+        # Analysis flattened to columns and joined to the census in one pass
+        employee_export_df = build_census_analysis_export(census_df, contribution_analysis)
+        csv = csv_download_data(employee_export_df)
 
         # Build filename with client name and timestamp
         timestamp = datetime.now().strftime(DATE_FORMAT)
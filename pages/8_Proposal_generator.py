@@ -20,31 +20,47 @@ from database import get_database_connection
 from constants import FAMILY_STATUS_CODES
 from utils import ContributionComparison, render_feedback_sidebar
 from email_service import EmailService, validate_email, validate_file_size
+from email_outbox import get_email_outbox
+from page_profiler import start_page_profile
 
 
 def send_email_and_update_state(
-    email_service: EmailService,
     recipient_email: str,
     client_name: str,
-    file_data: bytes,
+    file_data: bytes | BytesIO,
     filename: str,
     presentation_id: str
 ):
     """
-    Send proposal email and update session state with result.
+    Queue proposal email in the outbox and update session state with its status.
+
+    Delivery happens on the outbox worker thread; the page polls the job
+    status via refresh_email_result().
 
     Returns:
-        EmailResult from the send operation
+        OutboxJob for the queued email
     """
-    result = email_service.send_proposal_email(
+    job = get_email_outbox().enqueue_proposal(
         recipient_email=recipient_email,
         client_name=client_name,
         attachment_data=file_data,
         attachment_filename=filename,
         presentation_id=presentation_id
     )
-    st.session_state.email_result = result.to_dict()
-    return result
+    st.session_state.email_job_id = job.job_id
+    st.session_state.email_result = job.to_email_result_dict()
+    return job
+
+
+def refresh_email_result():
+    """Poll the outbox for the current email job and update session state."""
+    job_id = st.session_state.get('email_job_id')
+    if not job_id:
+        return st.session_state.email_result
+    job = get_email_outbox().get_status(job_id)
+    if job is not None:
+        st.session_state.email_result = job.to_email_result_dict()
+    return st.session_state.email_result
 
 
 # Template path for PPTX (with placeholders)
@@ -52,6 +68,7 @@ PPTX_TEMPLATE_PATH = Path(__file__).parent.parent / 'templates' / 'glove_proposa
 
 # Page config
 st.set_page_config(page_title="Proposal Generator", page_icon="📑", layout="wide")
+start_page_profile()
 
 # Sidebar styling and hero section
 st.markdown("""
@@ -111,6 +128,8 @@ if 'proposal_filename' not in st.session_state:
 # Email delivery state
 if 'email_result' not in st.session_state:
     st.session_state.email_result = None
+if 'email_job_id' not in st.session_state:
+    st.session_state.email_job_id = None
 
 if 'recipient_email' not in st.session_state:
     st.session_state.recipient_email = ""
@@ -632,7 +651,7 @@ else:
 
         with email_col2:
             st.markdown("&nbsp;")  # Spacer
-            st.caption("📨 The proposal will be sent as an attachment immediately after generation.")
+            st.caption("📨 The proposal will be queued and sent as an attachment in the background after generation.")
 
 st.markdown("---")
 
@@ -676,6 +695,7 @@ with generate_col1:
 
         # Reset email result
         st.session_state.email_result = None
+        st.session_state.email_job_id = None
 
         with st.spinner("Generating proposal..."):
             try:
@@ -703,31 +723,30 @@ with generate_col1:
 
                 # Check file size before attempting email
                 if send_email_enabled and st.session_state.recipient_email:
-                    file_data = st.session_state.proposal_buffer.getvalue()
+                    file_data = st.session_state.proposal_buffer
                     is_size_valid, size_error = validate_file_size(file_data, st.session_state.proposal_filename)
 
                     if not is_size_valid:
                         st.error(f"📁 {size_error}")
+                        st.session_state.email_job_id = None
                         st.session_state.email_result = {
                             "success": False,
                             "error_message": size_error
                         }
                     else:
-                        # Send email
-                        with st.spinner("Sending email..."):
-                            result = send_email_and_update_state(
-                                email_service=email_service,
-                                recipient_email=st.session_state.recipient_email,
-                                client_name=client_name,
-                                file_data=file_data,
-                                filename=st.session_state.proposal_filename,
-                                presentation_id=f"{client_name_safe}_{timestamp}"
-                            )
-
-                            if result.success:
-                                st.success(f"✅ Email sent successfully to {result.recipient}!")
-                            else:
-                                st.error(f"❌ Failed to send email: {result.error_message}")
+                        # Queue email - delivery continues in the background
+                        job = send_email_and_update_state(
+                            recipient_email=st.session_state.recipient_email,
+                            client_name=client_name,
+                            file_data=file_data,
+                            filename=st.session_state.proposal_filename,
+                            presentation_id=f"{client_name_safe}_{timestamp}"
+                        )
+
+                        if job.is_pending:
+                            st.info(f"📨 Email queued for {job.recipient}")
+                        else:
+                            st.error(f"❌ Failed to send email: {job.last_error}")
 
             except Exception as e:
                 st.error(f"Error generating proposal: {e}")
@@ -751,8 +770,20 @@ with generate_col2:
 # EMAIL STATUS DISPLAY
 # =============================================================================
 if st.session_state.email_result is not None:
-    result = st.session_state.email_result
-    if result.get("success"):
+    result = refresh_email_result()
+    if result.get("pending"):
+        attempts = result.get('attempts', 0)
+        attempt_note = f" (retry {attempts} of {get_email_outbox().max_attempts - 1})" if attempts else ""
+        st.markdown(f"""
+        <div style="padding: 15px; background: #eff6ff; border-radius: 8px; border-left: 4px solid #0047AB;">
+            <strong>📨 Email Sending{attempt_note}</strong><br>
+            <span style="color: #1e3a8a;">To: {result.get('recipient')}</span><br>
+            <span style="color: #1e3a8a; font-size: 0.9em;">Delivery continues in the background - you can keep working.</span>
+        </div>
+        """, unsafe_allow_html=True)
+        if st.button("🔄 Refresh status", type="secondary"):
+            st.rerun()
+    elif result.get("success"):
         st.markdown(f"""
         <div style="padding: 15px; background: #dcfce7; border-radius: 8px; border-left: 4px solid #16a34a;">
             <strong>📧 Email Delivered</strong><br>
@@ -773,25 +804,27 @@ if st.session_state.email_result is not None:
         # Retry button (shown inline with error status)
         if st.session_state.proposal_buffer is not None and is_email_configured:
             if st.button("🔄 Retry email", type="secondary"):
-                with st.spinner("Retrying email..."):
-                    file_data = st.session_state.proposal_buffer.getvalue()
+                retry_job = None
+                if st.session_state.get('email_job_id'):
+                    # Re-queue the job, re-spooling the proposal kept in session state
+                    retry_job = get_email_outbox().retry(
+                        st.session_state.email_job_id,
+                        attachment_data=st.session_state.proposal_buffer
+                    )
+
+                if retry_job is None or not retry_job.is_pending:
                     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                     client_name_safe = client_name.replace(' ', '_').replace('/', '-')
-
-                    retry_result = send_email_and_update_state(
-                        email_service=email_service,
+                    send_email_and_update_state(
                         recipient_email=st.session_state.recipient_email,
                         client_name=client_name,
-                        file_data=file_data,
+                        file_data=st.session_state.proposal_buffer,
                         filename=st.session_state.proposal_filename,
                         presentation_id=f"{client_name_safe}_{timestamp}"
                     )
-
-                    if retry_result.success:
-                        st.success(f"✅ Email sent successfully to {retry_result.recipient}!")
-                        st.rerun()
-                    else:
-                        st.error(f"❌ Failed to send email: {retry_result.error_message}")
+                else:
+                    st.session_state.email_result = retry_job.to_email_result_dict()
+                st.rerun()
 
 # =============================================================================
 # FOOTER
@@ -11,11 +11,14 @@ import streamlit as st
 import pandas as pd
 import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+if TYPE_CHECKING:
+    from pptx_plan_comparison import PlanComparisonSlideData
+
 from database import get_database_connection, DatabaseConnection
 from plan_comparison_types import (
     CurrentEmployerPlan,
@@ -28,13 +31,10 @@ from plan_comparison_types import (
     calculate_enhanced_ranking_score,
 )
 from queries import PlanComparisonQueries, PlanQueries
+from cost_of_care import household_utilization, load_cost_sharing, total_cost_of_care
 from utils import render_feedback_sidebar
-from pptx_plan_comparison import (
-    PlanComparisonSlideData,
-    PlanColumnData,
-    generate_plan_comparison_slide,
-)
 from sbc_parser import parse_sbc_markdown
+from page_profiler import start_page_profile
 from constants import (
     PLAN_TYPES,
     METAL_LEVELS,
@@ -42,6 +42,8 @@ from constants import (
     COMPARISON_INDICATORS,
     MAX_COMPARISON_PLANS,
     TARGET_STATES,
+    UTILIZATION_PROFILES,
+    DEFAULT_UTILIZATION_PROFILE,
 )
 
 # Comparison thresholds for premium rows (absolute $ difference)
@@ -55,6 +57,7 @@ st.set_page_config(
     page_icon="📊",
     layout="wide"
 )
+start_page_profile()
 
 # Custom CSS to match dashboard styling
 st.markdown("""
@@ -1328,7 +1331,7 @@ def search_marketplace_plans(db: DatabaseConnection, state: str, rating_area_id:
         # Query base rates directly for age 21 in the rating area
         age_21_query = f"""
         SELECT plan_id as hios_plan_id, individual_rate as premium
-        FROM rbis_insurance_plan_base_rates_20251019202724
+        FROM rbis_insurance_plan_base_rates
         WHERE plan_id IN ({', '.join(['%s'] * len(plan_ids))})
           AND rating_area_id = %s
           AND age = '21'
@@ -1447,16 +1450,27 @@ def search_marketplace_plans(db: DatabaseConnection, state: str, rating_area_id:
                 'tier': tier,
             })
 
+        # Expected out-of-pocket cost for every plan in one pass
+        if results:
+            result_plan_ids = [r['plan'].hios_plan_id for r in results]
+            cost_sharing = load_cost_sharing(db, result_plan_ids)
+            annual_premiums = [(r['plan'].age_21_premium or float('nan')) * 12 for r in results]
+            profile = getattr(filters, 'utilization_profile', DEFAULT_UTILIZATION_PROFILE)
+            costs = total_cost_of_care(cost_sharing, annual_premiums, household_utilization([[profile]]))
+            for r, oop in zip(results, costs['oop'][0]):
+                r['plan'].expected_annual_oop = float(oop)
+
         # Sort results
         if current_plan is not None:
             # Sort by RANKING score (includes cost consideration), not just match score
             results.sort(key=lambda x: x['ranking_score'], reverse=True)
         else:
-            # Marketplace Only: sort by premium (lowest first), then AV (highest first)
+            # Marketplace Only: sort by annual premium + expected out-of-pocket (lowest first), then AV (highest first)
             def sort_key(x):
-                premium = x['plan'].age_21_premium or float('inf')
+                premium = x['plan'].age_21_premium
+                total = premium * 12 + (x['plan'].expected_annual_oop or 0) if premium else float('inf')
                 av = x['plan'].actuarial_value or 0
-                return (premium, -av)
+                return (total, -av)
             results.sort(key=sort_key)
         return results
 
@@ -1629,12 +1643,22 @@ def render_stage_2_marketplace_selection():
             help="Maximum individual deductible (0 = no limit)"
         )
 
+    profile_names = list(UTILIZATION_PROFILES)
+    current_profile = getattr(filters, 'utilization_profile', DEFAULT_UTILIZATION_PROFILE)
+    utilization_profile = st.selectbox(
+        "Expected healthcare use",
+        options=profile_names,
+        index=profile_names.index(current_profile) if current_profile in profile_names else 0,
+        help="Used to estimate each plan's annual out-of-pocket cost (deductible, copays, coinsurance, capped at the MOOP)"
+    )
+
     # Update filters in session state
     st.session_state.comparison_filters = ComparisonFilters(
         metal_levels=metal_levels if metal_levels else ["Bronze", "Expanded Bronze", "Silver", "Gold", "Platinum", "Catastrophic"],
         plan_types=plan_types if plan_types else PLAN_TYPES,
         hsa_only=hsa_only,
         max_deductible=float(max_deductible) if max_deductible > 0 else None,
+        utilization_profile=utilization_profile,
     )
 
     # Search for plans
@@ -1783,6 +1807,9 @@ def render_stage_2_marketplace_selection():
             | Copays | 25% | Compares PCP, Specialist, and Generic Rx copays |
 
             Higher scores indicate plans more similar to your current coverage.
+
+            In **Marketplace Only** mode, plans are sorted by estimated total annual cost: the age-21
+            premium plus expected out-of-pocket cost for the selected healthcare use.
             """)
 
         # Get currently selected plans
@@ -1843,7 +1870,10 @@ def render_stage_2_marketplace_selection():
 
                 with col3:
                     st.write(f"{mp.metal_level}")
-                    st.caption(f"Ded: ${mp.individual_deductible:,.0f}")
+                    if mp.expected_annual_oop is not None:
+                        st.caption(f"Ded: ${mp.individual_deductible:,.0f} · Est. OOP: ${mp.expected_annual_oop:,.0f}/yr")
+                    else:
+                        st.caption(f"Ded: ${mp.individual_deductible:,.0f}")
 
                 with col4:
                     st.write(f"OOP: ${mp.individual_oop_max:,.0f}")
@@ -2087,7 +2117,7 @@ def format_value(value, attr: str, coinsurance_pct: int = 20, combined_format: b
 
 def build_slide_data(current_plan: CurrentEmployerPlan,
                      selected_plans: List[MarketplacePlanDetails],
-                     comparison_data: Dict[str, Any]) -> PlanComparisonSlideData:
+                     comparison_data: Dict[str, Any]) -> 'PlanComparisonSlideData':
     """
     Build PlanComparisonSlideData from current comparison context.
 
@@ -2103,6 +2133,8 @@ def build_slide_data(current_plan: CurrentEmployerPlan,
             - affordable_contributions: Dict[plan_id, {total, avg, min, max}]
             - footnote: str
     """
+    from pptx_plan_comparison import PlanComparisonSlideData, PlanColumnData
+
     plans = []
     employee_count = comparison_data.get('employee_count', 0)
 
@@ -2764,7 +2796,7 @@ def render_stage_3_comparison_table():
                 # Query rates for all age bands
                 rates_query = f"""
                 SELECT plan_id, age, individual_rate
-                FROM rbis_insurance_plan_base_rates_20251019202724
+                FROM rbis_insurance_plan_base_rates
                 WHERE plan_id IN ({', '.join(['%s'] * len(plan_ids))})
                   AND rating_area_id = %s
                   AND age IN ({', '.join(['%s'] * len(unique_ages))})
@@ -3105,6 +3137,8 @@ def render_stage_3_comparison_table():
     with col2:
         # Generate PowerPoint slide
         try:
+            # python-pptx is imported only when a slide is actually built
+            from pptx_plan_comparison import generate_plan_comparison_slide
             slide_data = build_slide_data(current_plan, selected_plans, comparison_export_data)
             pptx_buffer = generate_plan_comparison_slide(slide_data)
             st.download_button(
@@ -9,7 +9,6 @@ Renders census analysis report as PDF by:
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
-from jinja2 import Environment, FileSystemLoader
 from io import BytesIO
 from pathlib import Path
 import base64
@@ -18,6 +17,8 @@ import logging
 import subprocess
 import sys
 
+from template_rendering import get_environment, timed_section
+
 # Flag to track if browser has been installed this session
 _browser_installed = False
 
@@ -110,11 +111,8 @@ class CensusAnalysisPDFRenderer:
     TEMPLATE_DIR = Path(__file__).parent / 'templates' / 'census_analysis'
 
     def __init__(self):
-        """Initialize renderer with Jinja2 environment."""
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.TEMPLATE_DIR)),
-            autoescape=False  # We control the HTML, no XSS risk
-        )
+        """Initialize renderer with the shared Jinja2 environment."""
+        self.env = get_environment(self.TEMPLATE_DIR)
 
     def generate(self, data: CensusAnalysisData) -> BytesIO:
         """
@@ -133,11 +131,11 @@ class CensusAnalysisPDFRenderer:
         from playwright.sync_api import sync_playwright
 
         # 1. Render HTML with Jinja2
-        template = self.env.get_template('census_analysis.html')
-        html_content = template.render(data=data)
+        with timed_section('census_analysis.html'):
+            html_content = self.env.get_template('census_analysis.html').render(data=data)
 
         # 2. Convert to PDF with Playwright
-        with sync_playwright() as p:
+        with timed_section('census_analysis.pdf'), sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
 
@@ -189,8 +187,8 @@ class CensusAnalysisPDFRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template('census_analysis.html')
-        return template.render(data=data)
+        with timed_section('census_analysis.html'):
+            return self.env.get_template('census_analysis.html').render(data=data)
 
     def save_html(self, data: CensusAnalysisData, path: str) -> None:
         """
@@ -12,14 +12,14 @@ For Railway deployment, see nixpacks.toml for required apt packages.
 
 from dataclasses import dataclass
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
 from io import BytesIO
 from pathlib import Path
-import base64
 import logging
 import subprocess
 import sys
 
+from template_rendering import get_environment, load_logo_base64, timed_section
+
 # Flag to track if browser has been installed this session
 _browser_installed = False
 
@@ -122,18 +122,6 @@ class EmployerSummaryData:
     logo_base64: str = ""  # Base64 encoded logo image for PDF footer
 
 
-def _load_logo_base64() -> str:
-    """Load the Glove logo and return as base64 string."""
-    try:
-        logo_path = Path(__file__).parent / "decoratives" / "glove_logo.png"
-        if logo_path.exists():
-            with open(logo_path, "rb") as f:
-                return base64.b64encode(f.read()).decode("utf-8")
-    except Exception as e:
-        logging.warning(f"Could not load logo: {e}")
-    return ""
-
-
 def _savings_format(amount, decimals=0):
     """Jinja2 filter for consistent savings formatting."""
     if amount > 0:
@@ -160,14 +148,11 @@ class EmployerSummaryPDFRenderer:
     TEMPLATE_DIR = Path(__file__).parent / 'templates' / 'employer_summary'
 
     def __init__(self):
-        """Initialize renderer with Jinja2 environment."""
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.TEMPLATE_DIR)),
-            autoescape=False  # We control the HTML, no XSS risk
-        )
-        # Add custom filters for savings formatting
-        self.env.filters['savings_format'] = _savings_format
-        self.env.filters['savings_er_only'] = _savings_er_only
+        """Initialize renderer with the shared Jinja2 environment."""
+        self.env = get_environment(self.TEMPLATE_DIR, filters={
+            'savings_format': _savings_format,
+            'savings_er_only': _savings_er_only,
+        })
 
     def generate(self, data: EmployerSummaryData) -> BytesIO:
         """
@@ -186,11 +171,11 @@ class EmployerSummaryPDFRenderer:
         from playwright.sync_api import sync_playwright
 
         # 1. Render HTML with Jinja2
-        template = self.env.get_template('employer_summary.html')
-        html_content = template.render(data=data)
+        with timed_section('employer_summary.html'):
+            html_content = self.env.get_template('employer_summary.html').render(data=data)
 
         # 2. Convert to PDF with Playwright
-        with sync_playwright() as p:
+        with timed_section('employer_summary.pdf'), sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
 
@@ -227,8 +212,8 @@ class EmployerSummaryPDFRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template('employer_summary.html')
-        return template.render(data=data)
+        with timed_section('employer_summary.html'):
+            return self.env.get_template('employer_summary.html').render(data=data)
 
     def save_html(self, data: EmployerSummaryData, path: str) -> None:
         """
@@ -266,7 +251,7 @@ def build_employer_summary_data(
     """
     data = EmployerSummaryData(client_name=client_name)
     data.report_date = datetime.now().strftime("%m.%d.%y")
-    data.logo_base64 = _load_logo_base64()
+    data.logo_base64 = load_logo_base64()
 
     # Strategy info
     result = strategy_results.get('result', {})
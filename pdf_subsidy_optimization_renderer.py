@@ -11,18 +11,16 @@ Follows the same pattern as pdf_employer_summary_renderer.py.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
 from io import BytesIO
 from pathlib import Path
 from typing import List, Dict, Optional
-import base64
-import logging
 import math
 import pandas as pd
 
 # Import the shared browser installation function
 from pdf_employer_summary_renderer import _ensure_playwright_browser
 from constants import AFFORDABILITY_THRESHOLD_2026
+from template_rendering import get_environment, load_logo_base64, timed_section
 
 
 @dataclass
@@ -54,18 +52,6 @@ class SubsidyOptimizationData:
     employees: List[Dict] = field(default_factory=list)
 
 
-def _load_logo_base64() -> str:
-    """Load the Glove logo and return as base64 string."""
-    try:
-        logo_path = Path(__file__).parent / "decoratives" / "glove_logo.png"
-        if logo_path.exists():
-            with open(logo_path, "rb") as f:
-                return base64.b64encode(f.read()).decode("utf-8")
-    except Exception as e:
-        logging.warning(f"Could not load logo: {e}")
-    return ""
-
-
 def format_currency(val: Optional[float]) -> str:
     """Format value as currency or dash if None/NaN."""
     if val is None or (isinstance(val, float) and math.isnan(val)):
@@ -86,14 +72,11 @@ class SubsidyOptimizationPDFRenderer:
     TEMPLATE_DIR = Path(__file__).parent / 'templates' / 'subsidy_optimization'
 
     def __init__(self):
-        """Initialize renderer with Jinja2 environment."""
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.TEMPLATE_DIR)),
-            autoescape=False  # We control the HTML, no XSS risk
-        )
-        # Add custom filters
-        self.env.filters['format_currency'] = format_currency
-        self.env.filters['format_percent'] = format_percent
+        """Initialize renderer with the shared Jinja2 environment."""
+        self.env = get_environment(self.TEMPLATE_DIR, filters={
+            'format_currency': format_currency,
+            'format_percent': format_percent,
+        })
 
     def generate(self, data: SubsidyOptimizationData) -> BytesIO:
         """
@@ -112,11 +95,11 @@ class SubsidyOptimizationPDFRenderer:
         from playwright.sync_api import sync_playwright
 
         # 1. Render HTML with Jinja2
-        template = self.env.get_template('subsidy_optimization.html')
-        html_content = template.render(data=data)
+        with timed_section('subsidy_optimization.html'):
+            html_content = self.env.get_template('subsidy_optimization.html').render(data=data)
 
         # 2. Convert to PDF with Playwright
-        with sync_playwright() as p:
+        with timed_section('subsidy_optimization.pdf'), sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
 
@@ -153,8 +136,8 @@ class SubsidyOptimizationPDFRenderer:
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template('subsidy_optimization.html')
-        return template.render(data=data)
+        with timed_section('subsidy_optimization.html'):
+            return self.env.get_template('subsidy_optimization.html').render(data=data)
 
     def save_html(self, data: SubsidyOptimizationData, path: str) -> None:
         """
@@ -195,7 +178,7 @@ def build_subsidy_optimization_data(
     """
     data = SubsidyOptimizationData(client_name=client_name)
     data.report_date = datetime.now().strftime("%m.%d.%y")
-    data.logo_base64 = _load_logo_base64()
+    data.logo_base64 = load_logo_base64()
     data.show_slcsp = show_slcsp
 
     # Strategy info
@@ -0,0 +1,128 @@
+"""
+Plan Attribute Cache
+Process-wide read-through cache for static plan attributes.
+
+Plan variant, deductible/MOOP and benefit cost-share rows don't change during
+a plan year, but the enrichment queries in queries.py used to re-read them for
+the same plan IDs on every dashboard and comparison render. This cache keeps
+them in memory, keyed by (table, plan_id):
+
+Features:
+- Lookups for a batch of plan IDs are served from memory; all misses are
+  fetched with one query per table
+- Plans with no rows are cached too, so they are not re-queried
+- Bounded LRU across all tables (bounded_lru)
+- Hit/miss/query counts per table (get_plan_attribute_stats)
+
+Environment:
+- PLAN_ATTRIBUTE_CACHE_SIZE: Max cached (table, plan) entries (default 20000)
+"""
+
+import os
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List
+
+from bounded_lru import BoundedLRU
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 20_000
+
+
+class PlanAttributeCache:
+    """Bounded LRU of per-plan values, filled in batches by a fetch function."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self._entries = BoundedLRU(max_entries)
+        self._lock = threading.Lock()
+        # table -> {'hits', 'misses', 'queries'}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def max_entries(self) -> int:
+        return self._entries.max_entries
+
+    def get_many(
+        self,
+        table: str,
+        plan_ids: Iterable[str],
+        fetch: Callable[[List[str]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Get the cached value for each plan, fetching misses in one call.
+
+        Args:
+            table: Cache namespace (normally the source table name)
+            plan_ids: Plan IDs to look up (duplicates are ignored)
+            fetch: missing plan IDs -> {plan_id: value}; it must return a value
+                for every ID it was given (e.g. an empty frame for no rows)
+
+        Returns:
+            {plan_id: value} in first-seen order of plan_ids
+        """
+        plan_ids = list(dict.fromkeys(plan_ids))
+        found = {key[1]: value for key, value in self._entries.get_many((table, p) for p in plan_ids).items()}
+        missing = [plan_id for plan_id in plan_ids if plan_id not in found]
+
+        with self._lock:
+            stats = self._stats.setdefault(table, {'hits': 0, 'misses': 0, 'queries': 0})
+            stats['hits'] += len(found)
+            stats['misses'] += len(missing)
+
+        if missing:
+            # Errors propagate and nothing is cached, so the next call retries
+            fetched = fetch(missing)
+            with self._lock:
+                self._stats[table]['queries'] += 1
+            self._entries.put_many({(table, plan_id): fetched[plan_id] for plan_id in missing})
+            found.update((plan_id, fetched[plan_id]) for plan_id in missing)
+            logger.debug(f"Plan attribute cache: fetched {len(missing)} plan(s) from {table}")
+
+        return {plan_id: found[plan_id] for plan_id in plan_ids}
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-table counters.
+
+        Returns:
+            {table: {'hits', 'misses', 'queries', 'hit_rate'}}
+        """
+        with self._lock:
+            result = {}
+            for table, counts in self._stats.items():
+                lookups = counts['hits'] + counts['misses']
+                result[table] = {**counts, 'hit_rate': counts['hits'] / lookups if lookups else 0.0}
+            return result
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached values and counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+
+_cache = PlanAttributeCache(int(os.getenv('PLAN_ATTRIBUTE_CACHE_SIZE') or DEFAULT_CACHE_SIZE))
+
+
+def get_plan_attribute_cache() -> PlanAttributeCache:
+    """The process-wide cache used by queries.py."""
+    return _cache
+
+
+def get_plan_attribute_stats() -> Dict[str, Any]:
+    """
+    Hit-rate stats for the process-wide cache.
+
+    Returns:
+        {'entries': int, 'max_entries': int, 'tables': {table: {'hits', 'misses', 'queries', 'hit_rate'}}}
+    """
+    return {'entries': len(_cache), 'max_entries': _cache.max_entries, 'tables': _cache.stats()}
+
+
+def clear_plan_attribute_cache() -> None:
+    """Drop all cached plan attributes (e.g. after loading a new plan year)."""
+    _cache.clear()
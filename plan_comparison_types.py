@@ -6,6 +6,8 @@ Dataclasses for the Plan Comparison feature (Page 9)
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List
 
+from constants import DEFAULT_UTILIZATION_PROFILE
+
 
 @dataclass
 class CurrentEmployerPlan:
@@ -178,6 +180,9 @@ class MarketplacePlanDetails:
     # Monthly premium for age 21 (base rate)
     age_21_premium: Optional[float] = None
 
+    # Expected annual out-of-pocket cost for the selected utilization profile (cost_of_care.py)
+    expected_annual_oop: Optional[float] = None
+
     # Actuarial value (percentage, e.g., 70 for 70%)
     actuarial_value: Optional[float] = None
 
@@ -213,6 +218,7 @@ class ComparisonFilters:
     hsa_only: bool = False
     max_deductible: Optional[float] = None
     max_oop_max: Optional[float] = None
+    utilization_profile: str = DEFAULT_UTILIZATION_PROFILE  # Expected usage for out-of-pocket estimates
 
 
 def calculate_match_score(current_plan: CurrentEmployerPlan,
@@ -5,6 +5,11 @@ This module provides plan recommendations using:
 1. ACA-based scoring (cost efficiency, coverage, actuarial value, network flexibility)
 2. LLM analysis (optional) for strategic cost savings narrative
 
+LLM plan selection sends one request per state, concurrently, with each
+state's context trimmed to a token budget. Responses are cached by a hash of
+the request inputs (llm_response_cache), and a state whose response misses
+the latency SLO falls back to the PlanScorer ranking.
+
 Scoring Methodology:
 - Cost Efficiency (40%): Percentile rank of cost per covered employee
 - Geographic Coverage (30%): % of state employees with rates available
@@ -12,16 +17,19 @@ Scoring Methodology:
 - Network Flexibility (10%): Plan type (PPO=100, POS=80, EPO=60, HMO=40)
 """
 
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
+from functools import partial
 from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import logging
 import os
 import re
+import time
 from dotenv import load_dotenv
-import anthropic
 import json
 from queries import PlanQueries
+from llm_response_cache import LLMResponseCache, estimate_tokens, get_llm_response_cache, response_cache_key
 
 # Load environment variables
 load_dotenv()
@@ -160,6 +168,13 @@ Output formatting:
 - Structure responses with clear headers and bullet points
 - Keep analysis concise and actionable"""
 
+# Per-state LLM plan selection
+DEFAULT_SELECTION_SLO_SECONDS = 20.0  # Wait this long for a state's response before falling back
+DEFAULT_CONTEXT_TOKEN_BUDGET = 6000   # Max estimated tokens of JSON context per request
+DEFAULT_SELECTION_MAX_TOKENS = 4000   # Response tokens per state
+DEFAULT_SELECTION_WORKERS = 6         # States requested at once
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 120.0
+
 
 # ==============================================================================
 # DATA CLASSES
@@ -693,7 +708,7 @@ class AISuggestionEngine:
 
             # Group rating areas by state
             state_rating_areas = (
-                census_locations.groupby('state')['rating_area_num']
+                census_locations.groupby('state', observed=True)['rating_area_num']
                 .apply(lambda x: sorted([int(ra) for ra in x]))
                 .to_dict()
             )
@@ -1068,20 +1083,99 @@ class AISuggestionEngine:
 class LLMPlanAnalyzer:
     """Uses Claude API to provide intelligent analysis of plan recommendations"""
 
-    def __init__(self):
-        """Initialize Claude API client"""
-        api_key = get_anthropic_api_key()
-        if not api_key:
-            raise ValueError(
-                "ANTHROPIC_API_KEY not set. "
-                "Set in environment or Streamlit secrets (anthropic.api_key or ANTHROPIC_API_KEY)"
-            )
+    def __init__(self, client=None, cache: Optional[LLMResponseCache] = None):
+        """
+        Initialize Claude API client
 
-        self.client = anthropic.Anthropic(api_key=api_key)
+        Args:
+            client: Anthropic client (default: created from ANTHROPIC_API_KEY)
+            cache: Response cache (default: the process-wide cache)
+
+        Environment:
+            ANTHROPIC_MODEL, ANTHROPIC_MAX_TOKENS: Model and analysis response size
+            ANTHROPIC_SELECTION_MAX_TOKENS: Response size per state selection
+            LLM_SELECTION_SLO_SECONDS: Per-state latency SLO before falling back to scores
+            LLM_CONTEXT_TOKEN_BUDGET: Max estimated tokens of context per request
+            LLM_SELECTION_WORKERS: States requested concurrently
+        """
+        if client is None:
+            api_key = get_anthropic_api_key()
+            if not api_key:
+                raise ValueError(
+                    "ANTHROPIC_API_KEY not set. "
+                    "Set in environment or Streamlit secrets (anthropic.api_key or ANTHROPIC_API_KEY)"
+                )
+
+            import anthropic
+            client = anthropic.Anthropic(api_key=api_key)
+
+        self.client = client
+        self.cache = cache if cache is not None else get_llm_response_cache()
         self.model = os.getenv('ANTHROPIC_MODEL', 'claude-sonnet-4-5-20250929')
         self.max_tokens = int(os.getenv('ANTHROPIC_MAX_TOKENS', '16000'))
+        self.selection_max_tokens = int(os.getenv('ANTHROPIC_SELECTION_MAX_TOKENS') or DEFAULT_SELECTION_MAX_TOKENS)
+        self.selection_slo_seconds = float(os.getenv('LLM_SELECTION_SLO_SECONDS') or DEFAULT_SELECTION_SLO_SECONDS)
+        self.context_token_budget = int(os.getenv('LLM_CONTEXT_TOKEN_BUDGET') or DEFAULT_CONTEXT_TOKEN_BUDGET)
+        self.max_workers = int(os.getenv('LLM_SELECTION_WORKERS') or DEFAULT_SELECTION_WORKERS)
+        self.request_timeout = DEFAULT_REQUEST_TIMEOUT_SECONDS
         self.logger = logging.getLogger(__name__)
 
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        """Send one prompt with the ICHRA system prompt and return the response text."""
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=ICHRA_SYSTEM_PROMPT,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            timeout=self.request_timeout
+        )
+        return response.content[0].text
+
+    def _cache_response(self, key: str, future) -> None:
+        """Future callback: cache a successful response, even one that arrived after the SLO."""
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+
+    def _fit_token_budget(self, context: Dict, plan_lists: List[List[Dict]], min_plans: int = 1) -> Dict:
+        """
+        Shrink context in place until its JSON fits context_token_budget.
+
+        Plan lists must be ordered best-first. Strengths/considerations are cut
+        to two items each, then dropped; after that the lowest-ranked plans are
+        dropped from the longest list, keeping at least min_plans per list.
+        """
+        def tokens():
+            return estimate_tokens(json.dumps(context, indent=2, default=str))
+
+        budget = self.context_token_budget
+        if tokens() <= budget:
+            return context
+
+        for keep in (2, 0):
+            for plans in plan_lists:
+                for plan in plans:
+                    for key in ('strengths', 'considerations'):
+                        if key in plan:
+                            if keep:
+                                plan[key] = plan[key][:keep]
+                            else:
+                                del plan[key]
+            if tokens() <= budget:
+                return context
+
+        while tokens() > budget:
+            longest = max(plan_lists, key=len, default=[])
+            if len(longest) <= max(min_plans, 1):
+                self.logger.warning(f"LLM context still ~{tokens()} tokens after trimming (budget {budget})")
+                break
+            longest.pop()
+        return context
+
     def analyze_recommendations(
         self,
         scored_plans: List[ScoredPlan],
@@ -1104,26 +1198,23 @@ class LLMPlanAnalyzer:
         try:
             # Prepare context for LLM
             context = self._prepare_context(scored_plans[:top_n], census_df, preferences)
+            context = self._fit_token_budget(context, [context['marketplace_plans']])
+
+            # Same inputs -> same prompt, so reuse the cached response
+            cache_key = response_cache_key('analysis', self.model, self.max_tokens, context)
+            analysis = self.cache.get(cache_key)
+            if analysis is None:
+                # Create prompt
+                prompt = self._create_analysis_prompt(context)
+
+                # Call Claude API with system prompt
+                self.logger.info(f"Calling Claude API for plan analysis (model: {self.model})")
+                analysis = self._complete(prompt, self.max_tokens)
+                self.cache.put(cache_key, analysis)
+            else:
+                self.logger.info("Using cached LLM analysis")
 
-            # Create prompt
-            prompt = self._create_analysis_prompt(context)
-
-            # Call Claude API with system prompt
-            self.logger.info(f"Calling Claude API for plan analysis (model: {self.model})")
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                system=ICHRA_SYSTEM_PROMPT,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
-
-            # Extract analysis text and clean up formatting artifacts
-            analysis = response.content[0].text
+            # Clean up formatting artifacts
             analysis = clean_llm_output(analysis)
             self.logger.info("Successfully generated LLM analysis")
 
@@ -1316,8 +1407,14 @@ Return your analysis in markdown format following the three-section structure ab
         """
         Use LLM to intelligently select the best plans from scored candidates.
 
+        Each state is a separate request (that state's employees and candidates
+        only), and all states are requested concurrently. A cached response is
+        reused when a state's context is unchanged. States whose response fails
+        or takes longer than selection_slo_seconds use the PlanScorer ranking;
+        a late response is still cached for the next run.
+
         Args:
-            candidate_plans: List of pre-scored candidate plans (top N per state)
+            candidate_plans: List of pre-scored candidate plans (top N per state, best first)
             census_df: Employee census data
             preferences: Employer preferences
             max_per_state: Maximum plans to select per state
@@ -1325,58 +1422,95 @@ Return your analysis in markdown format following the three-section structure ab
         Returns:
             Tuple of (selected_plan_ids, analysis_markdown)
         """
+        # Group candidates by state
+        candidates_by_state = {}
+        for plan in candidate_plans:
+            state = plan.state_code
+            if state not in candidates_by_state:
+                candidates_by_state[state] = []
+            candidates_by_state[state].append(plan)
+
+        if not candidates_by_state:
+            return [], ""
+
+        start = time.perf_counter()
+        results: Dict[str, Tuple[List[str], str]] = {}
+        pending = {}
+        pool = None
+
         try:
-            # Group candidates by state
-            candidates_by_state = {}
-            for plan in candidate_plans:
-                state = plan.state_code
-                if state not in candidates_by_state:
-                    candidates_by_state[state] = []
-                candidates_by_state[state].append(plan)
-
-            # Prepare context for LLM selection
-            context = self._prepare_selection_context(
-                candidates_by_state,
-                census_df,
-                preferences
-            )
+            for state in sorted(candidates_by_state):
+                state_plans = candidates_by_state[state]
+                state_census = census_df[census_df['state'] == state] if 'state' in census_df.columns else census_df
+
+                context = self._prepare_selection_context({state: state_plans}, state_census, preferences)
+                context = self._fit_token_budget(context, [context['candidates_by_state'][state]], max_per_state)
+
+                cache_key = response_cache_key('selection', self.model, self.selection_max_tokens, max_per_state, context)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    self.logger.info(f"  {state}: using cached AI selection")
+                    results[state] = self._parse_selection_response(cached, state_plans)
+                    continue
+
+                if pool is None:
+                    workers = max(1, min(self.max_workers, len(candidates_by_state)))
+                    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='llm-select')
+                future = pool.submit(self._complete, self._create_selection_prompt(context, max_per_state),
+                                     self.selection_max_tokens)
+                future.add_done_callback(partial(self._cache_response, cache_key))
+                pending[future] = state
+
+            if pending:
+                self.logger.info(f"Calling Claude API for AI-driven plan selection: {len(pending)} state(s) "
+                                 f"(model: {self.model}, SLO {self.selection_slo_seconds:g}s)")
+                done, _ = wait(pending, timeout=self.selection_slo_seconds)
+                for future, state in pending.items():
+                    state_plans = candidates_by_state[state]
+                    if future not in done:
+                        self.logger.warning(f"  {state}: AI selection missed {self.selection_slo_seconds:g}s SLO")
+                        results[state] = self._fallback_selection(state, state_plans, max_per_state, "timed out")
+                    elif future.exception() is not None:
+                        self.logger.error(f"  {state}: error in LLM plan selection: {future.exception()}")
+                        results[state] = self._fallback_selection(state, state_plans, max_per_state,
+                                                                  f"error: {future.exception()}")
+                    else:
+                        results[state] = self._parse_selection_response(future.result(), state_plans)
 
-            # Create selection prompt
-            prompt = self._create_selection_prompt(context, max_per_state)
-
-            # Call Claude API with system prompt
-            self.logger.info(f"Calling Claude API for AI-driven plan selection (model: {self.model})")
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=16000,  # More tokens for selection + analysis
-                system=ICHRA_SYSTEM_PROMPT,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+        except Exception as e:
+            self.logger.error(f"Error in LLM plan selection: {e}")
+            for state, state_plans in candidates_by_state.items():
+                if state not in results:
+                    results[state] = self._fallback_selection(state, state_plans, max_per_state, f"error: {e}")
 
-            response_text = response.content[0].text
-            self.logger.info("LLM selection response received")
+        finally:
+            if pool is not None:
+                # Don't wait for late responses; their callbacks still cache them
+                pool.shutdown(wait=False)
 
-            # Parse the response to extract selected plan IDs and analysis
-            selected_ids, analysis = self._parse_selection_response(response_text, candidate_plans)
+        selected_ids = []
+        sections = []
+        for state in sorted(results):
+            state_ids, state_analysis = results[state]
+            selected_ids.extend(state_ids)
+            sections.append(f"## {state}\n\n{state_analysis}" if len(results) > 1 else state_analysis)
 
-            self.logger.info(f"AI selected {len(selected_ids)} plans: {selected_ids}")
+        self.logger.info(f"AI selected {len(selected_ids)} plans in {time.perf_counter() - start:.1f}s: {selected_ids}")
 
-            return selected_ids, analysis
+        return selected_ids, "\n\n".join(sections)
 
-        except Exception as e:
-            self.logger.error(f"Error in LLM plan selection: {e}")
-            # Fallback to algorithmic selection (top 1 per state by score)
-            fallback_ids = []
-            for state_plans in candidates_by_state.values():
-                if state_plans:
-                    best = max(state_plans, key=lambda p: p.total_score)
-                    fallback_ids.append(best.plan_id)
-            return fallback_ids, f"**Note:** AI selection unavailable. Using algorithmic selection.\n\nError: {str(e)}"
+    def _fallback_selection(
+        self,
+        state: str,
+        state_plans: List[ScoredPlan],
+        max_per_state: int,
+        reason: str
+    ) -> Tuple[List[str], str]:
+        """Top plans by PlanScorer total score, with a note for the analysis."""
+        ranked = sorted(state_plans, key=lambda p: p.total_score, reverse=True)[:max(max_per_state, 1)]
+        chosen = ", ".join(f"{p.plan_name} ({p.metal_level} {p.plan_type}, score {p.total_score:.0f})" for p in ranked)
+        note = f"**Note:** AI selection unavailable for {state} ({reason}). Using algorithmic selection: {chosen}."
+        return [p.plan_id for p in ranked], note
 
     def _prepare_selection_context(
         self,
@@ -0,0 +1,454 @@
+"""
+Plan-year ingestion for the RBIS tables
+
+Loads a new plan year of the CMS RBIS public use files (CSV, CSV.gz or xlsx)
+next to the active one and switches the app over in a single statement:
+
+1. Each source file is streamed with COPY FROM STDIN into a new table,
+   <logical name>_<version>, created LIKE the active version's table in the
+   same transaction. Generated columns (state_code, rating_area_numeric,
+   benefit_category, moop_ded_category from migrations/001-004) and defaults
+   come from the active table, so the new one is computed during the COPY.
+2. The active table's indexes are rebuilt on the new table after the load
+   (one sorted build per index instead of 13M+ incremental inserts), its
+   PRIMARY KEY / UNIQUE constraints are re-attached to them, and the table is
+   ANALYZEd.
+3. Row counts are validated against the active version.
+4. activate_version() points the dataset_registry row at the new version.
+   It refuses a version with no plans or rates effective on the app's plan
+   year (PLAN_YEAR_START): queries.py and the pages filter on that date, so
+   activating another year's load would empty every lookup without an error.
+   Move RENEWAL_PLAN_YEAR and those filters to the new year first.
+   queries.py resolves table names through dataset_registry, so readers keep
+   using the previous tables until then and switch over within
+   DATASET_REGISTRY_TTL_SECONDS. The previous tables are kept for rollback
+   until drop_version() removes them.
+
+Used by scripts/ingest_plan_year.py. All functions take a psycopg2 connection.
+"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from constants import RENEWAL_PLAN_YEAR
+from dataset_registry import (
+    DEFAULT_RBIS_VERSION,
+    RBIS_DATASET,
+    RBIS_TABLES,
+    REGISTRY_TABLE_DDL,
+    read_active_version,
+    validate_version,
+    versioned_table,
+)
+
+logger = logging.getLogger(__name__)
+
+SOURCE_SUFFIXES = ('.csv.gz', '.csv', '.xlsx')
+COPY_CHUNK_ROWS = 100_000
+# A new plan year smaller than this fraction of the active one is rejected (truncated file?)
+DEFAULT_MIN_ROW_RATIO = 0.5
+INDEX_MAINTENANCE_WORK_MEM = '1GB'
+MAX_IDENTIFIER_LENGTH = 63
+# plan_effective_date / rate_effective_date the app's queries filter on
+PLAN_YEAR_START = f'{RENEWAL_PLAN_YEAR}-01-01'
+# Logical table -> its effective date column, checked before activation
+PLAN_YEAR_COLUMNS = {
+    'rbis_insurance_plan': 'plan_effective_date',
+    'rbis_insurance_plan_base_rates': 'rate_effective_date',
+}
+
+_INDEX_DEF = re.compile(r'^(CREATE (?:UNIQUE )?INDEX) (\S+) ON (?:ONLY )?(\S+) (USING .*)$', re.DOTALL)
+
+
+def new_version() -> str:
+    """Version string for a load started now, in the same format as DEFAULT_RBIS_VERSION."""
+    return datetime.now().strftime('%Y%m%d%H%M%S')
+
+
+def normalize_column(name: str) -> str:
+    """Source header -> table column name ('HIOS Plan ID' -> 'hios_plan_id')."""
+    return re.sub(r'[^0-9a-z]+', '_', str(name).strip().lower()).strip('_')
+
+
+def find_sources(source_dir) -> Dict[str, Path]:
+    """
+    Source files in a directory, by logical table name.
+
+    Files are matched by name: rbis_insurance_plan_base_rates.csv (or .csv.gz,
+    .xlsx) is loaded into rbis_insurance_plan_base_rates. Other files are ignored.
+
+    Returns:
+        {logical table name: path}
+    """
+    sources: Dict[str, Path] = {}
+    for path in sorted(Path(source_dir).iterdir()):
+        suffix = next((s for s in SOURCE_SUFFIXES if path.name.lower().endswith(s)), None)
+        if suffix is None:
+            continue
+        table = path.name[:-len(suffix)].lower()
+        if table not in RBIS_TABLES:
+            continue
+        if table in sources:
+            raise ValueError(f"Two source files for {table}: {sources[table].name}, {path.name}")
+        sources[table] = path
+    return sources
+
+
+def existing_tables(conn, version: str) -> List[str]:
+    """Logical RBIS tables that exist in a version."""
+    physical = {versioned_table(table, version): table for table in RBIS_TABLES}
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT relname FROM pg_class WHERE relkind IN ('r', 'p') AND relname = ANY(%s) "
+            "AND pg_table_is_visible(oid)",
+            (list(physical),),
+        )
+        found = {physical[row[0]] for row in cursor.fetchall()}
+    return [table for table in RBIS_TABLES if table in found]
+
+
+def _loadable_columns(cursor, table: str) -> List[str]:
+    """Columns of a table that are loaded from the source (everything but generated columns)."""
+    cursor.execute(
+        """
+        SELECT attname
+        FROM pg_attribute
+        WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped AND attgenerated = ''
+        ORDER BY attnum
+        """,
+        (table,),
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _open_text(path: Path):
+    if path.name.lower().endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8-sig', newline='')
+    return open(path, 'r', encoding='utf-8-sig', newline='')
+
+
+def _open_binary(path: Path):
+    return gzip.open(path, 'rb') if path.name.lower().endswith('.gz') else open(path, 'rb')
+
+
+def _match_columns(header: Iterable[str], columns: List[str], source: str) -> Dict[str, str]:
+    """{source header: table column} for the headers that are table columns; all columns are required."""
+    mapping = {}
+    for name in header:
+        column = normalize_column(name)
+        if column in columns and column not in mapping.values():
+            mapping[name] = column
+    missing = [column for column in columns if column not in mapping.values()]
+    if missing:
+        raise ValueError(f"{source} is missing columns: {', '.join(missing)}")
+    return mapping
+
+
+def copy_dataframe(cursor, table: str, df: pd.DataFrame, chunk_rows: int = COPY_CHUNK_ROWS,
+                   freeze: bool = False) -> int:
+    """
+    COPY a DataFrame into a table, chunk_rows rows per COPY statement.
+
+    Columns are matched by name; missing values become NULL.
+
+    Returns:
+        Rows copied
+    """
+    column_list = ', '.join(f'"{column}"' for column in df.columns)
+    options = 'FORMAT csv, FREEZE' if freeze else 'FORMAT csv'
+    sql = f'COPY "{table}" ({column_list}) FROM STDIN WITH ({options})'
+    rows = 0
+    for start in range(0, len(df), chunk_rows):
+        buffer = io.StringIO()
+        df.iloc[start:start + chunk_rows].to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+        cursor.copy_expert(sql, buffer)
+        rows += cursor.rowcount
+    return rows
+
+
+def copy_source(cursor, table: str, path: Path, columns: List[str],
+                chunk_rows: int = COPY_CHUNK_ROWS) -> int:
+    """
+    Stream a source file into a table created in the current transaction.
+
+    A CSV whose header is exactly the table's columns (in any order and case) is
+    passed to COPY as-is; CSVs with extra columns are read in chunks with pandas,
+    as are xlsx files.
+
+    Returns:
+        Rows copied
+    """
+    name = path.name.lower()
+    if name.endswith('.xlsx'):
+        df = pd.read_excel(path, dtype=str)
+        mapping = _match_columns(df.columns, columns, path.name)
+        return copy_dataframe(cursor, table, df[list(mapping)].rename(columns=mapping), chunk_rows, freeze=True)
+
+    with _open_text(path) as f:
+        header = next(csv.reader(f), None)
+    if not header:
+        raise ValueError(f"{path.name} is empty")
+    mapping = _match_columns(header, columns, path.name)
+
+    if len(mapping) == len(header):
+        column_list = ', '.join(f'"{mapping[name]}"' for name in header)
+        with _open_binary(path) as f:
+            cursor.copy_expert(
+                f'COPY "{table}" ({column_list}) FROM STDIN WITH (FORMAT csv, HEADER true, FREEZE)', f)
+        return cursor.rowcount
+
+    rows = 0
+    for chunk in pd.read_csv(path, dtype=str, usecols=list(mapping), chunksize=chunk_rows,
+                             keep_default_na=False, na_values=[''], encoding='utf-8-sig'):
+        rows += copy_dataframe(cursor, table, chunk[list(mapping)].rename(columns=mapping), chunk_rows,
+                               freeze=True)
+    return rows
+
+
+def _index_name(name: str, old_version: str, version: str) -> str:
+    """Index name for the new version (index names are unique per schema)."""
+    base = name[:-len(old_version) - 1] if name.endswith(f"_{old_version}") else name
+    return f"{base[:MAX_IDENTIFIER_LENGTH - len(version) - 1]}_{version}"
+
+
+def copy_indexes(cursor, template: str, table: str, old_version: str, version: str) -> List[str]:
+    """
+    Build the indexes of template on table.
+
+    Returns:
+        Names of the indexes created
+    """
+    cursor.execute(
+        """
+        SELECT c.relname, pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = %s::regclass
+        ORDER BY c.relname
+        """,
+        (template,),
+    )
+    created = []
+    for name, definition in cursor.fetchall():
+        match = _INDEX_DEF.match(definition)
+        if match is None:
+            raise ValueError(f"Unrecognized index definition on {template}: {definition}")
+        new_name = _index_name(name, old_version, version)
+        cursor.execute(f'{match.group(1)} "{new_name}" ON "{table}" {match.group(4)}')
+        created.append(new_name)
+    return created
+
+
+def copy_constraints(cursor, template: str, table: str, old_version: str, version: str) -> List[str]:
+    """
+    Add the PRIMARY KEY and UNIQUE constraints of template to table, on the
+    indexes copy_indexes() built (CREATE TABLE ... LIKE excludes them with the indexes).
+
+    Returns:
+        Names of the constraints added
+    """
+    cursor.execute(
+        """
+        SELECT con.conname, con.contype, c.relname
+        FROM pg_constraint con
+        JOIN pg_class c ON c.oid = con.conindid
+        WHERE con.conrelid = %s::regclass AND con.contype IN ('p', 'u')
+        ORDER BY con.conname
+        """,
+        (template,),
+    )
+    added = []
+    for name, contype, index in cursor.fetchall():
+        new_name = _index_name(name, old_version, version)
+        kind = 'PRIMARY KEY' if contype == 'p' else 'UNIQUE'
+        cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{new_name}" {kind} '
+                       f'USING INDEX "{_index_name(index, old_version, version)}"')
+        added.append(new_name)
+    return added
+
+
+def _count(cursor, table: str) -> int:
+    cursor.execute(f'SELECT COUNT(*) FROM "{table}"')
+    return cursor.fetchone()[0]
+
+
+def load_table(conn, logical_name: str, source: Path, version: str, active_version: str,
+               min_row_ratio: float = DEFAULT_MIN_ROW_RATIO) -> Dict[str, Any]:
+    """
+    Load one source file into <logical_name>_<version> (see module docstring).
+
+    The table is replaced if it already exists (e.g. from a failed run) and is
+    committed only if it passes validation.
+
+    Returns:
+        {'table', 'rows', 'previous_rows', 'indexes', 'constraints', 'seconds'}
+    """
+    start = time.time()
+    template = versioned_table(logical_name, active_version)
+    table = versioned_table(logical_name, version)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"SET LOCAL maintenance_work_mem = '{INDEX_MAINTENANCE_WORK_MEM}'")
+            cursor.execute(f'DROP TABLE IF EXISTS "{table}"')
+            cursor.execute(f'CREATE TABLE "{table}" (LIKE "{template}" INCLUDING ALL EXCLUDING INDEXES)')
+            rows = copy_source(cursor, table, Path(source), _loadable_columns(cursor, table))
+
+            previous_rows = _count(cursor, template)
+            if rows == 0:
+                raise ValueError(f"{Path(source).name} has no rows")
+            if rows < previous_rows * min_row_ratio:
+                raise ValueError(
+                    f"{Path(source).name} has {rows:,} rows, fewer than {min_row_ratio:.0%} "
+                    f"of the {previous_rows:,} in {template}")
+
+            indexes = copy_indexes(cursor, template, table, active_version, version)
+            constraints = copy_constraints(cursor, template, table, active_version, version)
+            cursor.execute(f'ANALYZE "{table}"')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    result = {'table': table, 'rows': rows, 'previous_rows': previous_rows,
+              'indexes': indexes, 'constraints': constraints, 'seconds': round(time.time() - start, 2)}
+    logger.info(f"Loaded {table}: {rows:,} rows ({previous_rows:,} before), "
+                f"{len(indexes)} indexes in {result['seconds']:.1f}s")
+    return result
+
+
+def plan_year_rows(conn, version: str, plan_year_start: str = PLAN_YEAR_START) -> Dict[str, int]:
+    """
+    Rows of a version's plan and rate tables effective on plan_year_start.
+
+    Returns:
+        {logical table name: rows}, for the PLAN_YEAR_COLUMNS tables in the version
+    """
+    counts = {}
+    with conn.cursor() as cursor:
+        for table in existing_tables(conn, version):
+            if table in PLAN_YEAR_COLUMNS:
+                cursor.execute(
+                    f'SELECT COUNT(*) FROM "{versioned_table(table, version)}" '
+                    f'WHERE {PLAN_YEAR_COLUMNS[table]} = %s',
+                    (plan_year_start,),
+                )
+                counts[table] = cursor.fetchone()[0]
+    return counts
+
+
+def activate_version(conn, version: str, row_counts: Optional[Dict[str, int]] = None) -> Optional[str]:
+    """
+    Make version the active RBIS dataset in one statement.
+
+    Every table of the currently active version must exist in the new one, and
+    its plans and rates must include the app's plan year (PLAN_YEAR_START).
+
+    Returns:
+        The previously active version
+    """
+    validate_version(version)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(REGISTRY_TABLE_DDL)
+        active_version = read_active_version(conn) or DEFAULT_RBIS_VERSION
+        missing = set(existing_tables(conn, active_version)) - set(existing_tables(conn, version))
+        if missing:
+            raise ValueError(f"Version {version} is missing tables: {', '.join(sorted(missing))}")
+        off_year = [table for table, rows in plan_year_rows(conn, version).items() if rows == 0]
+        if off_year:
+            raise ValueError(
+                f"Version {version} has no rows effective {PLAN_YEAR_START} in {', '.join(off_year)}; "
+                f"the app queries plan year {RENEWAL_PLAN_YEAR} (constants.RENEWAL_PLAN_YEAR)")
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO dataset_registry (dataset, version, previous_version, row_counts, activated_at)
+                VALUES (%s, %s, %s, %s, now())
+                ON CONFLICT (dataset) DO UPDATE SET
+                    previous_version = dataset_registry.version,
+                    version = EXCLUDED.version,
+                    row_counts = EXCLUDED.row_counts,
+                    activated_at = EXCLUDED.activated_at
+                """,
+                (RBIS_DATASET, version, active_version, json.dumps(row_counts) if row_counts else None),
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    logger.info(f"Activated RBIS version {version} (was {active_version})")
+    return active_version
+
+
+def drop_version(conn, version: str) -> List[str]:
+    """
+    Drop the tables of an inactive version.
+
+    Returns:
+        Names of the tables dropped
+    """
+    if version == (read_active_version(conn) or DEFAULT_RBIS_VERSION):
+        conn.rollback()
+        raise ValueError(f"Version {version} is active")
+    tables = [versioned_table(table, version) for table in existing_tables(conn, version)]
+    try:
+        with conn.cursor() as cursor:
+            for table in tables:
+                cursor.execute(f'DROP TABLE "{table}"')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return tables
+
+
+def ingest_plan_year(conn, sources: Dict[str, Path], version: Optional[str] = None,
+                     min_row_ratio: float = DEFAULT_MIN_ROW_RATIO, activate: bool = True) -> Dict[str, Any]:
+    """
+    Load a plan year into a new version and (by default) activate it.
+
+    Args:
+        conn: psycopg2 connection (not autocommit)
+        sources: {logical table name: source file}; one for every table of the
+            active version
+        version: New version (default: new_version())
+        min_row_ratio: Reject tables with fewer rows than this fraction of the active table
+        activate: Switch the app to the new version once every table is loaded
+
+    Returns:
+        {'version', 'previous_version', 'activated', 'tables': {logical name: load_table() result}}
+    """
+    version = validate_version(version or new_version())
+    active_version = read_active_version(conn) or DEFAULT_RBIS_VERSION
+    conn.rollback()
+    if version == active_version:
+        raise ValueError(f"Version {version} is already active")
+
+    required = existing_tables(conn, active_version)
+    conn.rollback()
+    unknown = sorted(set(sources) - set(required))
+    missing = [table for table in required if table not in sources]
+    if unknown:
+        raise ValueError(f"Not tables of the active version {active_version}: {', '.join(unknown)}")
+    if missing:
+        raise ValueError(f"No source file for: {', '.join(missing)}")
+
+    tables = {}
+    for logical_name in required:
+        tables[logical_name] = load_table(conn, logical_name, sources[logical_name], version,
+                                          active_version, min_row_ratio)
+
+    if activate:
+        activate_version(conn, version, {name: info['rows'] for name, info in tables.items()})
+    return {'version': version, 'previous_version': active_version, 'activated': activate, 'tables': tables}
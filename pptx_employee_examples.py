@@ -77,6 +77,7 @@ class EmployeeExampleData:
     location: str
     family_ages: List[Dict] = field(default_factory=list)
     family_status: str = "EE"  # EE, ES, EC, F
+    employee_id: str = ""  # Census employee_id
 
     # Cost breakdown by scenario
     costs: Dict[str, Dict[str, float]] = field(default_factory=dict)
@@ -98,7 +99,8 @@ class EmployeeExampleData:
 class EmployeeExamplesSlideGenerator:
     """Generate PowerPoint slides for employee examples"""
 
-    def __init__(self, client_name: str = "", plan_config: Dict = None, include_qr_links: bool = False):
+    def __init__(self, client_name: str = "", plan_config: Dict = None, include_qr_links: bool = False,
+                 qr_pipeline=None):
         """Initialize with a new blank presentation
 
         Args:
@@ -106,6 +108,7 @@ class EmployeeExamplesSlideGenerator:
             plan_config: Plan configurator settings dict with 'hap_enabled', 'hap_iuas',
                         'sedera_enabled', 'sedera_iuas' keys
             include_qr_links: Whether to add QR codes linking to member breakdown pages
+            qr_pipeline: Optional QRLinkPipeline (default: R2 + dub.co + styled QR)
         """
         self.prs = Presentation()
         self.prs.slide_width = SLIDE_WIDTH
@@ -113,6 +116,9 @@ class EmployeeExamplesSlideGenerator:
         self.client_name = client_name
         self.plan_config = plan_config or {}
         self.include_qr_links = include_qr_links
+        self._qr_pipeline = qr_pipeline
+        # _qr_key(employee) -> QRLink (or None if its pipeline failed), filled by prefetch_qr_links()
+        self._qr_links: Dict[str, object] = {}
 
     def _set_cell_fill(self, cell, color: RGBColor):
         """Set cell background color"""
@@ -392,7 +398,7 @@ class EmployeeExamplesSlideGenerator:
         import logging
         logger = logging.getLogger(__name__)
         has_dependents = employee.family_status in ('ES', 'EC', 'F') or bool(employee.family_ages)
-        will_add_qr = self.include_qr_links and bool(employee.member_breakdowns) and has_dependents
+        will_add_qr = self._needs_qr_code(employee)
         logger.info(f"Employee {employee.name}: family_status={employee.family_status}, has_dependents={has_dependents}, will_add_qr={will_add_qr}")
 
         if employee.metal_plan_details:
@@ -533,10 +539,57 @@ class EmployeeExamplesSlideGenerator:
                         self._set_cell_text(cell, "—", COLORS['secondary'], font_size=10)
 
         # Add QR code linking to member breakdown page (if enabled, has breakdown data, and has dependents)
-        has_dependents = employee.family_status in ('ES', 'EC', 'F') or bool(employee.family_ages)
-        if self.include_qr_links and employee.member_breakdowns and has_dependents:
+        if self._needs_qr_code(employee):
             self._add_qr_code(slide, employee, banner_offset)
 
+    def _needs_qr_code(self, employee: EmployeeExampleData) -> bool:
+        """QR links are added for employees with dependents and member breakdown data."""
+        has_dependents = employee.family_status in ('ES', 'EC', 'F') or bool(employee.family_ages)
+        return self.include_qr_links and bool(employee.member_breakdowns) and has_dependents
+
+    def _get_qr_pipeline(self):
+        if self._qr_pipeline is None:
+            from qr_links import QRLinkPipeline
+            self._qr_pipeline = QRLinkPipeline()
+        return self._qr_pipeline
+
+    def _member_breakdown_html(self, employee: EmployeeExampleData) -> str:
+        from member_breakdown_template import generate_member_breakdown_html
+        return generate_member_breakdown_html(
+            employee_name=employee.name,
+            employee_age=employee.age,
+            tier=employee.tier,
+            location=employee.location,
+            family_ages=employee.family_ages,
+            member_breakdowns=employee.member_breakdowns,
+            client_name=self.client_name
+        )
+
+    @staticmethod
+    def _qr_key(employee: EmployeeExampleData) -> str:
+        """Prefetched-link key: the census employee_id (label and name if it has none)."""
+        return str(employee.employee_id) if employee.employee_id else f"{employee.label}|{employee.name}"
+
+    def prefetch_qr_links(self, employees: List[EmployeeExampleData]) -> None:
+        """Build every employee's breakdown upload, short link and QR image concurrently.
+
+        Slides added afterwards use the prefetched links instead of running
+        the pipeline one employee at a time.
+        """
+        targets = [employee for employee in employees if self._needs_qr_code(employee)]
+        if not targets:
+            return
+
+        try:
+            pipeline = self._get_qr_pipeline()
+        except ImportError:
+            # Dependencies not installed, skip QR codes
+            return
+
+        links = pipeline.build_many(targets, self._member_breakdown_html, label=lambda employee: employee.name)
+        for employee, link in zip(targets, links):
+            self._qr_links[self._qr_key(employee)] = link
+
     def _add_qr_code(self, slide, employee: EmployeeExampleData, banner_offset=Inches(0)):
         """Add QR code linking to member rate breakdown page."""
         import logging
@@ -544,49 +597,20 @@ class EmployeeExamplesSlideGenerator:
         logger.info(f"Attempting to add QR code for {employee.name}")
 
         try:
-            from r2_storage import R2StorageService
-            from qr_generator import generate_qr_code
-            from member_breakdown_template import generate_member_breakdown_html
-            from url_shortener import shorten_url
-
-            # Check if R2 is configured
-            r2 = R2StorageService()
-            is_configured, error = r2.is_configured()
-            if not is_configured:
-                # Skip QR code if R2 not configured (graceful degradation)
-                logger.warning(f"R2 not configured: {error}")
-                return
-
-            # Generate HTML page
-            html = generate_member_breakdown_html(
-                employee_name=employee.name,
-                employee_age=employee.age,
-                tier=employee.tier,
-                location=employee.location,
-                family_ages=employee.family_ages,
-                member_breakdowns=employee.member_breakdowns,
-                client_name=self.client_name
-            )
-
-            # Upload to R2 and get presigned URL
-            logger.info(f"Uploading HTML to R2 for {employee.name}")
-            url = r2.upload_html(html)
-            if not url:
-                logger.warning(f"Failed to upload HTML to R2 for {employee.name}")
-                return
-            logger.info(f"Uploaded successfully, URL: {url[:80]}...")
-
-            # Shorten URL for cleaner QR code (falls back to original if dub not configured)
-            short_url = shorten_url(url)
-            if short_url != url:
-                logger.info(f"Shortened URL: {short_url}")
-
-            # Generate QR code image
-            qr_buffer = generate_qr_code(short_url)
-            if not qr_buffer:
-                logger.warning(f"Failed to generate QR code for {employee.name}")
+            if self._qr_key(employee) in self._qr_links:
+                link = self._qr_links[self._qr_key(employee)]
+            else:
+                # Not prefetched (slide added directly): run the pipeline for this employee
+                pipeline = self._get_qr_pipeline()
+                is_configured, error = pipeline.is_configured()
+                if not is_configured:
+                    # Skip QR code if R2 not configured (graceful degradation)
+                    logger.warning(f"R2 not configured: {error}")
+                    return
+                link = pipeline.build(lambda: self._member_breakdown_html(employee), employee.name)
+            if link is None:
                 return
-            logger.info(f"QR code generated for {employee.name}")
+            short_url = link.short_url
 
             # Add QR code to slide (bottom-right corner)
             qr_size = Inches(2.5)
@@ -594,7 +618,7 @@ class EmployeeExamplesSlideGenerator:
             qr_top = Inches(4.25) + banner_offset
 
             slide.shapes.add_picture(
-                qr_buffer,
+                link.image(),
                 left=qr_left,
                 top=qr_top,
                 width=qr_size,
@@ -658,6 +682,9 @@ class EmployeeExamplesSlideGenerator:
 
     def generate(self, employees: List[EmployeeExampleData]) -> BytesIO:
         """Generate the presentation with all employee slides"""
+        if self.include_qr_links:
+            self.prefetch_qr_links(employees)
+
         for employee in employees:
             self.add_employee_slide(employee)
 
@@ -699,6 +726,7 @@ def generate_employee_examples_pptx(
             location=emp.get('location', ''),
             family_ages=emp.get('family_ages', []),
             family_status=emp.get('family_status', 'EE'),
+            employee_id=str(emp.get('employee_id', '')),
             costs=emp.get('costs', {}),
             winner=emp.get('winner', ''),
             insight=emp.get('insight', ''),
@@ -5,10 +5,7 @@ Uses python-pptx to populate a Glove template with census data,
 financial analysis, and Fit Score calculations.
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Any
 from io import BytesIO
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -419,12 +416,13 @@ class ProposalGenerator:
             template_path: Path to Glove template .pptx file
         """
         self.template_path = Path(template_path)
-        self.prs: Optional[Presentation] = None
+        self.prs = None  # pptx Presentation, loaded by load_template()
 
     def load_template(self) -> None:
         """Load the PowerPoint template file"""
         if not self.template_path.exists():
             raise FileNotFoundError(f"Template not found: {self.template_path}")
+        from pptx import Presentation
         self.prs = Presentation(str(self.template_path))
 
     def discover_shapes(self, slide_index: int) -> List[Dict]:
@@ -731,6 +729,7 @@ class ProposalGenerator:
             raise FileNotFoundError(f"Workflow slide not found: {WORKFLOW_SLIDE_PATH}")
 
         # Load the workflow slide presentation (pre-resized to match glove template)
+        from pptx import Presentation
         workflow_prs = Presentation(str(WORKFLOW_SLIDE_PATH))
 
         if len(workflow_prs.slides) == 0:
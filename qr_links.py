@@ -0,0 +1,142 @@
+"""
+QR Link Pipeline
+
+Builds the "Scan for member details" assets on employee example slides:
+member breakdown HTML -> R2 upload -> short link -> styled QR PNG.
+
+All but the first step wait on the network (R2 PUT, dub.co POST with a 10s
+timeout), so `build_many` runs every employee's pipeline concurrently with
+bounded parallelism, and slides are assembled afterwards from the results.
+QR images are cached by URL and style in qr_generator.
+
+The storage service, shortener and QR renderer are injectable, so the
+pipeline can run against local stand-ins (see tests/test_qr_links.py).
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Employees processed at once (each holds an R2 and a dub.co connection)
+DEFAULT_QR_WORKERS = 6
+
+T = TypeVar('T')
+
+
+@dataclass
+class QRLink:
+    """Assets for one employee's member breakdown link"""
+    url: str        # Presigned R2 URL
+    short_url: str  # Short link (same as url when shortening is unavailable)
+    qr_png: bytes
+
+    def image(self) -> BytesIO:
+        """Fresh buffer for slide.shapes.add_picture()."""
+        return BytesIO(self.qr_png)
+
+
+class QRLinkPipeline:
+    """Upload, shorten and render QR codes for member breakdown pages."""
+
+    def __init__(
+        self,
+        storage=None,
+        shorten: Optional[Callable[[str], str]] = None,
+        render_qr: Optional[Callable[[str], Optional[bytes]]] = None,
+        max_workers: int = DEFAULT_QR_WORKERS,
+    ):
+        """
+        Args:
+            storage: Object with is_configured() and upload_html(html), e.g.
+                R2StorageService (default) or one built on a local S3 stand-in
+            shorten: url -> short url, returning the input on failure (default: dub.co)
+            render_qr: url -> PNG bytes or None (default: styled Glove QR code)
+            max_workers: Maximum employees processed concurrently
+        """
+        if storage is None:
+            from r2_storage import R2StorageService
+            storage = R2StorageService()
+        if shorten is None:
+            from url_shortener import shorten_url as shorten
+        if render_qr is None:
+            from qr_generator import generate_qr_png as render_qr
+
+        self.storage = storage
+        self.shorten = shorten
+        self.render_qr = render_qr
+        self.max_workers = max_workers
+
+    def is_configured(self):
+        """(is_configured, error_message) of the storage service."""
+        return self.storage.is_configured()
+
+    def build(self, render_html: Callable[[], str], label: str = '') -> Optional[QRLink]:
+        """
+        Run the pipeline for one breakdown page.
+
+        Args:
+            render_html: Produces the page HTML (called on the worker thread)
+            label: Name used in log messages
+
+        Returns:
+            QRLink, or None if any step fails
+        """
+        try:
+            html = render_html()
+
+            url = self.storage.upload_html(html)
+            if not url:
+                logger.warning(f"Failed to upload HTML to R2 for {label}")
+                return None
+
+            # Falls back to the original URL if dub is not configured
+            short_url = self.shorten(url)
+
+            qr_png = self.render_qr(short_url)
+            if not qr_png:
+                logger.warning(f"Failed to generate QR code for {label}")
+                return None
+        except Exception as e:
+            logger.warning(f"Failed to build QR link for {label}: {e}")
+            return None
+
+        logger.info(f"QR link ready for {label}: {short_url}")
+        return QRLink(url=url, short_url=short_url, qr_png=qr_png)
+
+    def build_many(
+        self,
+        items: Sequence[T],
+        render_html: Callable[[T], str],
+        label: Callable[[T], str] = str,
+    ) -> List[Optional[QRLink]]:
+        """
+        Run the pipeline for several breakdown pages concurrently.
+
+        Args:
+            items: One entry per page (e.g. EmployeeExampleData)
+            render_html: item -> page HTML
+            label: item -> name used in log messages
+
+        Returns:
+            QRLink (or None on failure) per item, in input order
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        is_configured, error = self.is_configured()
+        if not is_configured:
+            # Skip QR codes if R2 not configured (graceful degradation)
+            logger.warning(f"R2 not configured: {error}")
+            return [None] * len(items)
+
+        workers = max(1, min(self.max_workers, len(items)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='qr-link') as pool:
+            return list(pool.map(
+                lambda item: self.build(lambda: render_html(item), label(item)),
+                items
+            ))
@@ -6,6 +6,8 @@ All queries against pricing-proposal PostgreSQL database
 from typing import Dict, List, Optional
 import pandas as pd
 from database import DatabaseConnection
+from dataset_registry import get_dataset_registry, rbis_table
+from plan_attribute_cache import get_plan_attribute_cache
 
 
 class PlanQueries:
@@ -16,13 +18,13 @@ class PlanQueries:
         """Get list of states with available Individual market plans"""
         query = """
         SELECT DISTINCT
-            SUBSTRING(hios_plan_id FROM 6 FOR 2) as state_code,
+            state_code,
             COUNT(DISTINCT hios_plan_id) as plan_count
-        FROM rbis_insurance_plan_20251019202724
+        FROM rbis_insurance_plan
         WHERE market_coverage = 'Individual'
             AND plan_effective_date = '2026-01-01'
             AND plan_expiration_date = '2026-12-31'
-        GROUP BY SUBSTRING(hios_plan_id FROM 6 FOR 2)
+        GROUP BY state_code
         ORDER BY state_code
         """
         return db.execute_query(query)
@@ -41,7 +43,7 @@ class PlanQueries:
         SELECT
             level_of_coverage as metal_level,
             COUNT(DISTINCT hios_plan_id) as plan_count
-        FROM rbis_insurance_plan_20251019202724
+        FROM rbis_insurance_plan
         WHERE market_coverage = 'Individual'
           AND plan_effective_date = '2026-01-01'
           AND level_of_coverage IN ('Bronze', 'Expanded Bronze', 'Silver', 'Gold')
@@ -104,8 +106,8 @@ class PlanQueries:
         SELECT
             p.level_of_coverage as metal_level,
             COUNT(DISTINCT p.hios_plan_id) as plan_count
-        FROM rbis_insurance_plan_20251019202724 p
-        JOIN rbis_insurance_plan_base_rates_20251019202724 br
+        FROM rbis_insurance_plan p
+        JOIN rbis_insurance_plan_base_rates br
             ON p.hios_plan_id = br.plan_id
             AND br.age = '21'
             AND br.rate_effective_date = '2026-01-01'
@@ -164,10 +166,10 @@ class PlanQueries:
 	p.service_area_id,
 	p.formulary_id,
 	SUBSTRING(p.hios_plan_id FROM 1 FOR 5) AS issuer_id,
-	SUBSTRING(p.hios_plan_id FROM 6 FOR 2) AS state_code
+	p.state_code
 FROM
-	rbis_insurance_plan_20251019202724 p
-	LEFT JOIN rbis_insurance_plan_variant_20251019202724 v ON p.hios_plan_id = v.hios_plan_id
+	rbis_insurance_plan p
+	LEFT JOIN rbis_insurance_plan_variant v ON p.hios_plan_id = v.hios_plan_id
 WHERE
 	p.market_coverage = 'Individual'
 	AND p.plan_effective_date = '2026-01-01'
@@ -180,10 +182,10 @@ WHERE
         # Handle both single state_code (deprecated) and state_codes (preferred)
         if state_codes:
             placeholders = ', '.join(['%s'] * len(state_codes))
-            filters.append(f"SUBSTRING(p.hios_plan_id FROM 6 FOR 2) IN ({placeholders})")
+            filters.append(f"p.state_code IN ({placeholders})")
             params.extend(state_codes)
         elif state_code:
-            filters.append("SUBSTRING(p.hios_plan_id FROM 6 FOR 2) = %s")
+            filters.append("p.state_code = %s")
             params.append(state_code)
 
         if metal_level:
@@ -246,13 +248,12 @@ WHERE
 
             # Create a CASE WHEN for counting employee area coverage per state
             # Safe to interpolate after validation above
-            # Use regex extraction for safe integer conversion (handles malformed data)
+            # rating_area_numeric is NULL for malformed rating area IDs (see migrations/002)
             rating_area_list = ', '.join([str(ra) for ra in validated_areas])
             case_statements.append(f"""
-                WHEN SUBSTRING(p.hios_plan_id, 6, 2) = '{state}'
-                    AND br.rating_area_id ~ '^Rating Area [0-9]+$'
-                    AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer IN ({rating_area_list})
-                THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
+                WHEN p.state_code = '{state}'
+                    AND br.rating_area_numeric IN ({rating_area_list})
+                THEN br.rating_area_numeric
             """)
 
         case_when_clause = '\n'.join(case_statements)
@@ -262,27 +263,19 @@ WHERE
         WITH plan_coverage AS (
             SELECT
                 p.hios_plan_id,
-                SUBSTRING(p.hios_plan_id, 6, 2) as state_code,
-                COUNT(DISTINCT CASE
-                    WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                    THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                END) as num_areas_covered,
-                ARRAY_AGG(DISTINCT CASE
-                    WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                    THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                END ORDER BY CASE
-                    WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                    THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                END) as covered_areas,
+                p.state_code,
+                COUNT(DISTINCT br.rating_area_numeric) as num_areas_covered,
+                ARRAY_AGG(DISTINCT br.rating_area_numeric ORDER BY br.rating_area_numeric) as covered_areas,
                 COUNT(DISTINCT CASE
                     {case_when_clause}
                 END) as num_employee_areas_covered
-            FROM rbis_insurance_plan_base_rates_20251019202724 br
-            JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
+            FROM rbis_insurance_plan_base_rates br
+            JOIN rbis_insurance_plan p ON br.plan_id = p.hios_plan_id
             WHERE p.hios_plan_id IN ({plan_placeholders})
-                AND br.rating_area_id ~ '^Rating Area [0-9]+$'
+                AND br.state_code = p.state_code
+                AND br.rating_area_numeric IS NOT NULL
                 AND br.rate_effective_date = '2026-01-01'
-            GROUP BY p.hios_plan_id
+            GROUP BY p.hios_plan_id, p.state_code
         )
         SELECT *
         FROM plan_coverage
@@ -322,7 +315,7 @@ WHERE
             family_ded_moop_per_person as family_per_person,
             family_ded_moop_per_group as family_per_group,
             network_type
-        FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+        FROM rbis_insurance_plan_variant_ddctbl_moop
         WHERE plan_id IN ({placeholders})
             AND network_type = 'In Network'
         """
@@ -372,18 +365,14 @@ WHERE
         query = f"""
         SELECT DISTINCT
             p.hios_plan_id,
-            SUBSTRING(p.hios_plan_id, 6, 2) AS state_code,
-            CASE
-                WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                ELSE NULL
-            END AS rating_area_id,
+            p.state_code,
+            br.rating_area_numeric AS rating_area_id,
             br.age,
             br.individual_rate AS premium,
             br.rate_effective_date,
             br.rate_expiration_date
-        FROM rbis_insurance_plan_base_rates_20251019202724 br
-        JOIN rbis_insurance_plan_20251019202724 p
+        FROM rbis_insurance_plan_base_rates br
+        JOIN rbis_insurance_plan p
             ON br.plan_id = p.hios_plan_id
         WHERE p.hios_plan_id IN ({plan_placeholders})
         AND br.age IN ({age_placeholders})
@@ -394,9 +383,9 @@ WHERE
         params = list(plan_ids) + age_list
 
         if rating_area_id:
-            # rating_area_id comes as integer from census, but stored as 'Rating Area X' in DB
-            # Use regex extraction for safe integer comparison
-            query += " AND br.rating_area_id ~ '^Rating Area [0-9]+$' AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s"
+            # rating_area_id comes as integer from census, but stored as 'Rating Area X' in DB;
+            # compare against the generated integer column (see migrations/002)
+            query += " AND br.rating_area_numeric = %s"
             params.append(rating_area_id)
 
         query += " ORDER BY p.hios_plan_id, br.age"
@@ -582,7 +571,7 @@ WHERE
                     county,
                     rating_area_id,
                     '' as city
-                FROM rbis_state_rating_area_20251019202724
+                FROM rbis_state_rating_area
                 WHERE ({" OR ".join(fallback_conditions)})
                     AND market = 'Individual'
                 """
@@ -719,7 +708,7 @@ WHERE
                     county,
                     rating_area_id,
                     '' as city
-                FROM rbis_state_rating_area_20251019202724
+                FROM rbis_state_rating_area
                 WHERE state = %s
                     AND three_digit_zip = %s
                     AND market = 'Individual'
@@ -770,23 +759,19 @@ WHERE
         SELECT
             p.hios_plan_id,
             p.plan_marketing_name as plan_name,
-            SUBSTRING(p.hios_plan_id, 6, 2) AS state_code,
-            CASE
-                WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                ELSE NULL
-            END AS rating_area_id,
+            p.state_code,
+            br.rating_area_numeric AS rating_area_id,
             br.age,
             br.individual_rate as premium
-        FROM rbis_insurance_plan_base_rates_20251019202724 br
-        JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
-        JOIN rbis_insurance_plan_variant_20251019202724 v ON p.hios_plan_id = v.hios_plan_id
+        FROM rbis_insurance_plan_base_rates br
+        JOIN rbis_insurance_plan p ON br.plan_id = p.hios_plan_id
+        JOIN rbis_insurance_plan_variant v ON p.hios_plan_id = v.hios_plan_id
         WHERE p.level_of_coverage = 'Silver'
             AND p.market_coverage = 'Individual'
             AND v.csr_variation_type = 'Exchange variant (no CSR)'
-            AND SUBSTRING(p.hios_plan_id, 6, 2) = %s
-            AND br.rating_area_id ~ '^Rating Area [0-9]+$'
-            AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
+            AND p.state_code = %s
+            AND br.state_code = p.state_code
+            AND br.rating_area_numeric = %s
             AND br.age = %s
             AND br.rate_effective_date = '2026-01-01'
             AND (br.tobacco IN ('No Preference', 'None', 'Tobacco User/Non-Tobacco User') OR br.tobacco IS NULL)
@@ -844,23 +829,19 @@ WHERE
             (SELECT
                 p.hios_plan_id,
                 p.plan_marketing_name as plan_name,
-                SUBSTRING(p.hios_plan_id, 6, 2) AS state_code,
-                CASE
-                    WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                    THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                    ELSE NULL
-                END AS rating_area_id,
+                p.state_code,
+                br.rating_area_numeric AS rating_area_id,
                 br.age as age_band,
                 br.individual_rate as premium
-            FROM rbis_insurance_plan_base_rates_20251019202724 br
-            JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
-            JOIN rbis_insurance_plan_variant_20251019202724 v ON p.hios_plan_id = v.hios_plan_id
+            FROM rbis_insurance_plan_base_rates br
+            JOIN rbis_insurance_plan p ON br.plan_id = p.hios_plan_id
+            JOIN rbis_insurance_plan_variant v ON p.hios_plan_id = v.hios_plan_id
             WHERE p.level_of_coverage = 'Silver'
                 AND p.market_coverage = 'Individual'
                 AND v.csr_variation_type = 'Exchange variant (no CSR)'
-                AND SUBSTRING(p.hios_plan_id, 6, 2) = %s
-                AND br.rating_area_id ~ '^Rating Area [0-9]+$'
-                AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
+                AND p.state_code = %s
+                AND br.state_code = p.state_code
+                AND br.rating_area_numeric = %s
                 AND br.age = %s
                 AND br.rate_effective_date = '2026-01-01'
                 AND (br.tobacco IN ('No Preference', 'None', 'Tobacco User/Non-Tobacco User') OR br.tobacco IS NULL)
@@ -904,24 +885,20 @@ WHERE
         SELECT
             p.hios_plan_id,
             p.plan_marketing_name as plan_name,
-            SUBSTRING(p.hios_plan_id, 6, 2) AS state_code,
-            CASE
-                WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                ELSE NULL
-            END AS rating_area_id,
+            p.state_code,
+            br.rating_area_numeric AS rating_area_id,
             br.age,
             br.individual_rate as premium,
             p.level_of_coverage as metal_level
-        FROM rbis_insurance_plan_base_rates_20251019202724 br
-        JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
-        JOIN rbis_insurance_plan_variant_20251019202724 v ON p.hios_plan_id = v.hios_plan_id
+        FROM rbis_insurance_plan_base_rates br
+        JOIN rbis_insurance_plan p ON br.plan_id = p.hios_plan_id
+        JOIN rbis_insurance_plan_variant v ON p.hios_plan_id = v.hios_plan_id
         WHERE p.level_of_coverage = %s
             AND p.market_coverage = 'Individual'
             AND v.csr_variation_type = 'Exchange variant (no CSR)'
-            AND SUBSTRING(p.hios_plan_id, 6, 2) = %s
-            AND br.rating_area_id ~ '^Rating Area [0-9]+$'
-            AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
+            AND p.state_code = %s
+            AND br.state_code = p.state_code
+            AND br.rating_area_numeric = %s
             AND br.age = %s
             AND br.rate_effective_date = '2026-01-01'
             AND (br.tobacco IN ('No Preference', 'None', 'Tobacco User/Non-Tobacco User') OR br.tobacco IS NULL)
@@ -981,24 +958,20 @@ WHERE
             (SELECT
                 p.hios_plan_id,
                 p.plan_marketing_name as plan_name,
-                SUBSTRING(p.hios_plan_id, 6, 2) AS state_code,
-                CASE
-                    WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                    THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                    ELSE NULL
-                END AS rating_area_id,
+                p.state_code,
+                br.rating_area_numeric AS rating_area_id,
                 br.age as age_band,
                 br.individual_rate as premium,
                 p.level_of_coverage as metal_level
-            FROM rbis_insurance_plan_base_rates_20251019202724 br
-            JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
-            JOIN rbis_insurance_plan_variant_20251019202724 v ON p.hios_plan_id = v.hios_plan_id
+            FROM rbis_insurance_plan_base_rates br
+            JOIN rbis_insurance_plan p ON br.plan_id = p.hios_plan_id
+            JOIN rbis_insurance_plan_variant v ON p.hios_plan_id = v.hios_plan_id
             WHERE p.level_of_coverage = %s
                 AND p.market_coverage = 'Individual'
                 AND v.csr_variation_type = 'Exchange variant (no CSR)'
-                AND SUBSTRING(p.hios_plan_id, 6, 2) = %s
-                AND br.rating_area_id ~ '^Rating Area [0-9]+$'
-                AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
+                AND p.state_code = %s
+                AND br.state_code = p.state_code
+                AND br.rating_area_numeric = %s
                 AND br.age = %s
                 AND br.rate_effective_date = '2026-01-01'
                 AND (br.tobacco IN ('No Preference', 'None', 'Tobacco User/Non-Tobacco User') OR br.tobacco IS NULL)
@@ -1071,24 +1044,20 @@ WHERE
                 (SELECT
                     p.hios_plan_id,
                     p.plan_marketing_name as plan_name,
-                    SUBSTRING(p.hios_plan_id, 6, 2) AS state_code,
-                    CASE
-                        WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                        THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                        ELSE NULL
-                    END AS rating_area_id,
+                    p.state_code,
+                    br.rating_area_numeric AS rating_area_id,
                     br.age as age_band,
                     br.individual_rate as premium,
                     p.level_of_coverage as metal_level
-                FROM rbis_insurance_plan_base_rates_20251019202724 br
-                JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
-                JOIN rbis_insurance_plan_variant_20251019202724 v ON p.hios_plan_id = v.hios_plan_id
+                FROM rbis_insurance_plan_base_rates br
+                JOIN rbis_insurance_plan p ON br.plan_id = p.hios_plan_id
+                JOIN rbis_insurance_plan_variant v ON p.hios_plan_id = v.hios_plan_id
                 WHERE p.level_of_coverage = %s
                     AND p.market_coverage = 'Individual'
                     AND v.csr_variation_type = 'Exchange variant (no CSR)'
-                    AND SUBSTRING(p.hios_plan_id, 6, 2) = %s
-                    AND br.rating_area_id ~ '^Rating Area [0-9]+$'
-                    AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
+                    AND p.state_code = %s
+                    AND br.state_code = p.state_code
+                    AND br.rating_area_numeric = %s
                     AND br.age = %s
                     AND br.rate_effective_date = '2026-01-01'
                     AND (br.tobacco IN ('No Preference', 'None', 'Tobacco User/Non-Tobacco User') OR br.tobacco IS NULL)
@@ -1159,26 +1128,22 @@ WHERE
                 SELECT
                     p.hios_plan_id,
                     p.plan_marketing_name as plan_name,
-                    SUBSTRING(p.hios_plan_id, 6, 2) AS state_code,
-                    CASE
-                        WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                        THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                        ELSE NULL
-                    END AS rating_area_id,
+                    p.state_code,
+                    br.rating_area_numeric AS rating_area_id,
                     br.age as age_band,
                     br.individual_rate::numeric as premium,
                     ROW_NUMBER() OVER (
                         ORDER BY br.individual_rate::numeric ASC
                     ) as rank
-                FROM rbis_insurance_plan_base_rates_20251019202724 br
-                JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
-                JOIN rbis_insurance_plan_variant_20251019202724 v ON p.hios_plan_id = v.hios_plan_id
+                FROM rbis_insurance_plan_base_rates br
+                JOIN rbis_insurance_plan p ON br.plan_id = p.hios_plan_id
+                JOIN rbis_insurance_plan_variant v ON p.hios_plan_id = v.hios_plan_id
                 WHERE p.level_of_coverage = 'Silver'
                     AND p.market_coverage = 'Individual'
                     AND v.csr_variation_type = 'Exchange variant (no CSR)'
-                    AND SUBSTRING(p.hios_plan_id, 6, 2) = %s
-                    AND br.rating_area_id ~ '^Rating Area [0-9]+$'
-                    AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
+                    AND p.state_code = %s
+                    AND br.state_code = p.state_code
+                    AND br.rating_area_numeric = %s
                     AND br.age = %s
                     AND br.rate_effective_date = '2026-01-01'
                     AND (br.tobacco IN ('No Preference', 'None', 'Tobacco User/Non-Tobacco User') OR br.tobacco IS NULL)
@@ -1247,26 +1212,22 @@ WHERE
                 SELECT
                     p.hios_plan_id,
                     p.plan_marketing_name as plan_name,
-                    SUBSTRING(p.hios_plan_id, 6, 2) AS state_code,
-                    CASE
-                        WHEN br.rating_area_id ~ '^Rating Area [0-9]+$'
-                        THEN (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer
-                        ELSE NULL
-                    END AS rating_area_id,
+                    p.state_code,
+                    br.rating_area_numeric AS rating_area_id,
                     br.age as age_band,
                     br.individual_rate::numeric as premium,
                     ROW_NUMBER() OVER (
                         ORDER BY br.individual_rate::numeric ASC
                     ) as plan_rank
-                FROM rbis_insurance_plan_base_rates_20251019202724 br
-                JOIN rbis_insurance_plan_20251019202724 p ON br.plan_id = p.hios_plan_id
-                JOIN rbis_insurance_plan_variant_20251019202724 v ON p.hios_plan_id = v.hios_plan_id
+                FROM rbis_insurance_plan_base_rates br
+                JOIN rbis_insurance_plan p ON br.plan_id = p.hios_plan_id
+                JOIN rbis_insurance_plan_variant v ON p.hios_plan_id = v.hios_plan_id
                 WHERE p.level_of_coverage = 'Silver'
                     AND p.market_coverage = 'Individual'
                     AND v.csr_variation_type = 'Exchange variant (no CSR)'
-                    AND SUBSTRING(p.hios_plan_id, 6, 2) = %s
-                    AND br.rating_area_id ~ '^Rating Area [0-9]+$'
-                    AND (REGEXP_REPLACE(br.rating_area_id, '[^0-9]', '', 'g'))::integer = %s
+                    AND p.state_code = %s
+                    AND br.state_code = p.state_code
+                    AND br.rating_area_numeric = %s
                     AND br.age = %s
                     AND br.rate_effective_date = '2026-01-01'
                     AND (br.tobacco IN ('No Preference', 'None', 'Tobacco User/Non-Tobacco User') OR br.tobacco IS NULL)
@@ -1286,6 +1247,137 @@ WHERE
         return result
 
 
+def _rows_by_plan(df: pd.DataFrame, id_col: str, plan_ids: List[str]) -> Dict[str, pd.DataFrame]:
+    """Split query rows per plan (keeping row order); plans without rows get an empty frame."""
+    groups = {plan_id: rows for plan_id, rows in df.groupby(id_col, sort=False)} if not df.empty else {}
+    empty = df.iloc[0:0]
+    return {plan_id: groups.get(plan_id, empty) for plan_id in plan_ids}
+
+
+def _concat_plan_rows(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    non_empty = [rows for rows in frames.values() if not rows.empty]
+    if not non_empty:
+        return next(iter(frames.values())).reset_index(drop=True)
+    return pd.concat(non_empty, ignore_index=True)
+
+
+def _contains_any(values: pd.Series, *needles: str) -> pd.Series:
+    """Case-insensitive substring match, like LOWER(col) LIKE '%needle%' (NULL never matches)."""
+    lowered = values.astype('string').str.lower()
+    mask = pd.Series(False, index=values.index)
+    for needle in needles:
+        mask |= lowered.str.contains(needle, regex=False).fillna(False).astype(bool)
+    return mask
+
+
+class PlanAttributeQueries:
+    """
+    Cached per-plan rows from the static plan attribute tables.
+
+    Rows are read through the process-wide plan attribute cache: each call
+    queries only the plans not seen before (one query per table), and the
+    enrichment queries below filter the cached rows in memory. Entries are
+    keyed by the versioned table name, so activating a new plan year (see
+    dataset_registry) doesn't serve the previous year's rows.
+    """
+
+    # Key benefits plus the hospital/ER rows used for AI cost-sharing summaries
+    KEY_BENEFITS = [
+        'Primary Care Visit to Treat an Injury or Illness',
+        'Specialist Visit',
+        'Generic Drugs',
+        'Preferred Brand Drugs',
+        'Emergency Room Services',
+        'Inpatient Hospital Services'
+    ]
+
+    @staticmethod
+    def get_deductible_moop_rows(db: DatabaseConnection, plan_ids: List[str]) -> pd.DataFrame:
+        """
+        Exchange-variant deductible/MOOP rows (all networks and types).
+
+        Returns:
+            DataFrame with columns: plan_id, network_type, moop_ded_type,
+            individual_ded_moop_amount (per plan ordered by network_type, moop_ded_type)
+        """
+        def fetch(missing: List[str]) -> Dict[str, pd.DataFrame]:
+            placeholders = ', '.join(['%s'] * len(missing))
+            query = f"""
+            SELECT
+                plan_id,
+                network_type,
+                moop_ded_type,
+                individual_ded_moop_amount
+            FROM rbis_insurance_plan_variant_ddctbl_moop
+            WHERE plan_id IN ({placeholders})
+                AND variant_component = 'Exchange variant (no CSR)'
+            ORDER BY plan_id, network_type, moop_ded_type
+            """
+            return _rows_by_plan(db.execute_query(query, tuple(missing)), 'plan_id', missing)
+
+        return _concat_plan_rows(get_plan_attribute_cache().get_many(
+            rbis_table('rbis_insurance_plan_variant_ddctbl_moop'), plan_ids, fetch
+        ))
+
+    @staticmethod
+    def get_benefit_rows(db: DatabaseConnection, plan_ids: List[str]) -> pd.DataFrame:
+        """
+        Key benefit, inpatient hospital and emergency room cost-share rows (all CSR variants and networks).
+
+        Returns:
+            DataFrame with columns: hios_plan_id, csr_variation_type, benefit,
+            network_type, copay, coinsurance (per plan ordered by network_type, benefit)
+        """
+        def fetch(missing: List[str]) -> Dict[str, pd.DataFrame]:
+            placeholders = ', '.join(['%s'] * len(missing))
+            benefit_placeholders = ', '.join(['%s'] * len(PlanAttributeQueries.KEY_BENEFITS))
+            query = f"""
+            SELECT
+                hios_plan_id,
+                csr_variation_type,
+                benefit,
+                network_type,
+                co_payment as copay,
+                co_insurance as coinsurance
+            FROM rbis_insurance_plan_benefit_cost_share
+            WHERE hios_plan_id IN ({placeholders})
+                AND (
+                    benefit IN ({benefit_placeholders})
+                    OR LOWER(benefit) LIKE '%%inpatient hospital%%'
+                    OR LOWER(benefit) LIKE '%%emergency room%%'
+                )
+            ORDER BY hios_plan_id, network_type, benefit
+            """
+            params = tuple(missing) + tuple(PlanAttributeQueries.KEY_BENEFITS)
+            return _rows_by_plan(db.execute_query(query, params), 'hios_plan_id', missing)
+
+        return _concat_plan_rows(get_plan_attribute_cache().get_many(
+            rbis_table('rbis_insurance_plan_benefit_cost_share'), plan_ids, fetch
+        ))
+
+    @staticmethod
+    def get_variant_rows(db: DatabaseConnection, plan_ids: List[str]) -> pd.DataFrame:
+        """
+        All rbis_insurance_plan_variant fields for every CSR variant of the plans.
+
+        Returns:
+            DataFrame of variant rows (per plan ordered by csr_variation_type)
+        """
+        def fetch(missing: List[str]) -> Dict[str, pd.DataFrame]:
+            placeholders = ', '.join(['%s'] * len(missing))
+            query = f"""
+            SELECT *
+            FROM rbis_insurance_plan_variant
+            WHERE hios_plan_id IN ({placeholders})
+            ORDER BY hios_plan_id, csr_variation_type
+            """
+            return _rows_by_plan(db.execute_query(query, tuple(missing)), 'hios_plan_id', missing)
+
+        return _concat_plan_rows(get_plan_attribute_cache().get_many(
+            rbis_table('rbis_insurance_plan_variant'), plan_ids, fetch
+        ))
+
+
 class ComprehensivePlanQueries:
     """SQL queries for comprehensive plan data retrieval"""
 
@@ -1303,7 +1395,7 @@ class ComprehensivePlanQueries:
         """
         query = """
         SELECT *
-        FROM rbis_insurance_plan_20251019202724
+        FROM rbis_insurance_plan
         WHERE hios_plan_id = %s
         """
         return db.execute_query(query, (hios_plan_id,))
@@ -1323,13 +1415,10 @@ class ComprehensivePlanQueries:
         Returns:
             DataFrame with all variant fields including document URLs
         """
-        query = """
-        SELECT *
-        FROM rbis_insurance_plan_variant_20251019202724
-        WHERE hios_plan_id = %s
-            AND csr_variation_type = %s
-        """
-        return db.execute_query(query, (hios_plan_id, csr_type))
+        variants = PlanAttributeQueries.get_variant_rows(db, [hios_plan_id])
+        if variants.empty:
+            return variants
+        return variants[variants['csr_variation_type'] == csr_type].reset_index(drop=True)
 
     @staticmethod
     def get_plan_document_urls_batch(db: DatabaseConnection, plan_ids: list,
@@ -1351,7 +1440,7 @@ class ComprehensivePlanQueries:
         placeholders = ', '.join(['%s'] * len(plan_ids))
         query = f"""
         SELECT hios_plan_id, plan_brochure, url_for_summary_of_benefits_and_coverage
-        FROM rbis_insurance_plan_variant_20251019202724
+        FROM rbis_insurance_plan_variant
         WHERE hios_plan_id IN ({placeholders})
             AND csr_variation_type = %s
         """
@@ -1372,7 +1461,7 @@ class ComprehensivePlanQueries:
         """
         query = """
         SELECT *
-        FROM rbis_insurance_plan_benefits_20251019202724
+        FROM rbis_insurance_plan_benefits
         WHERE hios_plan_id = %s
         ORDER BY benefit
         """
@@ -1394,7 +1483,7 @@ class ComprehensivePlanQueries:
         """
         query = """
         SELECT *
-        FROM rbis_insurance_plan_benefit_cost_share_20251019202724
+        FROM rbis_insurance_plan_benefit_cost_share
         WHERE hios_plan_id = %s
             AND csr_variation_type = %s
         ORDER BY benefit, network_type
@@ -1417,7 +1506,7 @@ class ComprehensivePlanQueries:
         """
         query = """
         SELECT *
-        FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+        FROM rbis_insurance_plan_variant_ddctbl_moop
         WHERE plan_id = %s
             AND variant_component = %s
         ORDER BY moop_ded_type, network_type
@@ -1440,7 +1529,7 @@ class ComprehensivePlanQueries:
         """
         query = """
         SELECT *
-        FROM rbis_insurance_plan_variant_sbc_scenario_20251019202724
+        FROM rbis_insurance_plan_variant_sbc_scenario
         WHERE plan_id = %s
             AND variant_component = %s
         ORDER BY sbc_coverage_name
@@ -1479,7 +1568,7 @@ class CostEstimatorQueries:
             co_payment as copay,
             co_insurance as coinsurance,
             network_type
-        FROM rbis_insurance_plan_benefit_cost_share_20251019202724
+        FROM rbis_insurance_plan_benefit_cost_share
         WHERE hios_plan_id IN ({placeholders})
             AND csr_variation_type = 'Exchange variant (no CSR)'
             AND network_type = 'In Network'
@@ -1493,6 +1582,7 @@ class CostEstimatorQueries:
                 OR LOWER(benefit) LIKE '%%emergency room%%'
                 OR LOWER(benefit) LIKE '%%urgent care%%'
                 OR LOWER(benefit) LIKE '%%mental health outpatient%%'
+                OR LOWER(benefit) LIKE '%%mental/behavioral health outpatient%%'
                 OR LOWER(benefit) LIKE '%%inpatient hospital%%'
                 OR LOWER(benefit) LIKE '%%outpatient facility%%'
             )
@@ -1529,7 +1619,7 @@ class CostEstimatorQueries:
             sbc_copayment_amount,
             sbc_coinsurance_amount,
             sbc_limit_amount
-        FROM rbis_insurance_plan_variant_sbc_scenario_20251019202724
+        FROM rbis_insurance_plan_variant_sbc_scenario
         WHERE plan_id IN ({placeholders})
             AND variant_component = 'Exchange variant (no CSR)'
         ORDER BY plan_id, sbc_coverage_name
@@ -1551,24 +1641,14 @@ class CostEstimatorQueries:
         if not plan_ids:
             return pd.DataFrame()
 
-        placeholders = ', '.join(['%s'] * len(plan_ids))
-
-        query = f"""
-        SELECT
-            plan_id,
-            moop_ded_type,
-            individual_ded_moop_amount
-        FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
-        WHERE plan_id IN ({placeholders})
-            AND variant_component = 'Exchange variant (no CSR)'
-            AND network_type = 'In Network'
-            AND (
-                LOWER(moop_ded_type) LIKE '%%deductible%%'
-                OR LOWER(moop_ded_type) LIKE '%%maximum out of pocket%%'
-            )
-        ORDER BY plan_id, moop_ded_type
-        """
-        return db.execute_query(query, tuple(plan_ids))
+        rows = PlanAttributeQueries.get_deductible_moop_rows(db, plan_ids)
+        rows = rows[
+            (rows['network_type'] == 'In Network')
+            & _contains_any(rows['moop_ded_type'], 'deductible', 'maximum out of pocket')
+        ]
+        # Cached rows are already ordered by moop_ded_type within each plan
+        rows = rows.sort_values('plan_id', kind='stable')
+        return rows[['plan_id', 'moop_ded_type', 'individual_ded_moop_amount']].reset_index(drop=True)
 
     @staticmethod
     def get_plan_cost_sharing_for_ai(db: DatabaseConnection, plan_ids: List[str]) -> dict:
@@ -1600,44 +1680,18 @@ class CostEstimatorQueries:
         if not plan_ids:
             return {}
 
-        placeholders = ', '.join(['%s'] * len(plan_ids))
-
-        # Query 1: Deductibles and MOOP (both networks)
-        ded_moop_query = f"""
-        SELECT
-            plan_id,
-            network_type,
-            moop_ded_type,
-            individual_ded_moop_amount
-        FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
-        WHERE plan_id IN ({placeholders})
-            AND variant_component = 'Exchange variant (no CSR)'
-            AND (
-                LOWER(moop_ded_type) LIKE '%%medical ehb deductible%%'
-                OR LOWER(moop_ded_type) LIKE '%%maximum out of pocket%%'
-            )
-        ORDER BY plan_id, network_type, moop_ded_type
-        """
-        ded_moop_df = db.execute_query(ded_moop_query, tuple(plan_ids))
+        # Deductibles and MOOP (both networks), ordered by network_type, moop_ded_type per plan
+        ded_moop_df = PlanAttributeQueries.get_deductible_moop_rows(db, plan_ids)
+        ded_moop_df = ded_moop_df[
+            _contains_any(ded_moop_df['moop_ded_type'], 'medical ehb deductible', 'maximum out of pocket')
+        ]
 
-        # Query 2: Hospital and ER coinsurance (both networks)
-        coinsurance_query = f"""
-        SELECT
-            hios_plan_id as plan_id,
-            network_type,
-            benefit,
-            co_payment as copay,
-            co_insurance as coinsurance
-        FROM rbis_insurance_plan_benefit_cost_share_20251019202724
-        WHERE hios_plan_id IN ({placeholders})
-            AND csr_variation_type = 'Exchange variant (no CSR)'
-            AND (
-                LOWER(benefit) LIKE '%%inpatient hospital%%'
-                OR LOWER(benefit) LIKE '%%emergency room%%'
-            )
-        ORDER BY hios_plan_id, network_type, benefit
-        """
-        coinsurance_df = db.execute_query(coinsurance_query, tuple(plan_ids))
+        # Hospital and ER coinsurance (both networks), ordered by network_type, benefit per plan
+        coinsurance_df = PlanAttributeQueries.get_benefit_rows(db, plan_ids)
+        coinsurance_df = coinsurance_df[
+            (coinsurance_df['csr_variation_type'] == 'Exchange variant (no CSR)')
+            & _contains_any(coinsurance_df['benefit'], 'inpatient hospital', 'emergency room')
+        ].rename(columns={'hios_plan_id': 'plan_id'})
 
         # Build result dict
         result = {}
@@ -1736,7 +1790,7 @@ class BenefitQueries:
             network_type,
             co_payment as copay,
             co_insurance as coinsurance
-        FROM rbis_insurance_plan_benefit_cost_share_20251019202724
+        FROM rbis_insurance_plan_benefit_cost_share
         WHERE hios_plan_id IN ({placeholders})
             AND network_type = 'In Network'
         """
@@ -1764,16 +1818,16 @@ class BenefitQueries:
         Returns:
             DataFrame with key benefit information
         """
-        key_benefits = [
-            'Primary Care Visit to Treat an Injury or Illness',
-            'Specialist Visit',
-            'Generic Drugs',
-            'Preferred Brand Drugs',
-            'Emergency Room Services',
-            'Inpatient Hospital Services'
-        ]
+        if not hios_plan_ids:
+            return pd.DataFrame()
 
-        return BenefitQueries.get_plan_benefits(db, hios_plan_ids, key_benefits)
+        rows = PlanAttributeQueries.get_benefit_rows(db, hios_plan_ids)
+        rows = rows[
+            (rows['network_type'] == 'In Network')
+            & rows['benefit'].isin(PlanAttributeQueries.KEY_BENEFITS)
+        ]
+        # Cached rows are already ordered by benefit within each plan's in-network rows
+        return rows.sort_values('hios_plan_id', kind='stable').reset_index(drop=True)
 
 
 # Utility functions for common queries
@@ -1794,19 +1848,11 @@ def get_plan_deductible_and_moop_batch(db: DatabaseConnection, plan_ids: list) -
     if not plan_ids:
         return {}
 
-    placeholders = ', '.join(['%s'] * len(plan_ids))
-    query = f"""
-        SELECT plan_id, individual_ded_moop_amount, moop_ded_type
-        FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
-        WHERE plan_id IN ({placeholders})
-          AND variant_component = 'Exchange variant (no CSR)'
-          AND network_type = 'In Network'
-          AND (
-              LOWER(moop_ded_type) LIKE '%%maximum out of pocket%%'
-              OR LOWER(moop_ded_type) LIKE '%%deductible%%'
-          )
-    """
-    result = db.execute_query(query, tuple(plan_ids))
+    result = PlanAttributeQueries.get_deductible_moop_rows(db, plan_ids)
+    result = result[
+        (result['network_type'] == 'In Network')
+        & _contains_any(result['moop_ded_type'], 'maximum out of pocket', 'deductible')
+    ]
 
     # Build lookup dict
     lookup = {}
@@ -1904,8 +1950,8 @@ class FinancialQueries:
             p.plan_marketing_name as name,
             p.level_of_coverage as metal,
             p.plan_type as type
-        FROM rbis_insurance_plan_20251019202724 p
-        WHERE SUBSTRING(p.hios_plan_id, 6, 2) = %s
+        FROM rbis_insurance_plan p
+        WHERE p.state_code = %s
           AND p.market_coverage = 'Individual'
           AND p.plan_effective_date = '2026-01-01'
         """
@@ -1918,7 +1964,7 @@ class FinancialQueries:
 
         query += " ORDER BY p.level_of_coverage, p.plan_marketing_name"
 
-        return pd.read_sql(query, db.engine, params=params)
+        return db.read_sql(query, params=params)
 
     @staticmethod
     def get_rates_batch(
@@ -1944,13 +1990,13 @@ class FinancialQueries:
             rating_area_id,
             age,
             individual_rate as rate
-        FROM rbis_insurance_plan_base_rates_20251019202724
+        FROM rbis_insurance_plan_base_rates
         WHERE plan_id IN %s
           AND market_coverage = 'Individual'
           AND rate_effective_date = '2026-01-01'
         """
 
-        return pd.read_sql(query, db.engine, params=(tuple(plan_ids),))
+        return db.read_sql(query, params=(tuple(plan_ids),))
 
     @staticmethod
     def get_plan_summary(
@@ -1975,13 +2021,13 @@ class FinancialQueries:
             p.plan_type as type,
             ded.individual_ded_moop_amount as deductible,
             moop.individual_ded_moop_amount as oopm
-        FROM rbis_insurance_plan_20251019202724 p
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 ded
+        FROM rbis_insurance_plan p
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop ded
             ON p.hios_plan_id = ded.plan_id
             AND ded.variant_component = 'Exchange variant (no CSR)'
             AND ded.moop_ded_type LIKE '%%Deductible%%'
             AND ded.network_type = 'In Network'
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 moop
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop moop
             ON p.hios_plan_id = moop.plan_id
             AND moop.variant_component = 'Exchange variant (no CSR)'
             AND moop.moop_ded_type LIKE '%%Out of Pocket%%'
@@ -1990,7 +2036,7 @@ class FinancialQueries:
         LIMIT 1
         """
 
-        df = pd.read_sql(query, db.engine, params=(plan_id,))
+        df = db.read_sql(query, params=(plan_id,))
 
         if df.empty:
             return {}
@@ -2019,13 +2065,13 @@ class FinancialQueries:
             p.plan_type as type,
             ded.individual_ded_moop_amount as deductible,
             moop.individual_ded_moop_amount as oopm
-        FROM rbis_insurance_plan_20251019202724 p
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 ded
+        FROM rbis_insurance_plan p
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop ded
             ON p.hios_plan_id = ded.plan_id
             AND ded.variant_component = 'Exchange variant (no CSR)'
             AND ded.moop_ded_type LIKE '%%Deductible%%'
             AND ded.network_type = 'In Network'
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 moop
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop moop
             ON p.hios_plan_id = moop.plan_id
             AND moop.variant_component = 'Exchange variant (no CSR)'
             AND moop.moop_ded_type LIKE '%%Out of Pocket%%'
@@ -2034,7 +2080,7 @@ class FinancialQueries:
         ORDER BY p.hios_plan_id
         """
 
-        return pd.read_sql(query, db.engine, params=(tuple(plan_ids),))
+        return db.read_sql(query, params=(tuple(plan_ids),))
 
 
 # =============================================================================
@@ -2047,8 +2093,8 @@ class HealthCheckQueries:
     REQUIRED_TABLES = [
         'zip_to_county_correct',
         'rbis_state_rating_area_amended',
-        'rbis_insurance_plan_base_rates_20251019202724',
-        'rbis_insurance_plan_20251019202724'
+        'rbis_insurance_plan_base_rates',
+        'rbis_insurance_plan'
     ]
 
     @staticmethod
@@ -2065,8 +2111,10 @@ class HealthCheckQueries:
         WHERE table_schema = 'public'
           AND table_name IN %s
         """
-        result = db.execute_query(query, (tuple(HealthCheckQueries.REQUIRED_TABLES),))
-        return result['table_name'].tolist() if not result.empty else []
+        # RBIS tables are checked under their versioned names (see dataset_registry)
+        physical = {rbis_table(table): table for table in HealthCheckQueries.REQUIRED_TABLES}
+        result = db.execute_query(query, (tuple(physical),))
+        return [physical[table] for table in result['table_name']] if not result.empty else []
 
     @staticmethod
     def get_missing_tables(db: DatabaseConnection) -> list:
@@ -2128,7 +2176,7 @@ class MarketplaceQueries:
         """
         query = """
         SELECT individual_rate
-        FROM rbis_insurance_plan_base_rates_20251019202724
+        FROM rbis_insurance_plan_base_rates
         WHERE plan_id = %s
           AND rating_area_id = %s
           AND age = %s
@@ -2141,6 +2189,128 @@ class MarketplaceQueries:
             return None
         return float(result.iloc[0]['individual_rate'])
 
+    @staticmethod
+    def get_household_quotes(
+        db: DatabaseConnection,
+        state: str,
+        rating_area_id: int,
+        member_bands: Dict[str, int],
+        employee_band: str,
+        metal_levels: list = None,
+        plan_types: list = None,
+        plan_ids: list = None,
+        limit: int = 10,
+        on_exchange_only: bool = False
+    ) -> pd.DataFrame:
+        """
+        Price a whole household across plans in one query and return the cheapest.
+
+        Member rates are joined against a VALUES list of (age_band, count), so
+        the household premium is a single SUM per plan instead of one rate
+        lookup per member per plan. Plans missing a rate for any member are
+        excluded.
+
+        Args:
+            db: Database connection
+            state: 2-letter state code
+            rating_area_id: Integer rating area
+            member_bands: {age_band: number of rated members in that band}
+                (ACA 3-child rule already applied)
+            employee_band: Employee's age band (reported as employee_premium)
+            metal_levels: Metal levels to include (None = all)
+            plan_types: Plan types to include, e.g. ['HMO', 'PPO'] (None = all)
+            plan_ids: Restrict to these HIOS plan IDs (None = all)
+            limit: Max number of plans to return
+            on_exchange_only: If True, only return on-exchange plans
+
+        Returns:
+            DataFrame with plan_id, plan_name, metal_level, plan_type, exchange_status,
+            household_premium, employee_premium, members_rated; cheapest first
+        """
+        if not member_bands:
+            return pd.DataFrame()
+
+        members_sql = ', '.join(['(%s, %s::int)'] * len(member_bands))
+        params = []
+        for band, count in member_bands.items():
+            params.extend([band, int(count)])
+
+        filters = ""
+        params.append(state.upper())
+        if metal_levels:
+            filters += f" AND p.level_of_coverage IN ({', '.join(['%s'] * len(metal_levels))})"
+            params.extend(metal_levels)
+        if plan_types:
+            filters += f" AND p.plan_type IN ({', '.join(['%s'] * len(plan_types))})"
+            params.extend(plan_types)
+        if plan_ids:
+            filters += f" AND p.hios_plan_id IN ({', '.join(['%s'] * len(plan_ids))})"
+            params.extend(plan_ids)
+
+        csr_filter = "= 'Exchange variant (no CSR)'" if on_exchange_only else "IN ('Exchange variant (no CSR)', 'Non-Exchange variant')"
+
+        query = f"""
+        WITH members(age_band, member_count) AS (
+            VALUES {members_sql}
+        ),
+        plans AS (
+            SELECT DISTINCT ON (p.hios_plan_id)
+                p.hios_plan_id as plan_id,
+                p.plan_marketing_name as plan_name,
+                p.level_of_coverage as metal_level,
+                p.plan_type,
+                CASE
+                    WHEN v.csr_variation_type = 'Exchange variant (no CSR)' THEN 'On-Exchange'
+                    ELSE 'Off-Exchange'
+                END as exchange_status
+            FROM rbis_insurance_plan p
+            JOIN rbis_insurance_plan_variant v
+                ON p.hios_plan_id = v.hios_plan_id
+            WHERE p.market_coverage = 'Individual'
+              AND v.csr_variation_type {csr_filter}
+              AND SUBSTRING(p.hios_plan_id FROM 6 FOR 2) = %s
+              {filters}
+            ORDER BY p.hios_plan_id, (v.csr_variation_type = 'Exchange variant (no CSR)') DESC
+        ),
+        rates AS (
+            SELECT DISTINCT ON (r.plan_id, r.age)
+                r.plan_id,
+                r.age,
+                r.individual_rate
+            FROM rbis_insurance_plan_base_rates r
+            JOIN plans pl ON pl.plan_id = r.plan_id
+            WHERE r.rating_area_id = %s
+              AND r.age IN (SELECT age_band FROM members)
+              AND r.tobacco IN ('No Preference', 'Tobacco User/Non-Tobacco User')
+              AND r.rate_effective_date = '2026-01-01'
+            ORDER BY r.plan_id, r.age, r.individual_rate
+        )
+        SELECT
+            pl.plan_id,
+            pl.plan_name,
+            pl.metal_level,
+            pl.plan_type,
+            pl.exchange_status,
+            SUM(rt.individual_rate * m.member_count) as household_premium,
+            MAX(CASE WHEN rt.age = %s THEN rt.individual_rate END) as employee_premium,
+            SUM(m.member_count) as members_rated
+        FROM plans pl
+        JOIN rates rt ON rt.plan_id = pl.plan_id
+        JOIN members m ON m.age_band = rt.age
+        GROUP BY pl.plan_id, pl.plan_name, pl.metal_level, pl.plan_type, pl.exchange_status
+        HAVING SUM(m.member_count) = %s
+        ORDER BY household_premium ASC
+        LIMIT %s
+        """
+        params.extend([
+            f"Rating Area {rating_area_id}",
+            employee_band,
+            sum(int(c) for c in member_bands.values()),
+            limit,
+        ])
+
+        return db.execute_query(query, tuple(params))
+
     @staticmethod
     def get_marketplace_plans_for_employee(
         db: DatabaseConnection,
@@ -2187,10 +2357,10 @@ class MarketplaceQueries:
                 WHEN v.csr_variation_type = 'Exchange variant (no CSR)' THEN 'On-Exchange'
                 ELSE 'Off-Exchange'
             END as exchange_status
-        FROM rbis_insurance_plan_20251019202724 p
-        JOIN rbis_insurance_plan_variant_20251019202724 v
+        FROM rbis_insurance_plan p
+        JOIN rbis_insurance_plan_variant v
             ON p.hios_plan_id = v.hios_plan_id
-        JOIN rbis_insurance_plan_base_rates_20251019202724 r
+        JOIN rbis_insurance_plan_base_rates r
             ON p.hios_plan_id = r.plan_id
         WHERE p.market_coverage = 'Individual'
           AND v.csr_variation_type {csr_filter}
@@ -2234,10 +2404,10 @@ class MarketplaceQueries:
             p.level_of_coverage as metal_level,
             p.plan_type,
             r.individual_rate as monthly_premium
-        FROM rbis_insurance_plan_20251019202724 p
-        JOIN rbis_insurance_plan_variant_20251019202724 v
+        FROM rbis_insurance_plan p
+        JOIN rbis_insurance_plan_variant v
             ON p.hios_plan_id = v.hios_plan_id
-        JOIN rbis_insurance_plan_base_rates_20251019202724 r
+        JOIN rbis_insurance_plan_base_rates r
             ON p.hios_plan_id = r.plan_id
         WHERE p.level_of_coverage = 'Silver'
           AND p.market_coverage = 'Individual'
@@ -2296,10 +2466,10 @@ class MarketplaceQueries:
                 ELSE 'Off-Exchange'
             END as exchange_status,
             ABS(r.individual_rate::numeric - %s) as rate_diff
-        FROM rbis_insurance_plan_20251019202724 p
-        JOIN rbis_insurance_plan_variant_20251019202724 v
+        FROM rbis_insurance_plan p
+        JOIN rbis_insurance_plan_variant v
             ON p.hios_plan_id = v.hios_plan_id
-        JOIN rbis_insurance_plan_base_rates_20251019202724 r
+        JOIN rbis_insurance_plan_base_rates r
             ON p.hios_plan_id = r.plan_id
         WHERE p.market_coverage = 'Individual'
           AND v.csr_variation_type IN ('Exchange variant (no CSR)', 'Non-Exchange variant')
@@ -2343,7 +2513,7 @@ class MarketplaceQueries:
         """
         query = """
         SELECT individual_ded_moop_amount
-        FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+        FROM rbis_insurance_plan_variant_ddctbl_moop
         WHERE plan_id = %s
           AND variant_component = 'Exchange variant (no CSR)'
           AND moop_ded_type LIKE '%%Deductible%%'
@@ -2373,7 +2543,7 @@ class MarketplaceQueries:
         """
         query = """
         SELECT individual_ded_moop_amount
-        FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+        FROM rbis_insurance_plan_variant_ddctbl_moop
         WHERE plan_id = %s
           AND variant_component = 'Exchange variant (no CSR)'
           AND moop_ded_type LIKE '%%Out of Pocket%%'
@@ -2442,18 +2612,18 @@ class EnrichedPlanQueries:
             v.hsa_eligible,
             ded.individual_ded_moop_amount as deductible,
             moop.individual_ded_moop_amount as oop_max
-        FROM rbis_insurance_plan_20251019202724 p
+        FROM rbis_insurance_plan p
         LEFT JOIN "HIOS_issuers_pivoted" i
             ON SUBSTRING(p.hios_plan_id, 1, 5) = i.hios_issuer_id
-        LEFT JOIN rbis_insurance_plan_variant_20251019202724 v
+        LEFT JOIN rbis_insurance_plan_variant v
             ON p.hios_plan_id = v.hios_plan_id
             AND v.variant_component = 'Exchange variant (no CSR)'
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 ded
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop ded
             ON p.hios_plan_id = ded.plan_id
             AND ded.variant_component = 'Exchange variant (no CSR)'
             AND ded.moop_ded_type LIKE '%%Deductible%%'
             AND ded.network_type = 'In Network'
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 moop
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop moop
             ON p.hios_plan_id = moop.plan_id
             AND moop.variant_component = 'Exchange variant (no CSR)'
             AND moop.moop_ded_type LIKE '%%Out of Pocket Maximum%%'
@@ -2491,11 +2661,25 @@ class EnrichedPlanQueries:
             plan_ids: List of HIOS plan IDs
 
         Returns:
-            Dict mapping plan_id to enriched plan data
+            Dict mapping plan_id to enriched plan data (plans not found are omitted)
         """
         if not plan_ids:
             return {}
 
+        try:
+            plans = get_plan_attribute_cache().get_many(
+                f"enriched_plan_with_carrier_{get_dataset_registry().version}", plan_ids,
+                lambda missing: EnrichedPlanQueries._fetch_plans_with_carrier(db, missing)
+            )
+        except Exception as e:
+            print(f"Error getting enriched plan data batch: {e}")
+            return {}
+        # Copies, so callers can't modify the cached dicts
+        return {plan_id: dict(plan) for plan_id, plan in plans.items() if plan is not None}
+
+    @staticmethod
+    def _fetch_plans_with_carrier(db: DatabaseConnection, plan_ids: list) -> dict:
+        """Enriched plan data for the given plans (None for plans not found)."""
         query = """
         SELECT
             p.hios_plan_id,
@@ -2507,30 +2691,28 @@ class EnrichedPlanQueries:
             v.hsa_eligible,
             ded.individual_ded_moop_amount as deductible,
             moop.individual_ded_moop_amount as oop_max
-        FROM rbis_insurance_plan_20251019202724 p
+        FROM rbis_insurance_plan p
         LEFT JOIN "HIOS_issuers_pivoted" i
             ON SUBSTRING(p.hios_plan_id, 1, 5) = i.hios_issuer_id
-        LEFT JOIN rbis_insurance_plan_variant_20251019202724 v
+        LEFT JOIN rbis_insurance_plan_variant v
             ON p.hios_plan_id = v.hios_plan_id
             AND v.variant_component = 'Exchange variant (no CSR)'
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 ded
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop ded
             ON p.hios_plan_id = ded.plan_id
             AND ded.variant_component = 'Exchange variant (no CSR)'
             AND ded.moop_ded_type LIKE '%%Deductible%%'
             AND ded.network_type = 'In Network'
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 moop
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop moop
             ON p.hios_plan_id = moop.plan_id
             AND moop.variant_component = 'Exchange variant (no CSR)'
             AND moop.moop_ded_type LIKE '%%Out of Pocket Maximum%%'
             AND moop.network_type = 'In Network'
         WHERE p.hios_plan_id IN %s
         """
-        try:
-            result = db.execute_query(query, (tuple(plan_ids),))
-            if result is None or result.empty:
-                return {}
+        result = db.execute_query(query, (tuple(plan_ids),))
 
-            plans = {}
+        plans = {plan_id: None for plan_id in plan_ids}
+        if result is not None:
             for _, row in result.iterrows():
                 plan_id = row.get('hios_plan_id')
                 plans[plan_id] = {
@@ -2544,10 +2726,7 @@ class EnrichedPlanQueries:
                     'deductible': float(row.get('deductible', 0)) if row.get('deductible') else None,
                     'oop_max': float(row.get('oop_max', 0)) if row.get('oop_max') else None,
                 }
-            return plans
-        except Exception as e:
-            print(f"Error getting enriched plan data batch: {e}")
-            return {}
+        return plans
 
     @staticmethod
     def get_lowest_cost_plan_by_metal(db: DatabaseConnection, state: str,
@@ -2576,20 +2755,20 @@ class EnrichedPlanQueries:
             ded.individual_ded_moop_amount as deductible,
             moop.individual_ded_moop_amount as oop_max,
             br.individual_rate as base_rate
-        FROM rbis_insurance_plan_20251019202724 p
-        JOIN rbis_insurance_plan_base_rates_20251019202724 br
+        FROM rbis_insurance_plan p
+        JOIN rbis_insurance_plan_base_rates br
             ON p.hios_plan_id = br.plan_id
         LEFT JOIN "HIOS_issuers_pivoted" i
             ON SUBSTRING(p.hios_plan_id, 1, 5) = i.hios_issuer_id
-        LEFT JOIN rbis_insurance_plan_variant_20251019202724 v
+        LEFT JOIN rbis_insurance_plan_variant v
             ON p.hios_plan_id = v.hios_plan_id
             AND v.variant_component = 'Exchange variant (no CSR)'
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 ded
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop ded
             ON p.hios_plan_id = ded.plan_id
             AND ded.variant_component = 'Exchange variant (no CSR)'
             AND ded.moop_ded_type LIKE '%%Deductible%%'
             AND ded.network_type = 'In Network'
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 moop
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop moop
             ON p.hios_plan_id = moop.plan_id
             AND moop.variant_component = 'Exchange variant (no CSR)'
             AND moop.moop_ded_type LIKE '%%Out of Pocket Maximum%%'
@@ -2665,28 +2844,29 @@ class PlanComparisonQueries:
             COALESCE(v.issuer_actuarial_value, v.av_calculator_output_number) as av_percent,
             COALESCE(dm_ded.individual_ded_moop_amount::numeric, 0) as individual_deductible,
             COALESCE(dm_moop.individual_ded_moop_amount::numeric, 0) as individual_oopm
-        FROM rbis_insurance_plan_20251019202724 p
-        JOIN rbis_insurance_plan_variant_20251019202724 v
+        FROM rbis_insurance_plan p
+        JOIN rbis_insurance_plan_variant v
             ON p.hios_plan_id = v.hios_plan_id
             AND v.csr_variation_type = 'Exchange variant (no CSR)'
         LEFT JOIN "HIOS_issuers_pivoted" i
             ON SUBSTRING(p.hios_plan_id, 1, 5) = i.hios_issuer_id
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 dm_ded
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop dm_ded
             ON p.hios_plan_id = dm_ded.plan_id
             AND dm_ded.variant_component = 'Exchange variant (no CSR)'
             AND dm_ded.network_type = 'In Network'
-            AND LOWER(dm_ded.moop_ded_type) LIKE '%%deductible%%'
-        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop_20251019202724 dm_moop
+            AND dm_ded.moop_ded_category = 'deductible'
+        LEFT JOIN rbis_insurance_plan_variant_ddctbl_moop dm_moop
             ON p.hios_plan_id = dm_moop.plan_id
             AND dm_moop.variant_component = 'Exchange variant (no CSR)'
             AND dm_moop.network_type = 'In Network'
-            AND LOWER(dm_moop.moop_ded_type) LIKE '%%maximum out of pocket%%'
-        JOIN rbis_insurance_plan_base_rates_20251019202724 br
+            AND dm_moop.moop_ded_category = 'moop'
+        JOIN rbis_insurance_plan_base_rates br
             ON p.hios_plan_id = br.plan_id
+            AND br.state_code = p.state_code
             AND br.rating_area_numeric = %s
             AND br.age = '21'
             AND br.rate_effective_date = '2026-01-01'
-        WHERE SUBSTRING(p.hios_plan_id FROM 6 FOR 2) = %s
+        WHERE p.state_code = %s
             AND p.market_coverage = 'Individual'
             AND p.plan_effective_date = '2026-01-01'
         """
@@ -2743,7 +2923,7 @@ class PlanComparisonQueries:
             co_payment as copay,
             co_insurance as coinsurance,
             network_type
-        FROM rbis_insurance_plan_benefit_cost_share_20251019202724
+        FROM rbis_insurance_plan_benefit_cost_share
         WHERE hios_plan_id IN ({placeholders})
             AND csr_variation_type = 'Exchange variant (no CSR)'
             AND network_type = 'In Network'
@@ -2784,14 +2964,11 @@ class PlanComparisonQueries:
             individual_ded_moop_amount as individual_amount,
             family_ded_moop_per_person as family_per_member_amount,
             family_ded_moop_per_group as family_amount
-        FROM rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+        FROM rbis_insurance_plan_variant_ddctbl_moop
         WHERE plan_id IN ({placeholders})
             AND variant_component = 'Exchange variant (no CSR)'
             AND network_type = 'In Network'
-            AND (
-                LOWER(moop_ded_type) LIKE '%%deductible%%'
-                OR LOWER(moop_ded_type) LIKE '%%maximum out of pocket%%'
-            )
+            AND moop_ded_category IN ('deductible', 'moop')
         ORDER BY plan_id, moop_ded_type
         """
         return db.execute_query(query, tuple(plan_ids))
@@ -2809,7 +2986,7 @@ class PlanComparisonQueries:
             hios_plan_id,
             hsa_eligible,
             issuer_actuarial_value as av_percent
-        FROM rbis_insurance_plan_variant_20251019202724
+        FROM rbis_insurance_plan_variant
         WHERE hios_plan_id IN ({placeholders})
             AND csr_variation_type = 'Exchange variant (no CSR)'
         """
@@ -2837,11 +3014,11 @@ class PlanComparisonQueries:
         SELECT
             hios_plan_id as plan_id,
             co_insurance as coinsurance
-        FROM rbis_insurance_plan_benefit_cost_share_20251019202724
+        FROM rbis_insurance_plan_benefit_cost_share
         WHERE hios_plan_id IN ({placeholders})
             AND csr_variation_type = 'Exchange variant (no CSR)'
             AND network_type = 'In Network'
-            AND LOWER(benefit) LIKE '%%inpatient hospital%%'
+            AND benefit_category = 'inpatient_hospital'
         LIMIT 1
         """
         return db.execute_query(query, tuple(plan_ids))
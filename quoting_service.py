@@ -0,0 +1,572 @@
+"""
+Quoting Service for Canopy
+Local JSON-over-HTTP access to the pricing engine, for internal tools.
+
+Endpoints:
+- POST /v1/lcsp      LCSP/SLCSP for a household (per rated member and total)
+- POST /v1/strategy  Priced contribution strategy for a census
+- GET  /v1/stats     Latency/throughput per endpoint and batcher cache stats
+- GET  /healthz      Liveness
+
+Benchmark lookups go through a coalescing batcher: lookups from concurrent
+requests are collected for a few milliseconds, deduplicated, and answered by
+a single PlanQueries.get_lcsp_and_slcsp_batch() query. Results are kept in an
+LRU cache keyed by (state, rating area, age band), so hot rating areas are
+served without touching the database. The batcher thread is the only user of
+the database connection.
+
+No Streamlit import: runs standalone.
+
+Usage:
+    python quoting_service.py --port 8765
+
+    curl -s localhost:8765/v1/lcsp -d '{"state": "NC", "rating_area_id": 4,
+        "ee_age": 40, "spouse_age": 38, "child_ages": [10], "family_status": "F"}'
+
+Environment:
+- Database settings as for the app (DATABASE_URL or DB_HOST/DB_NAME/...)
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from contribution_strategies import ContributionStrategyCalculator
+from financial_calculator import FinancialSummaryCalculator
+from household_quotes import rated_member_ages
+from queries import PlanQueries
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Batcher: how long to wait for more lookups, and the most per query
+BATCH_WINDOW_SECONDS = 0.005
+MAX_BATCH_KEYS = 200
+# Benchmarks kept in memory, keyed by (state, rating_area_id, age_band)
+BENCHMARK_CACHE_SIZE = 20_000
+# Seconds a request waits for its lookups before failing
+LOOKUP_TIMEOUT_SECONDS = 30.0
+
+# Recent latencies kept per endpoint for percentiles
+LATENCY_WINDOW = 2_000
+
+# Largest census accepted by /v1/strategy
+MAX_CENSUS_ROWS = 10_000
+
+BenchmarkKey = Tuple[str, int, str]
+
+
+class QuoteError(ValueError):
+    """Invalid quote request (returned as HTTP 400)"""
+
+
+def benchmark_key(state: str, rating_area_id: Any, age: int) -> BenchmarkKey:
+    """(state, rating area, age band) lookup key for an age."""
+    if isinstance(rating_area_id, str):
+        digits = ''.join(ch for ch in rating_area_id if ch.isdigit())
+        if not digits:
+            raise QuoteError(f"Invalid rating area: {rating_area_id}")
+        rating_area_id = digits
+    return (str(state).strip().upper(), int(rating_area_id), FinancialSummaryCalculator.get_age_band(int(age)))
+
+
+# =============================================================================
+# REQUEST COALESCING
+# =============================================================================
+
+class BenchmarkBatcher:
+    """
+    Coalesces LCSP/SLCSP lookups from concurrent requests into batched queries.
+
+    Callers submit keys and wait on the returned futures; a single dispatcher
+    thread drains the queue, serves cache hits, and runs one batch query for
+    the distinct misses.
+    """
+
+    def __init__(
+        self,
+        db,
+        window_seconds: float = BATCH_WINDOW_SECONDS,
+        max_batch_keys: int = MAX_BATCH_KEYS,
+        cache_size: int = BENCHMARK_CACHE_SIZE,
+    ):
+        """
+        Args:
+            db: Database connection (used only from the dispatcher thread)
+            window_seconds: How long to collect lookups before querying
+            max_batch_keys: Distinct keys per query
+            cache_size: Benchmarks kept in the LRU cache
+        """
+        self.db = db
+        self.window_seconds = window_seconds
+        self.max_batch_keys = max_batch_keys
+        self.cache_size = cache_size
+
+        self._cache: 'OrderedDict[BenchmarkKey, Dict[str, Any]]' = OrderedDict()
+        self._pending: List[Tuple[BenchmarkKey, Future]] = []
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._stats = {'lookups': 0, 'cache_hits': 0, 'batches': 0, 'keys_queried': 0, 'query_seconds': 0.0}
+
+        self._thread = threading.Thread(target=self._run, name='benchmark-batcher', daemon=True)
+        self._thread.start()
+
+    def lookup_many(self, keys: Iterable[BenchmarkKey], timeout: float = LOOKUP_TIMEOUT_SECONDS) -> Dict[BenchmarkKey, Dict[str, Any]]:
+        """
+        Resolve benchmarks for keys, blocking until all are answered.
+
+        Returns:
+            {key: {'lcsp': float|None, 'slcsp': float|None,
+                   'lcsp_plan_name': str|None, 'slcsp_plan_name': str|None}}
+        """
+        results: Dict[BenchmarkKey, Dict[str, Any]] = {}
+        futures: Dict[BenchmarkKey, Future] = {}
+
+        with self._cond:
+            for key in dict.fromkeys(keys):
+                self._stats['lookups'] += 1
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self._stats['cache_hits'] += 1
+                    results[key] = cached
+                else:
+                    future = Future()
+                    futures[key] = future
+                    self._pending.append((key, future))
+            if futures:
+                self._cond.notify()
+
+        deadline = time.monotonic() + timeout
+        for key, future in futures.items():
+            results[key] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup, cache and batch counters."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats['cache_entries'] = len(self._cache)
+        stats['cache_hit_rate'] = stats['cache_hits'] / stats['lookups'] if stats['lookups'] else 0.0
+        stats['avg_keys_per_batch'] = stats['keys_queried'] / stats['batches'] if stats['batches'] else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Stop the dispatcher thread."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        """Dispatcher loop: wait for work, let the window fill, query once."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    for _, future in self._pending:
+                        future.set_exception(RuntimeError("Quoting service is shutting down"))
+                    self._pending.clear()
+                    return
+
+            # Give concurrent requests a moment to join this batch
+            time.sleep(self.window_seconds)
+
+            with self._cond:
+                batch = self._take_batch()
+            if batch:
+                self._resolve(batch)
+
+    def _take_batch(self) -> Dict[BenchmarkKey, List[Future]]:
+        """Pop up to max_batch_keys distinct keys (caller holds the lock)."""
+        batch: Dict[BenchmarkKey, List[Future]] = {}
+        remaining = []
+        for key, future in self._pending:
+            cached = self._cache.get(key)
+            if cached is not None:
+                future.set_result(cached)
+            elif key in batch or len(batch) < self.max_batch_keys:
+                batch.setdefault(key, []).append(future)
+            else:
+                remaining.append((key, future))
+        self._pending = remaining
+        return batch
+
+    def _resolve(self, batch: Dict[BenchmarkKey, List[Future]]) -> None:
+        """Run one batch query and complete the waiting futures."""
+        locations = [
+            {'state_code': state, 'rating_area_id': rating_area_id, 'age_band': age_band}
+            for state, rating_area_id, age_band in batch
+        ]
+        start = time.perf_counter()
+        try:
+            rows = PlanQueries.get_lcsp_and_slcsp_batch(self.db, locations)
+        except Exception as e:
+            logger.error(f"QUOTING: Benchmark batch of {len(batch)} failed: {e}")
+            for futures in batch.values():
+                for future in futures:
+                    future.set_exception(e)
+            return
+        elapsed = time.perf_counter() - start
+
+        found = _benchmarks_from_rows(rows)
+        with self._cond:
+            self._stats['batches'] += 1
+            self._stats['keys_queried'] += len(batch)
+            self._stats['query_seconds'] += elapsed
+            for key in batch:
+                self._cache[key] = found.get(key, _empty_benchmark())
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        for key, futures in batch.items():
+            for future in futures:
+                future.set_result(found.get(key, _empty_benchmark()))
+
+
+def _empty_benchmark() -> Dict[str, Any]:
+    """Benchmark for a location with no Silver plans."""
+    return {'lcsp': None, 'slcsp': None, 'lcsp_plan_name': None, 'slcsp_plan_name': None}
+
+
+def _benchmarks_from_rows(rows: pd.DataFrame) -> Dict[BenchmarkKey, Dict[str, Any]]:
+    """Fold get_lcsp_and_slcsp_batch() rows (plan_rank 1/2) into benchmarks by key."""
+    found: Dict[BenchmarkKey, Dict[str, Any]] = {}
+    if rows is None or rows.empty:
+        return found
+    for row in rows.itertuples(index=False):
+        key = (str(row.state_code).upper(), int(row.rating_area_id), str(row.age_band))
+        benchmark = found.setdefault(key, _empty_benchmark())
+        if int(row.plan_rank) == 1:
+            benchmark['lcsp'] = float(row.premium)
+            benchmark['lcsp_plan_name'] = row.plan_name
+        elif int(row.plan_rank) == 2:
+            benchmark['slcsp'] = float(row.premium)
+            benchmark['slcsp_plan_name'] = row.plan_name
+    return found
+
+
+# =============================================================================
+# QUOTES
+# =============================================================================
+
+def _sum_rates(rates: List[Optional[float]]) -> Optional[float]:
+    """Household total, or None if any member has no benchmark."""
+    if not rates or any(r is None for r in rates):
+        return None
+    return round(sum(rates), 2)
+
+
+def quote_household_benchmarks(batcher: BenchmarkBatcher, request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    LCSP/SLCSP for a household.
+
+    Members are rated per the ACA 3-child rule; each member's benchmark is
+    the lowest/second-lowest Silver rate at their age, and the household
+    totals are their sum.
+
+    Args:
+        request: {state, rating_area_id, ee_age, spouse_age?, child_ages?, family_status?}
+    """
+    try:
+        state = request['state']
+        rating_area_id = request['rating_area_id']
+        ee_age = int(request['ee_age'])
+    except (KeyError, TypeError, ValueError) as e:
+        raise QuoteError(f"state, rating_area_id and ee_age are required ({e})")
+
+    family_status = str(request.get('family_status') or 'EE').upper()
+    ages = rated_member_ages(ee_age, request.get('spouse_age'), request.get('child_ages') or (), family_status)
+    keys = [benchmark_key(state, rating_area_id, age) for age in ages]
+    benchmarks = batcher.lookup_many(keys)
+
+    members = [
+        {'age': age, 'age_band': key[2], 'lcsp': benchmarks[key]['lcsp'], 'slcsp': benchmarks[key]['slcsp']}
+        for age, key in zip(ages, keys)
+    ]
+    employee = benchmarks[keys[0]]
+    return {
+        'state': keys[0][0],
+        'rating_area_id': keys[0][1],
+        'family_status': family_status,
+        'members': members,
+        'lcsp_ee_rate': employee['lcsp'],
+        'slcsp_ee_rate': employee['slcsp'],
+        'lcsp_plan_name': employee['lcsp_plan_name'],
+        'slcsp_plan_name': employee['slcsp_plan_name'],
+        'household_lcsp': _sum_rates([m['lcsp'] for m in members]),
+        'household_slcsp': _sum_rates([m['slcsp'] for m in members]),
+    }
+
+
+def build_lcsp_cache(batcher: BenchmarkBatcher, census_df: pd.DataFrame) -> Dict[str, Dict]:
+    """
+    ContributionStrategyCalculator LCSP cache from batched benchmark lookups.
+
+    Same shape as the calculator builds itself, with the family-tier premium
+    estimated from FinancialSummaryCalculator.TIER_MULTIPLIERS as in
+    calculate_lcsp_scenario().
+
+    Args:
+        census_df: Census with employee_id, state, rating_area_id, age, family_status
+    """
+    missing = [c for c in ('employee_id', 'state', 'rating_area_id', 'age') if c not in census_df.columns]
+    if missing:
+        raise QuoteError(f"Census rows need: {', '.join(missing)}")
+
+    rows = census_df.to_dict('records')
+    keys = []
+    for row in rows:
+        try:
+            keys.append(benchmark_key(row['state'], row['rating_area_id'], row['age']))
+        except (TypeError, ValueError) as e:
+            raise QuoteError(f"Employee {row.get('employee_id')}: {e}")
+    benchmarks = batcher.lookup_many(keys)
+
+    cache = {}
+    for row, key in zip(rows, keys):
+        benchmark = benchmarks[key]
+        family_status = str(row.get('family_status') or 'EE').upper()
+        lcsp = benchmark['lcsp'] or 0
+        cache[str(row['employee_id'])] = {
+            'lcsp_ee_rate': lcsp,
+            'slcsp_ee_rate': benchmark['slcsp'],
+            'lcsp_tier_premium': lcsp * FinancialSummaryCalculator.TIER_MULTIPLIERS.get(family_status, 1.0),
+            'lcsp_plan_name': benchmark['lcsp_plan_name'],
+            'state': key[0],
+            'rating_area': key[1],
+            'family_status': family_status,
+            'ee_age': int(row['age']),
+        }
+    return cache
+
+
+def quote_strategy(batcher: BenchmarkBatcher, request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Price a contribution strategy for a census.
+
+    Args:
+        request: {census: [{employee_id, age, state, rating_area_id, family_status,
+                  monthly_income?, ...}], strategy: {strategy_type, ...}}
+
+    Returns:
+        calculate_strategy() result (JSON-safe)
+    """
+    from batch_processing import build_strategy_config
+
+    census = request.get('census')
+    if not isinstance(census, list) or not census:
+        raise QuoteError("census must be a non-empty list of employee records")
+    if len(census) > MAX_CENSUS_ROWS:
+        raise QuoteError(f"census has {len(census)} rows; the limit is {MAX_CENSUS_ROWS}")
+
+    config = build_strategy_config(request.get('strategy') or {})
+    census_df = pd.DataFrame(census)
+    census_df['employee_id'] = census_df['employee_id'].astype(str)
+
+    calculator = ContributionStrategyCalculator(None, census_df, lcsp_cache=build_lcsp_cache(batcher, census_df))
+    return _json_safe(calculator.calculate_strategy(config))
+
+
+def _json_safe(value: Any) -> Any:
+    """Convert numpy/pandas scalars and NaN for json.dumps."""
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+# =============================================================================
+# STATS
+# =============================================================================
+
+class ServiceStats:
+    """Request counts, errors and latency percentiles per endpoint"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        """Record one request."""
+        with self._lock:
+            stats = self._endpoints.setdefault(
+                endpoint, {'requests': 0, 'errors': 0, 'latencies': deque(maxlen=LATENCY_WINDOW)}
+            )
+            stats['requests'] += 1
+            stats['errors'] += 0 if ok else 1
+            stats['latencies'].append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-endpoint requests, errors, requests/sec and p50/p95/p99 latency (ms)."""
+        with self._lock:
+            uptime = time.monotonic() - self._started
+            endpoints = {}
+            for endpoint, stats in self._endpoints.items():
+                latencies = np.array(stats['latencies']) * 1000
+                p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (0.0, 0.0, 0.0)
+                endpoints[endpoint] = {
+                    'requests': stats['requests'],
+                    'errors': stats['errors'],
+                    'requests_per_second': round(stats['requests'] / uptime, 2) if uptime > 0 else 0.0,
+                    'p50_ms': round(float(p50), 2),
+                    'p95_ms': round(float(p95), 2),
+                    'p99_ms': round(float(p99), 2),
+                }
+        return {'uptime_seconds': round(uptime, 1), 'endpoints': endpoints}
+
+
+# =============================================================================
+# HTTP
+# =============================================================================
+
+class QuotingService:
+    """Pricing engine behind a threaded HTTP server"""
+
+    ROUTES = {
+        ('POST', '/v1/lcsp'): quote_household_benchmarks,
+        ('POST', '/v1/strategy'): quote_strategy,
+    }
+
+    def __init__(self, db, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, **batcher_options):
+        """
+        Args:
+            db: Database connection
+            host: Bind address
+            port: Port (0 picks a free port)
+            **batcher_options: Passed to BenchmarkBatcher
+        """
+        self.batcher = BenchmarkBatcher(db, **batcher_options)
+        self.stats = ServiceStats()
+        self.server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.server.daemon_threads = True
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """(host, port) actually bound."""
+        return self.server.server_address[:2]
+
+    def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Route one request; returns (HTTP status, JSON payload)."""
+        if method == 'GET' and path == '/healthz':
+            return 200, {'status': 'ok'}
+        if method == 'GET' and path == '/v1/stats':
+            return 200, {**self.stats.snapshot(), 'batcher': self.batcher.stats()}
+
+        route = self.ROUTES.get((method, path))
+        if route is None:
+            return 404, {'error': f"No route for {method} {path}"}
+
+        start = time.perf_counter()
+        ok = False
+        try:
+            request = json.loads(body or b'{}')
+            if not isinstance(request, dict):
+                raise QuoteError("Request body must be a JSON object")
+            payload = route(self.batcher, request)
+            ok = True
+            return 200, payload
+        except (QuoteError, json.JSONDecodeError) as e:
+            return 400, {'error': str(e)}
+        except ValueError as e:
+            # Bad strategy options surface as ValueError from the engine
+            return 400, {'error': str(e)}
+        except Exception as e:
+            logger.exception(f"QUOTING: {path} failed")
+            return 500, {'error': f"{type(e).__name__}: {e}"}
+        finally:
+            self.stats.record(path, time.perf_counter() - start, ok)
+
+    def serve_forever(self) -> None:
+        """Serve until interrupted."""
+        logger.info(f"QUOTING: Listening on http://{self.address[0]}:{self.address[1]}")
+        self.server.serve_forever()
+
+    def start(self) -> threading.Thread:
+        """Serve from a background thread (tests, load runs)."""
+        thread = threading.Thread(target=self.server.serve_forever, name='quoting-service', daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self) -> None:
+        """Stop serving and stop the batcher."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.batcher.close()
+
+
+def _make_handler(service: QuotingService):
+    """Request handler class bound to a service."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _dispatch(self, method: str) -> None:
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else b''
+            status, payload = service.handle(method, self.path.split('?', 1)[0], body)
+            data = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._dispatch('GET')
+
+        def do_POST(self):
+            self._dispatch('POST')
+
+        def log_message(self, format, *args):
+            logger.debug(f"QUOTING: {self.address_string()} {format % args}")
+
+    return Handler
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Local JSON quoting service")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--batch-window-ms', type=float, default=BATCH_WINDOW_SECONDS * 1000)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s %(levelname)s %(message)s')
+
+    from database import create_database_connection
+
+    service = QuotingService(
+        create_database_connection(), args.host, args.port,
+        window_seconds=args.batch_window_ms / 1000,
+    )
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,13 +3,26 @@ Cloudflare R2 Storage Service
 
 Provides time-limited shared content via presigned URLs.
 Uses S3-compatible API for Cloudflare R2.
+
+Uploads are content-addressed: the object key is derived from a SHA-256 of the
+body, so identical breakdown pages are stored once and re-used. Bodies are
+compressed (gzip, or brotli when installed and requested) and served with the
+matching Content-Encoding header. One boto3 client is shared per endpoint and
+credential set, and `upload_many` uploads a batch concurrently.
+
+Set R2_ENDPOINT_URL to point at a local S3-compatible stand-in (MinIO, moto
+server) for testing.
 """
 
 import os
-import uuid
+import gzip
+import json
+import hashlib
 import logging
-from typing import Optional, Tuple
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timezone
 
 # Load environment variables from .env file
 try:
@@ -18,33 +31,99 @@ try:
 except ImportError:
     pass  # dotenv not installed, will use system env vars
 
+# Brotli is optional - gzip is used when it is not installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 logger = logging.getLogger(__name__)
 
+# Bodies smaller than this are uploaded uncompressed (encoding overhead not worth it)
+MIN_COMPRESS_BYTES = 1024
+
+# Re-use an existing content-addressed object only if it is younger than this,
+# so bucket lifecycle rules cannot delete it before the new link expires
+DEDUP_MAX_AGE_HOURS = 24
+
+# Default parallelism for upload_many
+DEFAULT_UPLOAD_WORKERS = 8
+
+# Shared boto3 clients keyed by (endpoint, access_key). boto3 clients are
+# thread-safe, but creating one costs tens of milliseconds.
+_client_cache: Dict[Tuple[Optional[str], Optional[str]], object] = {}
+_client_lock = threading.Lock()
+
+
+def compress_body(body: bytes, encoding: str = 'gzip') -> Tuple[bytes, Optional[str]]:
+    """Compress an upload body.
+
+    Args:
+        body: Raw bytes to upload
+        encoding: 'gzip', 'br' (brotli) or 'identity'
+
+    Returns:
+        Tuple of (payload, content_encoding). content_encoding is None when the
+        body was left uncompressed.
+    """
+    if encoding == 'identity' or len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    if encoding == 'br':
+        if brotli is not None:
+            return brotli.compress(body, quality=9), 'br'
+        logger.debug("brotli not installed, falling back to gzip")
+    # mtime=0 keeps the compressed bytes deterministic for identical input
+    return gzip.compress(body, compresslevel=6, mtime=0), 'gzip'
+
+
+def content_key(prefix: str, body: bytes, extension: str) -> str:
+    """Build a content-addressed object key for a body."""
+    digest = hashlib.sha256(body).hexdigest()
+    return f"{prefix}/{digest}.{extension}"
+
 
 class R2StorageService:
     """Service for uploading content to Cloudflare R2 and generating presigned URLs."""
 
-    def __init__(self):
-        """Initialize R2 storage service with credentials from environment."""
+    def __init__(self, client=None):
+        """Initialize R2 storage service with credentials from environment.
+
+        Args:
+            client: Optional pre-built S3 client (e.g. a local stand-in for tests).
+                When omitted, a shared boto3 client is created on first use.
+        """
         self.account_id = os.getenv('R2_ACCOUNT_ID')
         self.access_key = os.getenv('R2_ACCESS_KEY_ID')
         self.secret_key = os.getenv('R2_SECRET_ACCESS_KEY')
         self.bucket = os.getenv('R2_BUCKET', 'ichra-shared')
         # R2 presigned URLs max out at 7 days (604800 seconds)
         self.default_expiry_days = min(int(os.getenv('QR_LINK_EXPIRY_DAYS', '7')), 7)
+        # 'gzip' (default), 'br' or 'identity'
+        self.content_encoding = os.getenv('R2_CONTENT_ENCODING', 'gzip')
 
-        if self.account_id:
+        endpoint_override = os.getenv('R2_ENDPOINT_URL')
+        if endpoint_override:
+            self.endpoint = endpoint_override
+        elif self.account_id:
             self.endpoint = f"https://{self.account_id}.r2.cloudflarestorage.com"
         else:
             self.endpoint = None
 
+        self._client = client
+        # Keys known to exist in the bucket (avoids repeat HEAD requests)
+        self._known_keys: Dict[str, datetime] = {}
+        self._known_lock = threading.Lock()
+        self.stats = {'uploaded': 0, 'deduplicated': 0, 'bytes_raw': 0, 'bytes_sent': 0}
+
     def is_configured(self) -> Tuple[bool, Optional[str]]:
         """Check if R2 is properly configured.
 
         Returns:
             Tuple of (is_configured, error_message)
         """
-        if not self.account_id:
+        if self._client is not None:
+            return True, None
+        if not self.endpoint:
             return False, "R2_ACCOUNT_ID not set"
         if not self.access_key:
             return False, "R2_ACCESS_KEY_ID not set"
@@ -53,30 +132,75 @@ class R2StorageService:
         return True, None
 
     def _get_client(self):
-        """Get boto3 S3 client configured for R2."""
-        import boto3
-        from botocore.config import Config
-
-        return boto3.client(
-            's3',
-            endpoint_url=self.endpoint,
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            config=Config(signature_version='s3v4'),
-            region_name='auto'  # R2 uses 'auto' region
-        )
+        """Get the shared boto3 S3 client configured for R2."""
+        if self._client is not None:
+            return self._client
+
+        cache_key = (self.endpoint, self.access_key)
+        with _client_lock:
+            client = _client_cache.get(cache_key)
+            if client is None:
+                import boto3
+                from botocore.config import Config
+
+                client = boto3.client(
+                    's3',
+                    endpoint_url=self.endpoint,
+                    aws_access_key_id=self.access_key,
+                    aws_secret_access_key=self.secret_key,
+                    config=Config(
+                        signature_version='s3v4',
+                        max_pool_connections=max(DEFAULT_UPLOAD_WORKERS, 10),
+                    ),
+                    region_name='auto'  # R2 uses 'auto' region
+                )
+                _client_cache[cache_key] = client
+
+        self._client = client
+        return client
+
+    def _is_fresh_copy(self, client, key: str) -> bool:
+        """Check whether a recent copy of a content-addressed object exists."""
+        now = datetime.now(timezone.utc)
+        max_age_seconds = DEDUP_MAX_AGE_HOURS * 3600
+
+        with self._known_lock:
+            uploaded_at = self._known_keys.get(key)
+        if uploaded_at is not None:
+            return (now - uploaded_at).total_seconds() < max_age_seconds
 
-    def upload_html(
+        try:
+            head = client.head_object(Bucket=self.bucket, Key=key)
+        except Exception:
+            # 404 (or any HEAD failure) - upload a fresh copy
+            return False
+
+        last_modified = head.get('LastModified') or now
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        with self._known_lock:
+            self._known_keys[key] = last_modified
+        return (now - last_modified).total_seconds() < max_age_seconds
+
+    def upload_bytes(
         self,
-        html_content: str,
+        body: bytes,
+        content_type: str,
+        extension: str,
         expiry_days: Optional[int] = None,
-        prefix: str = "breakdowns"
+        prefix: str = "data"
     ) -> Optional[str]:
-        """Upload HTML content to R2 and return presigned URL.
+        """Upload bytes to a content-addressed key and return a presigned URL.
+
+        The body is compressed with `self.content_encoding`. If an identical
+        body was uploaded recently, the PUT is skipped and a new presigned URL
+        is issued for the existing object.
 
         Args:
-            html_content: HTML string to upload
-            expiry_days: Days until URL expires (default from env or 14)
+            body: Raw (uncompressed) bytes to upload
+            content_type: MIME type for the object
+            extension: File extension for the key (without dot)
+            expiry_days: Days until URL expires (default from env, max 7)
             prefix: Key prefix/folder in bucket
 
         Returns:
@@ -94,36 +218,71 @@ class R2StorageService:
 
         try:
             client = self._get_client()
+            key = content_key(prefix, body, extension)
+
+            if self._is_fresh_copy(client, key):
+                with self._known_lock:
+                    self.stats['deduplicated'] += 1
+                logger.info(f"Skipped upload, content already in R2: {key}")
+            else:
+                payload, encoding = compress_body(body, self.content_encoding)
+                put_args = {
+                    'Bucket': self.bucket,
+                    'Key': key,
+                    'Body': payload,
+                    'ContentType': content_type,
+                    # Content-addressed keys never change content
+                    'CacheControl': 'private, max-age=604800, immutable',
+                }
+                if encoding:
+                    put_args['ContentEncoding'] = encoding
+                client.put_object(**put_args)
+
+                with self._known_lock:
+                    self._known_keys[key] = datetime.now(timezone.utc)
+                    self.stats['uploaded'] += 1
+                    self.stats['bytes_raw'] += len(body)
+                    self.stats['bytes_sent'] += len(payload)
+                logger.info(
+                    f"Uploaded to R2: {key} ({len(body):,} -> {len(payload):,} bytes, "
+                    f"encoding={encoding or 'identity'})"
+                )
 
-            # Generate unique key with timestamp for debugging
-            timestamp = datetime.now().strftime("%Y%m%d")
-            unique_id = uuid.uuid4()
-            key = f"{prefix}/{timestamp}/{unique_id}.html"
-
-            # Upload HTML content
-            client.put_object(
-                Bucket=self.bucket,
-                Key=key,
-                Body=html_content.encode('utf-8'),
-                ContentType='text/html; charset=utf-8',
-                CacheControl='no-cache'  # Prevent caching issues
-            )
-
-            # Generate presigned URL
             expiry_seconds = expiry_days * 24 * 3600
-            url = client.generate_presigned_url(
+            return client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': self.bucket, 'Key': key},
                 ExpiresIn=expiry_seconds
             )
 
-            logger.info(f"Uploaded breakdown to R2: {key} (expires in {expiry_days} days)")
-            return url
-
         except Exception as e:
             logger.error(f"Failed to upload to R2: {e}")
             return None
 
+    def upload_html(
+        self,
+        html_content: str,
+        expiry_days: Optional[int] = None,
+        prefix: str = "breakdowns"
+    ) -> Optional[str]:
+        """Upload HTML content to R2 and return presigned URL.
+
+        Args:
+            html_content: HTML string to upload
+            expiry_days: Days until URL expires (default from env, max 7)
+            prefix: Key prefix/folder in bucket
+
+        Returns:
+            Presigned URL string, or None if upload fails
+        """
+        return self.upload_bytes(
+            html_content.encode('utf-8'),
+            content_type='text/html; charset=utf-8',
+            extension='html',
+            expiry_days=expiry_days,
+            prefix=prefix
+        )
+
     def upload_json(
         self,
         data: dict,
@@ -140,43 +299,51 @@ class R2StorageService:
         Returns:
             Presigned URL string, or None if upload fails
         """
-        import json
-
-        is_configured, error = self.is_configured()
-        if not is_configured:
-            logger.warning(f"R2 not configured: {error}")
-            return None
-
-        if expiry_days is None:
-            expiry_days = self.default_expiry_days
+        # sort_keys so equal dicts hash to the same key
+        return self.upload_bytes(
+            json.dumps(data, sort_keys=True).encode('utf-8'),
+            content_type='application/json',
+            extension='json',
+            expiry_days=expiry_days,
+            prefix=prefix
+        )
 
-        try:
-            client = self._get_client()
+    def upload_many(
+        self,
+        html_contents: Iterable[str],
+        expiry_days: Optional[int] = None,
+        prefix: str = "breakdowns",
+        max_workers: int = DEFAULT_UPLOAD_WORKERS
+    ) -> List[Optional[str]]:
+        """Upload several HTML pages concurrently.
 
-            timestamp = datetime.now().strftime("%Y%m%d")
-            unique_id = uuid.uuid4()
-            key = f"{prefix}/{timestamp}/{unique_id}.json"
+        Args:
+            html_contents: HTML strings to upload
+            expiry_days: Days until URLs expire
+            prefix: Key prefix/folder in bucket
+            max_workers: Maximum concurrent uploads
 
-            client.put_object(
-                Bucket=self.bucket,
-                Key=key,
-                Body=json.dumps(data).encode('utf-8'),
-                ContentType='application/json'
-            )
+        Returns:
+            Presigned URLs in input order (None for failed uploads)
+        """
+        items = list(html_contents)
+        if not items:
+            return []
 
-            expiry_seconds = expiry_days * 24 * 3600
-            url = client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket, 'Key': key},
-                ExpiresIn=expiry_seconds
-            )
+        is_configured, error = self.is_configured()
+        if not is_configured:
+            logger.warning(f"R2 not configured: {error}")
+            return [None] * len(items)
 
-            logger.info(f"Uploaded JSON to R2: {key}")
-            return url
+        # Build the client once up front so workers don't race to create it
+        self._get_client()
 
-        except Exception as e:
-            logger.error(f"Failed to upload JSON to R2: {e}")
-            return None
+        workers = max(1, min(max_workers, len(items)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='r2-upload') as pool:
+            return list(pool.map(
+                lambda html: self.upload_html(html, expiry_days, prefix),
+                items
+            ))
 
 
 # Module-level convenience function
@@ -223,3 +390,5 @@ if __name__ == "__main__":
         print("  R2_ACCESS_KEY_ID")
         print("  R2_SECRET_ACCESS_KEY")
         print("  R2_BUCKET (optional, defaults to 'ichra-shared')")
+        print("  R2_ENDPOINT_URL (optional, S3-compatible endpoint override)")
+        print("  R2_CONTENT_ENCODING (optional, 'gzip' | 'br' | 'identity')")
@@ -24,8 +24,6 @@ try:
 except ImportError:
     HAS_STREAMLIT = False
 
-from anthropic import Anthropic
-
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -361,6 +359,7 @@ def _extract_with_ai(content: str) -> Dict[str, Any]:
     if not api_key:
         raise ValueError("No Anthropic API key found. Set ANTHROPIC_API_KEY environment variable or Streamlit secrets.")
 
+    from anthropic import Anthropic
     client = Anthropic(api_key=api_key)
     original_content_length = len(content)
 
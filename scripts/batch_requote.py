@@ -0,0 +1,67 @@
+"""
+Batch re-quote CLI
+
+Runs the census → rating area → LCSP/multi-metal → strategy → export
+pipeline for every census CSV in a directory, on a process pool, and writes
+manifest.json with per-client timings. See batch_processing.py for the
+config format.
+
+Usage:
+    python scripts/batch_requote.py censuses/ --config requote.json --output out/
+    python scripts/batch_requote.py censuses/ --workers 1 --outputs csv census_pptx
+
+Database settings come from DATABASE_URL / DB_* environment variables, as
+for the app. Exits non-zero if any client failed.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch_processing import DEFAULT_WORKERS, OUTPUT_TYPES, BatchConfig, run_batch
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Re-quote a directory of client censuses")
+    parser.add_argument('census_dir', type=Path, help="Directory of census CSVs (one per client)")
+    parser.add_argument('--config', type=Path, help="Batch config JSON (strategies, metal_levels, outputs)")
+    parser.add_argument('--output', type=Path, default=Path('batch_output'), help="Output directory")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Worker processes")
+    parser.add_argument('--outputs', nargs='+', choices=OUTPUT_TYPES, help="Override the config's outputs")
+    parser.add_argument('--verbose', action='store_true', help="Log pipeline progress")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s %(levelname)s %(message)s')
+
+    if not args.census_dir.is_dir():
+        parser.error(f"{args.census_dir} is not a directory")
+
+    try:
+        config = BatchConfig.from_file(args.config) if args.config else BatchConfig()
+        if args.outputs:
+            config = BatchConfig(strategies=config.strategies, metal_levels=config.metal_levels,
+                                 outputs=args.outputs)
+    except (OSError, ValueError, TypeError) as e:
+        parser.error(f"Invalid config: {e}")
+
+    manifest = run_batch(args.census_dir, config, args.output, workers=args.workers)
+
+    print(f"{manifest['clients_ok']} ok, {manifest['clients_failed']} failed "
+          f"in {manifest['elapsed_seconds']:.1f}s - manifest: {args.output / 'manifest.json'}")
+    for client in manifest['clients']:
+        if client['status'] != 'ok':
+            print(f"  FAILED {client['client_name']}: {client['error']}")
+    if args.verbose:
+        print(json.dumps({c['client_name']: c['timings'] for c in manifest['clients']}, indent=2))
+
+    return 1 if manifest['clients_failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""
+Startup benchmark for the Streamlit app
+
+Measures two things, each in a fresh interpreter so results reflect a cold
+container start:
+
+1. Import cost per module (python -X importtime), with the heaviest
+   transitive imports listed so regressions are easy to attribute.
+2. Time-to-first-render for app.py and every page, using Streamlit's
+   AppTest harness (no browser or server needed).
+
+3. With --interactions, per-interaction latency on the ICHRA dashboard for
+   a synthetic census: the full-script rerun and the time spent in the
+   fragment that owns the widget. AppTest always reruns the whole script,
+   so the fragment time stands in for what a browser session waits for.
+
+Usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --imports-only --budget-ms 1500
+    python scripts/benchmark_startup.py --pages 2_ICHRA_dashboard 9_Plan_comparison --json startup.json
+    python scripts/benchmark_startup.py --interactions --employees 300
+
+Exits non-zero if any module import exceeds --budget-ms.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+PAGES_DIR = ROOT / 'pages'
+
+# Modules imported at the top of app.py / page scripts. Renderer, AI and
+# storage modules are listed so their (deferred) cost stays visible.
+DEFAULT_MODULES = [
+    'constants',
+    'database',
+    'utils',
+    'queries',
+    'census_schema',
+    'financial_calculator',
+    'contribution_strategies',
+    'subsidy_utils',
+    'fit_score_calculator',
+    'plan_comparison_types',
+    'sbc_parser',
+    'pptx_generator',
+    'email_service',
+    'contribution_eval.services',
+    'contribution_eval.components',
+    # Deferred - imported only on export/AI/storage code paths
+    'pptx_employee_examples',
+    'pptx_cooperative_health',
+    'pptx_plan_comparison',
+    'pdf_subsidy_optimization_renderer',
+    'pdf_employer_summary_renderer',
+    'plan_suggester',
+    'r2_storage',
+]
+
+PAGE_RENDER_SNIPPET = """
+import sys, time, json
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+harness_loaded = time.perf_counter()
+at = AppTest.from_file({path!r}, default_timeout={timeout})
+at.run()
+end = time.perf_counter()
+print(json.dumps({{
+    'harness_s': harness_loaded - start,
+    'first_render_s': end - harness_loaded,
+    'exceptions': [str(e.value) for e in at.exception],
+}}))
+"""
+
+# Runs the dashboard on a synthetic census (Wake County, NC) and times each
+# interaction. st.fragment is wrapped so the time inside each fragment
+# function is recorded by name.
+INTERACTION_SNIPPET = """
+import functools, sys, time, json
+sys.path.insert(0, {root!r})
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+fragment_seconds = {{}}
+_fragment = st.fragment
+
+def timed_fragment(func=None, **kwargs):
+    if func is None:
+        return lambda f: timed_fragment(f, **kwargs)
+
+    @functools.wraps(func)
+    def timed(*args, **kw):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kw)
+        finally:
+            fragment_seconds[func.__name__] = time.perf_counter() - start
+    return _fragment(timed, **kwargs)
+
+st.fragment = timed_fragment
+
+n = {employees}
+rng = np.random.default_rng(2026)
+census = pd.DataFrame({{
+    'employee_id': [f'E{{i:04d}}' for i in range(n)],
+    'first_name': [f'Employee{{i}}' for i in range(n)],
+    'last_name': ['Example'] * n,
+    'age': rng.integers(21, 64, n),
+    'family_status': rng.choice(['EE', 'ES', 'EC', 'F'], n, p=[0.5, 0.2, 0.15, 0.15]),
+    'state': ['NC'] * n,
+    'county': ['Wake'] * n,
+    'zip_code': ['27601'] * n,
+    'rating_area_id': [4] * n,
+    'current_ee_monthly': rng.uniform(100, 600, n).round(2),
+    'current_er_monthly': rng.uniform(300, 900, n).round(2),
+    'monthly_income': rng.uniform(2500, 9000, n).round(2),
+}})
+
+at = AppTest.from_file({path!r}, default_timeout={timeout})
+at.session_state['census_df'] = census
+
+def timed_run(label, fragment, apply=None):
+    fragment_seconds.clear()
+    if apply is not None:
+        apply()
+    start = time.perf_counter()
+    at.run()
+    return {{
+        'interaction': label,
+        'full_rerun_s': time.perf_counter() - start,
+        'fragment': fragment,
+        'fragment_s': fragment_seconds.get(fragment),
+        'exceptions': [str(e.value) for e in at.exception],
+    }}
+
+def pick_employee():
+    dropdown = at.selectbox(key='employee_dropdown_slot_1')
+    dropdown.select(dropdown.options[-1])
+
+def move_adoption_sliders():
+    at.slider(key='adoption_coop_slider').set_value(60)
+    at.slider(key='adoption_silver_slider').set_value(30)
+
+results = [
+    timed_run('first render', None),
+    timed_run('rerun (no change)', None),
+    timed_run('employee dropdown', 'render_employee_example_cards', pick_employee),
+    timed_run('adoption sliders', 'render_expected_adoption', move_adoption_sliders),
+]
+print(json.dumps(results))
+"""
+
+
+def measure_import(module: str, top_n: int = 5) -> dict:
+    """Import a module in a fresh interpreter and parse -X importtime output.
+
+    Returns:
+        Dict with cumulative_ms for the module and its heaviest transitive imports
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        last_line = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'unknown error'
+        return {'module': module, 'error': last_line}
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        # "import time:       self [us] |   cumulative | imported package"
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            _, self_us, cumulative_us, raw_name = line.replace('import time:', '|', 1).split('|')
+            # Nesting depth is encoded as two spaces per level after the first
+            depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+            entries.append((raw_name.strip(), depth, int(cumulative_us)))
+        except ValueError:
+            continue
+
+    cumulative_ms = 0.0
+    direct_imports = []
+    for index, (name, depth, cumulative_us) in enumerate(entries):
+        if name == module and depth == 0:
+            cumulative_ms = cumulative_us / 1000
+            # Children are printed before their parent; walk back to the
+            # previous top-level entry collecting direct imports only
+            for child_name, child_depth, child_us in reversed(entries[:index]):
+                if child_depth == 0:
+                    break
+                if child_depth == 1:
+                    direct_imports.append((child_name, child_us))
+            break
+    heaviest = sorted(direct_imports, key=lambda item: item[1], reverse=True)[:top_n]
+
+    return {
+        'module': module,
+        'cumulative_ms': round(cumulative_ms, 1),
+        'heaviest': [{'package': name, 'ms': round(cum / 1000, 1)} for name, cum in heaviest],
+    }
+
+
+def measure_page(path: Path, timeout: float = 60.0) -> dict:
+    """Run a page once through AppTest in a fresh interpreter."""
+    snippet = PAGE_RENDER_SNIPPET.format(root=str(ROOT), path=str(path), timeout=timeout)
+    proc = subprocess.run(
+        [sys.executable, '-c', snippet],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    result = {'page': path.stem}
+    if proc.returncode != 0:
+        last_line = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'unknown error'
+        result['error'] = last_line
+        return result
+
+    payload = json.loads(proc.stdout.strip().splitlines()[-1])
+    result['first_render_ms'] = round(payload['first_render_s'] * 1000, 1)
+    result['exceptions'] = payload['exceptions']
+    return result
+
+
+def measure_interactions(employees: int = 300, timeout: float = 300.0) -> dict:
+    """Time dashboard interactions in a fresh interpreter (see INTERACTION_SNIPPET).
+
+    Returns:
+        Dict with a row per interaction: full_rerun_ms and fragment_ms
+    """
+    snippet = INTERACTION_SNIPPET.format(root=str(ROOT), path=str(PAGES_DIR / '2_ICHRA_dashboard.py'),
+                                         timeout=timeout, employees=employees)
+    proc = subprocess.run(
+        [sys.executable, '-c', snippet],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    result = {'page': '2_ICHRA_dashboard', 'employees': employees}
+    if proc.returncode != 0:
+        last_line = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'unknown error'
+        result['error'] = last_line
+        return result
+
+    rows = []
+    for row in json.loads(proc.stdout.strip().splitlines()[-1]):
+        rows.append({
+            'interaction': row['interaction'],
+            'full_rerun_ms': round(row['full_rerun_s'] * 1000, 1),
+            'fragment': row['fragment'],
+            'fragment_ms': round(row['fragment_s'] * 1000, 1) if row['fragment_s'] is not None else None,
+            'exceptions': row['exceptions'],
+        })
+    result['interactions'] = rows
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import cost and time-to-first-render")
+    parser.add_argument('--modules', nargs='*', default=None, help="Modules to measure (default: app stack)")
+    parser.add_argument('--pages', nargs='*', default=None, help="Page stems to render (default: app + all pages)")
+    parser.add_argument('--imports-only', action='store_true', help="Skip page rendering")
+    parser.add_argument('--pages-only', action='store_true', help="Skip import measurements")
+    parser.add_argument('--budget-ms', type=float, default=None, help="Fail if any module import exceeds this")
+    parser.add_argument('--interactions', action='store_true',
+                        help="Only time ICHRA dashboard interactions (full rerun vs fragment)")
+    parser.add_argument('--employees', type=int, default=300, help="Synthetic census size for --interactions")
+    parser.add_argument('--json', type=Path, default=None, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    if args.interactions:
+        res = measure_interactions(args.employees)
+        print(f"ICHRA dashboard interactions ({args.employees} employees)")
+        print("-" * 70)
+        if 'error' in res:
+            print(f"  ERROR: {res['error']}")
+        for row in res.get('interactions', []):
+            fragment = f"{row['fragment_ms']:8.1f} ms in {row['fragment']}" if row['fragment_ms'] is not None else ""
+            note = f"  ({len(row['exceptions'])} exception(s))" if row['exceptions'] else ""
+            print(f"  {row['interaction']:22} full rerun {row['full_rerun_ms']:8.1f} ms  {fragment}{note}")
+        if args.json:
+            args.json.write_text(json.dumps(res, indent=2))
+            print(f"\nWrote {args.json}")
+        return
+
+    results = {'imports': [], 'pages': []}
+    over_budget = []
+
+    if not args.pages_only:
+        print("Import cost (cold interpreter)")
+        print("-" * 70)
+        for module in args.modules or DEFAULT_MODULES:
+            res = measure_import(module)
+            results['imports'].append(res)
+            if 'error' in res:
+                print(f"  {module:40} ERROR: {res['error']}")
+                continue
+            flag = ""
+            if args.budget_ms is not None and res['cumulative_ms'] > args.budget_ms:
+                over_budget.append(module)
+                flag = "  OVER BUDGET"
+            heaviest = ", ".join(f"{h['package']} {h['ms']:.0f}ms" for h in res['heaviest'][:3])
+            print(f"  {module:40} {res['cumulative_ms']:8.1f} ms{flag}")
+            if heaviest:
+                print(f"  {'':40} └ {heaviest}")
+
+    if not args.imports_only:
+        page_paths = [ROOT / 'app.py'] + sorted(PAGES_DIR.glob('[0-9]*.py'))
+        if args.pages:
+            page_paths = [p for p in page_paths if p.stem in args.pages]
+        print("\nTime to first render (AppTest, empty session)")
+        print("-" * 70)
+        for path in page_paths:
+            res = measure_page(path)
+            results['pages'].append(res)
+            if 'error' in res:
+                print(f"  {path.stem:40} ERROR: {res['error']}")
+            else:
+                note = f"  ({len(res['exceptions'])} exception(s))" if res['exceptions'] else ""
+                print(f"  {path.stem:40} {res['first_render_ms']:8.1f} ms{note}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\nWrote {args.json}")
+
+    if over_budget:
+        print(f"\n✗ Import budget of {args.budget_ms:.0f}ms exceeded by: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
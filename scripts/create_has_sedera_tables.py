@@ -3,7 +3,9 @@
 Migration script to create and populate HAS and Sedera rate tables.
 These tables are required for the ICHRA Dashboard plan comparisons.
 
-Safe to run multiple times (drops and recreates tables).
+Safe to run multiple times (drops and recreates tables). Each table is
+dropped, recreated and loaded in one transaction, so the app never sees it
+missing or empty.
 
 Usage:
     # Local (uses your OS user):
@@ -18,6 +20,14 @@ import sys
 import os
 import psycopg2
 import getpass
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from plan_year_ingest import copy_dataframe
 
 
 def get_direct_connection():
@@ -198,16 +208,12 @@ def create_has_sedera_tables():
                 deductible_2_5k NUMERIC(10,2)
             )
         """)
-        conn.commit()
         print("  Table created")
 
-        # Insert HAS data
-        print(f"  Inserting {len(HAS_DATA)} HAS rate rows...")
-        for row in HAS_DATA:
-            cursor.execute("""
-                INSERT INTO hap_cooperative_rates (age_band, family_status, deductible_1k, deductible_2_5k)
-                VALUES (%s, %s, %s, %s)
-            """, row)
+        # Load HAS data
+        print(f"  Copying {len(HAS_DATA)} HAS rate rows...")
+        copy_dataframe(cursor, 'hap_cooperative_rates', pd.DataFrame(
+            HAS_DATA, columns=['age_band', 'family_status', 'deductible_1k', 'deductible_2_5k']))
         conn.commit()
         print(f"  Inserted {len(HAS_DATA)} rows")
 
@@ -227,16 +233,13 @@ def create_has_sedera_tables():
                 sedera_monthly_rate NUMERIC(10,2)
             )
         """)
-        conn.commit()
         print("  Table created")
 
-        # Insert Sedera data
-        print(f"  Inserting {len(SEDERA_DATA)} Sedera rate rows...")
-        for row in SEDERA_DATA:
-            cursor.execute("""
-                INSERT INTO sedera_rates_with_dpc ("Plan", "IUA", age_band, family_status, family_status_sedera, sedera_monthly_rate)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, row)
+        # Load Sedera data
+        print(f"  Copying {len(SEDERA_DATA)} Sedera rate rows...")
+        copy_dataframe(cursor, 'sedera_rates_with_dpc', pd.DataFrame(
+            SEDERA_DATA,
+            columns=['Plan', 'IUA', 'age_band', 'family_status', 'family_status_sedera', 'sedera_monthly_rate']))
         conn.commit()
         print(f"  Inserted {len(SEDERA_DATA)} rows")
 
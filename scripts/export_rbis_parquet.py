@@ -0,0 +1,55 @@
+"""
+RBIS Parquet export CLI
+
+Copies the read-only plan, rate, rating-area and ZIP tables from PostgreSQL
+to state-partitioned Parquet for the embedded DuckDB backend (see
+duckdb_backend.py). Run once per plan-year data load, then ship the
+directory to each app node and set RBIS_PARQUET_DIR.
+
+Usage:
+    python scripts/export_rbis_parquet.py rbis_parquet/
+    python scripts/export_rbis_parquet.py rbis_parquet/ --tables zip_to_county_correct
+
+Database settings come from DATABASE_URL / DB_* environment variables, as
+for the app.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import DatabaseConnection, _create_postgres_connection
+from duckdb_backend import EXPORT_CHUNK_ROWS, export_rbis_parquet
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Export RBIS tables to Parquet for the DuckDB backend")
+    parser.add_argument('output', type=Path, help="Export directory")
+    parser.add_argument('--tables', nargs='+', help="Only these tables (default: all RBIS and reference tables)")
+    parser.add_argument('--chunk-rows', type=int, default=EXPORT_CHUNK_ROWS, help="Rows fetched per round trip")
+    parser.add_argument('--verbose', action='store_true', help="Log per-table progress")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s %(levelname)s %(message)s')
+
+    # Always export from PostgreSQL, even if RBIS_PARQUET_DIR is set
+    db: DatabaseConnection = _create_postgres_connection()
+    try:
+        manifest = export_rbis_parquet(db, args.output, tables=args.tables, chunk_rows=args.chunk_rows)
+    finally:
+        db.close()
+
+    for table, info in manifest['tables'].items():
+        partitioned = f"by {info['partition_column']}" if info['partition_column'] else "unpartitioned"
+        print(f"{table}: {info['rows']:,} rows ({partitioned}, {info['seconds']:.1f}s)")
+    print(f"Manifest: {args.output / 'manifest.json'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
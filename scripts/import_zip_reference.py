@@ -6,7 +6,6 @@ for county lookup by ZIP code.
 """
 
 import pandas as pd
-import psycopg2
 from pathlib import Path
 import sys
 
@@ -14,6 +13,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database import get_database_connection
+from plan_year_ingest import copy_dataframe
 
 
 def create_zip_reference_table(db):
@@ -68,50 +68,15 @@ def import_zip_data(db, xlsx_path):
 
     print(f"Cleaned to {len(df_clean):,} unique ZIP+State combinations")
 
-    # Clear existing data
+    # Replace existing data in one transaction, so lookups never see an empty table
     conn = db.connect()
     cursor = conn.cursor()
     cursor.execute("TRUNCATE TABLE zip_county_reference")
+    total_inserted = copy_dataframe(cursor, 'zip_county_reference', df_clean)
     conn.commit()
     cursor.close()
 
-    print("Cleared existing data")
-
-    # Insert data in batches
-    batch_size = 1000
-    total_inserted = 0
-
-    cursor = conn.cursor()
-
-    for i in range(0, len(df_clean), batch_size):
-        batch = df_clean.iloc[i:i+batch_size]
-
-        # Prepare values for bulk insert
-        values = []
-        for _, row in batch.iterrows():
-            values.append((
-                row['zip_code'],
-                row['fips_code'],
-                row['city'],
-                row['state_code']
-            ))
-
-        # Bulk insert
-        insert_query = """
-        INSERT INTO zip_county_reference (zip_code, fips_code, city, state_code)
-        VALUES (%s, %s, %s, %s)
-        ON CONFLICT (zip_code, state_code) DO NOTHING
-        """
-
-        cursor.executemany(insert_query, values)
-        conn.commit()
-
-        total_inserted += len(batch)
-        print(f"Inserted {total_inserted:,} / {len(df_clean):,} records...", end='\r')
-
-    cursor.close()
-
-    print(f"\n✓ Imported {total_inserted:,} ZIP code records")
+    print(f"✓ Imported {total_inserted:,} ZIP code records")
 
     # Verify import
     verify_query = "SELECT COUNT(*) FROM zip_county_reference"
@@ -0,0 +1,107 @@
+"""
+RBIS plan-year ingestion CLI
+
+Loads the next plan year of the CMS RBIS public use files into new versioned
+tables with COPY, validates them and activates them in the dataset registry
+(see plan_year_ingest.py). The app keeps serving the active version until the
+switch, and the previous tables stay in place for rollback.
+
+Activation is refused unless the new plans and rates are effective on the
+app's plan year (constants.RENEWAL_PLAN_YEAR, the date the queries filter on);
+load a later year with --no-activate and activate it once the app moves to it.
+
+Source files are named after the logical tables (rbis_insurance_plan.csv,
+rbis_insurance_plan_base_rates.csv.gz, ...); --source maps other file names.
+
+Usage:
+    python scripts/ingest_plan_year.py puf_2027/
+    python scripts/ingest_plan_year.py puf_2027/ --source rbis_insurance_plan_base_rates=Rate_PUF.csv
+    python scripts/ingest_plan_year.py puf_2027/ --no-activate        # load and validate only
+    python scripts/ingest_plan_year.py --activate 20251019202724      # roll back
+    python scripts/ingest_plan_year.py --drop-version 20251019202724  # free the old tables
+
+Database settings come from DATABASE_URL / DB_* environment variables, as
+for the app. Re-export the DuckDB Parquet files (scripts/export_rbis_parquet.py)
+after activating a new version.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import _create_postgres_connection
+from plan_year_ingest import (
+    DEFAULT_MIN_ROW_RATIO,
+    activate_version,
+    drop_version,
+    find_sources,
+    ingest_plan_year,
+)
+
+
+def _parse_sources(source_dir, overrides):
+    sources = find_sources(source_dir) if source_dir else {}
+    for item in overrides or []:
+        table, sep, path = item.partition('=')
+        if not sep:
+            raise ValueError(f"--source expects TABLE=FILE, got {item!r}")
+        path = Path(path)
+        sources[table] = path if path.is_absolute() or not source_dir else Path(source_dir) / path
+    return sources
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load a new RBIS plan year and switch the app to it")
+    parser.add_argument('source_dir', nargs='?', type=Path, help="Directory of source files")
+    parser.add_argument('--source', action='append', metavar='TABLE=FILE',
+                        help="Source file for a table (relative to source_dir); repeatable")
+    parser.add_argument('--version', help="Version suffix for the new tables (default: current timestamp)")
+    parser.add_argument('--min-row-ratio', type=float, default=DEFAULT_MIN_ROW_RATIO,
+                        help="Reject tables smaller than this fraction of the active ones")
+    parser.add_argument('--no-activate', action='store_true', help="Load and validate without switching")
+    parser.add_argument('--activate', metavar='VERSION', help="Switch to an already loaded version and exit")
+    parser.add_argument('--drop-version', metavar='VERSION', help="Drop an inactive version's tables and exit")
+    parser.add_argument('--verbose', action='store_true', help="Log per-table progress")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s %(levelname)s %(message)s')
+
+    db = _create_postgres_connection()
+    conn = db.connect()
+    try:
+        if args.activate:
+            previous = activate_version(conn, args.activate)
+            print(f"Active RBIS version: {args.activate} (was {previous})")
+            return 0
+        if args.drop_version:
+            for table in drop_version(conn, args.drop_version):
+                print(f"Dropped {table}")
+            return 0
+        if not args.source_dir and not args.source:
+            parser.error("source_dir or --source is required")
+
+        result = ingest_plan_year(conn, _parse_sources(args.source_dir, args.source), version=args.version,
+                                  min_row_ratio=args.min_row_ratio, activate=not args.no_activate)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    for info in result['tables'].values():
+        print(f"{info['table']}: {info['rows']:,} rows (was {info['previous_rows']:,}), "
+              f"{len(info['indexes'])} indexes, {info['seconds']:.1f}s")
+    if result['activated']:
+        print(f"Active RBIS version: {result['version']} (was {result['previous_version']})")
+    else:
+        print(f"Loaded version {result['version']}; activate with --activate {result['version']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Load test for the quoting service
+
+Fires concurrent /v1/lcsp (and optionally /v1/strategy) requests at a
+running quoting_service.py and reports client-side throughput and latency,
+followed by the service's own /v1/stats (batch sizes, cache hit rate).
+
+Usage:
+    python quoting_service.py --port 8765 &
+    python scripts/load_test_quoting_service.py --state NC --rating-areas 1-8 \
+        --threads 32 --requests 2000
+    python scripts/load_test_quoting_service.py --strategy-census 50
+
+Uses only the standard library client; point it at a service backed by a
+local Postgres for representative numbers.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+FAMILY_STATUSES = ['EE', 'ES', 'EC', 'F']
+
+
+def parse_range(value: str) -> List[int]:
+    """'1-8' or '1,3,5' -> list of ints."""
+    if '-' in value:
+        low, high = value.split('-', 1)
+        return list(range(int(low), int(high) + 1))
+    return [int(v) for v in value.split(',')]
+
+
+def random_household(rng: random.Random, state: str, rating_areas: List[int]) -> Dict[str, Any]:
+    family_status = rng.choice(FAMILY_STATUSES)
+    return {
+        'state': state,
+        'rating_area_id': rng.choice(rating_areas),
+        'ee_age': rng.randint(21, 64),
+        'spouse_age': rng.randint(21, 64),
+        'child_ages': [rng.randint(0, 20) for _ in range(rng.randint(1, 4))],
+        'family_status': family_status,
+    }
+
+
+def random_strategy_request(rng: random.Random, state: str, rating_areas: List[int], size: int) -> Dict[str, Any]:
+    census = [
+        {
+            'employee_id': f'E{i}',
+            'age': rng.randint(21, 64),
+            'state': state,
+            'rating_area_id': rng.choice(rating_areas),
+            'family_status': rng.choice(FAMILY_STATUSES),
+        }
+        for i in range(size)
+    ]
+    return {'census': census, 'strategy': {'strategy_type': 'percentage_lcsp', 'lcsp_percentage': 100}}
+
+
+def post(url: str, payload: Dict[str, Any], timeout: float) -> Tuple[int, float]:
+    """POST JSON; returns (status, seconds)."""
+    data = json.dumps(payload).encode('utf-8')
+    request = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception:
+        status = 0
+    return status, time.perf_counter() - start
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the local quoting service")
+    parser.add_argument('--url', default='http://127.0.0.1:8765', help="Service base URL")
+    parser.add_argument('--state', default='NC')
+    parser.add_argument('--rating-areas', default='1-8', help="e.g. 1-8 or 1,4,6")
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--strategy-census', type=int, default=0,
+                        help="Send /v1/strategy requests with this many employees instead of /v1/lcsp")
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    rating_areas = parse_range(args.rating_areas)
+    if args.strategy_census:
+        url = f"{args.url}/v1/strategy"
+        payloads = [random_strategy_request(rng, args.state, rating_areas, args.strategy_census)
+                    for _ in range(args.requests)]
+    else:
+        url = f"{args.url}/v1/lcsp"
+        payloads = [random_household(rng, args.state, rating_areas) for _ in range(args.requests)]
+
+    lock = threading.Lock()
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    def send(payload):
+        status, seconds = post(url, payload, args.timeout)
+        with lock:
+            latencies.append(seconds)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(send, payloads))
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(payloads)} requests to {url} with {args.threads} threads in {elapsed:.2f}s")
+    print(f"  throughput: {len(payloads) / elapsed:.1f} req/s")
+    print(f"  latency ms: p50 {percentile(latencies, 50) * 1000:.1f}  "
+          f"p95 {percentile(latencies, 95) * 1000:.1f}  p99 {percentile(latencies, 99) * 1000:.1f}")
+    print(f"  statuses: {dict(sorted(statuses.items()))}")
+
+    try:
+        with urllib.request.urlopen(f"{args.url}/v1/stats", timeout=args.timeout) as response:
+            print("Service stats:")
+            print(json.dumps(json.loads(response.read()), indent=2))
+    except Exception as e:
+        print(f"Could not fetch service stats: {e}")
+
+    return 0 if statuses.get(200, 0) == len(payloads) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,7 +5,7 @@ Consolidates all subsidy eligibility logic into one module to ensure
 consistent calculations across:
 - contribution_strategies.py
 - contribution_eval/components/action_bar.py
-- contribution_eval/services/subsidy_service.py
+- contribution_eval/services/subsidy_service.py (is_subsidy_eligible_array)
 
 Key concepts:
 - LCSP (Lowest Cost Silver Plan): Used for IRS ICHRA affordability test
@@ -17,6 +17,8 @@ Key concepts:
 
 from typing import Dict, Any, Optional
 
+import numpy as np
+
 from constants import (
     ACA_AGE_CURVE,
     AFFORDABILITY_THRESHOLD_2026,
@@ -176,6 +178,56 @@ def calculate_monthly_subsidy(
     return max(0.0, benchmark - expected_contribution)
 
 
+def get_applicable_percentage_array(annual_income: np.ndarray, household_size: np.ndarray) -> np.ndarray:
+    """
+    Vectorized get_applicable_percentage() over parallel income/household arrays.
+
+    Same ACA sliding scale; non-positive or NaN income maps to 0.0.
+    """
+    annual_income = np.asarray(annual_income, dtype=np.float64)
+    fpl = FPL_2025_BASE + (np.maximum(np.asarray(household_size), 1) - 1) * FPL_2025_PER_ADDITIONAL
+    fpl_percentage = np.where(annual_income > 0, annual_income / fpl * 100, 0.0)
+
+    return np.select(
+        [
+            fpl_percentage <= 100,
+            fpl_percentage <= 150,
+            fpl_percentage <= 200,
+            fpl_percentage <= 250,
+        ],
+        [
+            0.0,
+            (fpl_percentage - 100) / 50 * 0.04,
+            0.04 + (fpl_percentage - 150) / 50 * 0.025,
+            0.065 + (fpl_percentage - 200) / 50 * 0.02,
+        ],
+        default=0.085,
+    )
+
+
+def calculate_monthly_subsidy_array(
+    slcsp: np.ndarray,
+    monthly_income: np.ndarray,
+    household_size: np.ndarray,
+    lcsp: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized calculate_monthly_subsidy().
+
+    NaN/zero SLCSP falls back to LCSP; missing income yields 0 subsidy.
+    """
+    slcsp = np.asarray(slcsp, dtype=np.float64)
+    lcsp = np.asarray(lcsp, dtype=np.float64)
+    monthly_income = np.nan_to_num(np.asarray(monthly_income, dtype=np.float64), nan=0.0)
+
+    benchmark = np.where(np.nan_to_num(slcsp, nan=0.0) > 0, slcsp, np.nan_to_num(lcsp, nan=0.0))
+    annual_income = monthly_income * 12
+    expected_contribution = annual_income * get_applicable_percentage_array(annual_income, household_size) / 12
+
+    subsidy = np.maximum(0.0, benchmark - expected_contribution)
+    return np.where((monthly_income > 0) & (benchmark > 0), subsidy, 0.0)
+
+
 # =============================================================================
 # AGE FACTOR
 # =============================================================================
@@ -363,6 +415,87 @@ def is_subsidy_eligible(
     return result
 
 
+# Reasons from is_subsidy_eligible(), indexed by is_subsidy_eligible_array()'s reason_code
+ELIGIBILITY_REASONS = (
+    'Medicare-eligible (65+) - cannot receive ACA subsidies',
+    'No income data - cannot determine eligibility',
+    'ICHRA is affordable - must accept (cannot access subsidies)',
+    'ICHRA unaffordable AND qualifies for ACA subsidy',
+    'ICHRA unaffordable but income too high for subsidy (above 400% FPL)',
+)
+
+
+def is_subsidy_eligible_array(
+    monthly_income: np.ndarray,
+    lcsp: np.ndarray,
+    contribution: np.ndarray,
+    age: np.ndarray,
+    slcsp: np.ndarray = None,
+    household_size: np.ndarray = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized is_subsidy_eligible() over parallel per-employee arrays.
+
+    Same checks in the same order; NaN or non-positive income means no
+    income data (the scalar's None).
+
+    Args:
+        monthly_income: Employee monthly income
+        lcsp: Lowest Cost Silver Plan premium (monthly)
+        contribution: Employer's monthly ICHRA contribution
+        age: Employee age
+        slcsp: SLCSP premium; NaN/zero falls back to LCSP (default: LCSP)
+        household_size: From FAMILY_STATUS_HOUSEHOLD_SIZE (default: 1)
+
+    Returns:
+        Dict of arrays with is_subsidy_eligible()'s keys plus reason_code
+        (index into ELIGIBILITY_REASONS); affordability_pct and
+        max_contribution_for_eligibility are NaN where the scalar gives None
+    """
+    monthly_income = np.asarray(monthly_income, dtype=np.float64)
+    lcsp = np.asarray(lcsp, dtype=np.float64)
+    contribution = np.asarray(contribution, dtype=np.float64)
+    age = np.asarray(age, dtype=np.float64)
+    slcsp = np.full_like(lcsp, np.nan) if slcsp is None else np.asarray(slcsp, dtype=np.float64)
+    household_size = np.ones(lcsp.shape, dtype=np.int64) if household_size is None else np.asarray(household_size)
+
+    is_medicare = age >= MEDICARE_ELIGIBILITY_AGE
+    has_income = ~is_medicare & (monthly_income > 0)
+    income = np.where(has_income, monthly_income, 1.0)  # placeholder keeps the divisions warning-free
+
+    employee_cost = np.where(has_income, np.maximum(0.0, lcsp - contribution), 0.0)
+    threshold_cost = income * AFFORDABILITY_THRESHOLD_2026
+    is_unaffordable = has_income & (employee_cost > threshold_cost)
+
+    max_contribution = lcsp - threshold_cost
+    max_for_elig = np.where(
+        has_income & (lcsp > 0) & (max_contribution >= 0),
+        np.maximum(0.0, max_contribution * AFFORDABILITY_BUFFER),
+        np.nan,
+    )
+
+    subsidy = calculate_monthly_subsidy_array(slcsp, np.where(has_income, monthly_income, 0.0), household_size, lcsp)
+    eligible = is_unaffordable & (subsidy > 0)
+
+    reason_code = np.select(
+        [is_medicare, ~has_income, ~is_unaffordable, eligible],
+        [0, 1, 2, 3],
+        default=4,
+    )
+
+    return {
+        'eligible': eligible,
+        'reason_code': reason_code,
+        'reason': np.array(ELIGIBILITY_REASONS, dtype=object)[reason_code],
+        'subsidy_amount': np.where(eligible, subsidy, 0.0),
+        'is_medicare': is_medicare,
+        'is_unaffordable': is_unaffordable,
+        'employee_cost': employee_cost,
+        'affordability_pct': np.where(has_income, employee_cost / income * 100, np.nan),
+        'max_contribution_for_eligibility': max_for_elig,
+    }
+
+
 # =============================================================================
 # BATCH ELIGIBILITY CHECK
 # =============================================================================
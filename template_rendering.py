@@ -0,0 +1,214 @@
+"""
+Template Rendering Service
+Process-wide Jinja2 environments and asset caches for the HTML/PDF reports.
+
+The Playwright renderers used to build a fresh Environment per renderer and
+re-read/re-encode the logo on every report. This module keeps that work out of
+the request path:
+
+Features:
+- One Environment per template directory, shared by every renderer instance,
+  so compiled templates stay in Jinja's in-memory cache between renders
+- Filesystem bytecode cache, so a restarted process skips template compilation
+- Content-addressed cache of base64-encoded file assets (the logo), re-hashed
+  only when the file changes
+- Per-section render timings (e.g. 'census_analysis.html', 'census_analysis.pdf')
+
+Environment:
+- JINJA_BYTECODE_CACHE_DIR: Bytecode cache directory (default: <tmp>/canopy_jinja_cache)
+"""
+
+import os
+import time
+import base64
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+DECORATIVES_DIR = Path(__file__).parent / 'decoratives'
+
+# Compiled templates kept in memory per environment
+TEMPLATE_CACHE_SIZE = 100
+
+# Encoded file assets kept in memory
+ASSET_CACHE_SIZE = 64
+
+_lock = threading.Lock()
+_environments: Dict[str, Environment] = {}
+_bytecode_cache: Optional[FileSystemBytecodeCache] = None
+
+# (path, mtime_ns, size) -> content digest
+_file_digests: Dict[tuple, str] = {}
+# (kind, content digest) -> encoded value
+_assets: 'OrderedDict[tuple, str]' = OrderedDict()
+
+# section -> {'count', 'total_seconds', 'last_seconds'}
+_timings: Dict[str, Dict[str, float]] = {}
+
+
+# =============================================================================
+# JINJA ENVIRONMENTS
+# =============================================================================
+
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Shared bytecode cache, or None if the cache directory is not writable."""
+    global _bytecode_cache
+    if _bytecode_cache is None:
+        cache_dir = Path(
+            os.getenv('JINJA_BYTECODE_CACHE_DIR')
+            or Path(tempfile.gettempdir()) / 'canopy_jinja_cache'
+        )
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        except OSError as e:
+            logger.warning(f"Jinja bytecode cache disabled: {e}")
+            return None
+    return _bytecode_cache
+
+
+def get_environment(
+    template_dir: Path,
+    filters: Optional[Dict[str, Callable]] = None,
+) -> Environment:
+    """
+    Get the shared Jinja2 environment for a template directory.
+
+    The environment is created once per process; later calls return the same
+    instance, so templates compiled by one renderer are reused by the next.
+    Templates still reload if their file changes on disk.
+
+    Args:
+        template_dir: Template directory (e.g. templates/census_analysis)
+        filters: Custom filters to register (idempotent)
+
+    Returns:
+        Jinja2 Environment
+    """
+    key = str(Path(template_dir).resolve())
+    with _lock:
+        env = _environments.get(key)
+        if env is None:
+            env = Environment(
+                loader=FileSystemLoader(key),
+                autoescape=False,  # We control the HTML, no XSS risk
+                bytecode_cache=_get_bytecode_cache(),
+                cache_size=TEMPLATE_CACHE_SIZE,
+            )
+            _environments[key] = env
+        if filters:
+            env.filters.update(filters)
+    return env
+
+
+# =============================================================================
+# ASSET CACHE
+# =============================================================================
+
+def _cached_asset(kind: str, digest: str, encode: Callable[[], str]) -> str:
+    """Look up an encoded asset by content digest, encoding it on a miss."""
+    key = (kind, digest)
+    with _lock:
+        if key in _assets:
+            _assets.move_to_end(key)
+            return _assets[key]
+
+    value = encode()
+
+    with _lock:
+        _assets[key] = value
+        while len(_assets) > ASSET_CACHE_SIZE:
+            _assets.popitem(last=False)
+    return value
+
+
+def _read_asset(path: Path) -> tuple:
+    """Return (digest, bytes or None) for a file, hashing it only when it changes."""
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        digest = _file_digests.get(key)
+    if digest is not None:
+        return digest, None
+
+    content = path.read_bytes()
+    digest = hashlib.sha1(content).hexdigest()
+    with _lock:
+        _file_digests[key] = digest
+    return digest, content
+
+
+def load_base64_asset(path: Path) -> str:
+    """
+    Load an image file as a base64 string, cached by content.
+
+    Returns:
+        Base64 string, or "" if the file is missing or unreadable
+    """
+    try:
+        path = Path(path)
+        if not path.exists():
+            return ""
+        digest, content = _read_asset(path)
+        return _cached_asset(
+            'base64', digest,
+            lambda: base64.b64encode(content if content is not None else path.read_bytes()).decode('utf-8')
+        )
+    except Exception as e:
+        logger.warning(f"Could not load asset {path}: {e}")
+        return ""
+
+
+def load_logo_base64() -> str:
+    """Load the Glove logo and return as base64 string."""
+    return load_base64_asset(DECORATIVES_DIR / 'glove_logo.png')
+
+
+# =============================================================================
+# RENDER TIMINGS
+# =============================================================================
+
+@contextmanager
+def timed_section(section: str):
+    """Record the wall time of a render step under `section`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            stats = _timings.setdefault(section, {'count': 0, 'total_seconds': 0.0, 'last_seconds': 0.0})
+            stats['count'] += 1
+            stats['total_seconds'] += elapsed
+            stats['last_seconds'] = elapsed
+        logger.debug(f"Rendered {section} in {elapsed * 1000:.1f} ms")
+
+
+def get_render_timings() -> Dict[str, Dict[str, float]]:
+    """
+    Get render timings per section.
+
+    Returns:
+        {section: {'count', 'total_seconds', 'last_seconds', 'avg_seconds'}}
+    """
+    with _lock:
+        return {
+            section: {**stats, 'avg_seconds': stats['total_seconds'] / stats['count']}
+            for section, stats in _timings.items()
+        }
+
+
+def reset_render_timings() -> None:
+    """Clear recorded render timings."""
+    with _lock:
+        _timings.clear()
@@ -0,0 +1,200 @@
+-- Fixture database for tests/test_query_plans.py
+--
+-- Creates the plan, rate, rating-area and ZIP tables read by PlanQueries,
+-- FinancialQueries and PlanComparisonQueries (only the columns those queries
+-- use) and fills them with synthetic 2026 data: 4 states x 60 plans, 10 rating
+-- areas per state and one rate per plan, rating area and age band (~120K rate
+-- rows). Table and column names match production; indexes come from migrations/.
+--
+-- rating_area_numeric is created here because production already had it before
+-- migrations/001 (002 adds it with ADD COLUMN IF NOT EXISTS).
+
+CREATE TABLE rbis_insurance_plan_20251019202724 (
+    hios_plan_id varchar(14) NOT NULL,
+    plan_marketing_name text,
+    plan_type text,
+    level_of_coverage text,
+    market_coverage text,
+    plan_effective_date date,
+    plan_expiration_date date,
+    network_id text,
+    service_area_id text,
+    formulary_id text
+);
+
+CREATE TABLE rbis_insurance_plan_base_rates_20251019202724 (
+    plan_id varchar(14) NOT NULL,
+    rating_area_id text,
+    age text,
+    individual_rate numeric,
+    tobacco text,
+    rate_effective_date date,
+    rate_expiration_date date,
+    market_coverage text,
+    rating_area_numeric integer GENERATED ALWAYS AS (
+        CASE
+            WHEN rating_area_id ~ '^Rating Area [0-9]+$'
+            THEN (REGEXP_REPLACE(rating_area_id, '[^0-9]', '', 'g'))::integer
+        END
+    ) STORED
+);
+
+CREATE TABLE rbis_insurance_plan_variant_20251019202724 (
+    hios_plan_id varchar(14) NOT NULL,
+    csr_variation_type text,
+    hsa_eligible text,
+    issuer_actuarial_value text,
+    av_calculator_output_number text
+);
+
+CREATE TABLE rbis_insurance_plan_variant_ddctbl_moop_20251019202724 (
+    plan_id varchar(14) NOT NULL,
+    variant_component text,
+    network_type text,
+    moop_ded_type text,
+    individual_ded_moop_amount text,
+    family_ded_moop_per_person text,
+    family_ded_moop_per_group text
+);
+
+CREATE TABLE rbis_insurance_plan_benefit_cost_share_20251019202724 (
+    hios_plan_id varchar(14) NOT NULL,
+    csr_variation_type text,
+    network_type text,
+    benefit text,
+    co_payment text,
+    co_insurance text
+);
+
+CREATE TABLE "HIOS_issuers_pivoted" (
+    hios_issuer_id text,
+    marketingname text,
+    issr_lgl_name text
+);
+
+CREATE TABLE rbis_state_rating_area_amended (
+    state_code text,
+    county text,
+    rating_area_id integer,
+    market text,
+    "FIPS" text
+);
+
+CREATE TABLE rbis_state_rating_area_20251019202724 (
+    state text,
+    three_digit_zip text,
+    county text,
+    rating_area_id text,
+    market text
+);
+
+CREATE TABLE zip_to_county_correct (
+    "ZIP" text,
+    "State" text,
+    "County FIPS code" text,
+    "USPS Default City for ZIP" text
+);
+
+
+-- ============================================================================
+-- Synthetic data
+-- ============================================================================
+
+CREATE TEMPORARY TABLE fixture_states (state_code text, state_name text, fips_prefix text, zip_prefix integer);
+INSERT INTO fixture_states VALUES
+    ('WI', 'Wisconsin', '55', 530),
+    ('IL', 'Illinois', '17', 600),
+    ('NC', 'North Carolina', '37', 270),
+    ('TX', 'Texas', '48', 750);
+
+-- 60 plans per state from 6 issuers
+INSERT INTO rbis_insurance_plan_20251019202724
+SELECT
+    LPAD((10000 + (n % 6) * 1000 + s.fips_prefix::integer)::text, 5, '0') || s.state_code || LPAD(n::text, 7, '0'),
+    s.state_code || ' Plan ' || n,
+    (ARRAY['HMO', 'PPO', 'EPO', 'POS'])[1 + n % 4],
+    (ARRAY['Bronze', 'Expanded Bronze', 'Silver', 'Gold', 'Platinum'])[1 + n % 5],
+    'Individual',
+    DATE '2026-01-01',
+    DATE '2026-12-31',
+    s.state_code || 'N' || (n % 6),
+    s.state_code || 'S' || (n % 6),
+    s.state_code || 'F' || (n % 6)
+FROM fixture_states s, generate_series(1, 60) AS n;
+
+INSERT INTO "HIOS_issuers_pivoted"
+SELECT DISTINCT SUBSTRING(hios_plan_id, 1, 5), 'Issuer ' || SUBSTRING(hios_plan_id, 1, 5), 'Issuer ' || SUBSTRING(hios_plan_id, 1, 5) || ' Inc'
+FROM rbis_insurance_plan_20251019202724;
+
+-- Rates for 10 rating areas and ages 0-14, 15-63, 64 and over; a few malformed area IDs
+INSERT INTO rbis_insurance_plan_base_rates_20251019202724
+    (plan_id, rating_area_id, age, individual_rate, tobacco, rate_effective_date, rate_expiration_date, market_coverage)
+SELECT
+    p.hios_plan_id,
+    'Rating Area ' || ra,
+    CASE WHEN a = 14 THEN '0-14' WHEN a = 64 THEN '64 and over' ELSE a::text END,
+    round((300 + a * 9 + ra * 3 + (RIGHT(p.hios_plan_id, 3)::integer % 17) * 11)::numeric, 2),
+    'No Preference',
+    DATE '2026-01-01',
+    DATE '2026-12-31',
+    'Individual'
+FROM rbis_insurance_plan_20251019202724 p, generate_series(1, 10) AS ra, generate_series(14, 64) AS a;
+
+INSERT INTO rbis_insurance_plan_base_rates_20251019202724
+    (plan_id, rating_area_id, age, individual_rate, tobacco, rate_effective_date, rate_expiration_date, market_coverage)
+SELECT hios_plan_id, 'Statewide', '21', 400, 'No Preference', DATE '2026-01-01', DATE '2026-12-31', 'Individual'
+FROM rbis_insurance_plan_20251019202724
+WHERE RIGHT(hios_plan_id, 1) = '7';
+
+INSERT INTO rbis_insurance_plan_variant_20251019202724
+SELECT p.hios_plan_id, v.csr, CASE WHEN p.plan_type = 'HMO' THEN 'Yes' ELSE 'No' END, '0.' || (60 + RIGHT(p.hios_plan_id, 2)::integer % 30), NULL
+FROM rbis_insurance_plan_20251019202724 p,
+    (VALUES ('Exchange variant (no CSR)'), ('Non-Exchange variant'), ('73 percent AV Level Silver Plan')) AS v(csr);
+
+INSERT INTO rbis_insurance_plan_variant_ddctbl_moop_20251019202724
+SELECT p.hios_plan_id, v.component, n.network, t.moop_ded_type, t.amount, t.amount, (t.amount::integer * 2)::text
+FROM rbis_insurance_plan_20251019202724 p,
+    (VALUES ('Exchange variant (no CSR)'), ('Non-Exchange variant')) AS v(component),
+    (VALUES ('In Network'), ('Out of Network')) AS n(network),
+    (VALUES
+        ('Medical EHB Deductible', '3000'),
+        ('Drug EHB Deductible', '500'),
+        ('Combined Medical and Drug EHB Deductible', '3500'),
+        ('Maximum Out of Pocket for Medical and Drug EHB Benefits (Total)', '9200')
+    ) AS t(moop_ded_type, amount);
+
+INSERT INTO rbis_insurance_plan_benefit_cost_share_20251019202724
+SELECT p.hios_plan_id, v.csr, n.network, b.benefit, b.copay, b.coinsurance
+FROM rbis_insurance_plan_20251019202724 p,
+    (VALUES ('Exchange variant (no CSR)'), ('Non-Exchange variant')) AS v(csr),
+    (VALUES ('In Network'), ('Out of Network')) AS n(network),
+    (VALUES
+        ('Primary Care Visit to Treat an Injury or Illness', '$30', 'Not Applicable'),
+        ('Specialist Visit', '$60', 'Not Applicable'),
+        ('Generic Drugs', '$10', 'Not Applicable'),
+        ('Preferred Brand Drugs', '$50', 'Not Applicable'),
+        ('Non-Preferred Brand Drugs', '$100', 'Not Applicable'),
+        ('Specialty Drugs', 'No Charge', '40%'),
+        ('Emergency Room Services', '$500', '20%'),
+        ('Urgent Care Centers or Facilities', '$75', 'Not Applicable'),
+        ('Inpatient Hospital Services (e.g., Hospital Stay)', 'No Charge', '30%'),
+        ('Outpatient Facility Fee (e.g., Ambulatory Surgery Center)', 'No Charge', '30%'),
+        ('Mental/Behavioral Health Outpatient Services', '$30', 'Not Applicable'),
+        ('Routine Dental Services (Adult)', 'Not Covered', 'Not Covered')
+    ) AS b(benefit, copay, coinsurance);
+
+-- 30 counties per state, 3 per rating area
+INSERT INTO rbis_state_rating_area_amended
+SELECT s.state_code, s.state_code || ' County ' || c, 1 + (c - 1) / 3, m.market, s.fips_prefix || LPAD((c * 2 - 1)::text, 3, '0')
+FROM fixture_states s, generate_series(1, 30) AS c, (VALUES ('Individual'), ('Small Group')) AS m(market);
+
+INSERT INTO rbis_state_rating_area_20251019202724
+SELECT s.state_name, (s.zip_prefix + c % 10)::text, s.state_code || ' County ' || c, 'Rating Area ' || (1 + (c - 1) / 3), m.market
+FROM fixture_states s, generate_series(1, 30) AS c, (VALUES ('Individual'), ('Small Group')) AS m(market);
+
+-- 20 ZIPs per county
+INSERT INTO zip_to_county_correct
+SELECT LPAD((s.zip_prefix * 100 + c * 3 + z)::text, 5, '0'), s.state_code, s.fips_prefix || LPAD((c * 2 - 1)::text, 3, '0'), 'City ' || c
+FROM fixture_states s, generate_series(1, 30) AS c, generate_series(1, 20) AS z;
+
+DROP TABLE fixture_states;
@@ -0,0 +1,46 @@
+"""
+Shared fixtures for the ICHRA Calculator test suites.
+
+Builders used by more than one test module live here rather than in the
+modules themselves, so no test imports another test's private helpers.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def make_census(n: int, seed: int = 7):
+    """
+    Synthetic NC census and strategy cache for n employees.
+
+    Every fifth employee has no income and every third no SLCSP.
+
+    Returns:
+        (census_df, {employee_id: cached plan/benchmark fields})
+    """
+    rng = np.random.default_rng(seed)
+    statuses = ['EE', 'ES', 'EC', 'F']
+    rows, cache = [], {}
+    for i in range(n):
+        emp_id = f"E{i:03d}"
+        age = int(rng.integers(21, 70))
+        income = float(rng.integers(1500, 9000)) if i % 5 else None
+        rows.append({
+            'employee_id': emp_id,
+            'first_name': 'Test',
+            'last_name': f"Employee {i}",
+            'age': age,
+            'family_status': statuses[i % 4],
+            'state': 'NC',
+            'monthly_income': income,
+        })
+        lcsp = round(250 + age * 9.5 + float(rng.integers(0, 80)), 2)
+        cache[emp_id] = {
+            'lcsp_ee_rate': lcsp,
+            'slcsp_ee_rate': lcsp + 25 if i % 3 else None,
+            'state': 'NC',
+            'rating_area': 1,
+            'family_status': statuses[i % 4],
+            'ee_age': age,
+        }
+    return pd.DataFrame(rows), cache
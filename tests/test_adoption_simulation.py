@@ -0,0 +1,173 @@
+"""
+Test Suite for Monte Carlo Adoption Simulation - ICHRA Calculator
+
+Checks that simulate_adoption() is reproducible for a seed, that its means
+match the analytic expectation of the adoption mix, and that waivers, PTC
+opt-outs, Medicare eligibility and unpriced options are handled.
+
+Run with: python -m pytest tests/test_adoption_simulation.py
+"""
+
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from adoption_simulation import (
+    AdoptionInputs,
+    allowance_costs,
+    inputs_from_multi_metal,
+    premium_share_costs,
+    simulate_adoption,
+)
+from subsidy_utils import calculate_monthly_subsidy_array
+
+OPTIONS = ('Cooperative', 'ICHRA Bronze', 'ICHRA Silver', 'ICHRA Gold')
+RATES = {'Cooperative': 70, 'ICHRA Silver': 20, 'ICHRA Gold': 10}
+
+
+def _inputs(n, seed=5, income=None, lcsp_ratio=0.6):
+    rng = np.random.default_rng(seed)
+    silver = rng.uniform(300, 900, n).round(2)
+    return AdoptionInputs(
+        employee_ids=np.array([f"E{i}" for i in range(n)], dtype=object),
+        options=OPTIONS,
+        premiums=np.column_stack([silver * 0.72, silver * 0.8, silver, silver * 1.2]),
+        employer_paid=np.array([True, False, False, False]),
+        lcsp=silver * lcsp_ratio,
+        slcsp=np.full(n, np.nan),
+        monthly_income=np.full(n, 9000.0) if income is None else np.asarray(income, dtype=float),
+        age=rng.integers(21, 64, n),
+        household_size=np.ones(n, dtype=int),
+    )
+
+
+class TestSimulateAdoption(unittest.TestCase):
+    """simulate_adoption() statistics"""
+
+    def test_same_seed_same_results(self):
+        inputs = _inputs(200)
+        strategies = {'share': premium_share_costs(inputs, 0.65)}
+        first = simulate_adoption(inputs, strategies, RATES, draws=500, seed=7)
+        second = simulate_adoption(inputs, strategies, RATES, draws=500, seed=7)
+        other = simulate_adoption(inputs, strategies, RATES, draws=500, seed=8)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first['share']['employer_monthly'], other['share']['employer_monthly'])
+
+    def test_mean_matches_expected_mix(self):
+        inputs = _inputs(300)
+        costs = premium_share_costs(inputs, 0.65)
+        result = simulate_adoption(inputs, {'share': costs}, RATES, draws=4000, seed=1,
+                                   waive_rate=0.1, ptc_opt_out_rate=0.0)['share']
+
+        enrollable = inputs.age < 65
+        mix = np.array([0.7, 0.0, 0.2, 0.1])
+        expected = 0.9 * (costs[enrollable] @ mix).sum()
+        self.assertAlmostEqual(result['employer_monthly']['mean'], expected, delta=expected * 0.01)
+        self.assertLessEqual(result['employer_monthly']['p10'], result['employer_monthly']['p50'])
+        self.assertLessEqual(result['employer_monthly']['p50'], result['employer_monthly']['p90'])
+        self.assertEqual(result['by_option']['ICHRA Bronze'], 0.0)
+        self.assertAlmostEqual(result['waived']['mean'], 0.1 * enrollable.sum(), delta=3)
+
+    def test_everyone_waives(self):
+        inputs = _inputs(50)
+        result = simulate_adoption(inputs, {'share': premium_share_costs(inputs, 0.65)}, RATES,
+                                   draws=100, seed=1, waive_rate=1.0)['share']
+        self.assertEqual(result['employer_monthly']['p90'], 0.0)
+        self.assertEqual(result['enrolled']['mean'], 0.0)
+
+    def test_unpriced_options_are_never_chosen(self):
+        inputs = _inputs(40)
+        inputs.premiums[:, 0] = np.nan  # No Cooperative pricing
+        result = simulate_adoption(inputs, {'share': premium_share_costs(inputs, 0.65)}, RATES,
+                                   draws=500, seed=3, waive_rate=0.0)['share']
+        self.assertEqual(result['by_option']['Cooperative'], 0.0)
+        self.assertEqual(result['enrolled']['mean'], 40)
+        # Silver and Gold keep their 2:1 ratio
+        ratio = result['by_option']['ICHRA Silver'] / result['by_option']['ICHRA Gold']
+        self.assertAlmostEqual(ratio, 2.0, delta=0.15)
+
+    def test_medicare_eligible_not_enrolled(self):
+        inputs = _inputs(10)
+        inputs.age[:4] = 65
+        result = simulate_adoption(inputs, {'share': premium_share_costs(inputs, 0.65)}, RATES,
+                                   draws=50, seed=3, waive_rate=0.0)['share']
+        self.assertEqual(result['enrolled']['p50'], 6)
+
+    def test_unaffordable_allowance_opts_out_to_ptc(self):
+        # Low income, expensive benchmark and a small allowance: subsidy beats the ICHRA
+        inputs = _inputs(20, income=np.full(20, 2500.0), lcsp_ratio=1.0)
+        strategies = {'small': allowance_costs(inputs, 50), 'generous': allowance_costs(inputs, 5000)}
+        results = simulate_adoption(inputs, strategies, RATES, draws=200, seed=2,
+                                    waive_rate=0.0, ptc_opt_out_rate=1.0)
+        self.assertEqual(results['small']['opted_out_ptc']['mean'], 20)
+        self.assertEqual(results['small']['employer_monthly']['p90'], 0.0)
+        self.assertEqual(results['generous']['opted_out_ptc']['mean'], 0)
+
+    def test_family_affordability_uses_self_only_lcsp(self):
+        # Employee + family: $450 self-only LCSP, $1,800 Silver tier, $4,000/month income
+        inputs = _inputs(1, income=[4000.0])
+        inputs.premiums = np.array([[1296.0, 1440.0, 1800.0, 2160.0]])
+        inputs.lcsp = np.array([450.0])
+        inputs.age = np.array([40])
+        inputs.household_size = np.array([4])
+        strategies = {'affordable': allowance_costs(inputs, 400), 'none': allowance_costs(inputs, 0)}
+        results = simulate_adoption(inputs, strategies, RATES, draws=50, seed=3,
+                                    waive_rate=0.0, ptc_opt_out_rate=1.0)
+
+        # $50 self-only cost is under 9.96% of income: the ICHRA is affordable, no credit
+        self.assertEqual(results['affordable']['opted_out_ptc']['mean'], 0)
+        # With no allowance the credit covers the family's Silver tier, not the self-only plan
+        subsidy = calculate_monthly_subsidy_array(np.array([np.nan]), inputs.monthly_income,
+                                                  inputs.household_size, np.array([1800.0]))[0]
+        self.assertGreater(subsidy, 450.0)
+        self.assertEqual(results['none']['opted_out_ptc']['mean'], 1)
+        self.assertAlmostEqual(results['none']['employee_monthly']['p50'], 1800.0 - subsidy)
+
+    def test_rejects_mismatched_strategy(self):
+        inputs = _inputs(5)
+        with self.assertRaises(ValueError):
+            simulate_adoption(inputs, {'bad': np.zeros((5, 2))}, RATES, draws=10)
+
+    def test_10k_draws_2000_employees_timing(self):
+        inputs = _inputs(2000)
+        start = time.perf_counter()
+        simulate_adoption(inputs, {'share': premium_share_costs(inputs, 0.65)}, RATES, draws=10_000, seed=1)
+        elapsed = time.perf_counter() - start
+        # ~1s on a laptop; lenient bound for shared CI runners
+        self.assertLess(elapsed, 6.0)
+
+
+class TestInputsFromMultiMetal(unittest.TestCase):
+    """inputs_from_multi_metal() alignment"""
+
+    def test_builds_aligned_arrays(self):
+        def details(rate_scale):
+            return [
+                {'employee_id': 'A1', 'family_status': 'EE', 'ee_age': 30, 'lcp_ee_rate': 400.0,
+                 'estimated_tier_premium': 400.0 * rate_scale},
+                {'employee_id': 'A2', 'family_status': 'F', 'ee_age': 45, 'lcp_ee_rate': 0,
+                 'estimated_tier_premium': 0},
+            ]
+        results = {'Bronze': {'employee_details': details(0.8)}, 'Silver': {'employee_details': details(1.0)},
+                   'Gold': {'employee_details': details(1.2)}}
+        census = pd.DataFrame({'employee_id': ['A2', 'A1'], 'monthly_income': ['$3,000', '4500']})
+
+        inputs = inputs_from_multi_metal(results, census, cooperative_ratio=0.5)
+        self.assertEqual(inputs.options, OPTIONS)
+        np.testing.assert_allclose(inputs.premiums[0], [200.0, 320.0, 400.0, 480.0])
+        self.assertTrue(np.isnan(inputs.premiums[1]).all())
+        np.testing.assert_allclose(inputs.monthly_income, [4500.0, 3000.0])
+        self.assertEqual(list(inputs.household_size), [1, 4])
+
+        coop = inputs_from_multi_metal(results, census, cooperative_premiums={'A1': 310.0, 'A2': 900.0})
+        np.testing.assert_allclose(coop.premiums[:, 0], [310.0, 900.0])
+
+    def test_requires_employee_details(self):
+        with self.assertRaises(ValueError):
+            inputs_from_multi_metal({'Silver': {'employee_details': []}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Test Suite for ALE Affordability Solver - ICHRA Calculator
+
+Run with: python -m pytest tests/test_affordability_solver.py
+"""
+
+import unittest
+
+from contribution_eval import SafeHarborType
+from contribution_eval.services.strategy_service import StrategyService
+from contribution_eval.services.affordability_solver import ALL_EMPLOYEES_CLASS
+from tests.helpers import make_census
+
+
+class TestAffordabilitySolver(unittest.TestCase):
+    """Solved bases are compliant and minimal"""
+
+    def setUp(self):
+        census_df, cache = make_census(60)
+        census_df['state'] = ['NC' if i % 2 else 'SC' for i in range(len(census_df))]
+        self.service = StrategyService(None, census_df, cache)
+
+    def _all_affordable(self, strategy_type, base, safe_harbor):
+        result = self.service.calculate_strategy(
+            strategy_type=strategy_type,
+            base_contribution=base,
+            lcsp_percentage=base,
+        )
+        result = self.service.calculate_with_affordability(result, safe_harbor)
+        return result['affordability']['all_affordable']
+
+    def test_minimum_bases_are_compliant_and_tight(self):
+        for safe_harbor in (SafeHarborType.FPL, SafeHarborType.RATE_OF_PAY):
+            solutions = self.service.solve_minimum_bases(safe_harbor)[ALL_EMPLOYEES_CLASS]
+            for strategy_type in ('base_age_curve', 'percentage_lcsp'):
+                minimum = solutions[strategy_type].minimum_base
+                label = f"{strategy_type} / {safe_harbor.value}"
+                self.assertTrue(self._all_affordable(strategy_type, minimum, safe_harbor), label)
+                if safe_harbor == SafeHarborType.FPL:
+                    # Rate of Pay results are rescued by the ALE auto-bump, so only FPL is tight
+                    self.assertFalse(self._all_affordable(strategy_type, minimum - 1, safe_harbor), label)
+
+    def test_binding_employee_sets_the_base(self):
+        solution = self.service.solve_minimum_bases(SafeHarborType.FPL)[ALL_EMPLOYEES_CLASS]['base_age_curve']
+        top = solution.binding_employees[0]
+        self.assertAlmostEqual(top['required_base'], solution.exact_base, places=2)
+        self.assertEqual(solution.employees_considered, 60)
+
+    def test_per_class_solutions(self):
+        by_state = self.service.solve_minimum_bases(SafeHarborType.FPL, class_column='state')
+        overall = self.service.solve_minimum_bases(SafeHarborType.FPL)[ALL_EMPLOYEES_CLASS]
+        self.assertEqual(set(by_state), {'NC', 'SC'})
+        self.assertEqual(
+            max(by_state[s]['flat_amount'].exact_base for s in by_state),
+            overall['flat_amount'].exact_base,
+        )
+        self.assertEqual(sum(by_state[s]['flat_amount'].employees_considered for s in by_state), 60)
+
+    def test_ale_strategies_all_affordable(self):
+        results = self.service._calculate_ale_strategies(SafeHarborType.FPL)
+        for result in results:
+            self.assertTrue(result['affordability']['all_affordable'], result['strategy_type'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Test Suite for Batch Processing - ICHRA Calculator
+
+Runs the batch pipeline in-process with the database-backed steps (census
+parse, LCSP lookup, multi-metal scenario) replaced by fixtures, and checks
+the exports and manifest.
+
+Run with: python -m pytest tests/test_batch_processing.py
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from batch_processing import BatchConfig, build_strategy_config, client_name_from_path, run_batch
+from contribution_strategies import ContributionStrategyCalculator, StrategyType
+from financial_calculator import FinancialSummaryCalculator
+from tests.helpers import make_census
+from utils import CensusProcessor
+
+
+class TestBatchConfig(unittest.TestCase):
+    """Config entries are validated before any client runs"""
+
+    def test_strategy_config(self):
+        config = build_strategy_config({'strategy_type': 'flat_amount', 'flat_amount': 450})
+        self.assertEqual(config.strategy_type, StrategyType.FLAT_AMOUNT)
+        self.assertEqual(config.flat_amount, 450)
+
+    def test_rejects_unknown_names(self):
+        with self.assertRaises(ValueError):
+            build_strategy_config({'strategy_type': 'not_a_strategy'})
+        with self.assertRaises(ValueError):
+            build_strategy_config({'strategy_type': 'flat_amount', 'flat_amout': 450})
+        with self.assertRaises(ValueError):
+            BatchConfig(outputs=['csv', 'xlsx'])
+
+    def test_client_name_from_path(self):
+        self.assertEqual(client_name_from_path(Path('acme_corp_census.csv')), 'acme corp')
+        self.assertEqual(client_name_from_path(Path('Beta-Census.CSV')), 'Beta')
+
+
+class TestRunBatch(unittest.TestCase):
+    """A batch writes one export per strategy and a manifest entry per client"""
+
+    def test_pipeline_and_manifest(self):
+        census_df, cache = make_census(12)
+        multi_metal = {
+            'Silver': {'employee_details': [
+                {'employee_id': emp_id, 'lcp_ee_rate': c['lcsp_ee_rate'], 'lcp_plan_name': 'Silver HMO'}
+                for emp_id, c in cache.items()
+            ]},
+        }
+        config = BatchConfig(strategies=[
+            {'strategy_type': 'flat_amount', 'flat_amount': 400},
+            {'strategy_type': 'percentage_lcsp', 'lcsp_percentage': 80},
+        ])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            census_dir = Path(tmp) / 'censuses'
+            census_dir.mkdir()
+            (census_dir / 'acme_census.csv').write_text('Employee Number,Home Zip\n1,27601\n')
+            (census_dir / 'broken_census.csv').write_text('Employee Number,Home Zip\n1,27601\n')
+            (census_dir / 'notes.txt').write_text('not a census')
+
+            def parse(census_raw, db):
+                if parse.calls:
+                    raise ValueError("Missing required columns: EE DOB")
+                parse.calls += 1
+                return census_df, pd.DataFrame(columns=['employee_id', 'relationship', 'age'])
+            parse.calls = 0
+
+            with patch.object(CensusProcessor, 'parse_new_census_format', side_effect=parse), \
+                    patch.object(FinancialSummaryCalculator, 'calculate_multi_metal_scenario', return_value=multi_metal), \
+                    patch.object(ContributionStrategyCalculator, '_get_employee_lcsps', return_value=cache), \
+                    patch('database.create_database_connection', return_value=None):
+                manifest = run_batch(census_dir, config, Path(tmp) / 'out', workers=1)
+
+            self.assertEqual((manifest['clients_ok'], manifest['clients_failed']), (1, 1))
+            acme, broken = manifest['clients']
+            self.assertEqual(acme['client_name'], 'acme')
+            self.assertEqual(acme['employees'], 12)
+            self.assertEqual([s['strategy_type'] for s in acme['strategies']], ['flat_amount', 'percentage_lcsp'])
+            self.assertIn('parse_census', acme['timings'])
+            self.assertIn('Missing required columns', broken['error'])
+
+            export = pd.read_csv(acme['outputs']['csv'])
+            self.assertEqual(len(export), 12)
+            self.assertAlmostEqual(export['monthly_contribution'].sum(), acme['strategies'][0]['total_monthly'], places=2)
+            self.assertEqual(set(export['silver_plan_name']), {'Silver HMO'})
+            self.assertTrue(Path(acme['outputs']['csv_2']).exists())
+
+            with open(Path(tmp) / 'out' / 'manifest.json') as f:
+                self.assertEqual(json.load(f)['clients_ok'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Test Suite for Bounded LRU - ICHRA Calculator
+
+Checks that BoundedLRU evicts the least recently used entries, that reads
+refresh recency, and that hits and misses are counted.
+
+Run with: python -m pytest tests/test_bounded_lru.py
+"""
+
+import unittest
+
+from bounded_lru import BoundedLRU
+
+
+class TestBoundedLRU(unittest.TestCase):
+    """BoundedLRU eviction and counters"""
+
+    def test_evicts_least_recently_used(self):
+        lru = BoundedLRU(max_entries=2)
+        lru.put('a', 1)
+        lru.put('b', 2)
+        self.assertEqual(lru.get('a'), 1)  # 'b' is now the oldest
+        lru.put('c', 3)
+        self.assertNotIn('b', lru)
+        self.assertEqual(lru.get_many(['a', 'b', 'c']), {'a': 1, 'c': 3})
+        self.assertEqual(len(lru), 2)
+
+    def test_stats_and_clear(self):
+        lru = BoundedLRU(max_entries=10)
+        lru.put_many({'a': None, 'b': 2})
+        self.assertIsNone(lru.get('a', default='missing'))
+        self.assertEqual(lru.get('z', default='missing'), 'missing')
+        lru.get_many(['b', 'y'])
+        self.assertEqual(lru.stats(), {'entries': 2, 'max_entries': 10, 'hits': 2, 'misses': 2, 'hit_rate': 0.5})
+
+        lru.clear()
+        self.assertEqual(lru.stats()['entries'], 0)
+        self.assertEqual(lru.stats()['hits'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Test Suite for Census Schema Enforcement - ICHRA Calculator
+
+Checks that enforce_census_schema() stores the canonical columns compactly
+without changing the values consumers read, and leaves columns it can't
+convert losslessly untouched.
+
+Run with: python -m pytest tests/test_census_schema.py
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from census_schema import enforce_census_schema, parse_currency_series
+from financial_calculator import FinancialSummaryCalculator
+
+
+def make_census(n=400):
+    rng = np.random.default_rng(3)
+    return pd.DataFrame({
+        'employee_id': [f'E{i}' for i in range(n)],
+        'first_name': [f'Name{i}' for i in range(n)],
+        'age': rng.integers(21, 65, n).astype(float),
+        'dob': ['1985-03-14'] * n,
+        'state': rng.choice(['NC', 'GA', 'TX'], n),
+        'county': rng.choice(['Wake', 'Fulton', 'Travis'], n),
+        'zip_code': rng.choice(['27601', '30301', '73301'], n),
+        'rating_area_id': rng.choice(['4', '1', 'Rating Area 6'], n),
+        'family_status': rng.choice(['EE', 'ES', 'EC', 'F'], n),
+        'current_ee_monthly': rng.choice(['$1,200.50', '300', None], n),
+        'current_er_monthly': rng.uniform(100, 900, n),
+        'monthly_income': [None] * n,
+    })
+
+
+class TestEnforceCensusSchema(unittest.TestCase):
+    """Canonical columns get compact dtypes with the same values"""
+
+    def test_dtypes_and_values(self):
+        census = make_census()
+        out, report = enforce_census_schema(census)
+
+        self.assertEqual(out['age'].dtype, 'int16')
+        self.assertEqual(out['rating_area_id'].dtype, 'int16')
+        for column in ('state', 'county', 'zip_code', 'family_status'):
+            self.assertIsInstance(out[column].dtype, pd.CategoricalDtype, column)
+        self.assertEqual(out['current_ee_monthly'].dtype, 'float64')
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(out['dob_date']))
+
+        # Values read back the same
+        self.assertEqual(out['age'].tolist(), census['age'].astype(int).tolist())
+        self.assertEqual(out['state'].tolist(), census['state'].tolist())
+        self.assertEqual(set(out['rating_area_id']), {1, 4, 6})
+        self.assertEqual(out['current_ee_monthly'].dropna().max(), 1200.5)
+        self.assertIsInstance(out.to_dict('records')[0]['age'], int)
+        # Wide enough for rating-factor arithmetic on older ages
+        self.assertEqual((out['age'] * 3).max(), census['age'].max() * 3)
+
+        # Input untouched
+        self.assertEqual(census['age'].dtype, 'float64')
+        self.assertGreater(report.saved_bytes, 0)
+        self.assertGreater(report.reduction, 1.0)
+
+    def test_lossy_columns_are_skipped(self):
+        census = make_census(10)
+        census.loc[0, 'age'] = np.nan
+        census.loc[1, 'state'] = None
+        census.loc[2, 'rating_area_id'] = 'unknown'
+        out, report = enforce_census_schema(census)
+
+        self.assertEqual(out['age'].dtype, 'float64')
+        self.assertNotIsInstance(out['state'].dtype, pd.CategoricalDtype)
+        self.assertEqual(out['rating_area_id'].tolist(), census['rating_area_id'].tolist())
+        # All-blank money column keeps its None values
+        self.assertIsNone(out['monthly_income'].iloc[0])
+        self.assertIn('age', report.skipped)
+        self.assertIn('monthly_income', report.skipped)
+
+    def test_category_counts_have_no_empty_rows(self):
+        census = make_census()
+        census = census[census['family_status'] != 'EC']
+        out, _ = enforce_census_schema(census)
+        self.assertEqual(
+            out['family_status'].value_counts().to_dict(),
+            census['family_status'].value_counts().to_dict(),
+        )
+
+    def test_empty(self):
+        out, report = enforce_census_schema(pd.DataFrame())
+        self.assertTrue(out.empty)
+        self.assertEqual(report.converted, {})
+
+
+class TestCurrencyParsing(unittest.TestCase):
+    """Vectorized currency parsing matches the row-wise rules"""
+
+    def test_parse_currency_series(self):
+        values = pd.Series(['$5,920.23', '4500', '"$1,000"', '', None, 'n/a'])
+        parsed = parse_currency_series(values)
+        self.assertEqual(parsed.iloc[:3].tolist(), [5920.23, 4500.0, 1000.0])
+        self.assertTrue(parsed.iloc[3:].isna().all())
+
+    def test_contribution_totals_same_for_raw_and_typed_census(self):
+        census = make_census()
+        typed, _ = enforce_census_schema(census)
+        raw_totals = FinancialSummaryCalculator.calculate_current_totals(census)
+        typed_totals = FinancialSummaryCalculator.calculate_current_totals(typed)
+        self.assertAlmostEqual(raw_totals['total_ee_monthly'], typed_totals['total_ee_monthly'])
+        self.assertAlmostEqual(raw_totals['total_er_monthly'], typed_totals['total_er_monthly'])
+        self.assertEqual(raw_totals['employees_with_data'], typed_totals['employees_with_data'])
+
+
+if __name__ == '__main__':
+    unittest.main()
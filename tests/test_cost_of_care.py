@@ -0,0 +1,155 @@
+"""
+Test Suite for Total Cost of Care Engine - ICHRA Calculator
+
+Checks that RBIS cost-sharing rows compile into the right arrays, that
+expected out-of-pocket cost follows copay / deductible / coinsurance / MOOP
+rules, and that plans are ranked by premium plus expected OOP.
+
+Run with: python -m pytest tests/test_cost_of_care.py
+"""
+
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from constants import ACA_MAX_OOP_2026, COST_OF_CARE_SERVICES, SERVICE_ALLOWED_COSTS
+from cost_of_care import (
+    classify_benefits,
+    compile_cost_sharing,
+    expected_oop,
+    household_utilization,
+    total_cost_of_care,
+)
+
+PCP = 'Primary Care Visit to Treat an Injury or Illness'
+
+
+def _copays(rows):
+    return pd.DataFrame(rows, columns=['hios_plan_id', 'benefit', 'copay', 'coinsurance'])
+
+
+def _ded_moop(rows):
+    return pd.DataFrame(rows, columns=['plan_id', 'moop_ded_type', 'individual_ded_moop_amount'])
+
+
+def _plan(deductible, moop, copay_rows=()):
+    """One plan 'P' with a combined deductible and total MOOP."""
+    return compile_cost_sharing(
+        ['P'],
+        _copays([('P',) + row for row in copay_rows]),
+        _ded_moop([
+            ('P', 'Combined Medical and Drug EHB Deductible', deductible),
+            ('P', 'Maximum Out of Pocket for Medical and Drug EHB Benefits (Total)', moop),
+        ]),
+    )
+
+
+class TestCompileCostSharing(unittest.TestCase):
+    """compile_cost_sharing() parsing"""
+
+    def test_classifies_benefits(self):
+        benefits = pd.Series(['Non-Preferred Brand Drugs', 'Preferred Brand Drugs', PCP,
+                              'Mental/Behavioral Health Outpatient Services', 'Dental Check-Up for Children'])
+        self.assertEqual(list(classify_benefits(benefits)),
+                         ['non_preferred_rx', 'preferred_rx', 'pcp', 'mental_health', None])
+
+    def test_parses_cost_share_strings(self):
+        cs = compile_cost_sharing(
+            ['A', 'B'],
+            _copays([
+                ('A', PCP, '$30.00', 'Not Applicable'),
+                ('A', 'Generic Drugs', '10 Copay after deductible', 'Not Applicable'),
+                ('A', 'Specialist Visit', 'No Charge', '20.00% Coinsurance after deductible'),
+                ('A', 'Emergency Room Services', 'No Charge after deductible', 'Not Applicable'),
+                ('A', 'Urgent Care Centers or Facilities', 'Not Applicable', 'Not Applicable'),
+            ]),
+            _ded_moop([
+                ('A', 'Combined Medical and Drug EHB Deductible', 'Not Applicable'),
+                ('A', 'Medical EHB Deductible', '$7,500'),
+                ('A', 'Maximum Out of Pocket for Medical and Drug EHB Benefits (Total)', '$9,200'),
+            ]),
+        )
+        col = {s: i for i, s in enumerate(COST_OF_CARE_SERVICES)}
+        self.assertEqual((cs.copay[0, col['pcp']], cs.subject_to_deductible[0, col['pcp']]), (30.0, False))
+        self.assertEqual((cs.copay[0, col['generic_rx']], cs.subject_to_deductible[0, col['generic_rx']]), (10.0, True))
+        self.assertEqual(cs.coinsurance[0, col['specialist']], 0.2)
+        self.assertTrue(cs.subject_to_deductible[0, col['specialist']])
+        self.assertEqual(cs.coinsurance[0, col['er']], 0.0)
+        self.assertTrue(cs.subject_to_deductible[0, col['er']])
+        # No usable values: deductible then default coinsurance
+        self.assertEqual(cs.coinsurance[0, col['urgent_care']], 0.2)
+        self.assertEqual(list(cs.deductible), [7500.0, 0.0])
+        self.assertEqual(list(cs.moop), [9200.0, ACA_MAX_OOP_2026['individual']])
+        self.assertEqual(list(cs.family_moop), [18400.0, 2 * ACA_MAX_OOP_2026['individual']])
+
+
+class TestExpectedOop(unittest.TestCase):
+    """expected_oop() cost model"""
+
+    def test_copay_not_subject_to_deductible(self):
+        cs = _plan('$5,000', '$9,000', [(PCP, '$30.00', 'Not Applicable')])
+        oop = expected_oop(cs, household_utilization([[{'pcp': 3}]]))
+        self.assertEqual(oop[0, 0], 90.0)
+
+    def test_deductible_then_coinsurance(self):
+        cs = _plan('$1,000', '$9,000', [('Specialist Visit', 'No Charge', '20% Coinsurance after deductible')])
+        oop = expected_oop(cs, household_utilization([[{'specialist': 10}]]))
+        allowed = 10 * SERVICE_ALLOWED_COSTS['specialist']
+        self.assertAlmostEqual(oop[0, 0], 1000 + 0.2 * (allowed - 1000))
+
+    def test_individual_and_family_moop(self):
+        cs = _plan('$3,000', '$4,000')
+        stay = {'inpatient': 1}
+        oop = expected_oop(cs, household_utilization([[stay], [stay, stay, stay]]))
+        self.assertEqual(oop[0, 0], 4000.0)
+        self.assertEqual(oop[1, 0], 8000.0)
+
+    def test_plans_evaluated_independently(self):
+        rng = np.random.default_rng(3)
+        plans = [f'P{i}' for i in range(40)]
+        copay_rows, ded_rows = [], []
+        for plan in plans:
+            copay_rows.append((plan, PCP, f'${rng.integers(0, 60)}.00', 'Not Applicable'))
+            copay_rows.append((plan, 'Specialist Visit', 'No Charge', f'{rng.integers(0, 50)}% Coinsurance after deductible'))
+            ded_rows.append((plan, 'Combined Medical and Drug EHB Deductible', f'${rng.integers(0, 8000)}'))
+            ded_rows.append((plan, 'Maximum Out of Pocket for Medical and Drug EHB Benefits (Total)', '$9,000'))
+        cs = compile_cost_sharing(plans, _copays(copay_rows), _ded_moop(ded_rows))
+        units = household_utilization([['High'], ['Low', 'Moderate'], ['Inpatient stay', 'Low', 'Low']])
+        together = expected_oop(cs, units)
+        for p in range(len(plans)):
+            single = compile_cost_sharing([plans[p]], _copays(copay_rows), _ded_moop(ded_rows))
+            np.testing.assert_allclose(together[:, p], expected_oop(single, units)[:, 0])
+
+    def test_ranks_by_premium_plus_oop(self):
+        cs = compile_cost_sharing(
+            ['Cheap', 'Rich', 'Missing'],
+            _copays([]),
+            _ded_moop([
+                ('Cheap', 'Combined Medical and Drug EHB Deductible', '$9,000'),
+                ('Rich', 'Combined Medical and Drug EHB Deductible', '$0'),
+            ]),
+        )
+        result = total_cost_of_care(cs, [3000.0, 6000.0, np.nan],
+                                    household_utilization([['Low'], ['Inpatient stay']]))
+        # Low use: the cheap premium wins; a hospital stay makes the rich plan cheaper overall
+        self.assertEqual(list(result['ranking'][0]), [0, 1, 2])
+        self.assertEqual(list(result['ranking'][1]), [1, 0, 2])
+        self.assertTrue(np.isnan(result['total'][0, 2]))
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            household_utilization([['Extreme']])
+
+    def test_many_plans_and_households_timing(self):
+        cs = compile_cost_sharing([f'P{i}' for i in range(500)], None, None)
+        units = household_utilization([['Moderate', 'High', 'Low']] * 2000)
+        start = time.perf_counter()
+        oop = expected_oop(cs, units)
+        self.assertEqual(oop.shape, (2000, 500))
+        self.assertLess(time.perf_counter() - start, 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
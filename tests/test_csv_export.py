@@ -0,0 +1,110 @@
+"""
+Test Suite for the CSV Export Pipeline - ICHRA Calculator
+
+Checks the column-wise census exports against the per-row rules they
+replace, and that chunked encoding reassembles to the same CSV.
+
+Run with: python -m pytest tests/test_csv_export.py
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from csv_export import (
+    build_census_analysis_export,
+    census_identity_frame,
+    csv_download_data,
+    iter_csv_chunks,
+)
+
+
+class TestCensusAnalysisExport(unittest.TestCase):
+    """Census export joins the ICHRA analysis by employee ID"""
+
+    def setUp(self):
+        self.census_df = pd.DataFrame({
+            'employee_id': ['E1', 'E2', 'E3'],
+            'first_name': ['Ann', 'Bo', 'Cy'],
+            'last_name': ['Xu', 'Yi', 'Zo'],
+            'age': [30, 45, 60],
+            'state': ['NC', 'NC', 'TX'],
+            'family_status': ['EE', 'F', 'ES'],
+            'current_ee_monthly': [100.0, np.nan, 50.0],
+            'current_er_monthly': [400.0, 600.0, 500.0],
+        })
+        self.analysis = {
+            'E1': {'ichra_analysis': {'total_premium': 450.0, 'employer_contribution': 400.0, 'employee_cost': 50.0}},
+            'E2': {'ichra_analysis': {'total_premium': 1200.0, 'employer_contribution': 700.0, 'employee_cost': 500.0}},
+        }
+
+    def test_changes_match_row_rules(self):
+        export = build_census_analysis_export(self.census_df, self.analysis)
+
+        self.assertEqual(len(export), 3)
+        e1 = export.iloc[0]
+        self.assertEqual(e1['ichra_employee_cost'], 50.0)
+        self.assertEqual(e1['ee_change_monthly'], -50.0)
+        self.assertEqual(e1['er_change_annual'], 0.0)
+
+        # Missing current EE contribution: EE change blank, ER change present
+        e2 = export.iloc[1]
+        self.assertTrue(pd.isna(e2['ee_change_monthly']))
+        self.assertEqual(e2['er_change_monthly'], 100.0)
+
+        # No analysis for E3: every ICHRA and change column blank
+        e3 = export.iloc[2]
+        self.assertTrue(pd.isna(e3['ichra_total_premium']))
+        self.assertTrue(pd.isna(e3['er_change_annual']))
+        self.assertEqual(e3['county'], '')
+
+    def test_empty_analysis(self):
+        export = build_census_analysis_export(self.census_df, {})
+        self.assertEqual(len(export), 3)
+        self.assertTrue(export['ichra_employee_cost'].isna().all())
+
+
+class TestCensusIdentityFrame(unittest.TestCase):
+    """Identity columns fall back to the alternate census headers"""
+
+    def test_alternate_headers_and_defaults(self):
+        census_df = pd.DataFrame({
+            'Employee Number': ['7'],
+            'First Name': ['Dee'],
+            'Home Zip': ['27601'],
+            'age': [np.nan],
+        })
+        frame = census_identity_frame(census_df).iloc[0]
+
+        self.assertEqual(frame['employee_id'], '7')
+        self.assertEqual(frame['first_name'], 'Dee')
+        self.assertEqual(frame['zip'], '27601')
+        self.assertEqual(frame['age'], 0)
+        self.assertEqual(frame['family_status'], 'EE')
+        self.assertEqual(frame['rating_area'], '')
+
+
+class TestChunkedCsv(unittest.TestCase):
+    """Chunked encoding is byte-identical to a single to_csv()"""
+
+    def test_chunks_reassemble(self):
+        df = pd.DataFrame({
+            'employee_id': [f'E{i}' for i in range(23)],
+            'rate': np.linspace(100, 200, 23),
+            'note': [None if i % 4 else 'a,b' for i in range(23)],
+        })
+        expected = df.to_csv(index=False).encode('utf-8')
+
+        chunks = list(iter_csv_chunks(df, chunk_rows=5))
+        self.assertEqual(len(chunks), 1 + 5)
+        self.assertEqual(b''.join(chunks), expected)
+        self.assertEqual(csv_download_data(df, chunk_rows=5).getvalue(), expected)
+
+    def test_empty_frame_is_header_only(self):
+        df = pd.DataFrame(columns=['a', 'b'])
+        self.assertEqual(csv_download_data(df).getvalue(), b'a,b\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
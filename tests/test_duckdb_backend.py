@@ -0,0 +1,294 @@
+"""
+Test Suite for the DuckDB/Parquet Backend - ICHRA Calculator
+
+Checks psycopg2 -> DuckDB query translation, routing between the Parquet
+export and the fallback database, and queries.py results served from a
+small Parquet export built in-process (no PostgreSQL needed).
+
+With QUERY_PLAN_TEST_DSN set (see tests/test_query_plans.py), the fixture
+database is also exported with export_rbis_parquet() and every PlanQueries,
+FinancialQueries and PlanComparisonQueries method must return the same rows
+from DuckDB as from PostgreSQL.
+
+Run with: python -m pytest tests/test_duckdb_backend.py
+"""
+
+import tempfile
+import unittest
+import uuid
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+
+from dataset_registry import rbis_table
+from duckdb_backend import referenced_tables, translate_query, write_manifest, write_parquet_table
+from queries import FinancialQueries, PlanQueries
+from tests.test_query_plans import (
+    DSN,
+    FIXTURE_LOCATIONS,
+    _connect,
+    build_fixture_schema,
+    fixture_plan_ids,
+    query_cases,
+)
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+
+class TestTranslateQuery(unittest.TestCase):
+    """psycopg2 parameters become DuckDB parameters"""
+
+    def test_placeholders(self):
+        sql, values = translate_query(
+            "SELECT * FROM t WHERE a = %s AND b IN %s AND c LIKE '%%x%%' AND d = ANY(%s)",
+            ('WI', ('p1', 'p2', 'p3'), ['x', 'y']),
+        )
+        self.assertEqual(sql, "SELECT * FROM t WHERE a = ? AND b IN (?, ?, ?) AND c LIKE '%x%' AND d = ANY(?)")
+        self.assertEqual(values, ['WI', 'p1', 'p2', 'p3', ['x', 'y']])
+
+    def test_no_params_leaves_query_untouched(self):
+        self.assertEqual(translate_query("SELECT '%%'"), ("SELECT '%%'", []))
+
+    def test_rejects_mismatches(self):
+        with self.assertRaises(ValueError):
+            translate_query("SELECT %s, %s", ('a',))
+        with self.assertRaises(ValueError):
+            translate_query("SELECT %s", ('a', 'b'))
+        with self.assertRaises(ValueError):
+            translate_query("SELECT %(a)s", {'a': 1})
+
+    def test_referenced_tables(self):
+        query = """
+            WITH ranked AS (SELECT * FROM rbis_insurance_plan)
+            SELECT * FROM ranked r
+            JOIN "HIOS_issuers_pivoted" i ON i.id = r.id
+            LEFT JOIN (SELECT 1) x ON true
+            CROSS JOIN unnest(ARRAY[1, 2]) u
+        """
+        self.assertEqual(referenced_tables(query), {'rbis_insurance_plan', 'HIOS_issuers_pivoted'})
+
+
+PLANS = pd.DataFrame({
+    'hios_plan_id': ['11111WI0010001', '11111WI0010002', '22222WI0020001', '33333IL0030001', '11111WI0010003'],
+    'plan_marketing_name': ['WI Silver A', 'WI Silver B', 'WI Silver C', 'IL Silver', 'WI Gold'],
+    'plan_type': ['HMO', 'PPO', 'EPO', 'HMO', 'PPO'],
+    'level_of_coverage': ['Silver', 'Silver', 'Silver', 'Silver', 'Gold'],
+    'market_coverage': 'Individual',
+    'plan_effective_date': date(2026, 1, 1),
+    'state_code': ['WI', 'WI', 'WI', 'IL', 'WI'],
+})
+
+
+def _rates():
+    rows = []
+    for i, plan in enumerate(PLANS.itertuples()):
+        for area in (1, 2):
+            for age in ('21', '40'):
+                rows.append({
+                    'plan_id': plan.hios_plan_id,
+                    'rating_area_id': f"Rating Area {area}",
+                    'age': age,
+                    'individual_rate': Decimal('400.00') + 25 * i + 10 * area + (100 if age == '40' else 0),
+                    'tobacco': 'No Preference',
+                    'rate_effective_date': date(2026, 1, 1),
+                    'rate_expiration_date': date(2026, 12, 31),
+                    'market_coverage': 'Individual',
+                    'state_code': plan.state_code,
+                    'rating_area_numeric': area,
+                })
+    return pd.DataFrame(rows)
+
+
+def _variants():
+    return pd.DataFrame({
+        'hios_plan_id': PLANS['hios_plan_id'],
+        'csr_variation_type': 'Exchange variant (no CSR)',
+        'hsa_eligible': 'No',
+    })
+
+
+class FakeFallback:
+    """Records the queries DuckDBConnection hands to the fallback database."""
+
+    def __init__(self):
+        self.queries = []
+
+    def execute_query(self, query, params=None):
+        self.queries.append(query)
+        return pd.DataFrame({'source': ['fallback']})
+
+
+@unittest.skipIf(duckdb is None, "duckdb not installed")
+class TestParquetExport(unittest.TestCase):
+    """queries.py SQL served from a Parquet export"""
+
+    @classmethod
+    def setUpClass(cls):
+        from duckdb_backend import DuckDBConnection
+
+        cls.tmp = tempfile.TemporaryDirectory()
+        con = duckdb.connect()
+        tables = {
+            'rbis_insurance_plan': PLANS,
+            'rbis_insurance_plan_base_rates': _rates(),
+            'rbis_insurance_plan_variant': _variants(),
+        }
+        exported = {}
+        for table, df in tables.items():
+            con.register('source_df', df)
+            con.execute(f'CREATE TABLE "{table}" AS SELECT * FROM source_df')
+            con.unregister('source_df')
+            exported[table] = write_parquet_table(con, table, cls.tmp.name)
+        write_manifest(cls.tmp.name, exported)
+        con.close()
+
+        cls.exported = exported
+        cls.fallback = FakeFallback()
+        cls.db = DuckDBConnection(cls.tmp.name)
+        cls.routed_db = DuckDBConnection(cls.tmp.name, fallback=cls.fallback)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        cls.tmp.cleanup()
+
+    def test_state_partitioned_layout(self):
+        rates_dir = Path(self.tmp.name) / 'rbis_insurance_plan_base_rates'
+        self.assertEqual(sorted(p.name for p in rates_dir.iterdir()), ['state_code=IL', 'state_code=WI'])
+        self.assertEqual(self.exported['rbis_insurance_plan_base_rates'],
+                         {'rows': 20, 'partition_column': 'state_code'})
+        self.assertIsNone(self.exported['rbis_insurance_plan_variant']['partition_column'])
+
+    def test_lcsp_lookup(self):
+        lcsp = PlanQueries.get_lcsp_by_rating_area(self.db, 'WI', 2, '40')
+        self.assertEqual(len(lcsp), 1)
+        row = lcsp.iloc[0]
+        self.assertEqual(row['hios_plan_id'], '11111WI0010001')
+        self.assertEqual(row['state_code'], 'WI')
+        self.assertEqual(row['rating_area_id'], 2)
+        self.assertEqual(row['premium'], Decimal('520'))
+        self.assertIsInstance(row['premium'], Decimal)  # same cell types as psycopg2
+
+    def test_batch_lookups(self):
+        rates = PlanQueries.get_plan_rates_by_age(self.db, ['11111WI0010002', '33333IL0030001'], ['21'], 1)
+        self.assertEqual(sorted(rates['hios_plan_id']), ['11111WI0010002', '33333IL0030001'])
+        self.assertEqual(set(rates['rating_area_id']), {1})
+
+        batch = FinancialQueries.get_rates_batch(self.db, ['11111WI0010001', '11111WI0010003'])
+        self.assertEqual(len(batch), 8)
+        self.assertEqual(batch['rate'].dtype, float)  # read_sql contract: numeric as float
+        self.assertEqual(batch['rate'].max(), 620.0)
+
+    def test_routing(self):
+        local = self.routed_db.execute_query(
+            "SELECT COUNT(*) AS n FROM rbis_insurance_plan WHERE state_code = %s", ('WI',))
+        self.assertEqual(local.iloc[0]['n'], 4)
+        self.assertEqual(self.fallback.queries, [])
+
+        remote = self.routed_db.execute_query(
+            "SELECT * FROM rbis_insurance_plan p JOIN employer_quotes q ON q.plan_id = p.hios_plan_id")
+        self.assertEqual(remote.iloc[0]['source'], 'fallback')
+        self.assertEqual(len(self.fallback.queries), 1)
+
+
+def _normalize(result):
+    """Order- and type-insensitive form of a query result for comparison."""
+    def value(v):
+        if isinstance(v, (Decimal, float)):
+            return round(float(v), 6)
+        if isinstance(v, (list, tuple)):
+            return tuple(value(x) for x in v)
+        return v
+
+    if not isinstance(result, pd.DataFrame):
+        return result
+    columns = sorted(result.columns)
+    rows = [tuple(value(record[c]) for c in columns) for record in result.to_dict('records')]
+    return columns, sorted(rows, key=repr)
+
+
+# Which deductible row these LEFT JOIN ... LIMIT 1 / DISTINCT ON queries return isn't
+# defined by their SQL, so it may differ between databases
+UNORDERED_COLUMNS = {
+    'get_plan_summary': {'deductible'},
+    'get_plan_summaries_batch': {'deductible'},
+}
+
+
+@unittest.skipUnless(DSN, "QUERY_PLAN_TEST_DSN not set")
+@unittest.skipIf(duckdb is None, "duckdb not installed")
+class TestPostgresParity(unittest.TestCase):
+    """Every query returns the same rows from the Parquet export as from PostgreSQL"""
+
+    @classmethod
+    def setUpClass(cls):
+        import psycopg2
+
+        from database import DatabaseConnection
+        from duckdb_backend import DuckDBConnection, export_rbis_parquet
+
+        cls.conn = _connect()
+        if cls.conn is None:
+            raise unittest.SkipTest("Cannot connect to QUERY_PLAN_TEST_DSN")
+        cls.schema = f"duckdb_parity_test_{uuid.uuid4().hex[:8]}"
+        build_fixture_schema(cls.conn, cls.schema)
+        cls.plan_ids = fixture_plan_ids(cls.conn)
+
+        class FixtureDb(DatabaseConnection):
+            """DatabaseConnection on the fixture schema; read_sql without SQLAlchemy."""
+
+            def __init__(self, conn):
+                super().__init__()
+                self._conn = conn
+
+            def read_sql(self, query, params=None):
+                df = self.execute_query(query, params)
+                return pd.DataFrame.from_records(df.to_dict('records'), columns=df.columns, coerce_float=True)
+
+        # Export reads through a server-side cursor, which needs a transaction (not autocommit)
+        cls.pg = FixtureDb(psycopg2.connect(DSN, options=f"-c search_path={cls.schema},public"))
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.manifest = export_rbis_parquet(cls.pg, cls.tmp.name)
+        cls.duck = DuckDBConnection(cls.tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.duck.close()
+        cls.pg.close()
+        cls.tmp.cleanup()
+        with cls.conn.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {cls.schema} CASCADE")
+        cls.conn.close()
+
+    def test_exports_every_table(self):
+        tables = self.manifest['tables']
+        self.assertEqual(tables['rbis_insurance_plan_base_rates']['partition_column'], 'state_code')
+        self.assertEqual(tables['zip_to_county_correct']['partition_column'], 'State')
+        self.assertIn('HIOS_issuers_pivoted', tables)
+        with self.conn.cursor() as cursor:
+            for table, info in tables.items():
+                cursor.execute(f'SELECT COUNT(*) FROM "{rbis_table(table)}"')
+                self.assertEqual(info['rows'], cursor.fetchone()[0], table)
+
+    def test_same_results_as_postgres(self):
+        for query_class, method, args, kwargs in query_cases(self.plan_ids, FIXTURE_LOCATIONS):
+            with self.subTest(f"{query_class.__name__}.{method}"):
+                expected = getattr(query_class, method)(self.pg, *args, **kwargs)
+                self.pg.connect().rollback()  # don't hold locks on the fixture schema
+                actual = getattr(query_class, method)(self.duck, *args, **kwargs)
+                skip = UNORDERED_COLUMNS.get(method, set())
+                if isinstance(expected, pd.DataFrame):
+                    expected, actual = expected.drop(columns=list(skip)), actual.drop(columns=list(skip))
+                elif isinstance(expected, dict):
+                    expected = {k: v for k, v in expected.items() if k not in skip}
+                    actual = {k: v for k, v in actual.items() if k not in skip}
+                self.assertEqual(_normalize(actual), _normalize(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
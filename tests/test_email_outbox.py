@@ -0,0 +1,167 @@
+"""
+Test Suite for Email Outbox - ICHRA Calculator
+
+Run with: python -m pytest tests/test_email_outbox.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+from datetime import datetime
+from unittest.mock import Mock
+
+from email_service import EmailResult
+from email_outbox import (
+    EmailOutbox,
+    backoff_delay,
+    STATUS_QUEUED,
+    STATUS_SENT,
+    STATUS_FAILED,
+)
+
+
+def _mock_email_service(*results):
+    service = Mock()
+    service.is_configured.return_value = (True, "")
+    service.send_proposal_email_from_file.side_effect = list(results)
+    return service
+
+
+def _ok(recipient="client@example.com"):
+    return EmailResult(success=True, recipient=recipient, sent_at=datetime.now(), status_code=202)
+
+
+def _error(status_code=503, recipient="client@example.com"):
+    return EmailResult(
+        success=False,
+        recipient=recipient,
+        error_message=f"SendGrid returned status {status_code}",
+        error_details={"status_code": status_code},
+        status_code=status_code,
+    )
+
+
+class TestEmailOutbox(unittest.TestCase):
+    """Queueing, delivery and retry behaviour (worker driven manually)"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _outbox(self, service, **kwargs):
+        outbox = EmailOutbox(outbox_dir=self.tmpdir, email_service=service, base_delay=0.0, **kwargs)
+        # Drive delivery from the test instead of the background thread
+        outbox.start = Mock()
+        return outbox
+
+    def test_enqueue_returns_immediately_and_spools_attachment(self):
+        service = _mock_email_service(_ok())
+        outbox = self._outbox(service)
+
+        job = outbox.enqueue_proposal("client@example.com", "ABC", BytesIO(b"deck"), "proposal.pdf")
+
+        self.assertEqual(job.status, STATUS_QUEUED)
+        self.assertTrue(os.path.exists(job.attachment_path))
+        service.send_proposal_email_from_file.assert_not_called()
+
+    def test_delivery_marks_sent_and_removes_spool_file(self):
+        service = _mock_email_service(_ok())
+        outbox = self._outbox(service)
+        job = outbox.enqueue_proposal("client@example.com", "ABC", b"deck", "proposal.pdf")
+
+        outbox.process_due_jobs()
+
+        status = outbox.get_status(job.job_id)
+        self.assertEqual(status.status, STATUS_SENT)
+        self.assertTrue(status.to_email_result_dict()["success"])
+        self.assertFalse(os.path.exists(job.attachment_path))
+
+    def test_transient_failure_retries(self):
+        service = _mock_email_service(_error(503), _ok())
+        outbox = self._outbox(service)
+        job = outbox.enqueue_proposal("client@example.com", "ABC", b"deck", "proposal.pdf")
+
+        outbox.process_due_jobs()
+        status = outbox.get_status(job.job_id)
+        # base_delay=0 makes the retry due immediately, so the same pass delivers it
+        self.assertEqual(status.status, STATUS_SENT)
+        self.assertEqual(status.attempts, 2)
+
+    def test_gives_up_after_max_attempts_and_notifies(self):
+        service = _mock_email_service(_error(503), _error(503))
+        outbox = self._outbox(service, max_attempts=2)
+        job = outbox.enqueue_proposal("client@example.com", "ABC", b"deck", "proposal.pdf")
+
+        outbox.process_due_jobs()
+
+        status = outbox.get_status(job.job_id)
+        self.assertEqual(status.status, STATUS_FAILED)
+        self.assertEqual(status.attempts, 2)
+        service._send_failure_notification.assert_called_once()
+
+    def test_permanent_failure_removes_spool_file(self):
+        service = _mock_email_service(_error(503), _error(503))
+        outbox = self._outbox(service, max_attempts=2)
+        job = outbox.enqueue_proposal("client@example.com", "ABC", b"deck", "proposal.pdf")
+
+        outbox.process_due_jobs()
+
+        self.assertEqual(outbox.get_status(job.job_id).status, STATUS_FAILED)
+        self.assertFalse(os.path.exists(job.attachment_path))
+
+    def test_non_retryable_status_fails_immediately(self):
+        service = _mock_email_service(_error(401))
+        outbox = self._outbox(service)
+        job = outbox.enqueue_proposal("client@example.com", "ABC", b"deck", "proposal.pdf")
+
+        outbox.process_due_jobs()
+
+        self.assertEqual(outbox.get_status(job.job_id).status, STATUS_FAILED)
+        self.assertEqual(service.send_proposal_email_from_file.call_count, 1)
+
+    def test_invalid_recipient_fails_without_queueing(self):
+        service = _mock_email_service()
+        outbox = self._outbox(service)
+
+        job = outbox.enqueue_proposal("invalid", "ABC", b"deck", "proposal.pdf")
+
+        self.assertEqual(job.status, STATUS_FAILED)
+        self.assertFalse(job.to_email_result_dict()["pending"])
+        self.assertEqual(outbox.process_due_jobs(), 0)
+
+    def test_retry_requeues_failed_job(self):
+        service = _mock_email_service(_error(401), _ok())
+        outbox = self._outbox(service)
+        job = outbox.enqueue_proposal("client@example.com", "ABC", b"deck", "proposal.pdf")
+        outbox.process_due_jobs()
+
+        # The spool file is gone after the failure; without data the job stays failed
+        self.assertEqual(outbox.retry(job.job_id).status, STATUS_FAILED)
+        retried = outbox.retry(job.job_id, attachment_data=BytesIO(b"deck"))
+        self.assertEqual(retried.status, STATUS_QUEUED)
+        self.assertTrue(os.path.exists(job.attachment_path))
+        outbox.process_due_jobs()
+        self.assertEqual(outbox.get_status(job.job_id).status, STATUS_SENT)
+
+    def test_queue_persists_across_instances(self):
+        service = _mock_email_service(_ok())
+        job = self._outbox(_mock_email_service()).enqueue_proposal(
+            "client@example.com", "ABC", b"deck", "proposal.pdf"
+        )
+
+        reopened = self._outbox(service)
+        self.assertEqual(reopened.pending_count(), 1)
+        reopened.process_due_jobs()
+        self.assertEqual(reopened.get_status(job.job_id).status, STATUS_SENT)
+
+    def test_backoff_grows_and_is_capped(self):
+        self.assertLess(backoff_delay(1, 2.0, 300.0), backoff_delay(4, 2.0, 300.0))
+        self.assertLessEqual(backoff_delay(20, 2.0, 300.0), 300.0 * 1.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
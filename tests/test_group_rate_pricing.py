@@ -0,0 +1,101 @@
+"""
+Test Suite for Group-Rate Pricing - ICHRA Calculator
+
+Checks the compiled HAS/Sedera rate tables against the family-rate rules:
+one rate per family from the tier and the eldest covered member's age band.
+
+Run with: python -m pytest tests/test_group_rate_pricing.py
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from group_rate_pricing import (
+    age_band_index, cooperative_rate_table, group_rate_totals, price_census, sedera_rate_table,
+)
+
+BANDS = ['18-29', '30-39', '40-49', '50-59', '60-64']
+STATUSES = ['EE', 'ES', 'EC', 'F']
+
+
+def make_coop_rates():
+    # Rate encodes band and tier: band_index * 100 + tier_index (+1000 for the 2.5k column)
+    rows = []
+    for b, band in enumerate(BANDS):
+        for s, status in enumerate(STATUSES):
+            rows.append({'age_band': band, 'family_status': status,
+                         'deductible_1k': b * 100 + s, 'deductible_2_5k': 1000 + b * 100 + s})
+    return pd.DataFrame(rows)
+
+
+def make_sedera_rates():
+    rows = []
+    for iua, base in (('500', 500), ('1000', 200)):
+        for b, band in enumerate(BANDS):
+            for s, status in enumerate(STATUSES):
+                rows.append({'IUA': iua, 'age_band': band.replace('60-64', '60+'),
+                             'family_status': status, 'sedera_monthly_rate': base + b * 10 + s})
+    return pd.DataFrame(rows)
+
+
+class TestGroupRatePricing(unittest.TestCase):
+
+    def setUp(self):
+        self.census = pd.DataFrame({
+            'employee_id': ['E1', 'E2', 'E3', 'E4', 'E5'],
+            'age': [25, 25, 25, 45, 33],
+            'family_status': ['EE', 'ES', 'EC', 'F', 'XX'],
+        })
+        self.dependents = pd.DataFrame({
+            'employee_id': ['E1', 'E2', 'E2', 'E3', 'E3', 'E4', 'E4'],
+            'relationship': ['Spouse', 'Spouse', 'Spouse', 'Child', 'child', 'Spouse', 'Child'],
+            'age': [70, 52, 65, 8, 31, 40, 12],
+        })
+
+    def test_age_bands(self):
+        ages = [0, 18, 29, 30, 39, 40, 59, 60, 64, 80]
+        self.assertEqual(age_band_index(ages).tolist(), [0, 0, 0, 1, 1, 2, 3, 4, 4, 4])
+
+    def test_eldest_member_sets_band(self):
+        prices = price_census(self.census, cooperative_rate_table(make_coop_rates()), self.dependents)
+
+        # EE ignores the spouse row; ES uses the first spouse (52, not 65)
+        self.assertEqual(prices['1k'].tolist(), [0, 301, 102, 203, 0])
+        self.assertEqual(prices['2.5k'].tolist(), [1000, 1301, 1102, 1203, 0])
+
+    def test_no_dependents_prices_on_employee_age(self):
+        prices = price_census(self.census, cooperative_rate_table(make_coop_rates()), None)
+        self.assertEqual(prices['1k'].tolist(), [0, 1, 2, 203, 0])
+
+    def test_totals_by_tier(self):
+        totals = group_rate_totals(self.census, cooperative_rate_table(make_coop_rates()), self.dependents)
+
+        self.assertEqual(totals['1k']['total'], 606)
+        self.assertEqual(totals['1k']['by_tier']['ES'], {'total': 301, 'count': 1})
+        self.assertEqual(totals['2.5k']['by_tier']['F'], {'total': 1203, 'count': 1})
+        self.assertEqual(totals['1k']['rate_ranges']['EC'], {'min': 2, 'max': 402})
+
+    def test_sedera_iua_without_rates(self):
+        table = sedera_rate_table(make_sedera_rates(), ['500', '1000', '5000'])
+        totals = group_rate_totals(self.census, table, self.dependents)
+
+        self.assertEqual(totals['500']['total'], 500 + 531 + 512 + 523)
+        self.assertEqual(totals['1000']['by_tier']['EE'], {'total': 200, 'count': 1})
+        self.assertEqual(totals['5000']['total'], 0)
+        self.assertEqual(totals['5000']['by_tier']['EE']['count'], 0)
+
+    def test_missing_rate_table(self):
+        prices = price_census(self.census, cooperative_rate_table(None), self.dependents)
+        self.assertTrue((prices.to_numpy() == 0).all())
+
+    def test_categorical_census(self):
+        census = self.census.astype({'family_status': 'category', 'employee_id': 'category'})
+        expected = price_census(self.census, cooperative_rate_table(make_coop_rates()), self.dependents)
+        prices = price_census(census, cooperative_rate_table(make_coop_rates()), self.dependents)
+        np.testing.assert_array_equal(prices.to_numpy(), expected.to_numpy())
+
+
+if __name__ == '__main__':
+    unittest.main()
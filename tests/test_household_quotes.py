@@ -0,0 +1,60 @@
+"""
+Test Suite for Household Quote Engine - ICHRA Calculator
+
+Run with: python -m pytest tests/test_household_quotes.py
+"""
+
+import unittest
+from unittest.mock import Mock
+
+import pandas as pd
+
+from household_quotes import member_age_bands, quote_household, rated_member_ages
+
+
+class TestRatedMembers(unittest.TestCase):
+    """ACA rated-member rules"""
+
+    def test_employee_only_ignores_dependents(self):
+        self.assertEqual(rated_member_ages(40, 38, [10, 8], 'EE'), [40])
+
+    def test_three_oldest_children_under_21(self):
+        ages = rated_member_ages(45, 44, [3, 17, 9, 12, 1], 'F')
+        self.assertEqual(ages, [45, 44, 17, 12, 9])
+
+    def test_adult_children_always_rated(self):
+        ages = rated_member_ages(55, None, [22, 19, 15, 12, 10], 'EC')
+        self.assertEqual(ages, [55, 19, 15, 12, 22])
+
+    def test_infant_is_rated(self):
+        self.assertEqual(rated_member_ages(30, None, [0, None], 'EC'), [30, 0])
+
+    def test_age_bands_collapse_young_children(self):
+        self.assertEqual(member_age_bands([40, 12, 9, 66]), {'40': 1, '0-14': 2, '64 and over': 1})
+
+
+class TestQuoteHousehold(unittest.TestCase):
+    """Single set-based query per household"""
+
+    def test_one_query_with_member_counts(self):
+        db = Mock()
+        db.execute_query.return_value = pd.DataFrame([{
+            'plan_id': '12345NC0010001', 'plan_name': 'Silver HMO', 'metal_level': 'Silver',
+            'plan_type': 'HMO', 'exchange_status': 'On-Exchange',
+            'household_premium': 1510.25, 'employee_premium': 520.10, 'members_rated': 5,
+        }])
+
+        quotes = quote_household(db, 'nc', 3, 45, 44, [3, 17, 9, 12, 1], 'F', limit=5)
+
+        self.assertEqual(db.execute_query.call_count, 1)
+        params = db.execute_query.call_args[0][1]
+        # (band, count) pairs lead the parameters: 45, 44, 17, then two children in 0-14
+        self.assertEqual(params[:8], ('45', 1, '44', 1, '17', 1, '0-14', 2))
+        self.assertIn('NC', params)
+        self.assertEqual(params[-2:], (5, 5))
+        self.assertEqual(quotes[0].household_premium, 1510.25)
+        self.assertEqual(quotes[0].members_rated, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
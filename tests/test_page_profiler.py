@@ -0,0 +1,118 @@
+"""
+Test Suite for the Page Profiler - ICHRA Calculator
+
+Runs a fake page script on its own thread (as Streamlit does) and checks
+that the profiler stops when the page returns, charges time to the page's
+top-level functions and DB calls, and exports valid speedscope JSON.
+
+Run with: python -m pytest tests/test_page_profiler.py
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import database
+from database import DatabaseConnection
+from page_profiler import PageProfiler
+
+PAGE_SOURCE = '''
+import sys, time
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+def render_slow_section():
+    busy(0.15)
+
+def render_fast_section():
+    busy(0.03)
+
+profiler = make_profiler(sys._getframe())
+render_slow_section()
+render_fast_section()
+db.execute_query("SELECT 1")
+'''
+
+
+def run_fake_page(db):
+    """Execute PAGE_SOURCE as a page script on a new thread; return its profiler."""
+    holder = {}
+
+    def make_profiler(frame):
+        holder['profiler'] = PageProfiler(frame, 'fake_page', interval_ms=1).start()
+        return holder['profiler']
+
+    code = compile(PAGE_SOURCE, '/app/pages/fake_page.py', 'exec')
+    thread = threading.Thread(target=exec, args=(code, {'make_profiler': make_profiler, 'db': db}))
+    thread.start()
+    thread.join()
+    profiler = holder['profiler']
+    profiler.wait(timeout=5)
+    return profiler
+
+
+def fake_db():
+    db = DatabaseConnection()
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.description = None
+
+    def slow_execute(*args):
+        time.sleep(0.02)
+
+    cursor.execute.side_effect = slow_execute
+    db.connect = MagicMock(return_value=conn)
+    return db
+
+
+class TestPageProfiler(unittest.TestCase):
+    """Sampling a page rerun"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.profiler = run_fake_page(fake_db())
+
+    def test_stops_when_page_returns(self):
+        self.assertTrue(self.profiler.finished.is_set())
+        self.assertGreater(len(self.profiler.samples), 10)
+        self.assertEqual(database._query_listeners, [])
+
+    def test_function_attribution(self):
+        times = {row['function']: row['seconds'] for row in self.profiler.function_times()}
+        self.assertGreater(times['render_slow_section'], times['render_fast_section'])
+        self.assertGreater(times['render_slow_section'], 0.08)
+
+    def test_db_attribution(self):
+        rows = self.profiler.db_times()
+        self.assertEqual(rows[0]['function'], 'database.py:DatabaseConnection.execute_query')
+        self.assertEqual(rows[0]['calls'], 1)
+        self.assertGreaterEqual(rows[0]['query_seconds'], 0.02)
+
+    def test_speedscope_export(self):
+        profile = self.profiler.to_speedscope()
+        frames = profile['shared']['frames']
+        sampled = profile['profiles'][0]
+
+        self.assertEqual(sampled['type'], 'sampled')
+        self.assertEqual(len(sampled['samples']), len(sampled['weights']))
+        self.assertTrue(all(0 <= i < len(frames) for stack in sampled['samples'] for i in stack))
+        self.assertAlmostEqual(sampled['endValue'], self.profiler.sampled_seconds, places=6)
+        # Stacks are rooted at the page module, not the thread's runner frames
+        self.assertEqual(frames[sampled['samples'][0][0]]['name'], '<module>')
+
+
+class TestProfilingToggle(unittest.TestCase):
+    """CANOPY_PROFILE enables profiling without a query param"""
+
+    def test_env_var(self):
+        from page_profiler import profiling_enabled
+        with patch.dict('os.environ', {'CANOPY_PROFILE': '1'}):
+            self.assertTrue(profiling_enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+Test Suite for Plan Attribute Cache - ICHRA Calculator
+
+Checks that the enrichment queries read plan attribute tables through the
+process-wide cache: repeat lookups stay in memory and misses are fetched in
+one query per table, with the same results the direct SQL filters gave.
+
+Run with: python -m pytest tests/test_plan_attribute_cache.py
+"""
+
+import unittest
+
+import pandas as pd
+
+from plan_attribute_cache import (
+    PlanAttributeCache, clear_plan_attribute_cache, get_plan_attribute_stats,
+)
+from queries import (
+    BenefitQueries, ComprehensivePlanQueries, CostEstimatorQueries,
+    EnrichedPlanQueries, get_plan_deductible_and_moop_batch,
+)
+
+DDCTBL_ROWS = [
+    # plan_id, network_type, moop_ded_type, individual_ded_moop_amount
+    ('11111NC0010001', 'In Network', 'Maximum Out of Pocket for Medical and Drug EHB Benefits (Total)', '$9,100'),
+    ('11111NC0010001', 'In Network', 'Medical EHB Deductible', '$5,000'),
+    ('11111NC0010001', 'In Network', 'Drug EHB Deductible', 'Included in Medical'),
+    ('11111NC0010001', 'Out of Network', 'Maximum Out of Pocket for Medical and Drug EHB Benefits (Total)', 'Not Applicable'),
+    ('11111NC0010001', 'Out of Network', 'Medical EHB Deductible', '$10,000'),
+    ('22222NC0020002', 'In Network', 'Combined Medical and Drug EHB Deductible', '$1,500'),
+    ('22222NC0020002', 'In Network', 'Maximum Out of Pocket for Medical and Drug EHB Benefits (Total)', '$6,000'),
+]
+
+BENEFIT_ROWS = [
+    # hios_plan_id, csr_variation_type, benefit, network_type, copay, coinsurance
+    ('11111NC0010001', 'Exchange variant (no CSR)', 'Emergency Room Services', 'In Network', '500', ''),
+    ('11111NC0010001', 'Exchange variant (no CSR)', 'Inpatient Hospital Services (e.g., Hospital Stay)', 'In Network', '', '40'),
+    ('11111NC0010001', 'Exchange variant (no CSR)', 'Specialist Visit', 'In Network', '$80', ''),
+    ('11111NC0010001', 'Zero Cost Sharing Plan Variation', 'Specialist Visit', 'In Network', '$0', ''),
+    ('11111NC0010001', 'Exchange variant (no CSR)', 'Inpatient Hospital Services (e.g., Hospital Stay)', 'Out of Network', '', ''),
+]
+
+
+class FakePlanDb:
+    """Answers the plan attribute queries from in-memory rows and counts queries per table."""
+
+    def __init__(self):
+        self.queries = []
+
+    def execute_query(self, query, params=None):
+        plan_ids = set(params[0]) if params and isinstance(params[0], tuple) else set(params or ())
+        if 'FROM rbis_insurance_plan_variant_ddctbl_moop' in query:
+            self.queries.append('ddctbl_moop')
+            df = pd.DataFrame(DDCTBL_ROWS, columns=['plan_id', 'network_type', 'moop_ded_type',
+                                                    'individual_ded_moop_amount'])
+            df = df[df['plan_id'].isin(plan_ids)]
+            return df.sort_values(['plan_id', 'network_type', 'moop_ded_type']).reset_index(drop=True)
+        if 'FROM rbis_insurance_plan_benefit_cost_share' in query:
+            self.queries.append('benefit_cost_share')
+            df = pd.DataFrame(BENEFIT_ROWS, columns=['hios_plan_id', 'csr_variation_type', 'benefit',
+                                                     'network_type', 'copay', 'coinsurance'])
+            df = df[df['hios_plan_id'].isin(plan_ids)]
+            return df.sort_values(['hios_plan_id', 'network_type', 'benefit']).reset_index(drop=True)
+        if 'FROM rbis_insurance_plan_variant\n' in query:
+            self.queries.append('variant')
+            df = pd.DataFrame([
+                ('11111NC0010001', 'Exchange variant (no CSR)', 'https://example.com/sbc.pdf'),
+                ('11111NC0010001', 'Zero Cost Sharing Plan Variation', 'https://example.com/sbc-zero.pdf'),
+            ], columns=['hios_plan_id', 'csr_variation_type', 'url_for_summary_of_benefits_and_coverage'])
+            return df[df['hios_plan_id'].isin(plan_ids)].reset_index(drop=True)
+        if 'FROM rbis_insurance_plan p' in query:
+            self.queries.append('enriched')
+            rows = [{'hios_plan_id': pid, 'plan_marketing_name': f'Plan {pid[:5]}', 'metal_level': 'Silver',
+                     'plan_type': 'HMO', 'carrier_name': 'Carrier', 'av_percent': '70.1', 'hsa_eligible': 'No',
+                     'deductible': '5000', 'oop_max': '9100'}
+                    for pid in sorted(plan_ids) if pid.startswith('1')]
+            return pd.DataFrame(rows)
+        raise AssertionError(f"Unexpected query: {query[:80]}")
+
+
+class TestPlanAttributeCache(unittest.TestCase):
+
+    def test_lru_bound_and_stats(self):
+        cache = PlanAttributeCache(max_entries=2)
+        fetched = []
+
+        def fetch(ids):
+            fetched.append(list(ids))
+            return {plan_id: plan_id.lower() for plan_id in ids}
+
+        self.assertEqual(cache.get_many('t', ['A', 'B', 'A'], fetch), {'A': 'a', 'B': 'b'})
+        cache.get_many('t', ['A'], fetch)
+        cache.get_many('t', ['C'], fetch)   # evicts B (least recently used)
+        cache.get_many('t', ['A', 'B'], fetch)
+
+        self.assertEqual(fetched, [['A', 'B'], ['C'], ['B']])
+        self.assertEqual(len(cache), 2)
+        stats = cache.stats()['t']
+        self.assertEqual((stats['hits'], stats['misses'], stats['queries']), (2, 4, 3))
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 6)
+
+    def test_fetch_error_not_cached(self):
+        cache = PlanAttributeCache()
+
+        def failing(ids):
+            raise RuntimeError("connection lost")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_many('t', ['A'], failing)
+        self.assertEqual(cache.get_many('t', ['A'], lambda ids: {'A': 1}), {'A': 1})
+
+
+class TestCachedEnrichmentQueries(unittest.TestCase):
+
+    def setUp(self):
+        clear_plan_attribute_cache()
+        self.db = FakePlanDb()
+        self.plans = ['11111NC0010001', '22222NC0020002']
+
+    def tearDown(self):
+        clear_plan_attribute_cache()
+
+    def test_one_query_per_table_then_memory(self):
+        for _ in range(3):
+            get_plan_deductible_and_moop_batch(self.db, self.plans)
+            CostEstimatorQueries.get_plan_deductible_and_moop(self.db, self.plans)
+            CostEstimatorQueries.get_plan_cost_sharing_for_ai(self.db, self.plans)
+            BenefitQueries.get_key_benefits(self.db, self.plans)
+            ComprehensivePlanQueries.get_plan_variant_details(self.db, self.plans[0])
+            EnrichedPlanQueries.get_plans_with_carrier_batch(self.db, self.plans)
+
+        self.assertEqual(sorted(self.db.queries), ['benefit_cost_share', 'ddctbl_moop', 'enriched', 'variant'])
+        tables = get_plan_attribute_stats()['tables']
+        self.assertEqual(tables['rbis_insurance_plan_variant_ddctbl_moop_20251019202724']['queries'], 1)
+        self.assertGreater(tables['rbis_insurance_plan_variant_ddctbl_moop_20251019202724']['hit_rate'], 0.8)
+
+        # A new plan only queries for that plan
+        get_plan_deductible_and_moop_batch(self.db, self.plans + ['33333NC0030003'])
+        self.assertEqual(self.db.queries.count('ddctbl_moop'), 2)
+
+    def test_deductible_and_moop_results(self):
+        lookup = get_plan_deductible_and_moop_batch(self.db, self.plans + ['33333NC0030003'])
+        self.assertEqual(lookup['11111NC0010001'], {'individual_deductible': 5000.0, 'individual_moop': 9100.0})
+        self.assertEqual(lookup['22222NC0020002'], {'individual_deductible': 1500.0, 'individual_moop': 6000.0})
+        self.assertEqual(lookup['33333NC0030003'], {'individual_deductible': None, 'individual_moop': None})
+
+        df = CostEstimatorQueries.get_plan_deductible_and_moop(self.db, list(reversed(self.plans)))
+        self.assertEqual(list(df.columns), ['plan_id', 'moop_ded_type', 'individual_ded_moop_amount'])
+        self.assertEqual(df['plan_id'].tolist(), ['11111NC0010001'] * 3 + ['22222NC0020002'] * 2)
+        self.assertEqual(df['moop_ded_type'].iloc[0], 'Drug EHB Deductible')
+
+    def test_cost_sharing_for_ai(self):
+        result = CostEstimatorQueries.get_plan_cost_sharing_for_ai(self.db, self.plans)
+        plan = result['11111NC0010001']
+        self.assertEqual(plan['deductible_in_network'], '$5,000')
+        self.assertEqual(plan['deductible_out_of_network'], '$10,000')
+        self.assertEqual(plan['moop_in_network'], '$9,100')
+        self.assertEqual(plan['hospital_coinsurance_in_network'], '40% coinsurance')
+        self.assertEqual(plan['hospital_coinsurance_out_of_network'], 'Not covered')
+        self.assertEqual(plan['er_cost'], '$500 copay')
+        # 'Combined Medical and Drug EHB Deductible' doesn't match 'medical ehb deductible'
+        self.assertIsNone(result['22222NC0020002']['deductible_in_network'])
+
+    def test_key_benefits_and_variants(self):
+        benefits = BenefitQueries.get_key_benefits(self.db, self.plans)
+        self.assertEqual(benefits['benefit'].tolist(), ['Emergency Room Services', 'Specialist Visit', 'Specialist Visit'])
+        self.assertTrue(BenefitQueries.get_key_benefits(self.db, []).empty)
+
+        variant = ComprehensivePlanQueries.get_plan_variant_details(self.db, '11111NC0010001')
+        self.assertEqual(variant['url_for_summary_of_benefits_and_coverage'].tolist(), ['https://example.com/sbc.pdf'])
+        self.assertTrue(ComprehensivePlanQueries.get_plan_variant_details(self.db, '22222NC0020002').empty)
+
+    def test_enriched_plans_are_copies(self):
+        plans = EnrichedPlanQueries.get_plans_with_carrier_batch(self.db, self.plans)
+        self.assertEqual(list(plans), ['11111NC0010001'])
+        plans['11111NC0010001']['plan_name'] = 'changed'
+
+        again = EnrichedPlanQueries.get_plans_with_carrier_batch(self.db, self.plans)
+        self.assertEqual(again['11111NC0010001']['plan_name'], 'Plan 11111')
+        self.assertEqual(self.db.queries.count('enriched'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
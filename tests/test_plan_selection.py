@@ -0,0 +1,215 @@
+"""
+Test Suite for LLM Plan Selection - ICHRA Calculator
+
+Runs LLMPlanAnalyzer.select_plans_from_candidates against a fake Anthropic
+client: one concurrent request per state, cached responses, the PlanScorer
+fallback for slow or failing states, and context token budgets.
+
+Run with: python -m pytest tests/test_plan_selection.py
+"""
+
+import json
+import re
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+import pandas as pd
+
+from llm_response_cache import LLMResponseCache, estimate_tokens
+from plan_suggester import EmployerPreferences, LLMPlanAnalyzer, ScoredPlan
+
+
+class FakeMessages:
+    """Stand-in for client.messages: picks the lowest-scored candidate in the prompt."""
+
+    def __init__(self, delay=0.05, slow_states=(), slow_delay=0.5, fail_states=()):
+        self.delay = delay
+        self.slow_states = slow_states
+        self.slow_delay = slow_delay
+        self.fail_states = fail_states
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def create(self, model, max_tokens, system, messages, timeout=None):
+        prompt = messages[0]['content']
+        state = re.search(r'"candidates_by_state": \{\s*"([A-Z]{2})"', prompt).group(1)
+        with self._lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.slow_delay if state in self.slow_states else self.delay)
+            if state in self.fail_states:
+                raise ConnectionError("overloaded")
+            plan_id = re.findall(r'"plan_id": "(\w+)"', prompt.split('**Your Task:**')[0])[-1]
+            selection = {'selections': [{'state': state, 'plan_id': plan_id, 'reason': 'Lowest premium'}]}
+            text = f"```json\n{json.dumps(selection)}\n```\n\n### Why This Plan\n{state} analysis."
+            return SimpleNamespace(content=[SimpleNamespace(text=text)])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def make_candidates(states=('GA', 'NC', 'TX'), per_state=5):
+    plans = []
+    for state in states:
+        for i in range(per_state):
+            plans.append(ScoredPlan(
+                plan_id=f"1234{i}{state}00{i:05d}",
+                plan_name=f"{state} Plan {i}",
+                state_code=state,
+                metal_level='Silver',
+                plan_type='PPO',
+                total_annual_cost=50000 + 1000 * i,
+                avg_monthly_cost_per_employee=400 + 10 * i,
+                employees_covered=10,
+                total_employees=10,
+                coverage_percentage=100.0,
+                total_score=90 - 5 * i,
+                strengths=[f"Strength {n} " + "x" * 40 for n in range(6)],
+                considerations=[f"Consideration {n} " + "y" * 40 for n in range(6)],
+            ))
+    return plans
+
+
+def make_census(states=('GA', 'NC', 'TX')):
+    return pd.DataFrame({
+        'state': [state for state in states for _ in range(4)],
+        'age': [25, 34, 47, 58] * len(states),
+    })
+
+
+def make_analyzer(messages, **settings):
+    analyzer = LLMPlanAnalyzer(client=SimpleNamespace(messages=messages), cache=LLMResponseCache())
+    for name, value in settings.items():
+        setattr(analyzer, name, value)
+    return analyzer
+
+
+class TestConcurrentSelection(unittest.TestCase):
+    """One request per state, sent concurrently"""
+
+    def test_states_requested_concurrently(self):
+        messages = FakeMessages(delay=0.2)
+        analyzer = make_analyzer(messages)
+        candidates = make_candidates()
+
+        start = time.perf_counter()
+        selected, analysis = analyzer.select_plans_from_candidates(candidates, make_census(), EmployerPreferences())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(messages.prompts), 3)
+        self.assertGreaterEqual(messages.peak, 2)
+        self.assertLess(elapsed, 0.5)
+        # LLM picks (lowest-scored candidate per state), in state order
+        self.assertEqual(selected, [f"12344{state}0000004" for state in ('GA', 'NC', 'TX')])
+        for state in ('GA', 'NC', 'TX'):
+            self.assertIn(f"## {state}", analysis)
+            self.assertIn(f"{state} analysis.", analysis)
+
+        # Each request only carries its own state's candidates and employees
+        ga_prompt = next(p for p in messages.prompts if '"GA"' in p)
+        self.assertNotIn('NC Plan', ga_prompt)
+        self.assertIn('"total_employees": 4', ga_prompt)
+
+    def test_single_state_has_no_state_heading(self):
+        analyzer = make_analyzer(FakeMessages())
+        _, analysis = analyzer.select_plans_from_candidates(
+            make_candidates(('GA',)), make_census(('GA',)), EmployerPreferences())
+        self.assertNotIn("## GA", analysis)
+
+    def test_no_candidates(self):
+        messages = FakeMessages()
+        self.assertEqual(make_analyzer(messages).select_plans_from_candidates([], make_census(), EmployerPreferences()), ([], ""))
+        self.assertEqual(messages.prompts, [])
+
+
+class TestSelectionCache(unittest.TestCase):
+    """Identical candidate sets and preferences reuse the cached response"""
+
+    def test_rerun_uses_cache(self):
+        messages = FakeMessages()
+        analyzer = make_analyzer(messages)
+        first = analyzer.select_plans_from_candidates(make_candidates(), make_census(), EmployerPreferences())
+        second = analyzer.select_plans_from_candidates(make_candidates(), make_census(), EmployerPreferences())
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(messages.prompts), 3)
+        self.assertEqual(analyzer.cache.stats()['hits'], 3)
+
+    def test_changed_preferences_miss_cache(self):
+        messages = FakeMessages()
+        analyzer = make_analyzer(messages)
+        analyzer.select_plans_from_candidates(make_candidates(), make_census(), EmployerPreferences())
+        analyzer.select_plans_from_candidates(make_candidates(), make_census(), EmployerPreferences(contribution_pct=60.0))
+        self.assertEqual(len(messages.prompts), 6)
+
+
+class TestSelectionFallback(unittest.TestCase):
+    """Slow or failing states use the PlanScorer ranking"""
+
+    def test_slow_state_falls_back_and_late_response_is_cached(self):
+        messages = FakeMessages(delay=0.01, slow_states=('NC',), slow_delay=0.4)
+        analyzer = make_analyzer(messages, selection_slo_seconds=0.15)
+
+        start = time.perf_counter()
+        selected, analysis = analyzer.select_plans_from_candidates(make_candidates(), make_census(), EmployerPreferences())
+        self.assertLess(time.perf_counter() - start, 0.35)
+
+        # NC: highest total_score; other states: LLM pick
+        self.assertEqual(selected, ['12344GA0000004', '12340NC0000000', '12344TX0000004'])
+        self.assertIn("AI selection unavailable for NC (timed out)", analysis)
+
+        # The late NC response lands in the cache for the next run
+        time.sleep(0.4)
+        selected, analysis = analyzer.select_plans_from_candidates(make_candidates(), make_census(), EmployerPreferences())
+        self.assertEqual(selected, ['12344GA0000004', '12344NC0000004', '12344TX0000004'])
+        self.assertEqual(len(messages.prompts), 3)
+
+    def test_failing_state_falls_back(self):
+        messages = FakeMessages(fail_states=('TX',))
+        analyzer = make_analyzer(messages)
+        selected, analysis = analyzer.select_plans_from_candidates(
+            make_candidates(), make_census(), EmployerPreferences(), max_per_state=2)
+
+        self.assertEqual(selected[-2:], ['12340TX0000000', '12341TX0000001'])
+        self.assertIn("AI selection unavailable for TX (error: overloaded)", analysis)
+        self.assertEqual(len(analyzer.cache), 2)  # failures are not cached
+
+
+class TestTokenBudget(unittest.TestCase):
+    """Context is trimmed to the token budget, best candidates first"""
+
+    def test_context_trimmed_to_budget(self):
+        messages = FakeMessages()
+        analyzer = make_analyzer(messages)
+        analyzer.select_plans_from_candidates(make_candidates(('GA',), per_state=8), make_census(('GA',)), EmployerPreferences())
+        untrimmed = messages.prompts[-1]
+
+        analyzer = make_analyzer(messages, context_token_budget=600)
+        selected, _ = analyzer.select_plans_from_candidates(
+            make_candidates(('GA',), per_state=8), make_census(('GA',)), EmployerPreferences(), max_per_state=2)
+        trimmed = messages.prompts[-1]
+
+        context = json.loads(re.search(r'\*\*Context:\*\*\n(\{.*?\n\})\n', trimmed, re.S).group(1))
+        plans = context['candidates_by_state']['GA']
+        self.assertLessEqual(estimate_tokens(json.dumps(context, indent=2)), 600)
+        self.assertLess(len(trimmed), len(untrimmed))
+        self.assertNotIn('strengths', plans[0])
+        # Lowest-ranked candidates are dropped first, never below max_per_state
+        self.assertGreaterEqual(len(plans), 2)
+        self.assertEqual(plans[0]['plan_id'], '12340GA0000000')
+        self.assertIn(selected[0], [p['plan_id'] for p in plans])
+
+    def test_fit_token_budget_keeps_small_context(self):
+        analyzer = make_analyzer(FakeMessages())
+        context = {'plans': [{'plan_id': 'A', 'strengths': ['s']}]}
+        self.assertEqual(analyzer._fit_token_budget(context, [context['plans']]), {'plans': [{'plan_id': 'A', 'strengths': ['s']}]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,317 @@
+"""
+Test Suite for Plan-Year Ingestion and the Dataset Registry - ICHRA Calculator
+
+Checks that logical RBIS table names resolve to the active version's tables,
+and (with QUERY_PLAN_TEST_DSN set, see tests/test_query_plans.py) that
+plan_year_ingest loads CSV, CSV.gz and xlsx sources into a new version with
+the active version's generated columns, indexes and constraints, validates row counts,
+and that queries switch to the new tables only when it is activated, and
+only to a version for the app's plan year.
+
+Run with: python -m pytest tests/test_plan_year_ingest.py
+"""
+
+import gzip
+import shutil
+import tempfile
+import unittest
+import uuid
+from pathlib import Path
+
+import pandas as pd
+
+from database import DatabaseConnection
+from dataset_registry import (
+    DEFAULT_RBIS_VERSION,
+    DatasetRegistry,
+    clear_dataset_registry,
+    read_active_version,
+    versioned_table,
+)
+from plan_year_ingest import (
+    _index_name,
+    _loadable_columns,
+    activate_version,
+    drop_version,
+    existing_tables,
+    find_sources,
+    ingest_plan_year,
+    normalize_column,
+    plan_year_rows,
+)
+from queries import PlanQueries
+from tests.test_query_plans import DSN, _connect, build_fixture_schema
+
+
+class TestDatasetRegistry(unittest.TestCase):
+    """Logical table names resolve to the active version"""
+
+    def test_resolve_rewrites_logical_names_only(self):
+        registry = DatasetRegistry(pinned_version='20261101000000')
+        query = """
+            SELECT * FROM rbis_insurance_plan p
+            JOIN rbis_insurance_plan_base_rates br ON br.plan_id = p.hios_plan_id
+            JOIN rbis_state_rating_area_amended ra ON ra.state_code = p.state_code
+            JOIN rbis_state_rating_area sra ON sra.state = p.state_code
+            JOIN rbis_insurance_plan_variant_20251019202724 v ON v.hios_plan_id = p.hios_plan_id
+            WHERE p.plan_marketing_name <> 'rbis_insurance_plans'
+        """
+        resolved = registry.resolve(query)
+        self.assertIn('FROM rbis_insurance_plan_20261101000000 p', resolved)
+        self.assertIn('JOIN rbis_insurance_plan_base_rates_20261101000000 br', resolved)
+        self.assertIn('JOIN rbis_state_rating_area_amended ra', resolved)
+        self.assertIn('JOIN rbis_state_rating_area_20261101000000 sra', resolved)
+        self.assertIn('JOIN rbis_insurance_plan_variant_20251019202724 v', resolved)
+        self.assertIn("'rbis_insurance_plans'", resolved)
+        self.assertEqual(registry.resolve(resolved), resolved)
+
+    def test_table_names(self):
+        registry = DatasetRegistry()
+        self.assertEqual(registry.table('rbis_insurance_plan'), f'rbis_insurance_plan_{DEFAULT_RBIS_VERSION}')
+        self.assertEqual(registry.table('zip_to_county_correct'), 'zip_to_county_correct')
+        with self.assertRaises(ValueError):
+            versioned_table('rbis_insurance_plan', '2027; DROP TABLE x')
+        with self.assertRaises(ValueError):
+            versioned_table('zip_to_county_correct', DEFAULT_RBIS_VERSION)
+
+    def test_pinned_version_never_reads_the_database(self):
+        registry = DatasetRegistry(pinned_version='pinned')
+        self.assertEqual(registry.refresh(conn=None), 'pinned')
+        self.assertEqual(registry.resolve('SELECT * FROM rbis_insurance_plan', conn=object()),
+                         'SELECT * FROM rbis_insurance_plan_pinned')
+
+
+class TestSourceFiles(unittest.TestCase):
+    """Source files and headers map to tables and columns"""
+
+    def test_normalize_column(self):
+        self.assertEqual(normalize_column('HIOS Plan ID'), 'hios_plan_id')
+        self.assertEqual(normalize_column(' Individual Rate '), 'individual_rate')
+        self.assertEqual(normalize_column('co_payment'), 'co_payment')
+
+    def test_find_sources(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ('rbis_insurance_plan.csv', 'RBIS_INSURANCE_PLAN_BASE_RATES.csv.gz',
+                         'rbis_state_rating_area.xlsx', 'README.txt', 'other_table.csv'):
+                (Path(tmp) / name).touch()
+            sources = find_sources(tmp)
+            self.assertEqual(sorted(sources), ['rbis_insurance_plan', 'rbis_insurance_plan_base_rates',
+                                               'rbis_state_rating_area'])
+            (Path(tmp) / 'rbis_insurance_plan.xlsx').touch()
+            with self.assertRaises(ValueError):
+                find_sources(tmp)
+
+    def test_index_names(self):
+        self.assertEqual(_index_name('idx_rates_state_code', '20251019202724', '20261101000000'),
+                         'idx_rates_state_code_20261101000000')
+        self.assertEqual(_index_name('idx_rates_state_code_20261101000000', '20261101000000', '20271101000000'),
+                         'idx_rates_state_code_20271101000000')
+        self.assertEqual(len(_index_name('idx_' + 'x' * 70, 'a', '20261101000000')), 63)
+
+
+class FixtureDb(DatabaseConnection):
+    """DatabaseConnection on an existing psycopg2 connection."""
+
+    def __init__(self, conn):
+        super().__init__()
+        self._conn = conn
+
+
+NEW_VERSION = 'ingest_test_2027'
+
+
+def _write_sources(conn, out_dir):
+    """Export the fixture's active tables as next year's source files (CSV, CSV.gz, xlsx)."""
+    out_dir = Path(out_dir)
+    with conn.cursor() as cursor:
+        for table in existing_tables(conn, DEFAULT_RBIS_VERSION):
+            physical = versioned_table(table, DEFAULT_RBIS_VERSION)
+            # CMS-style headers ('HIOS Plan ID'), normalized back on load
+            columns = [f'"{c}" AS "{c.replace("_", " ").title()}"' for c in _loadable_columns(cursor, physical)]
+            if table == 'rbis_insurance_plan':
+                columns = [c.replace('"plan_marketing_name"', '"plan_marketing_name" || \' 2027\'') for c in columns]
+            if table == 'rbis_insurance_plan_variant':
+                columns.append('\'ignored\' AS "Extra Column"')
+            path = out_dir / f"{table}.csv"
+            with open(path, 'w', newline='') as f:
+                cursor.copy_expert(
+                    f'COPY (SELECT {", ".join(columns)} FROM "{physical}") TO STDOUT WITH (FORMAT csv, HEADER true)', f)
+            if table == 'rbis_insurance_plan_base_rates':
+                with open(path, 'rb') as src, gzip.open(out_dir / f"{table}.csv.gz", 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                path.unlink()
+            elif table == 'rbis_state_rating_area':
+                pd.read_csv(path, dtype=str, keep_default_na=False).to_excel(out_dir / f"{table}.xlsx", index=False)
+                path.unlink()
+    conn.rollback()
+
+
+@unittest.skipUnless(DSN, "QUERY_PLAN_TEST_DSN not set")
+class TestPlanYearIngest(unittest.TestCase):
+    """A new version is loaded next to the active one and switched to atomically"""
+
+    @classmethod
+    def setUpClass(cls):
+        import psycopg2
+
+        cls.admin = _connect()
+        if cls.admin is None:
+            raise unittest.SkipTest("Cannot connect to QUERY_PLAN_TEST_DSN")
+        cls.schema = f"ingest_test_{uuid.uuid4().hex[:8]}"
+        build_fixture_schema(cls.admin, cls.schema)
+        with cls.admin.cursor() as cursor:
+            # Constraints to carry over (the fixture's tables have none)
+            cursor.execute(f"ALTER TABLE {versioned_table('rbis_insurance_plan', DEFAULT_RBIS_VERSION)} "
+                           "ADD PRIMARY KEY (hios_plan_id)")
+            cursor.execute(f"ALTER TABLE {versioned_table('rbis_insurance_plan_variant', DEFAULT_RBIS_VERSION)} "
+                           "ADD UNIQUE (hios_plan_id, csr_variation_type)")
+
+        cls.conn = psycopg2.connect(DSN, options=f"-c search_path={cls.schema},public")
+        cls.tmp = tempfile.TemporaryDirectory()
+        _write_sources(cls.conn, cls.tmp.name)
+        cls.sources = find_sources(cls.tmp.name)
+        cls.result = ingest_plan_year(cls.conn, cls.sources, version=NEW_VERSION, activate=False)
+        cls.db = FixtureDb(cls.conn)
+
+    @classmethod
+    def tearDownClass(cls):
+        clear_dataset_registry()
+        cls.conn.close()
+        cls.tmp.cleanup()
+        with cls.admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {cls.schema} CASCADE")
+        cls.admin.close()
+
+    def setUp(self):
+        clear_dataset_registry()
+
+    def _scalar(self, query):
+        with self.conn.cursor() as cursor:
+            cursor.execute(query)
+            value = cursor.fetchone()[0]
+        self.conn.rollback()
+        return value
+
+    def _constraints(self, table):
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT contype, pg_get_constraintdef(oid) FROM pg_constraint "
+                           "WHERE conrelid = %s::regclass AND contype IN ('p', 'u') ORDER BY 1, 2", (table,))
+            rows = cursor.fetchall()
+        self.conn.rollback()
+        return rows
+
+    def test_loads_every_table_with_generated_columns_and_indexes(self):
+        tables = self.result['tables']
+        self.assertEqual(sorted(tables), sorted(self.sources))
+        self.assertFalse(self.result['activated'])
+        for table, info in tables.items():
+            with self.subTest(table):
+                self.assertEqual(info['rows'], info['previous_rows'])
+                self.assertEqual(self._scalar(f'SELECT COUNT(*) FROM "{info["table"]}"'), info['rows'])
+                old_indexes = self._scalar(
+                    f"SELECT COUNT(*) FROM pg_indexes WHERE tablename = '{versioned_table(table, DEFAULT_RBIS_VERSION)}'")
+                self.assertEqual(len(info['indexes']), old_indexes)
+                self.assertTrue(all(name.endswith(f"_{NEW_VERSION}") for name in info['indexes']))
+                self.assertEqual(self._constraints(info['table']),
+                                 self._constraints(versioned_table(table, DEFAULT_RBIS_VERSION)))
+                self.assertEqual(len(info['constraints']), len(self._constraints(info['table'])))
+
+        self.assertEqual(self._constraints(versioned_table('rbis_insurance_plan', NEW_VERSION)),
+                         [('p', 'PRIMARY KEY (hios_plan_id)')])
+        self.assertEqual(self._constraints(versioned_table('rbis_insurance_plan_variant', NEW_VERSION)),
+                         [('u', 'UNIQUE (hios_plan_id, csr_variation_type)')])
+
+        rates = versioned_table('rbis_insurance_plan_base_rates', NEW_VERSION)
+        self.assertEqual(self._scalar(f"SELECT COUNT(*) FROM {rates} WHERE state_code IS NULL"), 0)
+        self.assertEqual(
+            self._scalar(f"SELECT COUNT(*) FROM {rates} WHERE rating_area_numeric IS NULL"),
+            self._scalar(f"SELECT COUNT(*) FROM {versioned_table('rbis_insurance_plan_base_rates', DEFAULT_RBIS_VERSION)} "
+                         "WHERE rating_area_numeric IS NULL"))
+        benefits = versioned_table('rbis_insurance_plan_benefit_cost_share', NEW_VERSION)
+        self.assertGreater(self._scalar(f"SELECT COUNT(*) FROM {benefits} WHERE benefit_category IS NOT NULL"), 0)
+
+    def test_queries_switch_on_activation(self):
+        def plan_names():
+            return set(PlanQueries.get_plans_by_filters(self.db, 'WI')['plan_marketing_name'])
+
+        before = plan_names()
+        self.assertFalse(any(name.endswith(' 2027') for name in before))
+
+        self.assertEqual(activate_version(self.conn, NEW_VERSION), DEFAULT_RBIS_VERSION)
+        self.assertEqual(plan_names(), before)  # until the registry TTL passes
+        clear_dataset_registry()
+        self.assertEqual(plan_names(), {f"{name} 2027" for name in before})
+
+        # Roll back
+        self.assertEqual(activate_version(self.conn, DEFAULT_RBIS_VERSION), NEW_VERSION)
+        clear_dataset_registry()
+        self.assertEqual(plan_names(), before)
+        self.assertEqual(self._scalar("SELECT previous_version FROM dataset_registry"), NEW_VERSION)
+
+    def test_refuses_to_activate_another_plan_year(self):
+        # Next year's plans under the active version's rates
+        with self.conn.cursor() as cursor:
+            for table in existing_tables(self.conn, DEFAULT_RBIS_VERSION):
+                old, new = versioned_table(table, DEFAULT_RBIS_VERSION), versioned_table(table, 'ingest_test_next')
+                cursor.execute(f'CREATE TABLE "{new}" (LIKE "{old}")')
+                if table in ('rbis_insurance_plan', 'rbis_insurance_plan_base_rates'):
+                    cursor.execute(f'INSERT INTO "{new}" SELECT * FROM "{old}"')
+            cursor.execute(f"UPDATE {versioned_table('rbis_insurance_plan', 'ingest_test_next')} "
+                           "SET plan_effective_date = plan_effective_date + INTERVAL '1 year'")
+        self.conn.commit()
+
+        self.assertEqual(plan_year_rows(self.conn, NEW_VERSION)['rbis_insurance_plan'], 240)
+        with self.assertRaisesRegex(ValueError, r'no rows effective 2026-01-01 in rbis_insurance_plan;'):
+            activate_version(self.conn, 'ingest_test_next')
+        self.assertEqual(read_active_version(self.conn), DEFAULT_RBIS_VERSION)
+        self.conn.rollback()
+        drop_version(self.conn, 'ingest_test_next')
+
+    def test_rejects_truncated_source(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sources = dict(self.sources)
+            short = Path(tmp) / 'rbis_insurance_plan.csv'
+            with open(self.sources['rbis_insurance_plan']) as f:
+                short.write_text(''.join(f.readlines()[:11]))
+            sources['rbis_insurance_plan'] = short
+
+            with self.assertRaisesRegex(ValueError, 'fewer than 50%'):
+                ingest_plan_year(self.conn, sources, version='ingest_test_short')
+
+        self.assertEqual(read_active_version(self.conn), DEFAULT_RBIS_VERSION)
+        self.conn.rollback()
+        self.assertEqual(existing_tables(self.conn, 'ingest_test_short'), [])
+        self.conn.rollback()
+
+    def test_rejects_missing_columns_and_sources(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sources = dict(self.sources)
+            bad = Path(tmp) / 'rbis_insurance_plan.csv'
+            df = pd.read_csv(self.sources['rbis_insurance_plan'], dtype=str)
+            df.drop(columns=['Plan Type']).to_csv(bad, index=False)
+            sources['rbis_insurance_plan'] = bad
+            with self.assertRaisesRegex(ValueError, 'missing columns: plan_type'):
+                ingest_plan_year(self.conn, sources, version='ingest_test_bad')
+
+        sources = {k: v for k, v in self.sources.items() if k != 'rbis_state_rating_area'}
+        with self.assertRaisesRegex(ValueError, 'No source file for: rbis_state_rating_area'):
+            ingest_plan_year(self.conn, sources, version='ingest_test_bad')
+        with self.assertRaisesRegex(ValueError, 'already active'):
+            ingest_plan_year(self.conn, self.sources, version=DEFAULT_RBIS_VERSION)
+
+    def test_drop_version(self):
+        with self.conn.cursor() as cursor:
+            cursor.execute(f'CREATE TABLE {versioned_table("rbis_insurance_plan", "ingest_test_old")} (x int)')
+        self.conn.commit()
+
+        with self.assertRaisesRegex(ValueError, 'is active'):
+            drop_version(self.conn, DEFAULT_RBIS_VERSION)
+        with self.assertRaisesRegex(ValueError, 'missing tables'):
+            activate_version(self.conn, 'ingest_test_old')
+        self.assertEqual(drop_version(self.conn, 'ingest_test_old'), ['rbis_insurance_plan_ingest_test_old'])
+        self.assertEqual(existing_tables(self.conn, 'ingest_test_old'), [])
+        self.conn.rollback()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Test Suite for QR Link Pipeline - ICHRA Calculator
+
+Runs the breakdown upload -> short link -> QR pipeline against local
+stand-ins (in-memory S3 client, fake shortener and QR renderer).
+
+Run with: python -m pytest tests/test_qr_links.py
+"""
+
+import importlib.util
+import threading
+import time
+import unittest
+
+from qr_links import QRLinkPipeline
+from r2_storage import R2StorageService
+from tests.test_r2_storage import FakeS3Client
+
+HAS_QRCODE = importlib.util.find_spec('qrcode') is not None
+HAS_PPTX = importlib.util.find_spec('pptx') is not None
+
+
+class SlowShortener:
+    """Stand-in for dub.co: fixed latency, tracks peak concurrency."""
+
+    def __init__(self, delay=0.05, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url):
+        with self._lock:
+            self.calls.append(url)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in url:
+                raise ConnectionError("dub.co timeout")
+            return f"https://dub.sh/{len(url)}-{url[-12:]}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def fake_qr(url):
+    return f"PNG:{url}".encode('utf-8')
+
+
+def _page(name):
+    return f"<html><body><h1>{name}</h1></body></html>"
+
+
+class TestQRLinkPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.s3 = FakeS3Client()
+        self.storage = R2StorageService(client=self.s3)
+
+    def test_build_many_in_order_and_concurrent(self):
+        shortener = SlowShortener()
+        pipeline = QRLinkPipeline(self.storage, shortener, fake_qr, max_workers=4)
+        names = [f'Employee {i}' for i in range(10)]
+
+        links = pipeline.build_many(names, _page)
+
+        self.assertEqual(len(links), 10)
+        self.assertEqual(self.s3.put_calls, 10)
+        for link in links:
+            self.assertEqual(link.qr_png, fake_qr(link.short_url))
+            self.assertEqual(link.image().read(), link.qr_png)
+        # Output order follows input order
+        self.assertEqual([link.url for link in links],
+                         [self.storage.upload_html(_page(name)) for name in names])
+        self.assertGreater(shortener.peak, 1)
+        self.assertLessEqual(shortener.peak, 4)
+
+    def test_failure_only_affects_one_item(self):
+        shortener = SlowShortener(delay=0)
+        target_key = self.storage.upload_html(_page('Bad')).split('/')[-1].split('?')[0]
+        shortener.fail_on = target_key
+        pipeline = QRLinkPipeline(self.storage, shortener, fake_qr)
+
+        links = pipeline.build_many(['Good', 'Bad', 'Also good'], _page)
+
+        self.assertIsNotNone(links[0])
+        self.assertIsNone(links[1])
+        self.assertIsNotNone(links[2])
+
+    def test_failed_qr_render(self):
+        pipeline = QRLinkPipeline(self.storage, lambda url: url, lambda url: None)
+        self.assertEqual(pipeline.build_many(['A'], _page), [None])
+
+    def test_not_configured_skips_network(self):
+        class Unconfigured:
+            def is_configured(self):
+                return False, "R2_ACCOUNT_ID not set"
+
+            def upload_html(self, html):
+                raise AssertionError("should not upload")
+
+        shortener = SlowShortener(delay=0)
+        pipeline = QRLinkPipeline(Unconfigured(), shortener, fake_qr)
+
+        self.assertEqual(pipeline.build_many(['A', 'B'], _page), [None, None])
+        self.assertEqual(shortener.calls, [])
+
+    @unittest.skipUnless(HAS_QRCODE, "qrcode not installed")
+    def test_qr_png_cached_by_url_and_style(self):
+        from qr_generator import _render_styled_qr, generate_qr_code, generate_qr_png
+
+        _render_styled_qr.cache_clear()
+        first = generate_qr_png("https://dub.sh/abc")
+        self.assertEqual(generate_qr_code("https://dub.sh/abc").getvalue(), first)
+        self.assertEqual(_render_styled_qr.cache_info().hits, 1)
+
+        generate_qr_png("https://dub.sh/abc", box_size=8)
+        self.assertEqual(_render_styled_qr.cache_info().misses, 2)
+
+
+@unittest.skipUnless(HAS_PPTX, "python-pptx not installed")
+class TestSlidePrefetch(unittest.TestCase):
+
+    def test_prefetch_only_employees_with_dependents(self):
+        from pptx_employee_examples import EmployeeExampleData, EmployeeExamplesSlideGenerator
+
+        batches = []
+
+        class RecordingPipeline(QRLinkPipeline):
+            def build_many(self, items, render_html, label=str):
+                batches.append([label(item) for item in items])
+                return super().build_many(items, render_html, label)
+
+        pipeline = RecordingPipeline(R2StorageService(client=FakeS3Client()), lambda url: url, fake_qr)
+        generator = EmployeeExamplesSlideGenerator(include_qr_links=True, qr_pipeline=pipeline)
+        employees = [
+            EmployeeExampleData(
+                label='Example', name=name, age=40, tier='Family', location='Raleigh, NC',
+                family_status=status, member_breakdowns={'Silver': {'total': 1}}, employee_id=emp_id,
+            )
+            for emp_id, name, status in (('E1', 'Single', 'EE'), ('E2', 'Pat', 'F'), ('E3', 'Sam', 'ES'))
+        ]
+
+        generator.prefetch_qr_links(employees)
+
+        self.assertEqual(batches, [['Pat', 'Sam']])
+        self.assertEqual(sorted(generator._qr_links), ['E2', 'E3'])
+
+if __name__ == '__main__':
+    unittest.main()
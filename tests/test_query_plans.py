@@ -0,0 +1,239 @@
+"""
+Test Suite for Query Plans - ICHRA Calculator
+
+Runs every PlanQueries, FinancialQueries and PlanComparisonQueries query
+through EXPLAIN (FORMAT JSON) against a fixture database built from
+tests/fixtures/query_plan_fixture.sql plus migrations/*.sql, and fails if any
+of them sequentially scans the base-rates table (13.4M rows in production).
+
+Sequential scans are disabled for the session, so the planner only picks one
+when no index can serve the query's predicates.
+
+Needs a scratch PostgreSQL database (a temporary schema is created and dropped):
+    QUERY_PLAN_TEST_DSN="host=localhost dbname=postgres user=postgres" \\
+        python -m pytest tests/test_query_plans.py
+
+pg_trgm is optional; without it the trigram index statements are skipped.
+
+Run with: python -m pytest tests/test_query_plans.py
+"""
+
+import inspect
+import os
+import re
+import unittest
+import uuid
+from pathlib import Path
+
+from database import DatabaseConnection
+from dataset_registry import get_dataset_registry
+from queries import FinancialQueries, PlanComparisonQueries, PlanQueries
+
+DSN = os.environ.get('QUERY_PLAN_TEST_DSN')
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURE = ROOT / 'tests' / 'fixtures' / 'query_plan_fixture.sql'
+MIGRATIONS = sorted((ROOT / 'migrations').glob('[0-9][0-9][0-9]_*.sql'))
+
+BASE_RATES_TABLE = 'rbis_insurance_plan_base_rates_20251019202724'
+QUERY_CLASSES = (PlanQueries, FinancialQueries, PlanComparisonQueries)
+
+
+def split_sql(text):
+    """Statements in a migration/fixture file (full-line -- comments dropped)."""
+    lines = [line for line in text.splitlines() if not line.strip().startswith('--')]
+    return [stmt.strip() for stmt in re.split(r';\s*$', '\n'.join(lines), flags=re.M) if stmt.strip()]
+
+
+def seq_scans(plan, relation):
+    """
+    Scans reading all of relation anywhere in an EXPLAIN (FORMAT JSON) plan.
+
+    With enable_seqscan off the planner may walk a whole index instead of the
+    heap, so index scans without an Index Cond count as sequential too.
+    """
+    found = []
+    if plan.get('Relation Name') == relation:
+        node = plan.get('Node Type')
+        if node == 'Seq Scan' or (node in ('Index Scan', 'Index Only Scan') and 'Index Cond' not in plan):
+            found.append(plan)
+    for child in plan.get('Plans', []):
+        found.extend(seq_scans(child, relation))
+    return found
+
+
+class ExplainingDb(DatabaseConnection):
+    """DatabaseConnection that records EXPLAIN (FORMAT JSON) for every query it runs."""
+
+    def __init__(self, conn):
+        super().__init__()
+        self._conn = conn
+        self.plans = []  # (query, plan)
+
+    def execute_query(self, query, params=None):
+        with self._conn.cursor() as cursor:
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + get_dataset_registry().resolve(query), params)
+            self.plans.append((query, cursor.fetchone()[0][0]['Plan']))
+        return super().execute_query(query, params)
+
+    def read_sql(self, query, params=None):
+        """FinancialQueries' pd.read_sql path, run through execute_query (no SQLAlchemy needed)."""
+        return self.execute_query(query, tuple(params) if params is not None else None)
+
+
+def query_cases(plan_ids, locations):
+    """(query class, method name, args, kwargs) for every query method under test."""
+    return [
+        (PlanQueries, 'get_available_states', (), {}),
+        (PlanQueries, 'get_plan_counts_by_metal', (), {}),
+        (PlanQueries, 'get_plan_counts_by_metal_for_census', ([('WI', 3), ('IL', 5)],), {}),
+        (PlanQueries, 'get_plans_by_filters', (), {'state_codes': ['WI', 'NC'], 'metal_level': 'Silver'}),
+        (PlanQueries, 'get_plans_with_rating_area_coverage', (plan_ids, {'WI': [1, 2, 3]}), {}),
+        (PlanQueries, 'get_plan_deductibles_moop', (plan_ids,), {}),
+        (PlanQueries, 'get_plan_rates_by_age', (plan_ids, [21, 40], 3), {}),
+        (PlanQueries, 'get_rating_area_by_county', ('wi', 'wi county 4'), {}),
+        (PlanQueries, 'get_rating_areas_batch', ([('WI', 'WI County 4'), ('NC', 'NC County 9')],), {}),
+        (PlanQueries, 'get_counties_by_zip_batch', ([('53004', 'WI'), ('75199', 'TX')],), {}),
+        (PlanQueries, 'get_counties_by_state', ('NC',), {}),
+        (PlanQueries, 'get_county_by_zip', ('75199', 'TX'), {}),
+        (PlanQueries, 'get_lcsp_by_rating_area', ('WI', 3, '40'), {}),
+        (PlanQueries, 'get_lcsp_for_employees_batch', (locations,), {}),
+        (PlanQueries, 'get_lowest_cost_plan_by_rating_area', ('WI', 3, '40', 'Gold'), {}),
+        (PlanQueries, 'get_lowest_cost_plans_batch', (locations, 'Bronze'), {}),
+        (PlanQueries, 'get_lowest_cost_plans_all_metals_batch', (locations,), {}),
+        (PlanQueries, 'get_slcsp_for_employees_batch', (locations,), {}),
+        (PlanQueries, 'get_lcsp_and_slcsp_batch', (locations,), {}),
+        (FinancialQueries, 'get_plans_for_state', ('WI', 'Silver'), {}),
+        (FinancialQueries, 'get_rates_batch', (plan_ids,), {}),
+        (FinancialQueries, 'get_plan_summary', (plan_ids[0],), {}),
+        (FinancialQueries, 'get_plan_summaries_batch', (plan_ids,), {}),
+        (PlanComparisonQueries, 'get_plans_with_full_details', ('WI', 3), {
+            'metal_levels': ['Silver', 'Gold'], 'plan_types': ['HMO', 'PPO'],
+            'max_deductible': 5000, 'max_oopm': 10000, 'hsa_only': True,
+        }),
+        (PlanComparisonQueries, 'get_plan_copays_for_comparison', (plan_ids,), {}),
+        (PlanComparisonQueries, 'get_plan_family_deductibles_oopm', (plan_ids,), {}),
+        (PlanComparisonQueries, 'get_plan_hsa_eligibility', (plan_ids,), {}),
+        (PlanComparisonQueries, 'get_plan_coinsurance', (plan_ids,), {}),
+    ]
+
+
+def _connect():
+    try:
+        import psycopg2
+        conn = psycopg2.connect(DSN)
+    except Exception:
+        return None
+    conn.autocommit = True  # CREATE INDEX CONCURRENTLY can't run in a transaction
+    return conn
+
+
+def build_fixture_schema(conn, schema):
+    """Create schema from the fixture and migrations, analyze it, and leave it on the search_path."""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        has_trgm = cursor.fetchone() is not None
+
+        cursor.execute(f"CREATE SCHEMA {schema}")
+        cursor.execute(f"SET search_path TO {schema}, public")
+        for stmt in split_sql(FIXTURE.read_text()):
+            cursor.execute(stmt)
+        for migration in MIGRATIONS:
+            for stmt in split_sql(migration.read_text()):
+                if not has_trgm and ('pg_trgm' in stmt or 'gin_trgm_ops' in stmt):
+                    continue
+                cursor.execute(stmt)
+        cursor.execute("SELECT tablename FROM pg_tables WHERE schemaname = %s", (schema,))
+        for (table,) in cursor.fetchall():
+            cursor.execute(f'ANALYZE "{table}"')
+
+
+def fixture_plan_ids(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT hios_plan_id FROM rbis_insurance_plan_20251019202724 "
+                       "WHERE state_code = 'WI' ORDER BY hios_plan_id LIMIT 8")
+        return [row[0] for row in cursor.fetchall()]
+
+
+FIXTURE_LOCATIONS = [
+    {'state_code': 'WI', 'rating_area_id': 3, 'age_band': '40'},
+    {'state_code': 'IL', 'rating_area_id': 5, 'age_band': '21'},
+]
+
+
+@unittest.skipUnless(DSN, "QUERY_PLAN_TEST_DSN not set")
+class TestQueryPlans(unittest.TestCase):
+    """No query sequentially scans the base-rates table"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.conn = _connect()
+        if cls.conn is None:
+            raise unittest.SkipTest("Cannot connect to QUERY_PLAN_TEST_DSN")
+
+        cls.schema = f"query_plan_test_{uuid.uuid4().hex[:8]}"
+        build_fixture_schema(cls.conn, cls.schema)
+        with cls.conn.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+        cls.plan_ids = fixture_plan_ids(cls.conn)
+        cls.locations = FIXTURE_LOCATIONS
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.conn.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {cls.schema} CASCADE")
+        cls.conn.close()
+
+    def explain(self, query_class, method, args, kwargs):
+        db = ExplainingDb(self.conn)
+        getattr(query_class, method)(db, *args, **kwargs)
+        return db.plans
+
+    def test_every_query_method_is_covered(self):
+        cases = {(cls, name) for cls, name, _, _ in query_cases(self.plan_ids, self.locations)}
+        for query_class in QUERY_CLASSES:
+            for name, _ in inspect.getmembers(query_class, inspect.isfunction):
+                if not name.startswith('_'):
+                    self.assertIn((query_class, name), cases, f"No EXPLAIN case for {query_class.__name__}.{name}")
+
+    def test_no_sequential_scan_of_base_rates(self):
+        for query_class, method, args, kwargs in query_cases(self.plan_ids, self.locations):
+            with self.subTest(f"{query_class.__name__}.{method}"):
+                plans = self.explain(query_class, method, args, kwargs)
+                self.assertTrue(plans, "method ran no queries")
+                for query, plan in plans:
+                    self.assertEqual(
+                        seq_scans(plan, BASE_RATES_TABLE), [],
+                        f"Sequential scan of {BASE_RATES_TABLE}:\n{' '.join(query.split())[:300]}"
+                    )
+
+    def test_rewritten_predicates_return_expected_rows(self):
+        db = ExplainingDb(self.conn)
+
+        lcsp = PlanQueries.get_lcsp_by_rating_area(db, 'WI', 3, '40')
+        self.assertEqual(len(lcsp), 1)
+        self.assertEqual(lcsp.iloc[0]['state_code'], 'WI')
+        self.assertEqual(lcsp.iloc[0]['rating_area_id'], 3)
+
+        coverage = PlanQueries.get_plans_with_rating_area_coverage(db, self.plan_ids, {'WI': [1, 2, 3]})
+        self.assertEqual(len(coverage), len(self.plan_ids))
+        self.assertTrue((coverage['num_areas_covered'] == 10).all())  # 'Statewide' rows are not counted
+        self.assertTrue((coverage['num_employee_areas_covered'] == 3).all())
+        self.assertEqual(list(coverage.iloc[0]['covered_areas']), list(range(1, 11)))
+
+        rates = PlanQueries.get_plan_rates_by_age(db, self.plan_ids, [21], 3)
+        self.assertEqual(len(rates), len(self.plan_ids))
+        self.assertEqual(set(rates['rating_area_id']), {3})
+
+        details = PlanComparisonQueries.get_plans_with_full_details(db, 'WI', 3)
+        self.assertEqual(set(details['individual_deductible']), {500, 3000, 3500})
+        self.assertEqual(set(details['individual_oopm']), {9200})
+
+        coinsurance = PlanComparisonQueries.get_plan_coinsurance(db, self.plan_ids)
+        self.assertEqual(coinsurance.iloc[0]['coinsurance'], '30%')
+
+        moop = PlanComparisonQueries.get_plan_family_deductibles_oopm(db, self.plan_ids[:1])
+        self.assertEqual(len(moop), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Test Suite for the Quoting Service - ICHRA Calculator
+
+Uses a fake database whose batch benchmark query prices each age band from
+the request, so coalescing, caching and the HTTP endpoints can be checked
+without Postgres.
+
+Run with: python -m pytest tests/test_quoting_service.py
+"""
+
+import json
+import subprocess
+import sys
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pandas as pd
+
+from quoting_service import BenchmarkBatcher, QuotingService, benchmark_key
+
+
+class FakeBenchmarkDb:
+    """Answers get_lcsp_and_slcsp_batch with LCSP = 300 + band, SLCSP = LCSP + 20"""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def execute_query(self, query, params=None):
+        with self.lock:
+            self.calls.append(params)
+        rows = []
+        # get_lcsp_and_slcsp_batch binds (state, rating_area_id, age_band) per location
+        for i in range(0, len(params), 3):
+            state, rating_area_id, age_band = params[i:i + 3]
+            band = 64 if age_band == '64 and over' else (14 if age_band == '0-14' else int(age_band))
+            lcsp = 300.0 + band
+            for rank, premium in ((1, lcsp), (2, lcsp + 20)):
+                rows.append({
+                    'hios_plan_id': f'{state}{rating_area_id}{rank}', 'plan_name': f'Silver {rank}',
+                    'state_code': state, 'rating_area_id': rating_area_id, 'age_band': age_band,
+                    'premium': premium, 'plan_rank': rank,
+                })
+        return pd.DataFrame(rows)
+
+
+class TestBenchmarkBatcher(unittest.TestCase):
+    """Concurrent lookups share one query; repeats come from the cache"""
+
+    def setUp(self):
+        self.db = FakeBenchmarkDb()
+        self.batcher = BenchmarkBatcher(self.db, window_seconds=0.05)
+
+    def tearDown(self):
+        self.batcher.close()
+
+    def test_concurrent_lookups_coalesce(self):
+        keys = [benchmark_key('NC', 4, age) for age in (30, 31, 32, 33, 30, 31)]
+        results = {}
+
+        def lookup(key):
+            results[key] = self.batcher.lookup_many([key])
+
+        threads = [threading.Thread(target=lookup, args=(key,)) for key in keys]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.db.calls), 1)
+        self.assertEqual(results[('NC', 4, '30')][('NC', 4, '30')]['lcsp'], 330.0)
+        self.assertEqual(self.batcher.stats()['keys_queried'], 4)
+
+    def test_hot_keys_served_from_cache(self):
+        key = benchmark_key('nc', 'Rating Area 4', 40)
+        self.assertEqual(key, ('NC', 4, '40'))
+        first = self.batcher.lookup_many([key])[key]
+        second = self.batcher.lookup_many([key])[key]
+
+        self.assertEqual(first, second)
+        self.assertEqual(second['slcsp'], 360.0)
+        self.assertEqual(len(self.db.calls), 1)
+        self.assertEqual(self.batcher.stats()['cache_hits'], 1)
+
+
+class TestQuotingServiceHttp(unittest.TestCase):
+    """JSON endpoints on an ephemeral port"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = FakeBenchmarkDb()
+        cls.service = QuotingService(cls.db, port=0, window_seconds=0.001)
+        cls.service.start()
+        host, port = cls.service.address
+        cls.base_url = f'http://{host}:{port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.shutdown()
+
+    def request(self, path, payload=None):
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        try:
+            with urllib.request.urlopen(urllib.request.Request(self.base_url + path, data=data), timeout=10) as r:
+                return r.status, json.loads(r.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_household_lcsp(self):
+        status, body = self.request('/v1/lcsp', {
+            'state': 'NC', 'rating_area_id': 4, 'ee_age': 40, 'spouse_age': 38,
+            'child_ages': [10], 'family_status': 'F',
+        })
+        self.assertEqual(status, 200)
+        self.assertEqual([m['age_band'] for m in body['members']], ['40', '38', '0-14'])
+        self.assertEqual(body['lcsp_ee_rate'], 340.0)
+        self.assertEqual(body['household_lcsp'], 340.0 + 338.0 + 314.0)
+        self.assertEqual(body['household_slcsp'], 340.0 + 338.0 + 314.0 + 60)
+
+    def test_strategy(self):
+        status, body = self.request('/v1/strategy', {
+            'census': [
+                {'employee_id': 'E1', 'age': 30, 'state': 'NC', 'rating_area_id': 4, 'family_status': 'EE'},
+                {'employee_id': 'E2', 'age': 50, 'state': 'NC', 'rating_area_id': 4, 'family_status': 'ES'},
+            ],
+            'strategy': {'strategy_type': 'percentage_lcsp', 'lcsp_percentage': 100},
+        })
+        self.assertEqual(status, 200, body)
+        self.assertEqual(body['employees_covered'], 2)
+        self.assertAlmostEqual(body['employee_contributions']['E1']['monthly_contribution'], 330.0)
+
+    def test_bad_requests(self):
+        self.assertEqual(self.request('/v1/lcsp', {'state': 'NC'})[0], 400)
+        self.assertEqual(self.request('/v1/strategy', {'census': []})[0], 400)
+        self.assertEqual(self.request('/v1/strategy', {
+            'census': [{'employee_id': 'E1', 'age': 30, 'state': 'NC', 'rating_area_id': 4}],
+            'strategy': {'strategy_type': 'nope'},
+        })[0], 400)
+        self.assertEqual(self.request('/v1/unknown')[0], 404)
+
+    def test_stats(self):
+        self.request('/v1/lcsp', {'state': 'NC', 'rating_area_id': 4, 'ee_age': 25})
+        status, body = self.request('/v1/stats')
+        self.assertEqual(status, 200)
+        self.assertGreaterEqual(body['endpoints']['/v1/lcsp']['requests'], 1)
+        self.assertIn('p95_ms', body['endpoints']['/v1/lcsp'])
+        self.assertIn('cache_hit_rate', body['batcher'])
+
+
+
+class TestStandalone(unittest.TestCase):
+    """The service runs without Streamlit"""
+
+    def test_no_streamlit_import(self):
+        code = "import sys, quoting_service; sys.exit('streamlit' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], cwd=str(Path(__file__).parent.parent))
+        self.assertEqual(result.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Test Suite for R2 Storage Service - ICHRA Calculator
+
+Runs against an in-memory S3-compatible stand-in, so no R2 credentials or
+network access are needed.
+
+Run with: python -m pytest tests/test_r2_storage.py
+"""
+
+import gzip
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from r2_storage import R2StorageService, compress_body, content_key, MIN_COMPRESS_BYTES
+
+
+class FakeS3Client:
+    """Minimal S3 client stand-in implementing the calls R2StorageService uses."""
+
+    def __init__(self):
+        self.objects = {}
+        self.put_calls = 0
+        self.head_calls = 0
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        with self._lock:
+            self.put_calls += 1
+            self.objects[(Bucket, Key)] = {
+                'Body': Body,
+                'LastModified': datetime.now(timezone.utc),
+                **kwargs,
+            }
+
+    def head_object(self, Bucket, Key):
+        with self._lock:
+            self.head_calls += 1
+            if (Bucket, Key) not in self.objects:
+                raise KeyError("404 Not Found")
+            return {'LastModified': self.objects[(Bucket, Key)]['LastModified']}
+
+    def generate_presigned_url(self, method, Params, ExpiresIn):
+        return f"https://fake-r2/{Params['Bucket']}/{Params['Key']}?expires={ExpiresIn}"
+
+
+def _large_html(marker: str) -> str:
+    return f"<html><body><h1>{marker}</h1>{'<p>row</p>' * 500}</body></html>"
+
+
+class TestCompression(unittest.TestCase):
+    """Body encoding"""
+
+    def test_small_body_not_compressed(self):
+        payload, encoding = compress_body(b"x" * (MIN_COMPRESS_BYTES - 1))
+        self.assertIsNone(encoding)
+
+    def test_gzip_roundtrip(self):
+        body = _large_html("gzip").encode('utf-8')
+        payload, encoding = compress_body(body, 'gzip')
+        self.assertEqual(encoding, 'gzip')
+        self.assertLess(len(payload), len(body))
+        self.assertEqual(gzip.decompress(payload), body)
+
+    def test_gzip_is_deterministic(self):
+        body = _large_html("same").encode('utf-8')
+        self.assertEqual(compress_body(body)[0], compress_body(body)[0])
+
+    def test_content_key_is_stable(self):
+        self.assertEqual(content_key("p", b"abc", "html"), content_key("p", b"abc", "html"))
+        self.assertNotEqual(content_key("p", b"abc", "html"), content_key("p", b"abd", "html"))
+
+
+class TestUploads(unittest.TestCase):
+    """Uploads against the in-memory stand-in"""
+
+    def setUp(self):
+        self.client = FakeS3Client()
+        self.service = R2StorageService(client=self.client)
+
+    def test_upload_html_sets_content_encoding(self):
+        url = self.service.upload_html(_large_html("a"))
+        self.assertIsNotNone(url)
+        (stored,) = self.client.objects.values()
+        self.assertEqual(stored['ContentEncoding'], 'gzip')
+        self.assertEqual(stored['ContentType'], 'text/html; charset=utf-8')
+        self.assertIn(b"<h1>a</h1>", gzip.decompress(stored['Body']))
+
+    def test_duplicate_upload_skipped(self):
+        url1 = self.service.upload_html(_large_html("dup"))
+        url2 = self.service.upload_html(_large_html("dup"))
+        self.assertEqual(url1, url2)
+        self.assertEqual(self.client.put_calls, 1)
+        self.assertEqual(self.service.stats['deduplicated'], 1)
+
+    def test_existing_object_found_by_head(self):
+        self.service.upload_html(_large_html("shared"))
+        other = R2StorageService(client=self.client)
+        other.upload_html(_large_html("shared"))
+        self.assertEqual(self.client.put_calls, 1)
+        self.assertEqual(other.stats['deduplicated'], 1)
+
+    def test_stale_object_reuploaded(self):
+        self.service.upload_html(_large_html("old"))
+        for obj in self.client.objects.values():
+            obj['LastModified'] = datetime.now(timezone.utc) - timedelta(days=3)
+        other = R2StorageService(client=self.client)
+        other.upload_html(_large_html("old"))
+        self.assertEqual(self.client.put_calls, 2)
+
+    def test_upload_many_preserves_order(self):
+        pages = [_large_html(f"emp-{i}") for i in range(12)] + [_large_html("emp-0")]
+        urls = self.service.upload_many(pages, max_workers=4)
+        self.assertEqual(len(urls), 13)
+        self.assertTrue(all(urls))
+        self.assertEqual(urls[0], urls[-1])
+        self.assertEqual(len(self.client.objects), 12)
+
+    def test_not_configured_returns_none(self):
+        with patch.dict('os.environ', {}, clear=True):
+            service = R2StorageService()
+            self.assertIsNone(service.upload_html("<html></html>"))
+            self.assertEqual(service.upload_many(["a", "b"]), [None, None])
+
+    def test_endpoint_override(self):
+        with patch.dict('os.environ', {
+            'R2_ENDPOINT_URL': 'http://localhost:9000',
+            'R2_ACCESS_KEY_ID': 'minio',
+            'R2_SECRET_ACCESS_KEY': 'minio123',
+        }, clear=True):
+            service = R2StorageService()
+            self.assertEqual(service.endpoint, 'http://localhost:9000')
+            self.assertEqual(service.is_configured(), (True, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
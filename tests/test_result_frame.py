@@ -0,0 +1,83 @@
+"""
+Test Suite for the Columnar Strategy Result - ICHRA Calculator
+
+Checks that build_result_frame() lines up contribution, affordability and
+subsidy records per employee exactly as the dict lookups it replaces.
+
+Run with: python -m pytest tests/test_result_frame.py
+"""
+
+import unittest
+
+from contribution_eval import SafeHarborType
+from contribution_eval.components.employee_breakdown import (
+    _build_age_distribution_data,
+    _build_family_distribution_data,
+)
+from contribution_eval.services.strategy_service import StrategyService
+from contribution_eval.services.subsidy_service import SubsidyService
+from contribution_eval.utils.calculations import calculate_age_band
+from contribution_eval.utils.result_frame import build_result_frame, join_census
+from tests.helpers import make_census
+
+
+class TestResultFrame(unittest.TestCase):
+    """Frame columns agree with the per-employee dicts"""
+
+    def setUp(self):
+        self.census_df, cache = make_census(40)
+        service = StrategyService(None, self.census_df, cache)
+        result = service.calculate_strategy(strategy_type='flat_amount', base_contribution=400.0)
+        self.result = service.calculate_with_affordability(result, SafeHarborType.RATE_OF_PAY)
+        lcsp = {e: c.get('lcsp_ee_rate', 0) for e, c in self.result['employee_contributions'].items()}
+        self.subsidy = SubsidyService(None, self.census_df).analyze_workforce_subsidy_potential(
+            self.result, lcsp, lcsp
+        )
+        self.frame = build_result_frame(self.result, self.result['affordability'], self.subsidy)
+
+    def test_rows_align_with_source_records(self):
+        contributions = self.result['employee_contributions']
+        employee_affordability = self.result['affordability']['employee_affordability']
+        by_employee = {e['employee_id']: e for e in self.subsidy['by_employee']}
+
+        self.assertEqual(list(self.frame.index), list(contributions))
+        for emp_id, row in self.frame.iterrows():
+            self.assertEqual(row['monthly_contribution'], contributions[emp_id]['monthly_contribution'])
+            self.assertEqual(row['has_affordability'], emp_id in employee_affordability)
+            if emp_id in employee_affordability:
+                self.assertEqual(row['aff_is_affordable'], employee_affordability[emp_id]['is_affordable'])
+                self.assertEqual(row['aff_gap'], employee_affordability[emp_id]['gap'])
+            self.assertEqual(row['has_subsidy'], emp_id in by_employee)
+            if emp_id in by_employee:
+                self.assertEqual(row['subsidy_eligible'], by_employee[emp_id]['eligible'])
+                self.assertEqual(row['subsidy_subsidy'], by_employee[emp_id]['subsidy'])
+
+    def test_breakdown_groups_match_dict_totals(self):
+        contributions = self.result['employee_contributions'].values()
+
+        for band in _build_age_distribution_data(self.frame):
+            members = [c for c in contributions if calculate_age_band(c['age']) == band['band']]
+            self.assertEqual(band['employees'], len(members))
+            self.assertAlmostEqual(band['total'], sum(c['monthly_contribution'] for c in members), places=6)
+
+        for status in _build_family_distribution_data(self.frame):
+            members = [c for c in contributions if c['family_status'] == status['status_code']]
+            self.assertEqual(status['employees'], len(members))
+            self.assertAlmostEqual(status['total'], sum(c['monthly_contribution'] for c in members), places=6)
+
+    def test_join_census(self):
+        census = self.census_df.assign(county='Wake')
+        joined = join_census(self.frame, census, ['county', 'monthly_income', 'not_a_column'])
+
+        self.assertTrue((joined['county'] == 'Wake').all())
+        self.assertIn('monthly_income_census', joined.columns)
+        self.assertTrue(joined['not_a_column'].isna().all())
+
+    def test_empty_result(self):
+        frame = build_result_frame({'employee_contributions': {}})
+        self.assertTrue(frame.empty)
+        self.assertEqual(_build_age_distribution_data(frame), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Test Suite for Contribution Scenario Sweep - ICHRA Calculator
+
+Checks that every row of the vectorized sweep matches the single-point
+strategy calculation for the same parameters.
+
+Run with: python -m pytest tests/test_scenario_sweep.py
+"""
+
+import unittest
+
+import pandas as pd
+
+from contribution_eval import OperatingMode, SafeHarborType
+from contribution_eval.services.strategy_service import StrategyService
+from contribution_eval.services.scenario_sweep import (
+    pareto_frontier,
+    sweep_contribution_grid,
+)
+from tests.helpers import make_census
+
+
+class TestScenarioSweep(unittest.TestCase):
+    """Sweep rows agree with calculate_strategy() + calculate_with_affordability()"""
+
+    def _assert_matches_single_point(self, n_employees, mode, safe_harbor):
+        census_df, cache = make_census(n_employees)
+        service = StrategyService(None, census_df, cache)
+        grid = [150.0, 325.5, 600.0]
+        percentages = [40.0, 85.0]
+
+        sweep = service.sweep_strategies(mode, grid, percentages, safe_harbor=safe_harbor)
+        self.assertFalse(sweep.empty)
+
+        for row in sweep.itertuples():
+            result = service.calculate_strategy(
+                strategy_type=row.strategy_type,
+                base_contribution=row.parameter,
+                lcsp_percentage=row.parameter,
+            )
+            result = service.calculate_with_affordability(result, safe_harbor)
+            label = f"{row.strategy_type} @ {row.parameter}"
+
+            self.assertAlmostEqual(row.total_monthly, result['total_monthly'], places=2, msg=label)
+            self.assertEqual(row.affordable_count, result['affordability']['affordable_count'], label)
+            self.assertEqual(row.total_analyzed, result['affordability']['total_analyzed'], label)
+            self.assertEqual(
+                row.employees_affordability_adjusted, result.get('employees_affordability_adjusted', 0), label
+            )
+            eligible = sum(
+                1 for c in result['employee_contributions'].values() if c.get('is_subsidy_eligible')
+            )
+            self.assertEqual(row.subsidy_eligible_count, eligible, label)
+
+    def test_matches_single_point_non_ale(self):
+        self._assert_matches_single_point(20, OperatingMode.NON_ALE_STANDARD, SafeHarborType.RATE_OF_PAY)
+
+    def test_matches_single_point_ale_fpl(self):
+        self._assert_matches_single_point(60, OperatingMode.ALE, SafeHarborType.FPL)
+
+    def test_matches_single_point_ale_rate_of_pay(self):
+        self._assert_matches_single_point(60, OperatingMode.ALE, SafeHarborType.RATE_OF_PAY)
+
+    def test_subsidy_mode_frontier_ranks_on_eligibility(self):
+        census_df, cache = make_census(40)
+        service = StrategyService(None, census_df, cache)
+        sweep = service.sweep_strategies(OperatingMode.NON_ALE_SUBSIDY, [50.0, 150.0, 300.0, 600.0])
+
+        self.assertEqual(set(sweep['strategy_type']), {'flat_amount', 'base_age_curve'})
+        expected = pareto_frontier(sweep, benefit_col='subsidy_eligible_count')
+        self.assertEqual(sweep['on_frontier'].tolist(), expected.tolist())
+        # Each frontier point is the cheapest way to reach its eligible count
+        frontier = sweep[sweep['on_frontier']]
+        for row in frontier.itertuples():
+            cheaper = sweep[sweep['total_monthly'] < row.total_monthly]
+            self.assertFalse((cheaper['subsidy_eligible_count'] >= row.subsidy_eligible_count).any())
+
+    def test_unsupported_strategy_rejected(self):
+        census_df, cache = make_census(5)
+        arrays = StrategyService(None, census_df, cache)._calculator.get_workforce_arrays()
+        with self.assertRaises(ValueError):
+            sweep_contribution_grid(arrays, ['fpl_safe_harbor'], [100.0])
+
+    def test_pareto_frontier(self):
+        df = pd.DataFrame({
+            'total_monthly': [100, 200, 150, 300, 250],
+            'affordable_count': [2, 5, 2, 5, 6],
+        })
+        self.assertEqual(pareto_frontier(df).tolist(), [True, True, False, False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+"""
+Test Suite for Vectorized Subsidy Eligibility - ICHRA Calculator
+
+Checks that is_subsidy_eligible_array() returns exactly what the scalar
+is_subsidy_eligible() returns for every employee, and that
+SubsidyService.analyze_workforce_subsidy_potential() matches the
+per-employee loop it replaces.
+
+Run with: python -m pytest tests/test_subsidy_kernel.py
+"""
+
+import math
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from contribution_eval.services.subsidy_service import SubsidyService
+from subsidy_utils import (
+    ELIGIBILITY_REASONS,
+    FAMILY_STATUS_HOUSEHOLD_SIZE,
+    is_subsidy_eligible,
+    is_subsidy_eligible_array,
+)
+
+STATUSES = ['EE', 'ES', 'EC', 'F']
+
+
+def _random_inputs(n, seed=11):
+    """Per-employee inputs covering every eligibility branch and edge case."""
+    rng = np.random.default_rng(seed)
+    income = rng.uniform(800, 15000, n).round(2)
+    income[rng.random(n) < 0.1] = np.nan
+    income[rng.random(n) < 0.05] = 0.0
+    lcsp = rng.uniform(200, 1400, n).round(2)
+    lcsp[rng.random(n) < 0.03] = 0.0
+    slcsp = lcsp + rng.uniform(0, 90, n).round(2)
+    slcsp[rng.random(n) < 0.2] = np.nan
+    slcsp[rng.random(n) < 0.05] = 0.0
+    contribution = rng.uniform(0, 1200, n).round(2)
+    age = rng.integers(18, 75, n)
+    age[:3] = [64, 65, 66]
+    # Unaffordable, but the expected contribution exceeds a cheap benchmark
+    income[-3:], lcsp[-3:], slcsp[-3:], contribution[-3:], age[-3:] = 12000.0, 1300.0, 400.0, 0.0, 40
+    statuses = [STATUSES[i] for i in rng.integers(0, 4, n)]
+    return income, lcsp, contribution, age, slcsp, statuses
+
+
+def _scalar(income, lcsp, contribution, age, slcsp, status):
+    return is_subsidy_eligible(
+        monthly_income=None if math.isnan(income) else income,
+        lcsp=lcsp,
+        contribution=contribution,
+        age=int(age),
+        slcsp=None if math.isnan(slcsp) else slcsp,
+        family_status=status,
+    )
+
+
+class TestEligibilityKernel(unittest.TestCase):
+    """is_subsidy_eligible_array() agrees with is_subsidy_eligible()"""
+
+    def test_matches_scalar_for_every_field(self):
+        income, lcsp, contribution, age, slcsp, statuses = _random_inputs(3000)
+        household = np.array([FAMILY_STATUS_HOUSEHOLD_SIZE[s] for s in statuses])
+        result = is_subsidy_eligible_array(income, lcsp, contribution, age, slcsp, household)
+
+        seen_reasons = set()
+        for i in range(len(income)):
+            expected = _scalar(income[i], lcsp[i], contribution[i], age[i], slcsp[i], statuses[i])
+            seen_reasons.add(expected['reason'])
+            for key in ('eligible', 'reason', 'subsidy_amount', 'is_medicare', 'is_unaffordable', 'employee_cost'):
+                self.assertEqual(result[key][i], expected[key], f"{key} for employee {i}")
+            for key in ('affordability_pct', 'max_contribution_for_eligibility'):
+                if expected[key] is None:
+                    self.assertTrue(np.isnan(result[key][i]), f"{key} for employee {i}")
+                else:
+                    self.assertEqual(result[key][i], expected[key], f"{key} for employee {i}")
+            self.assertEqual(ELIGIBILITY_REASONS[result['reason_code'][i]], expected['reason'])
+
+        self.assertEqual(seen_reasons, set(ELIGIBILITY_REASONS))
+
+    def test_defaults_and_empty_input(self):
+        result = is_subsidy_eligible_array([2500.0], [600.0], [100.0], [40])
+        expected = is_subsidy_eligible(2500.0, 600.0, 100.0, 40)
+        self.assertEqual(bool(result['eligible'][0]), expected['eligible'])
+        self.assertEqual(result['subsidy_amount'][0], expected['subsidy_amount'])
+
+        empty = is_subsidy_eligible_array([], [], [], [])
+        self.assertEqual(len(empty['eligible']), 0)
+        self.assertEqual(len(empty['reason']), 0)
+
+
+def _workforce(n, seed=5):
+    """Census plus strategy result, LCSP and SLCSP dicts for n employees."""
+    income, lcsp, contribution, age, slcsp, statuses = _random_inputs(n, seed)
+    ids = [f"E{i:05d}" for i in range(n)]
+    census_df = pd.DataFrame({
+        'employee_id': ids,
+        'age': age,
+        'family_status': statuses,
+        'monthly_income': [None if math.isnan(v) else f"${v:,.2f}" for v in income],
+    })
+    contributions = {
+        emp_id: {
+            'monthly_contribution': float(contribution[i]),
+            'lcsp_ee_rate': float(lcsp[i]),
+            'age': int(age[i]) if i % 4 else None,
+            'name': f"Employee {i}",
+        }
+        for i, emp_id in enumerate(ids)
+    }
+    contributions['E_NOT_IN_CENSUS'] = {'monthly_contribution': 100.0, 'lcsp_ee_rate': 500.0}
+    lcsp_data = {emp_id: float(lcsp[i]) for i, emp_id in enumerate(ids) if i % 7}
+    slcsp_data = {emp_id: float(slcsp[i]) for i, emp_id in enumerate(ids) if not math.isnan(slcsp[i])}
+    return census_df, {'employee_contributions': contributions}, lcsp_data, slcsp_data
+
+
+def _reference_by_employee(service, strategy_result, lcsp_data, slcsp_data):
+    """The per-employee loop analyze_workforce_subsidy_potential() used before vectorizing."""
+    results = []
+    for emp_id, contrib in strategy_result['employee_contributions'].items():
+        contribution = contrib.get('monthly_contribution', 0)
+        lcsp = lcsp_data.get(emp_id, contrib.get('lcsp_ee_rate', 0))
+        slcsp = slcsp_data.get(emp_id, contrib.get('slcsp_ee_rate', 0))
+        matches = service.census_df[service.census_df['employee_id'].astype(str) == str(emp_id)]
+        if matches.empty:
+            continue
+        emp_data = matches.iloc[0].to_dict()
+        age = contrib.get('age')
+        if age is None:
+            age = emp_data.get('age') or emp_data.get('ee_age') or 30
+        eligibility = is_subsidy_eligible(
+            monthly_income=service._parse_income(emp_data.get('monthly_income')),
+            lcsp=lcsp,
+            contribution=contribution,
+            age=int(age),
+            slcsp=slcsp,
+            family_status=str(emp_data.get('family_status') or 'EE').upper(),
+        )
+        result = {
+            'employee_id': emp_id,
+            'name': contrib.get('name', emp_id),
+            'eligible': eligibility['eligible'],
+            'reason': eligibility['reason'],
+            'subsidy': eligibility['subsidy_amount'],
+            'is_medicare': eligibility['is_medicare'],
+        }
+        if eligibility['eligible']:
+            subsidy = eligibility['subsidy_amount']
+            result.update({
+                'ichra_contribution': contribution,
+                'better_option': 'Subsidy' if subsidy > contribution else 'ICHRA',
+                'net_benefit': round(max(subsidy, contribution), 2),
+            })
+        if not eligibility['is_unaffordable'] and not eligibility['is_medicare']:
+            result['ichra_cost'] = eligibility['employee_cost']
+        results.append(result)
+    return results
+
+
+class TestWorkforceAnalysis(unittest.TestCase):
+    """SubsidyService results are unchanged by the vectorized kernel"""
+
+    def test_matches_per_employee_loop(self):
+        census_df, strategy_result, lcsp_data, slcsp_data = _workforce(400)
+        service = SubsidyService(None, census_df)
+        analysis = service.analyze_workforce_subsidy_potential(strategy_result, lcsp_data, slcsp_data)
+        expected = _reference_by_employee(service, strategy_result, lcsp_data, slcsp_data)
+
+        self.assertEqual(analysis['by_employee'], expected)
+        for record in analysis['by_employee']:
+            self.assertIs(type(record['eligible']), bool)
+            self.assertIs(type(record['subsidy']), float)
+        self.assertEqual(analysis['total_analyzed'], 400)
+        self.assertEqual(analysis['eligible_count'], sum(1 for e in expected if e['eligible']))
+        self.assertEqual(analysis['medicare_count'], sum(1 for e in expected if e['is_medicare']))
+        self.assertEqual(analysis['total_monthly_subsidy'], round(sum(e['subsidy'] for e in expected), 2))
+        self.assertTrue(analysis['has_income_data'])
+
+    def test_first_matching_id_column_wins(self):
+        census_df = pd.DataFrame({
+            'Employee Number': ['7', '8', '7'],
+            'employee_number': ['8', '9', '10'],
+            'age': [30, 40, 50],
+        })
+        service = SubsidyService(None, census_df)
+        self.assertEqual(service._get_employee_data('7')['age'], 30)
+        self.assertEqual(service._get_employee_data(8)['age'], 40)
+        self.assertEqual(service._get_employee_data('10')['age'], 50)
+        self.assertIsNone(service._get_employee_data('11'))
+
+    def test_no_employees(self):
+        service = SubsidyService(None, pd.DataFrame({'employee_id': []}))
+        analysis = service.analyze_workforce_subsidy_potential({'employee_contributions': {}}, {}, {})
+        self.assertEqual(analysis['total_analyzed'], 0)
+        self.assertEqual(analysis['by_employee'], [])
+
+    def test_5000_employees_is_interactive(self):
+        census_df, strategy_result, lcsp_data, slcsp_data = _workforce(5000)
+        service = SubsidyService(None, census_df)
+        service.analyze_workforce_subsidy_potential(strategy_result, lcsp_data, slcsp_data)  # warm up
+
+        start = time.perf_counter()
+        analysis = service.analyze_workforce_subsidy_potential(strategy_result, lcsp_data, slcsp_data)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(analysis['total_analyzed'], 5000)
+        # Target is <100ms; the bound leaves headroom for slow CI machines
+        self.assertLess(elapsed, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
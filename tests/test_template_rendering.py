@@ -0,0 +1,81 @@
+"""
+Test Suite for the Template Rendering Service - ICHRA Calculator
+
+Checks that renderers share one Jinja environment per template directory,
+that assets are cached by content, and that render steps are timed.
+
+Run with: python -m pytest tests/test_template_rendering.py
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+import template_rendering
+from pdf_census_renderer import CensusAnalysisPDFRenderer, build_census_analysis_data
+from pdf_employer_summary_renderer import EmployerSummaryPDFRenderer
+from template_rendering import (
+    get_render_timings,
+    load_base64_asset,
+    load_logo_base64,
+    reset_render_timings,
+)
+
+
+class TestSharedEnvironment(unittest.TestCase):
+    """Renderer instances reuse the process-wide environment"""
+
+    def test_environment_shared_between_instances(self):
+        first = CensusAnalysisPDFRenderer()
+        second = CensusAnalysisPDFRenderer()
+        self.assertIs(first.env, second.env)
+        self.assertIsNot(first.env, EmployerSummaryPDFRenderer().env)
+        self.assertIn('savings_format', EmployerSummaryPDFRenderer().env.filters)
+
+    def test_census_html_render_is_timed(self):
+        employees_df = pd.DataFrame({
+            'age': [30, 45, 60],
+            'state': ['MO', 'MO', 'KS'],
+            'family_status': ['EE', 'F', 'ES'],
+        })
+        dependents_df = pd.DataFrame({'age': [8, 40], 'relationship': ['child', 'spouse']})
+        data = build_census_analysis_data(employees_df, dependents_df, None, client_name='Test Co',
+                                          chart_images={'age_dist': b'\x89PNG-age'})
+
+        reset_render_timings()
+        renderer = CensusAnalysisPDFRenderer()
+        first = renderer.generate_html(data)
+        second = renderer.generate_html(data)
+
+        self.assertEqual(first, second)
+        self.assertIn('Test Co', first)
+        self.assertIn(data.age_dist_chart, first)
+        self.assertEqual(get_render_timings()['census_analysis.html']['count'], 2)
+
+
+class TestAssetCache(unittest.TestCase):
+    """Encoded assets are keyed by content"""
+
+    def test_file_assets_follow_content_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'logo.png'
+            path.write_bytes(b'chart-bytes')
+            self.assertEqual(load_base64_asset(path), 'Y2hhcnQtYnl0ZXM=')
+
+            path.write_bytes(b'other-bytes!')
+            self.assertEqual(load_base64_asset(path), 'b3RoZXItYnl0ZXMh')
+
+            self.assertEqual(load_base64_asset(Path(tmp) / 'missing.png'), '')
+
+    def test_logo_is_cached(self):
+        logo = load_logo_base64()
+        if not (template_rendering.DECORATIVES_DIR / 'glove_logo.png').exists():
+            self.skipTest('logo not present')
+        self.assertTrue(logo)
+        self.assertIs(load_logo_base64(), logo)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Test Suite for the Streaming XLSX Export - ICHRA Calculator
+
+Run with: python -m pytest tests/test_xlsx_export.py
+"""
+
+import io
+import unittest
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from xlsx_export import StreamingWorkbook
+
+
+class TestStreamingWorkbook(unittest.TestCase):
+    """Rows, styles and column formats survive a round trip through openpyxl"""
+
+    def _load(self, data):
+        return load_workbook(io.BytesIO(data))
+
+    def test_frame_values_and_column_formats(self):
+        df = pd.DataFrame({
+            'Employee ID': ['E1', 'E2'],
+            'Age': np.array([30, 41], dtype=np.int64),
+            'Monthly': [412.5, np.nan],
+        })
+        workbook = StreamingWorkbook()
+        self.assertEqual(workbook.add_frame('Detail', df, column_formats={'Monthly': 'currency'}), 2)
+        ws = self._load(workbook.close())['Detail']
+
+        self.assertEqual([c.value for c in ws[1]], ['Employee ID', 'Age', 'Monthly'])
+        self.assertTrue(ws['A1'].font.b)
+        self.assertEqual(ws['A1'].font.name, 'Tahoma')
+        self.assertEqual([c.value for c in ws[2]], ['E1', 30, 412.5])
+        self.assertEqual(ws['C2'].number_format, '$#,##0.00')
+        self.assertEqual(ws['B2'].font.name, 'Tahoma')
+        self.assertIsNone(ws['C3'].value)  # NaN written as a blank
+
+    def test_generator_rows_and_section_style(self):
+        def rows():
+            yield ('BY AGE TIER', '', None)
+            for i in range(3):
+                yield ('', f'{20 + i * 10}s', i * 100.0)
+
+        workbook = StreamingWorkbook()
+        written = workbook.add_sheet(
+            'Breakdowns', ['Category', 'Group', 'Total'], rows(),
+            is_section_row=lambda row: bool(row[0]) and row[0].startswith('BY '),
+        )
+        ws = self._load(workbook.close())['Breakdowns']
+
+        self.assertEqual(written, 4)
+        self.assertEqual(ws.max_row, 5)
+        self.assertTrue(ws['A2'].font.b)
+        self.assertEqual(ws['C2'].fill.fgColor.rgb, 'FFF0F4FA')  # Whole section row filled
+        self.assertFalse(ws['A3'].font.b)
+
+    def test_records_and_long_sheet_name(self):
+        workbook = StreamingWorkbook()
+        workbook.add_records(
+            'A sheet name that is longer than Excel allows', [{'Metric': 'x', 'Value': 1}, {'Metric': 'y'}],
+            ['Metric', 'Value'],
+        )
+        wb = self._load(workbook.close())
+        ws = wb.worksheets[0]
+
+        self.assertEqual(len(ws.title), 31)
+        self.assertEqual([c.value for c in ws[3]], ['y', None])
+
+
+if __name__ == '__main__':
+    unittest.main()
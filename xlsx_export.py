@@ -0,0 +1,179 @@
+"""
+Streaming XLSX Export
+
+Shared engine for the multi-tab Excel downloads. Workbooks are written with
+XlsxWriter in constant-memory mode: each row is flushed to disk as soon as the
+next one starts, so a 10,000-employee detail tab costs the same memory as a
+10-employee one.
+
+Styling is declared up front instead of restyling every cell afterwards:
+- Named styles (body, header, section) are created once per workbook
+- Number formats are set per column; cells written without a format inherit
+  their column's format
+- Section rows (e.g. 'BY AGE TIER') get the section style as they are written
+
+Usage:
+    workbook = StreamingWorkbook()
+    workbook.add_frame('Employee Detail', df, column_formats={'ER ICHRA Monthly': 'currency'})
+    workbook.add_sheet('Summary', ['Metric', 'Value'], rows_generator())
+    data = workbook.close()
+"""
+
+import io
+import math
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+import pandas as pd
+import xlsxwriter
+
+# Workbook-wide font (matches the existing exports)
+FONT_NAME = 'Tahoma'
+FONT_SIZE = 12
+
+# Named styles, layered on the base font
+NAMED_STYLES = {
+    'body': {},
+    'header': {'bold': True, 'bg_color': '#E8F1FD'},
+    'section': {'bold': True, 'bg_color': '#F0F4FA'},
+}
+
+# Column format names -> Excel number formats
+NUMBER_FORMATS = {
+    'currency': '$#,##0.00',
+    'currency_whole': '$#,##0',
+    'percent': '0.00%',
+    'percent_whole': '0%',
+    'integer': '0',
+    'decimal': '0.00',
+    'text': '@',
+}
+
+# Excel caps sheet names at 31 characters
+MAX_SHEET_NAME_LENGTH = 31
+
+
+def _cell_value(value: Any) -> Any:
+    """Normalize a value for writing: NaN/NA become blanks, numpy scalars become Python."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if hasattr(value, 'item') and not isinstance(value, (str, bytes)):
+        value = value.item()
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        return None
+    return value
+
+
+class StreamingWorkbook:
+    """Constant-memory XLSX writer with named styles and column-level formats"""
+
+    def __init__(self, output: Optional[io.BytesIO] = None):
+        """
+        Args:
+            output: Buffer to write into (a new BytesIO if None)
+        """
+        self._output = output if output is not None else io.BytesIO()
+        self._workbook = xlsxwriter.Workbook(
+            self._output, {'constant_memory': True, 'strings_to_urls': False}
+        )
+        self._formats: Dict[tuple, Any] = {}
+
+    def style(self, name: str = 'body', number_format: Optional[str] = None):
+        """
+        Get a named style, optionally with a number format.
+
+        Each (style, number format) pair is created once and reused.
+
+        Args:
+            name: One of NAMED_STYLES
+            number_format: Key of NUMBER_FORMATS or a raw Excel format string
+        """
+        key = (name, number_format)
+        if key not in self._formats:
+            properties = {'font_name': FONT_NAME, 'font_size': FONT_SIZE, **NAMED_STYLES[name]}
+            if number_format:
+                properties['num_format'] = NUMBER_FORMATS.get(number_format, number_format)
+            self._formats[key] = self._workbook.add_format(properties)
+        return self._formats[key]
+
+    def add_sheet(
+        self,
+        title: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        column_formats: Optional[Dict[str, str]] = None,
+        column_widths: Optional[Dict[str, float]] = None,
+        is_section_row: Optional[Callable[[Sequence[Any]], bool]] = None,
+    ) -> int:
+        """
+        Write one worksheet from a row iterator.
+
+        Rows are consumed lazily and written in order, so a generator keeps
+        memory flat however long the sheet is.
+
+        Args:
+            title: Sheet name (truncated to 31 characters)
+            columns: Header labels
+            rows: Row value sequences, aligned with columns
+            column_formats: {column: NUMBER_FORMATS key or Excel format}
+            column_widths: {column: width in characters}
+            is_section_row: Predicate marking rows to write in the section style
+
+        Returns:
+            Number of data rows written
+        """
+        column_formats = column_formats or {}
+        column_widths = column_widths or {}
+        worksheet = self._workbook.add_worksheet(title[:MAX_SHEET_NAME_LENGTH])
+
+        # Column formats first: unformatted cells inherit them
+        for col, name in enumerate(columns):
+            worksheet.set_column(col, col, column_widths.get(name), self.style('body', column_formats.get(name)))
+
+        worksheet.write_row(0, 0, list(columns), self.style('header'))
+
+        section = self.style('section')
+        row_idx = 0
+        for row_idx, values in enumerate(rows, start=1):
+            values = [_cell_value(v) for v in values]
+            if is_section_row is not None and is_section_row(values):
+                worksheet.write_row(row_idx, 0, values, section)
+            else:
+                for col, value in enumerate(values):
+                    if value is not None:
+                        worksheet.write(row_idx, col, value)
+
+        return row_idx
+
+    def add_frame(
+        self,
+        title: str,
+        df: pd.DataFrame,
+        column_formats: Optional[Dict[str, str]] = None,
+        column_widths: Optional[Dict[str, float]] = None,
+        is_section_row: Optional[Callable[[Sequence[Any]], bool]] = None,
+    ) -> int:
+        """Write a DataFrame (without its index) as a worksheet. See add_sheet()."""
+        return self.add_sheet(
+            title,
+            [str(c) for c in df.columns],
+            df.itertuples(index=False, name=None),
+            column_formats=column_formats,
+            column_widths=column_widths,
+            is_section_row=is_section_row,
+        )
+
+    def add_records(
+        self,
+        title: str,
+        records: Iterable[Dict[str, Any]],
+        columns: Sequence[str],
+        **kwargs,
+    ) -> int:
+        """Write dict records (missing keys left blank) as a worksheet. See add_sheet()."""
+        rows = ([record.get(c) for c in columns] for record in records)
+        return self.add_sheet(title, columns, rows, **kwargs)
+
+    def close(self) -> bytes:
+        """Finish the workbook and return the XLSX bytes."""
+        self._workbook.close()
+        return self._output.getvalue()